@@ -0,0 +1,84 @@
+import os
+import threading
+from enum import StrEnum
+from typing import Any, Callable, Generic, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class Lifetime(StrEnum):
+    SINGLETON = "singleton"  # 프로세스당 하나 (처음 resolve할 때 생성)
+    TRANSIENT = "transient"  # resolve할 때마다 새로 생성 (사용 단위 상태를 가진 객체)
+
+
+class _Lazy(Generic[T]):
+    """속성에 처음 접근할 때 resolve하는 대리 객체 (모듈 전역에서 쓰기 위함)"""
+
+    def __init__(self, container: "Container", key: type[T]):
+        self._container = container
+        self._key = key
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._container.resolve(self._key), name)
+
+
+class Container:
+    """
+    프로세스 단위 의존성 컨테이너.
+    - 등록은 각 앱의 AppConfig.ready()에서 한다 (monitoring/dependencies.py, user/dependencies.py)
+    - 싱글턴은 처음 resolve할 때 만들고, factory 안에서 다른 의존성을 resolve해도 된다
+    - fork된 자식 프로세스(celery prefork 등)는 부모의 싱글턴(소켓, 커넥션 풀)을 물려받지 않고 새로 만든다
+    """
+
+    def __init__(self):
+        self._factories: dict[type, tuple[Callable[[], Any], Lifetime]] = {}
+        self._instances: dict[type, Any] = {}
+        self._lock = threading.RLock()
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def register(
+        self,
+        key: type[T],
+        factory: Callable[[], T],
+        lifetime: Lifetime = Lifetime.SINGLETON,
+    ) -> None:
+        with self._lock:
+            self._factories[key] = (factory, lifetime)
+            self._instances.pop(key, None)
+
+    def resolve(self, key: type[T]) -> T:
+        try:
+            return self._instances[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if key in self._instances:
+                return self._instances[key]
+            try:
+                factory, lifetime = self._factories[key]
+            except KeyError:
+                raise LookupError(f"{key.__name__}가 컨테이너에 등록되지 않았습니다.")
+            instance = factory()
+            if lifetime == Lifetime.SINGLETON:
+                self._instances[key] = instance
+            return instance
+
+    def lazy(self, key: type[T]) -> T:
+        """
+        모듈 import 시점에는 등록이 끝나지 않았을 수 있으므로 사용 시점에 resolve한다.
+        grafana_api: VisualizationPlatformProvider = container.lazy(VisualizationPlatformProvider)
+        """
+        return cast(T, _Lazy(self, key))
+
+    def reset(self) -> None:
+        """만들어 둔 싱글턴을 버린다. (등록은 유지)"""
+        with self._lock:
+            self._instances.clear()
+
+    def _after_fork(self) -> None:
+        self._lock = threading.RLock()
+        self._instances.clear()
+
+
+container = Container()
@@ -0,0 +1,94 @@
+import os
+import threading
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base as postgresql_base
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+from common.db.pool import ConnectionPool
+
+# (alias, DB 이름) → 풀. 같은 프로세스의 모든 스레드(요청, celery threads pool)가 공유
+_pools: dict[tuple[str, str], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+# fork 전에 부모가 만든 풀. 자식에서 GC되면서 부모와 공유하는 소켓을 닫지 않도록 참조만 유지
+_inherited_pools: list[ConnectionPool] = []
+
+
+def _after_fork() -> None:
+    global _pools_lock
+    _inherited_pools.extend(_pools.values())
+    _pools.clear()
+    _pools_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_after_fork)
+
+
+def pool_stats() -> dict[str, dict[str, Any]]:
+    """health/metrics 노출용: alias별 풀 상태"""
+    return {alias: pool.stats() for (alias, _), pool in list(_pools.items())}
+
+
+class DatabaseWrapper(postgresql_base.DatabaseWrapper):
+    """
+    django.db.backends.postgresql + 프로세스 단위 커넥션 풀.
+    DATABASES의 POOL_OPTIONS(POOL_SIZE, MAX_OVERFLOW, RECYCLE, PRE_PING, TIMEOUT)를 따른다.
+    Django가 요청/태스크가 끝날 때 커넥션을 닫으면 실제로 닫지 않고 풀에 반납한다.
+    (CONN_MAX_AGE로 스레드마다 커넥션을 붙잡아 두는 방식과는 같이 쓰지 않는다)
+    """
+
+    @property
+    def pool(self) -> ConnectionPool | None:
+        options = self.settings_dict.get("POOL_OPTIONS")
+        if self.alias == NO_DB_ALIAS or not options:
+            return None
+        key = (self.alias, self.settings_dict["NAME"])
+        pool = _pools.get(key)
+        if pool is None:
+            with _pools_lock:
+                pool = _pools.get(key)
+                if pool is None:
+                    pool = _pools[key] = self._create_pool(options)
+        return pool
+
+    def _create_pool(self, options: dict[str, Any]) -> ConnectionPool:
+        if self.settings_dict.get("CONN_MAX_AGE"):
+            raise ImproperlyConfigured(
+                "POOL_OPTIONS를 쓸 때는 CONN_MAX_AGE를 0으로 두어야 합니다."
+            )
+        conn_params = self.get_connection_params()
+        return ConnectionPool(
+            # 새 커넥션만 기본 구현(isolation level, psycopg2 jsonb loads 등록)으로 연다
+            connect=lambda: super(DatabaseWrapper, self).get_new_connection(
+                conn_params
+            ),
+            pool_size=options.get("POOL_SIZE", 5),
+            max_overflow=options.get("MAX_OVERFLOW", 10),
+            recycle=options.get("RECYCLE"),
+            pre_ping=options.get("PRE_PING", False),
+            timeout=options.get("TIMEOUT", 30.0),
+        )
+
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+        # 재사용 커넥션도 이 wrapper에 isolation level이 설정돼 있어야 한다 (기본 구현과 동일)
+        self.isolation_level = IsolationLevel(
+            self.settings_dict["OPTIONS"].get(
+                "isolation_level", IsolationLevel.READ_COMMITTED
+            )
+        )
+        return pool.acquire()
+
+    def _close(self):
+        pool = self.pool
+        if self.connection is None or pool is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            pool.release(self.connection)
+        # atomic 블록 안에서 닫히면 Django는 connection을 남겨두므로,
+        # 다른 스레드에 빌려준 커넥션을 계속 쓰지 않도록 여기서 끊는다
+        self.connection = None
@@ -0,0 +1,218 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# psycopg2/psycopg(3) 공통: connection.info.transaction_status 값
+_TRANSACTION_IDLE = 0
+_TRANSACTION_INTRANS = 2
+_TRANSACTION_INERROR = 3
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """
+    스레드 간에 공유하는 DB-API 커넥션 풀 (옵션 의미는 SQLAlchemy QueuePool과 같다).
+    - pool_size: 반납 후에도 열어 두는 커넥션 수. 미리 열지 않고 필요할 때 만든다
+    - max_overflow: pool_size를 넘어 잠깐 더 열 수 있는 수. 기다리는 스레드가 없으면 반납 즉시 닫는다
+    - 전부 사용 중이면 timeout까지 기다리고, 그래도 없으면 PoolTimeout
+    - recycle: 만든 지 이만큼(초) 지난 커넥션은 꺼낼 때 닫고 새로 만든다
+    - pre_ping: 꺼낼 때 SELECT 1로 살아 있는지 확인 (끊겼으면 버리고 다시 꺼낸다)
+    - 반납 시 트랜잭션이 열려 있으면 rollback, autocommit이 꺼져 있으면 다시 켜고,
+      상태를 알 수 없으면 버린다
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        pool_size: int,
+        max_overflow: int,
+        recycle: float | None,
+        pre_ping: bool,
+        timeout: float,
+    ):
+        self.connect = connect
+        self.pool_size = pool_size
+        self.max_size = pool_size + max_overflow
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+        self.timeout = timeout
+
+        self._cond = threading.Condition()
+        self._idle: deque[Any] = deque()
+        self._created_at: dict[int, float] = {}  # id(connection) → 생성 시각
+        self._size = 0  # 열려 있거나 만드는 중인 커넥션 수
+        self._waiting = 0
+
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.timeouts = 0
+        self.created = 0
+        self.discarded = 0
+        self.peak_in_use = 0
+
+    def acquire(self) -> Any:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            connection = self._checkout(deadline)
+            if connection is None:
+                return self._create()
+            if self._is_healthy(connection):
+                return connection
+            self._discard(connection)
+
+    def release(self, connection: Any) -> None:
+        with self._cond:
+            owned = id(connection) in self._created_at
+        if not owned:
+            # 이 풀에서 꺼낸 커넥션이 아님 (fork 전에 부모 프로세스가 연 커넥션 등)
+            self._close_quietly(connection)
+            return
+        if not self._reset(connection):
+            self._discard(connection)
+            return
+
+        with self._cond:
+            if self._waiting or len(self._idle) < self.pool_size:
+                # 최근에 반납된 커넥션부터 꺼낸다 (pop)
+                self._idle.append(connection)
+                self._cond.notify()
+                return
+        self._discard(connection)
+
+    def close(self) -> None:
+        """idle 커넥션을 닫는다. (사용 중인 커넥션은 반납될 때 정리)"""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+        for connection in idle:
+            self._discard(connection)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            in_use = self._size - len(self._idle)
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": in_use,
+                "waiting": self._waiting,
+                "pool_size": self.pool_size,
+                "max_size": self.max_size,
+                "saturation": round(in_use / self.max_size, 3),
+                "peak_in_use": self.peak_in_use,
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "wait_time": round(self.wait_time, 3),
+                "timeouts": self.timeouts,
+                "created": self.created,
+                "discarded": self.discarded,
+            }
+
+    def _checkout(self, deadline: float) -> Any | None:
+        """idle 커넥션을 꺼낸다. 새로 만들어야 하면 자리만 잡아 두고 None"""
+        with self._cond:
+            started = None
+            while True:
+                if self._idle:
+                    connection = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    connection = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.timeouts += 1
+                    if started is not None:
+                        self.wait_time += time.monotonic() - started
+                    raise PoolTimeout(
+                        f"{self.timeout}s 안에 사용할 수 있는 DB 커넥션이 없습니다. "
+                        f"(max_size={self.max_size})"
+                    )
+                if started is None:
+                    started = time.monotonic()
+                    self.waits += 1
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+            if started is not None:
+                self.wait_time += time.monotonic() - started
+            self.checkouts += 1
+            self.peak_in_use = max(self.peak_in_use, self._size - len(self._idle))
+            return connection
+
+    def _create(self) -> Any:
+        try:
+            connection = self.connect()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._created_at[id(connection)] = time.monotonic()
+            self.created += 1
+        return connection
+
+    def _is_healthy(self, connection: Any) -> bool:
+        if connection.closed:
+            return False
+        if self.recycle is not None:
+            with self._cond:
+                created_at = self._created_at[id(connection)]
+            if time.monotonic() - created_at > self.recycle:
+                return False
+        if self.pre_ping:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+            except Exception as e:
+                logger.warning(f"[DB pool] pre-ping 실패, 커넥션 교체: {e}")
+                return False
+        return True
+
+    def _reset(self, connection: Any) -> bool:
+        """다시 빌려줄 수 있는 상태로 돌려놓는다. 실패하면 False"""
+        if connection.closed:
+            return False
+        try:
+            status = connection.info.transaction_status
+            if status in (_TRANSACTION_INTRANS, _TRANSACTION_INERROR):
+                connection.rollback()
+                status = connection.info.transaction_status
+            if status != _TRANSACTION_IDLE:
+                return False
+            if not connection.autocommit:
+                # atomic() 도중 반납된 커넥션. 그대로 두면 pre-ping이 트랜잭션을 열어
+                # 다음 사용자의 set_autocommit(True)가 ProgrammingError로 실패한다
+                connection.autocommit = True
+            return True
+        except Exception as e:
+            logger.warning(f"[DB pool] 반납된 커넥션 정리 실패, 버림: {e}")
+            return False
+
+    def _discard(self, connection: Any) -> None:
+        with self._cond:
+            if self._created_at.pop(id(connection), None) is None:
+                return
+            self._size -= 1
+            self.discarded += 1
+            self._cond.notify()
+        self._close_quietly(connection)
+
+    @staticmethod
+    def _close_quietly(connection: Any) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
@@ -1,13 +1,11 @@
-import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any, Generic, Type, TypeVar
+from functools import cache
+from typing import Any, Callable, Generic, Type, TypeVar
 
 from arrow import Arrow
 from dacite import Config, from_dict
 
-from common.utils.base import remove_none
-
 
 @dataclass
 class Domain:
@@ -20,13 +18,115 @@ class Domain:
         )
 
     def to_dict(self, excludes: list[str] = []) -> dict[str, Any]:  # dict로 변환
-        dto = remove_none(json.dumps(asdict(self), default=str))
+        """
+        asdict → json.dumps(default=str) → json.loads → remove_none 과 같은 결과를
+        복사 없이 필드를 한 번만 돌면서 만든다. (_converter 참고)
+        """
+        dto = _to_json_value(self, True)
         if excludes:
             return {key: value for key, value in dto.items() if key not in excludes}
         else:
             return dto
 
 
+_Converter = Callable[[Any, bool], Any]
+
+
+def _to_json_value(value: Any, prune: bool) -> Any:
+    """
+    prune: dict 안의 None, 빈 dict 값을 뺀다. (remove_none처럼 list 안으로는 내려가지 않는다)
+    """
+    return _converter(type(value))(value, prune)
+
+
+@cache
+def _converter(cls: type) -> _Converter:
+    """
+    타입별 변환 함수. json.dumps(default=str) 후 json.loads 한 값과 같아야 한다.
+    - dataclass → dict (필드 목록은 클래스마다 한 번만 구함)
+    - list/tuple → list, dict → key를 문자열로 바꾼 dict
+    - str/int/float 서브클래스(StrEnum 등) → 기본 타입 값
+    - 그 밖의 타입(datetime, Arrow, Enum ...) → str()
+    """
+    if cls in (str, int, float, bool, type(None)):
+        return _as_is
+    if hasattr(cls, "__dataclass_fields__"):
+        return _dataclass_converter(tuple(f.name for f in fields(cls)))
+    if issubclass(cls, (list, tuple)):
+        return _list_to_json
+    if issubclass(cls, dict):
+        return _dict_to_json
+    if issubclass(cls, str):
+        return lambda value, prune: str.__str__(value)
+    if issubclass(cls, int):
+        return lambda value, prune: int.__int__(value)
+    if issubclass(cls, float):
+        return lambda value, prune: float.__float__(value)
+    return lambda value, prune: str(value)
+
+
+def _as_is(value: Any, prune: bool) -> Any:
+    return value
+
+
+def _is_pruned(value: Any) -> bool:
+    return value is None or (type(value) is dict and not value)
+
+
+def _dataclass_converter(names: tuple[str, ...]) -> _Converter:
+    def convert(obj: Any, prune: bool) -> dict[str, Any]:
+        dto = {}
+        for name in names:
+            value = getattr(obj, name)
+            value = _converter(type(value))(value, prune)
+            if not (prune and _is_pruned(value)):
+                dto[name] = value
+        return dto
+
+    return convert
+
+
+def _list_to_json(values: list | tuple, prune: bool) -> list:
+    return [_converter(type(value))(value, False) for value in values]
+
+
+def _dict_to_json(values: dict, prune: bool) -> dict[str, Any]:
+    dto: dict[str, Any] = {}
+    for key, value in values.items():
+        if type(key) is not str:
+            key = _json_key(key)
+        value = _converter(type(value))(value, prune)
+        if prune and _is_pruned(value):
+            # 문자열로 바꾼 key가 겹치면 json.loads처럼 마지막 값 기준
+            dto.pop(key, None)
+        else:
+            dto[key] = value
+    return dto
+
+
+def _json_key(key: Any) -> str:
+    # json.dumps의 dict key 변환 규칙
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        if key != key:
+            return "NaN"
+        if key in (float("inf"), float("-inf")):
+            return "Infinity" if key > 0 else "-Infinity"
+        return float.__repr__(key)
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )
+
+
 T = TypeVar("T")
 
 
@@ -39,3 +139,11 @@ class PagedResult(Generic[T]):
     page_size: int
     has_previous: bool
     has_next: bool
+
+
+@dataclass
+class CursorPagedResult(Generic[T]):
+    items: list[T]
+    page_size: int
+    has_next: bool
+    next_cursor: str | None = None
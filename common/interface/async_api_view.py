@@ -0,0 +1,40 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    핸들러(get/post ...)를 async def로 쓰는 APIView. (DRF APIView.dispatch는 sync만 지원)
+    ASGI에서는 요청을 스레드 없이 event loop에서 처리한다.
+    - 인증/권한/throttle(initial)은 세션 조회 등 DB를 탈 수 있어 요청 스레드에서 실행
+    - 예외 처리, 응답 마무리는 APIView와 동일
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -1,7 +1,22 @@
-from typing import Any
+import json
+from typing import Any, Iterable
 
-from django.http import JsonResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
+from rest_framework.renderers import BaseRenderer
+
+
+class PydanticJsonResponse(HttpResponse):
+    """
+    pydantic 모델을 dict로 풀지 않고 pydantic-core로 바로 JSON bytes로 직렬화한다.
+    (model_dump()로 dict를 만들고 JsonResponse가 다시 json.dumps 하던 것을 한 번에)
+    data에 pydantic 모델을 그대로 넣어도 dict와 같은 모양으로 나간다.
+    """
+
+    def __init__(self, model: BaseModel, status: int = 200, **kwargs):
+        kwargs.setdefault("content_type", "application/json; charset=utf-8")
+        super().__init__(content=to_json(model), status=status, **kwargs)
 
 
 class SuccessResponse(BaseModel):
@@ -11,13 +26,9 @@ class SuccessResponse(BaseModel):
 
 def success_response(
     data: Any, message: str = "성공적으로 처리되었습니다.", status: int = 200
-) -> JsonResponse:
-    response_model = SuccessResponse(data=data, message=message)
-
-    return JsonResponse(
-        response_model.model_dump(),
-        status=status,
-        content_type="application/json; charset=utf-8",
+) -> PydanticJsonResponse:
+    return PydanticJsonResponse(
+        SuccessResponse(data=data, message=message), status=status
     )
 
 
@@ -36,13 +47,43 @@ def error_response(
     message: str | None = None,
     status: int = 400,
     detail: dict = {},
-) -> JsonResponse:
-    response_model = ErrorResponse(
-        error=ErrorDetail(code=code, message=message, detail=detail)
-    )
-
-    return JsonResponse(
-        response_model.model_dump(),
+) -> PydanticJsonResponse:
+    return PydanticJsonResponse(
+        ErrorResponse(error=ErrorDetail(code=code, message=message, detail=detail)),
         status=status,
-        content_type="application/json; charset=utf-8",
     )
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Accept: text/event-stream 요청이 DRF content negotiation에서 406이 되지 않도록 하는 용도.
+    실제 본문은 event_stream_response가 직접 만든다.
+    """
+
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return data
+
+
+def sse_message(event: str | None = None, data: dict | None = None) -> str:
+    """
+    SSE 메시지 한 개. 둘 다 None이면 연결 유지용 주석(keepalive)
+    """
+    if event is None and data is None:
+        return ": keepalive\n\n"
+    lines = []
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def event_stream_response(messages: Iterable[str]) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(messages, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # nginx 등 reverse proxy가 응답을 모았다가 보내지 않도록
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -1,80 +1,97 @@
 import copy
 from functools import wraps
-from typing import Type
+from typing import Any, Callable, Type
 
+from asgiref.sync import iscoroutinefunction
+from django.http import HttpResponse
 from pydantic import BaseModel, ValidationError
 from rest_framework.parsers import JSONParser
 
 from common.interface.response import error_response
 
+Validator = Callable[[Any], tuple[Any, HttpResponse | None]]
+
+
+def inject_validated(f, name: str, validate: Validator):
+    """
+    validate(request) → (값, 에러 응답). 에러가 없으면 값을 name 키워드 인자로 넘겨 핸들러를 호출한다.
+    sync/async 핸들러 모두 지원 (async 핸들러면 async wrapper를 돌려준다)
+    """
+    if iscoroutinefunction(f):
+
+        @wraps(f)
+        async def async_wrapper(*args, **kwargs):
+            value, error = validate(args[1])
+            if error is not None:
+                return error
+            return await f(*args, **kwargs, **{name: value})
+
+        return async_wrapper
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        value, error = validate(args[1])
+        if error is not None:
+            return error
+        return f(*args, **kwargs, **{name: value})
+
+    return wrapper
+
 
 def validate_query_params(model: Type[BaseModel]):
+    def validate(request):
+        params = request.GET.dict()
+        try:
+            return model.model_validate(params), None
+        except ValidationError as e:
+            return None, error_response(
+                code="VALIDATE_QUERY_ERROR",
+                message="query params validation error",
+                detail={"details": e.errors()},
+            )
+
     def decorated_func(f):
-        @wraps(f)
-        def wrapper(*args, **kwargs):
-            request = args[1]
-            params = request.GET.dict()
-            try:
-                validated_params = model.model_validate(params)
-            except ValidationError as e:
-                return error_response(
-                    code="VALIDATE_QUERY_ERROR",
-                    message="query params validation error",
-                    detail={"details": e.errors()},
-                )
-
-            return f(*args, **kwargs, params=validated_params)
-
-        return wrapper
+        return inject_validated(f, "params", validate)
 
     return decorated_func
 
 
 def validate_body(model: Type[BaseModel]):
+    def validate(request):
+        body = JSONParser().parse(request)
+        try:
+            return model.model_validate(body), None
+        except ValidationError as e:
+            return None, error_response(
+                code="VALIDATE_BODY_ERROR",
+                message="Body validation error",
+                detail={"details": e.errors()},
+            )
+
     def decorated_func(f):
-        @wraps(f)
-        def wrapper(*args, **kwargs):
-            request = args[1]
-            body = JSONParser().parse(request)
-            try:
-                validated_body = model.model_validate(body)
-            except ValidationError as e:
-                return error_response(
-                    code="VALIDATE_BODY_ERROR",
-                    message="Body validation error",
-                    detail={"details": e.errors()},
-                )
-
-            return f(*args, **kwargs, body=validated_body)
-
-        return wrapper
+        return inject_validated(f, "body", validate)
 
     return decorated_func
 
 
 def validate_form_data(model: Type[BaseModel]):
+    def validate(request):
+        form_data = {}
+        for key, value in copy.deepcopy(request.POST).items():
+            form_data[key] = value
+        for key, value in request.FILES.items():
+            form_data[key] = value
+
+        try:
+            return model.model_validate(form_data), None
+        except ValidationError as e:
+            return None, error_response(
+                code="VALIDATE_FORM_DATA_ERROR",
+                message="form validation error",
+                detail={"details": e.errors()},
+            )
+
     def decorated_func(f):
-        @wraps(f)
-        def wrapper(*args, **kwargs):
-            request = args[1]
-
-            form_data = {}
-            for key, value in copy.deepcopy(request.POST).items():
-                form_data[key] = value
-            for key, value in request.FILES.items():
-                form_data[key] = value
-
-            try:
-                validated_form_data = model.model_validate(form_data)
-            except ValidationError as e:
-                return error_response(
-                    code="VALIDATE_FORM_DATA_ERROR",
-                    message="form validation error",
-                    detail={"details": e.errors()},
-                )
-
-            return f(*args, **kwargs, form_data=validated_form_data)
-
-        return wrapper
+        return inject_validated(f, "form_data", validate)
 
     return decorated_func
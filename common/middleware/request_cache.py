@@ -0,0 +1,48 @@
+from contextvars import ContextVar
+from typing import Any
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+_request_cache: ContextVar[dict[str, Any] | None] = ContextVar(
+    "request_cache", default=None
+)
+
+
+def get_request_cache() -> dict[str, Any] | None:
+    """
+    현재 요청 동안만 유지되는 memo dict를 반환한다.
+    요청 밖(celery, management command 등)에서는 None.
+    """
+    return _request_cache.get()
+
+
+class RequestCacheMiddleware:
+    """
+    요청마다 비어있는 memo dict를 열고, 응답 후 닫는다.
+    같은 요청 안에서 반복되는 조회(예: 토큰 → 유저)를 한 번으로 줄이기 위해 사용.
+    ASGI에서 async view 앞에 sync middleware가 끼면 요청마다 스레드로 넘어가므로 둘 다 지원한다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _request_cache.set({})
+        try:
+            return self.get_response(request)
+        finally:
+            _request_cache.reset(token)
+
+    async def __acall__(self, request):
+        token = _request_cache.set({})
+        try:
+            return await self.get_response(request)
+        finally:
+            _request_cache.reset(token)
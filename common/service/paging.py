@@ -1,3 +1,6 @@
+import base64
+import json
+from datetime import datetime
 from typing import Generic, TypeVar
 
 from common.domain import PagedResult
@@ -10,7 +13,7 @@ class Paginator(Generic[T]):
     MAX_PAGE_SIZE = 100
 
     @staticmethod
-    def paginate(items: list[T], page: int = 1, page_size: int = 10) -> PagedResult[T]:
+    def validate_params(page: int, page_size: int) -> None:
         if page < 1 or page_size < 1:
             raise InvalidPagingParameterException(
                 "페이지 번호와 페이지 크기는 1 이상이어야 합니다."
@@ -21,20 +24,30 @@ class Paginator(Generic[T]):
                 f"페이지 크기는 최대 {Paginator.MAX_PAGE_SIZE}까지 가능합니다."
             )
 
-        total_items = len(items)
+    @staticmethod
+    def get_total_pages(total_items: int, page: int, page_size: int) -> int:
         total_pages = (total_items + page_size - 1) // page_size if page_size > 0 else 0
 
         if page > total_pages and total_pages != 0:
             raise InvalidPagingParameterException(
                 "페이지 번호가 총 페이지 수를 초과합니다."
             )
+        return total_pages
 
-        start_index = (page - 1) * page_size
-        end_index = start_index + page_size
-        paged_items = items[start_index:end_index]
+    @staticmethod
+    def get_offset(page: int, page_size: int) -> int:
+        return (page - 1) * page_size
 
+    @staticmethod
+    def to_paged_result(
+        items: list[T], total_items: int, total_pages: int, page: int, page_size: int
+    ) -> PagedResult[T]:
+        """
+        이미 잘라낸 페이지(items)와 전체 개수로 PagedResult를 만든다.
+        DB에서 LIMIT/OFFSET으로 페이징한 결과를 감쌀 때 사용.
+        """
         return PagedResult(
-            items=paged_items,
+            items=items,
             total_items=total_items,
             total_pages=total_pages,
             current_page=page,
@@ -42,3 +55,39 @@ class Paginator(Generic[T]):
             has_previous=(page > 1),
             has_next=(page < total_pages),
         )
+
+    @staticmethod
+    def paginate(items: list[T], page: int = 1, page_size: int = 10) -> PagedResult[T]:
+        Paginator.validate_params(page, page_size)
+
+        total_items = len(items)
+        total_pages = Paginator.get_total_pages(total_items, page, page_size)
+
+        start_index = Paginator.get_offset(page, page_size)
+        end_index = start_index + page_size
+        paged_items = items[start_index:end_index]
+
+        return Paginator.to_paged_result(
+            paged_items, total_items, total_pages, page, page_size
+        )
+
+
+class CursorPaginator:
+    """
+    (created_at, id) 기반 keyset 페이징용 커서 인코딩/디코딩.
+    클라이언트에는 내용을 알 수 없는 opaque 문자열로만 노출한다.
+    """
+
+    @staticmethod
+    def encode(created_at: datetime, id: str) -> str:
+        raw = json.dumps([created_at.isoformat(), id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str) -> tuple[datetime, str]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+            return datetime.fromisoformat(created_at), str(id)
+        except (ValueError, TypeError):
+            raise InvalidPagingParameterException("유효하지 않은 커서입니다.")
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+# ASGI로 띄우면 step1/조회 endpoint는 async view로 처리 (monitoring/interface/urls.py)
+os.environ.setdefault("ASYNC_VIEWS_ENABLED", "true")
 
 application = get_asgi_application()
@@ -1,7 +1,12 @@
 import os
 
-from celery import Celery
-from celery.signals import worker_process_init
+from celery import Celery, concurrency
+from celery.signals import (
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
 from kombu import Exchange, Queue
 
 # ─ Django 설정 등록 및 setup ─
@@ -12,20 +17,13 @@ app = Celery("config")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks(["monitoring.infra.celery.tasks"])
 
+# prefork 워커: 템플릿 렌더링, DB 작업 (CPU/DB 위주)
 TASK_QUEUE = "worker_tasks_queue"
 ROUTING_KEY = "tasks"
 DIRECT_EXCHANGE = "worker_tasks_exchange"
-
-worker_queue = Queue(
-    TASK_QUEUE,
-    Exchange(DIRECT_EXCHANGE, type="direct"),
-    routing_key="tasks",
-    queue_arguments={"x-queue-type": "quorum"},
-    no_declare=True,
-)
-
-app.conf.task_queues = [worker_queue]
-app.conf.task_create_missing_queues = False
+# threads 워커: Grafana/S3 호출 (대부분 네트워크 대기라 높은 동시성으로 처리)
+IO_TASK_QUEUE = "io_tasks_queue"
+IO_ROUTING_KEY = "io_tasks"
 
 app.conf.task_queues = [
     Queue(
@@ -34,18 +32,78 @@ app.conf.task_queues = [
         routing_key=ROUTING_KEY,
         queue_arguments={"x-queue-type": "quorum"},
     ),
+    Queue(
+        IO_TASK_QUEUE,
+        Exchange(DIRECT_EXCHANGE, type="direct", durable=True),
+        routing_key=IO_ROUTING_KEY,
+        queue_arguments={"x-queue-type": "quorum"},
+    ),
     Queue("celery", Exchange("celery", type="direct"), routing_key="celery"),
 ]
+app.conf.task_create_missing_queues = False
+
+# 태스크 모듈 단위 라우팅 (워커별 -Q 는 scripts/start-celery-*.sh 참고)
+app.conf.task_routes = {
+    "monitoring.infra.celery.tasks.grafana_tasks.*": {
+        "queue": IO_TASK_QUEUE,
+        "routing_key": IO_ROUTING_KEY,
+    },
+    "monitoring.infra.celery.tasks.*": {
+        "queue": TASK_QUEUE,
+        "routing_key": ROUTING_KEY,
+    },
+}
 
 # broker로부터 ack를 받아야 넘어감
 app.conf.broker_transport_options = {"confirm_publish": True}
 
 
 # ── 시그널 등록 ───────────────────────────────────────────
+def _start_worker_services():
+    print("registering signals")
+    from monitoring.infra.celery.tasks.signals import task_signals
+
+    task_signals.status_flusher.start()
+
+
+def _stop_worker_services():
+    from monitoring.infra.celery.tasks.signals import task_signals
+
+    # 버퍼에 남은 상태 전이를 DB에 반영하고 종료
+    task_signals.status_flusher.stop()
+
+
+def _runs_in_main_process(worker) -> bool:
+    # prefork(자식 프로세스)와 solo pool은 worker_process_init을 직접 보낸다
+    # 벤치마크 등 다른 앱으로 띄운 워커는 제외
+    pool = concurrency.get_implementation(worker.pool_cls)
+    return worker.app is app and pool.__module__ not in (
+        "celery.concurrency.prefork",
+        "celery.concurrency.solo",
+    )
+
+
 @worker_process_init.connect
 def init_worker(**kwargs):
-    print("registering signals")
-    import monitoring.infra.celery.tasks.signals.task_signals
+    _start_worker_services()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker(**kwargs):
+    _stop_worker_services()
+
+
+# threads/gevent pool은 자식 프로세스가 없어 worker_process_* 시그널이 오지 않는다
+@worker_init.connect
+def init_non_prefork_worker(sender, **kwargs):
+    if _runs_in_main_process(sender):
+        _start_worker_services()
+
+
+@worker_shutdown.connect
+def shutdown_non_prefork_worker(sender, **kwargs):
+    if _runs_in_main_process(sender):
+        _stop_worker_services()
 
 
 # setup_celery_signals()
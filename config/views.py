@@ -2,12 +2,27 @@ from django.http import JsonResponse
 from rest_framework import status
 from rest_framework.views import APIView
 
+from common.container import container
+from common.db.backends.postgresql_pool.base import pool_stats
 from config.settings import ENV
+from monitoring.infra.redis.circuit_breaker import RedisCircuitBreaker
+from user.infra.token.user_token_parser import user_token_payload_cache
 
 
 class HealthChecker(APIView):
+    def __init__(self):
+        self.grafana_circuit = container.resolve(RedisCircuitBreaker)
+
     def get(self, request):
         return JsonResponse(
-            data={"status": "success", "ENV": ENV},
+            data={
+                "status": "success",
+                "ENV": ENV,
+                "token_payload_cache": user_token_payload_cache.stats(),
+                "grafana_circuit": (
+                    self.grafana_circuit.snapshot() if self.grafana_circuit else None
+                ),
+                "db_pool": pool_stats(),
+            },
             status=status.HTTP_200_OK,
         )
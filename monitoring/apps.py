@@ -9,3 +9,13 @@ class MonitoringConfig(AppConfig):
         import monitoring.infra.models.monitoring_project_model
         import monitoring.infra.models.task_result_model
         import monitoring.infra.models.visualization_platform_model
+        from common.container import container
+        from monitoring.dependencies import register_dependencies
+        from monitoring.infra.jinja2.jinja2_template_renderer import (
+            Jinja2TemplateRenderer,
+        )
+
+        register_dependencies(container)
+
+        # web/worker 시작 시 템플릿을 미리 컴파일
+        Jinja2TemplateRenderer.warm_up()
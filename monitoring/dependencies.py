@@ -0,0 +1,109 @@
+from common.container import Container, Lifetime
+from config import settings
+from monitoring.domain.i_repo.i_monitoring_project_repo import IMonitoringProjectRepo
+from monitoring.domain.i_repo.i_task_result_repo import ITaskResultRepo
+from monitoring.domain.i_repo.i_visualization_platform_repo.i_dashbaord_repo import (
+    IDashboardRepo,
+    IPublicDashboardRepo,
+)
+from monitoring.domain.i_repo.i_visualization_platform_repo.i_folder_permission_repo import (
+    IFolderPermissionRepo,
+)
+from monitoring.domain.i_repo.i_visualization_platform_repo.i_folder_repo import (
+    IFolderRepo,
+)
+from monitoring.domain.i_repo.i_visualization_platform_repo.i_service_account_repo import (
+    IServiceAccountRepo,
+)
+from monitoring.infra.beats.file_beats import FileBeats
+from monitoring.infra.celery.task_executor.grafana_executor import GrafanaTaskExecutor
+from monitoring.infra.grafana.async_grafana_api import AsyncGrafanaAPI
+from monitoring.infra.grafana.grafana_api import GrafanaAPI
+from monitoring.infra.grafana.grafana_http_client import grafana_circuit_breaker
+from monitoring.infra.grafana.grafana_template_provider import GrafanaTemplateProvider
+from monitoring.infra.jinja2.jinja2_template_renderer import Jinja2TemplateRenderer
+from monitoring.infra.redis.circuit_breaker import RedisCircuitBreaker
+from monitoring.infra.redis.provision_progress_notifier import (
+    RedisProvisionProgressNotifier,
+)
+from monitoring.infra.redis.redis_client import redis_client
+from monitoring.infra.redis.task_status_buffer import TaskStatusBuffer
+from monitoring.infra.repo.monitoring_project_repo import MonitoringProjectRepo
+from monitoring.infra.repo.task_result_repo import TaskResultRepo
+from monitoring.infra.repo.visualization_platform_repo.dashboard_repo import (
+    DashboardRepo,
+    PublicDashboardRepo,
+)
+from monitoring.infra.repo.visualization_platform_repo.folder_permission_repo import (
+    FolderPermissionRepo,
+)
+from monitoring.infra.repo.visualization_platform_repo.folder_repo import FolderRepo
+from monitoring.infra.repo.visualization_platform_repo.service_account_repo import (
+    ServiceAccountRepo,
+)
+from monitoring.infra.s3.async_s3_agent_storage import AsyncS3AgentStorageProvider
+from monitoring.infra.s3.s3_agent_storage import S3AgentStorageProvider
+from monitoring.service.harvester_agent_service import HarvesterAgentService
+from monitoring.service.i_executors.visualization_platform_executor import (
+    VisualizationPlatformTaskExecutor,
+)
+from monitoring.service.i_log_agent.i_log_agent_provider import ILogAgentProvider
+from monitoring.service.i_progress.i_provision_progress_notifier import (
+    IProvisionProgressNotifier,
+)
+from monitoring.service.i_storage.i_storage_provider import (
+    AsyncAgentStorageProvider,
+    IAgentStorageProvider,
+)
+from monitoring.service.i_template_renderer.template_renderer import ITemplateRenderer
+from monitoring.service.i_visualization_platform.i_template_provider import (
+    VisualizationPlatformTemplateProvider,
+)
+from monitoring.service.i_visualization_platform.i_visualization_platform_provider import (
+    AsyncVisualizationPlatformProvider,
+    VisualizationPlatformProvider,
+)
+from monitoring.service.monitoring_project_service import MonitoringProjectService
+from monitoring.service.monitoring_provision_service import MonitoringProvisionService
+
+
+def register_dependencies(container: Container) -> None:
+    """
+    monitoring 앱의 구현체 등록. (MonitoringConfig.ready()에서 호출)
+    서비스/repo/client는 요청마다 상태를 갖지 않으므로 프로세스당 하나를 공유하고,
+    async with로 event loop에 묶인 커넥션을 여는 Async* 구현체만 사용할 때마다 새로 만든다.
+    """
+    # infra
+    container.register(
+        TaskStatusBuffer,
+        lambda: TaskStatusBuffer(redis_client, ttl=settings.TASK_STATUS_BUFFER_TTL),
+    )
+    container.register(ITaskResultRepo, TaskResultRepo)
+    container.register(IMonitoringProjectRepo, MonitoringProjectRepo)
+    container.register(IFolderRepo, FolderRepo)
+    container.register(IServiceAccountRepo, ServiceAccountRepo)
+    container.register(IFolderPermissionRepo, FolderPermissionRepo)
+    container.register(IDashboardRepo, DashboardRepo)
+    container.register(IPublicDashboardRepo, PublicDashboardRepo)
+    container.register(ITemplateRenderer, Jinja2TemplateRenderer)
+    container.register(VisualizationPlatformTemplateProvider, GrafanaTemplateProvider)
+    container.register(ILogAgentProvider, FileBeats)
+    container.register(IAgentStorageProvider, S3AgentStorageProvider)
+    container.register(
+        AsyncAgentStorageProvider,
+        lambda: AsyncS3AgentStorageProvider(container.resolve(IAgentStorageProvider)),
+        Lifetime.TRANSIENT,
+    )
+    container.register(IProvisionProgressNotifier, RedisProvisionProgressNotifier)
+    # GRAFANA_CIRCUIT_ENABLED가 꺼져 있으면 None
+    container.register(RedisCircuitBreaker, grafana_circuit_breaker)
+    container.register(VisualizationPlatformTaskExecutor, GrafanaTaskExecutor)
+    container.register(VisualizationPlatformProvider, GrafanaAPI)
+    container.register(
+        AsyncVisualizationPlatformProvider, AsyncGrafanaAPI, Lifetime.TRANSIENT
+    )
+
+    # service
+    container.register(HarvesterAgentService, HarvesterAgentService)
+    container.register(MonitoringProvisionService, MonitoringProvisionService)
+    container.register(MonitoringProjectService, MonitoringProjectService)
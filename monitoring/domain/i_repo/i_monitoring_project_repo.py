@@ -1,10 +1,12 @@
 from abc import abstractmethod
 
+from common.domain import CursorPagedResult, PagedResult
 from monitoring.domain.monitoring_project import (
     MonitoringProject,
     MonitoringProjectWithBothDashboardsDto,
     MonitoringProjectWithDashboardDto,
     MonitoringProjectWithPublicDashboardDto,
+    ProvisioningSnapshot,
 )
 
 
@@ -12,9 +14,15 @@ class IMonitoringProjectRepo:
     @abstractmethod
     def save(self, project: MonitoringProject) -> None: ...
 
+    @abstractmethod
+    async def asave(self, project: MonitoringProject) -> None: ...
+
     @abstractmethod
     def find_by_id(self, project_id: str) -> MonitoringProject | None: ...
 
+    @abstractmethod
+    async def afind_by_id(self, project_id: str) -> MonitoringProject | None: ...
+
     @abstractmethod
     def update_status(self, project_id: str, status: str) -> None: ...
 
@@ -24,6 +32,11 @@ class IMonitoringProjectRepo:
     @abstractmethod
     def exists_by_id_and_user_id(self, project_id: str, user_id: str) -> bool: ...
 
+    @abstractmethod
+    async def aexists_by_id_and_user_id(
+        self, project_id: str, user_id: str
+    ) -> bool: ...
+
     @abstractmethod
     def find_with_dashboard_dto(
         self, project_id: str
@@ -40,11 +53,41 @@ class IMonitoringProjectRepo:
     ) -> MonitoringProjectWithPublicDashboardDto | None: ...
 
     @abstractmethod
-    def find_all_with_full_dashboard_dto_by_user(
-        self, user_id: str
-    ) -> list[MonitoringProjectWithBothDashboardsDto]: ...
+    def find_page_with_full_dashboard_dto_by_user(
+        self, user_id: str, page: int = 1, page_size: int = 10
+    ) -> PagedResult[MonitoringProjectWithBothDashboardsDto]: ...
+
+    @abstractmethod
+    async def afind_page_with_full_dashboard_dto_by_user(
+        self, user_id: str, page: int = 1, page_size: int = 10
+    ) -> PagedResult[MonitoringProjectWithBothDashboardsDto]: ...
+
+    @abstractmethod
+    def find_cursor_page_with_full_dashboard_dto_by_user(
+        self, user_id: str, cursor: str | None = None, page_size: int = 10
+    ) -> CursorPagedResult[MonitoringProjectWithBothDashboardsDto]: ...
+
+    @abstractmethod
+    async def afind_cursor_page_with_full_dashboard_dto_by_user(
+        self, user_id: str, cursor: str | None = None, page_size: int = 10
+    ) -> CursorPagedResult[MonitoringProjectWithBothDashboardsDto]: ...
 
     @abstractmethod
     def find_with_full_dashboard_dto(
         self, project_id: str
     ) -> MonitoringProjectWithBothDashboardsDto | None: ...
+
+    @abstractmethod
+    async def afind_with_full_dashboard_dto(
+        self, project_id: str
+    ) -> MonitoringProjectWithBothDashboardsDto | None: ...
+
+    @abstractmethod
+    def find_provisioning_snapshot(
+        self, user_id: str, project_id: str
+    ) -> ProvisioningSnapshot: ...
+
+    @abstractmethod
+    def find_provisioning_snapshots(
+        self, project_ids: list[str]
+    ) -> dict[str, ProvisioningSnapshot]: ...
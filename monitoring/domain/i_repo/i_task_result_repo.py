@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any
 
-from monitoring.domain.task_result import TaskResult
+from monitoring.domain.task_result import TaskResult, TaskStatus
 
 
 class ITaskResultRepo(ABC):
@@ -24,6 +25,21 @@ class ITaskResultRepo(ABC):
         """
         pass
 
+    @abstractmethod
+    def record_status(self, task_id: str, **fields: Any) -> None:
+        """
+        태스크 상태 전이 기록 (write-behind).
+        버퍼에만 쓰고 DB에는 flush_buffered가 모아서 반영한다. find_by_task_id는 버퍼 내용을 합쳐서 반환.
+        """
+        pass
+
+    @abstractmethod
+    def flush_buffered(self, limit: int) -> int:
+        """
+        버퍼에 쌓인 상태 전이를 최대 limit개 DB에 일괄 반영하고 반영한 개수를 반환
+        """
+        pass
+
     @abstractmethod
     def bulk_upsert(self, task_results: list[TaskResult]) -> None:
         """
@@ -31,3 +47,22 @@ class ITaskResultRepo(ABC):
         존재하지 않으면 insert, 존재하면 update 합니다.
         """
         pass
+
+    @abstractmethod
+    def find_expired_keys(
+        self,
+        status: TaskStatus,
+        created_before: datetime | None,
+        after: tuple[datetime, str] | None,
+        limit: int,
+    ) -> list[tuple[datetime, str]]:
+        """
+        보관 기간이 지난 태스크의 (date_created, id)를 그 순서로 최대 limit개 조회
+        after: 이전 chunk의 마지막 키 (keyset 커서, 이미 지운 구간을 다시 읽지 않도록)
+        created_before가 None이면 생성 시각과 관계없이 해당 status 전부
+        """
+        pass
+
+    @abstractmethod
+    def delete_by_ids(self, ids: list[str]) -> int:
+        pass
@@ -8,11 +8,22 @@ class RenderedConfigFile(BaseModel):
     렌더링된 설정 파일을 표현하는 도메인 객체.
     - filename: 저장 또는 업로드 시 사용할 파일명
     - content: 파일의 바이너리 컨텐츠
+    - shareable: 프로젝트별 값(project_id, 타임스탬프, URL 등)이 없어 다른 프로젝트와 같은 객체를 써도 되는지
     """
 
     filename: str
     content: bytes
+    shareable: bool = False
 
     @property
     def base64(self) -> str:
         return base64.b64encode(self.content).decode("ascii")
+
+    @property
+    def content_type(self) -> str:
+        ext = self.filename.rsplit(".", 1)[-1].lower()
+        if ext in ("yml", "yaml"):
+            return "text/yaml"
+        elif ext == "sh":
+            return "text/x-shellscript"
+        return "application/octet-stream"
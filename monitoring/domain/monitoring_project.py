@@ -8,6 +8,8 @@ from monitoring.domain.visualization_platform.dashboard import (
     Dashboard,
     PublicDashboard,
 )
+from monitoring.domain.visualization_platform.folder import FolderPermission, UserFolder
+from monitoring.domain.visualization_platform.service_account import ServiceAccount
 
 
 class MonitoringType(StrEnum):
@@ -102,6 +104,7 @@ class MonitoringProjectWithPublicDashboardDto(Domain):
     dashboard_id: str | None = None
     agent_context: AgentProvisioningContext | None = None
     public_dashboard: PublicDashboard | None = None
+    project: MonitoringProject | None = None
 
 
 @dataclass
@@ -129,3 +132,19 @@ class MonitoringProjectWithBothDashboardsDto(Domain):
     dashboard: Dashboard | None = None
     agent_context: AgentProvisioningContext | None = None
     public_dashboard: PublicDashboard | None = None
+    project: MonitoringProject | None = None
+
+
+@dataclass
+class ProvisioningSnapshot(Domain):
+    """
+    (사용자, 프로젝트)의 프로비저닝 리소스 현황. 없는 리소스는 None
+    project는 여러 프로젝트를 한 번에 조회할 때만 채워진다
+    """
+
+    user_folder: UserFolder | None = None
+    service_account: ServiceAccount | None = None
+    folder_permission: FolderPermission | None = None
+    dashboard: Dashboard | None = None
+    public_dashboard: PublicDashboard | None = None
+    project: MonitoringProject | None = None
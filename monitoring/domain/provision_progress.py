@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from enum import StrEnum
+
+from common.domain import Domain
+from monitoring.domain.monitoring_project import ProjectStatus
+
+
+class ProvisionEventType(StrEnum):
+    STEP = "step"  # 프로비저닝 단계(태스크) 하나의 상태 변화 (TaskStatus)
+    PROJECT = "project"  # 프로젝트 전체 상태 변화 (ProjectStatus)
+
+
+@dataclass
+class ProvisionProgressEvent(Domain):
+    """
+    프로비저닝 진행 상황 이벤트 (SSE로 클라이언트에 그대로 전달)
+    """
+
+    FIELD_PROJECT_ID = "project_id"
+    FIELD_TYPE = "type"
+    FIELD_STATUS = "status"
+    FIELD_STEP = "step"
+    FIELD_TIMESTAMP = "timestamp"
+
+    project_id: str
+    type: ProvisionEventType
+    status: str
+    step: str | None = None
+    timestamp: str | None = None
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.type == ProvisionEventType.PROJECT and self.status in (
+            ProjectStatus.READY,
+            ProjectStatus.FAILED,
+        )
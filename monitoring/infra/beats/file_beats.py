@@ -3,6 +3,7 @@ from typing import Any
 
 from typing_extensions import override
 
+from common.container import container
 from monitoring.domain.log_agent.agent_provision_context import (
     AgentProvisioningContext,
     PlatformType,
@@ -13,7 +14,6 @@ from monitoring.domain.log_agent.log_collector import (
 )
 from monitoring.domain.log_agent.log_router import LogRouterConfigContext
 from monitoring.domain.log_agent.rendered_config import RenderedConfigFile
-from monitoring.infra.jinja2.jinja2_template_renderer import Jinja2TemplateRenderer
 from monitoring.service.i_log_agent.i_log_agent_provider import ILogAgentProvider
 from monitoring.service.i_template_renderer.template_renderer import ITemplateRenderer
 
@@ -24,8 +24,7 @@ class FileBeats(ILogAgentProvider):
     """
 
     def __init__(self):
-        # TODO: DI
-        self.template_provider: ITemplateRenderer = Jinja2TemplateRenderer()
+        self.template_provider = container.resolve(ITemplateRenderer)
 
     @override
     def create_log_collector_config(
@@ -92,8 +91,9 @@ class FileBeats(ILogAgentProvider):
             "logstash_conf.j2", context.model_dump()
         )
         data = rendered.encode()
+        # logstash_conf.j2에는 프로젝트별 값이 들어가지 않아 프로젝트끼리 공유할 수 있다
         return RenderedConfigFile(
-            filename=f"router_{context.project_id}.yml", content=data
+            filename=f"router_{context.project_id}.yml", content=data, shareable=True
         )
 
     @override
@@ -0,0 +1,133 @@
+import logging
+import socket
+import time
+
+from celery import Celery
+from celery.canvas import Signature
+from kombu import Producer
+
+from config import settings
+from config.celery import app as celery_app
+
+logger = logging.getLogger(__name__)
+
+
+class _CountingProducer(Producer):
+    """
+    발행에 성공한 메시지 수를 센다.
+    confirm 모드 채널에서는 delivery tag가 1부터 순서대로 매겨지므로 이 값이 마지막 tag가 된다.
+    """
+
+    published = 0
+
+    def publish(self, *args, **kwargs):
+        result = super().publish(*args, **kwargs)
+        self.published += 1
+        return result
+
+
+class _ConfirmTracker:
+    """채널의 basic.ack / basic.nack을 받아 아직 확인되지 않은 delivery tag를 추적한다."""
+
+    def __init__(self, channel):
+        self.pending: set[int] = set()
+        self.nacked: set[int] = set()
+        channel.events["basic_ack"].add(self._on_ack)
+        channel.events["basic_nack"].add(self._on_nack)
+        channel.confirm_select()
+
+    def _on_ack(self, delivery_tag: int, multiple: bool) -> None:
+        self._settle(delivery_tag, multiple, nacked=False)
+
+    def _on_nack(self, delivery_tag: int, multiple: bool) -> None:
+        self._settle(delivery_tag, multiple, nacked=True)
+
+    def _settle(self, delivery_tag: int, multiple: bool, nacked: bool) -> None:
+        tags = (
+            [tag for tag in self.pending if tag <= delivery_tag]
+            if multiple
+            else [delivery_tag]
+        )
+        for tag in tags:
+            self.pending.discard(tag)
+            if nacked:
+                self.nacked.add(tag)
+
+
+class ConfirmBatchPublisher:
+    """
+    여러 canvas를 broker 커넥션/채널 하나로 발행하고 publisher confirm은 마지막에 한꺼번에 기다린다.
+    - 앱 설정의 confirm_publish는 메시지마다 ack를 기다리므로(py-amqp) 이 커넥션에서만 끄고,
+      채널을 직접 confirm 모드로 바꿔 발행이 끝난 뒤 ack를 모아서 확인한다
+    - confirm을 지원하지 않는 transport(memory 등)는 발행 성공을 그대로 결과로 쓴다
+    - 중간에 재연결되면 delivery tag가 다시 매겨지므로 발행 재시도는 하지 않는다 (실패는 key별로 반환)
+    """
+
+    def __init__(
+        self,
+        app: Celery = celery_app,
+        confirm_timeout: float = settings.PROVISION_BULK_CONFIRM_TIMEOUT,
+    ):
+        self.app = app
+        self.confirm_timeout = confirm_timeout
+
+    def publish(self, workflows: dict[str, Signature]) -> dict[str, str | None]:
+        """
+        :param workflows: {key: 발행할 canvas}
+        :return: {key: 실패 사유 (성공이면 None)}
+        """
+        if not workflows:
+            return {}
+
+        transport_options = {
+            **(self.app.conf.broker_transport_options or {}),
+            "confirm_publish": False,
+        }
+        with self.app.connection_for_write(transport_options=transport_options) as conn:
+            try:
+                channel = conn.default_channel
+                tracker = (
+                    _ConfirmTracker(channel)
+                    if hasattr(channel, "confirm_select")
+                    else None
+                )
+            except Exception as e:
+                logger.error(f"[일괄 발행] broker 연결 실패: {e}")
+                return {key: f"broker 연결 실패: {e}" for key in workflows}
+
+            producer = _CountingProducer(channel)
+            results: dict[str, str | None] = {}
+            tags: dict[str, range] = {}
+            for key, workflow in workflows.items():
+                start = producer.published
+                try:
+                    workflow.apply_async(producer=producer, retry=False)
+                    results[key] = None
+                except Exception as e:
+                    logger.error(f"[일괄 발행] {key} 발행 실패: {e}")
+                    results[key] = f"발행 실패: {e}"
+                tags[key] = range(start + 1, producer.published + 1)
+                if tracker:
+                    tracker.pending.update(tags[key])
+
+            if tracker:
+                self._wait_for_confirms(conn, tracker)
+                for key, key_tags in tags.items():
+                    if results[key] is not None:
+                        continue
+                    if any(tag in tracker.nacked for tag in key_tags):
+                        results[key] = "broker가 메시지를 거부했습니다 (nack)"
+                    elif any(tag in tracker.pending for tag in key_tags):
+                        results[key] = "publisher confirm을 받지 못했습니다 (timeout)"
+            return results
+
+    def _wait_for_confirms(self, conn, tracker: _ConfirmTracker) -> None:
+        deadline = time.monotonic() + self.confirm_timeout
+        while tracker.pending and (remaining := deadline - time.monotonic()) > 0:
+            try:
+                conn.drain_events(timeout=remaining)
+            except (socket.timeout, TimeoutError):
+                break
+            except Exception as e:
+                logger.error(f"[일괄 발행] confirm 대기 중 오류: {e}")
+                break
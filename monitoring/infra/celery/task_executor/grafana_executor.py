@@ -1,9 +1,12 @@
+from enum import StrEnum
 from typing import Any
 
-from celery import chain
+from celery import chain, group
 from typing_extensions import override
 
 from monitoring.domain.visualization_platform import dashboard
+from monitoring.infra.celery.task_executor.batch_publisher import ConfirmBatchPublisher
+from monitoring.infra.celery.task_executor.workflow_dag import WorkflowDAG
 from monitoring.infra.celery.tasks.grafana_tasks import (
     task_create_grafana_dashboard,
     task_create_grafana_folder,
@@ -26,6 +29,7 @@ from monitoring.service.i_executors.excutor_DTO import (
     CreateServiceTokenDTO,
     CreateUserFolderDTO,
     DashboardProvisionDTO,
+    DashboardProvisionPlan,
     FinalizeDashboardDTO,
     ProvisionFailureDTO,
     SetFolderPermissionsDTO,
@@ -35,6 +39,36 @@ from monitoring.service.i_executors.visualization_platform_executor import (
 )
 
 
+class ProvisionStep(StrEnum):
+    FOLDER = "folder"
+    SERVICE_ACCOUNT = "service_account"
+    SERVICE_TOKEN = "service_token"
+    PERMISSIONS = "permissions"
+    DASHBOARD = "dashboard"
+    PUBLIC_DASHBOARD = "public_dashboard"
+    FINALIZE = "finalize"
+
+
+# 각 단계가 시작하기 전에 끝나 있어야 하는 단계
+# critical path: folder → dashboard → public_dashboard → finalize
+PROVISION_STEP_DEPENDENCIES: dict[ProvisionStep, list[ProvisionStep]] = {
+    ProvisionStep.FOLDER: [],
+    ProvisionStep.SERVICE_ACCOUNT: [],
+    ProvisionStep.SERVICE_TOKEN: [ProvisionStep.SERVICE_ACCOUNT],
+    ProvisionStep.PERMISSIONS: [ProvisionStep.FOLDER, ProvisionStep.SERVICE_ACCOUNT],
+    ProvisionStep.DASHBOARD: [ProvisionStep.FOLDER],
+    ProvisionStep.PUBLIC_DASHBOARD: [ProvisionStep.DASHBOARD],
+    ProvisionStep.FINALIZE: [
+        ProvisionStep.FOLDER,
+        ProvisionStep.SERVICE_ACCOUNT,
+        ProvisionStep.SERVICE_TOKEN,
+        ProvisionStep.PERMISSIONS,
+        ProvisionStep.DASHBOARD,
+        ProvisionStep.PUBLIC_DASHBOARD,
+    ],
+}
+
+
 class GrafanaTaskExecutor(VisualizationPlatformTaskExecutor):
     # ─────────────────────────────────────────────────────────────────────────────
     # Signature generators
@@ -133,7 +167,7 @@ class GrafanaTaskExecutor(VisualizationPlatformTaskExecutor):
             ),
         )
 
-    def build_dashboard_provision_chain(
+    def build_dashboard_provision_workflow(
         self,
         *,
         user_folder: CreateUserFolderDTO | None = None,
@@ -143,83 +177,100 @@ class GrafanaTaskExecutor(VisualizationPlatformTaskExecutor):
         dashboard: CreateDashboardDTO | None = None,
         public_dashboard: CreatePublicDashboardDTO | None = None,
         finalize_dashboard: FinalizeDashboardDTO | None = None,
+        link_error: Any | None = None,
     ) -> Any | None:
         """
-        - 모든 DTO는 None 허용
-        - 제공된 DTO만 순서대로 체인에 포함
-        - chain(*sigs)로 Canvas 객체를 반환, DTO가 하나도 없으면 None 반환
+        - 모든 DTO는 None 허용, 제공된 DTO만 워크플로우에 포함
+        - link_error: 어느 단계든 최종 실패하면 호출할 errback
+        - 단계 간 의존관계는 PROVISION_STEP_DEPENDENCIES를 따르며,
+          서로 독립적인 단계는 group/chord로 병렬 실행
+        - DTO가 하나도 없으면 None 반환
         """
-        sigs = []
+        dag = WorkflowDAG()
 
         if user_folder:
-            sigs.append(
+            dag.add(
+                ProvisionStep.FOLDER,
                 self.get_create_user_folder_sig(
                     task_id=user_folder.task_id,
                     user_id=user_folder.user_id,
                     folder_name=user_folder.folder_name,
-                )
+                ),
+                PROVISION_STEP_DEPENDENCIES[ProvisionStep.FOLDER],
             )
 
         if service_account:
-            sigs.append(
+            dag.add(
+                ProvisionStep.SERVICE_ACCOUNT,
                 self.get_create_service_account_sig(
                     task_id=service_account.task_id,
                     project_id=service_account.project_id,
                     account_name=service_account.account_name,
                     user_id=service_account.user_id,
-                )
+                ),
+                PROVISION_STEP_DEPENDENCIES[ProvisionStep.SERVICE_ACCOUNT],
             )
 
         if service_token:
-            sigs.append(
+            dag.add(
+                ProvisionStep.SERVICE_TOKEN,
                 self.get_create_service_token_sig(
                     task_id=service_token.task_id,
                     project_id=service_token.project_id,
                     token_name=service_token.token_name,
-                )
+                ),
+                PROVISION_STEP_DEPENDENCIES[ProvisionStep.SERVICE_TOKEN],
             )
 
         if permissions:
-            sigs.append(
+            dag.add(
+                ProvisionStep.PERMISSIONS,
                 self.get_set_folder_permissions_sig(
                     task_id=permissions.task_id,
                     user_id=permissions.user_id,
                     project_id=permissions.project_id,
-                )
+                ),
+                PROVISION_STEP_DEPENDENCIES[ProvisionStep.PERMISSIONS],
             )
 
         if dashboard:
-            sigs.append(
+            dag.add(
+                ProvisionStep.DASHBOARD,
                 self.get_create_dashboard_sig(
                     task_id=dashboard.task_id,
                     user_id=dashboard.user_id,
                     project_id=dashboard.project_id,
                     dashboard_title=dashboard.dashboard_title,
                     dashboard_config=dashboard.dashboard_config,
-                )
+                ),
+                PROVISION_STEP_DEPENDENCIES[ProvisionStep.DASHBOARD],
             )
 
         if public_dashboard:
-            sigs.append(
+            dag.add(
+                ProvisionStep.PUBLIC_DASHBOARD,
                 self.get_create_public_dashboard_sig(
                     task_id=public_dashboard.task_id,
                     project_id=public_dashboard.project_id,
-                )
+                ),
+                PROVISION_STEP_DEPENDENCIES[ProvisionStep.PUBLIC_DASHBOARD],
             )
 
         if finalize_dashboard:
-            sigs.append(
+            dag.add(
+                ProvisionStep.FINALIZE,
                 self.get_finalize_monitoring_project_sig(
                     task_id=finalize_dashboard.task_id,
                     user_id=finalize_dashboard.user_id,
                     project_id=finalize_dashboard.project_id,
-                )
+                ),
+                PROVISION_STEP_DEPENDENCIES[ProvisionStep.FINALIZE],
             )
 
-        return chain(*sigs) if sigs else None
+        return dag.build(link_error=link_error)
 
     # ─────────────────────────────────────────────────────────────────────────────
-    # Provision chain
+    # Provision workflow
     # ─────────────────────────────────────────────────────────────────────────────
 
     @override
@@ -236,11 +287,11 @@ class GrafanaTaskExecutor(VisualizationPlatformTaskExecutor):
         failure: ProvisionFailureDTO,
     ) -> str:
         """
-        - build_dashboard_provision_chain와 동일한 인자를 키워드로 받음
+        - build_dashboard_provision_workflow와 동일한 인자를 키워드로 받음
         - failure DTO는 에러 핸들러에 쓰일 task_id, project_id 포함
         - 반환값: failure.project_id (모니터링 프로젝트 ID)
         """
-        chain_sig = self.build_dashboard_provision_chain(
+        workflow_sig = self.build_dashboard_provision_workflow(
             user_folder=user_folder,
             service_account=service_account,
             service_token=service_token,
@@ -248,14 +299,63 @@ class GrafanaTaskExecutor(VisualizationPlatformTaskExecutor):
             dashboard=dashboard,
             public_dashboard=public_dashboard,
             finalize_dashboard=finalize_dashboard,
+            link_error=handle_monitoring_project_failure.si(
+                failure.task_id,
+                failure.project_id,
+            ),
         )
 
-        if chain_sig:
-            chain_sig.apply_async(
-                link_error=handle_monitoring_project_failure.si(
-                    failure.task_id,
-                    failure.project_id,
-                )
-            )
+        if workflow_sig:
+            workflow_sig.apply_async()
 
         return failure.project_id
+
+    @override
+    def dispatch_provision_dashboard_workflows(
+        self,
+        plans: list[DashboardProvisionPlan],
+        user_folder: CreateUserFolderDTO | None = None,
+    ) -> dict[str, str | None]:
+        """
+        - 프로젝트별 워크플로우를 만든 뒤 ConfirmBatchPublisher로 커넥션 하나에 발행
+        - user_folder가 있으면 chain(폴더, group(프로젝트 워크플로우...)) 하나로 묶는다.
+          (각 워크플로우의 폴더 의존은 이미 충족된 것으로 보므로 폴더가 먼저 끝나야 함)
+          폴더 실패 시 모든 프로젝트의 실패 처리를 호출하고, 발행 결과도 전 프로젝트가 공유한다
+        - 반환값: {project_id: 실패 사유 (성공이면 None)}
+        """
+        workflows: dict[str, Any] = {}
+        for plan in plans:
+            workflow_sig = self.build_dashboard_provision_workflow(
+                user_folder=plan.user_folder,
+                service_account=plan.service_account,
+                service_token=plan.service_token,
+                permissions=plan.permissions,
+                dashboard=plan.dashboard,
+                public_dashboard=plan.public_dashboard,
+                finalize_dashboard=plan.finalize_dashboard,
+                link_error=self._failure_sig(plan.failure),
+            )
+            if workflow_sig:
+                workflows[plan.project_id] = workflow_sig
+
+        results: dict[str, str | None] = {plan.project_id: None for plan in plans}
+        publisher = ConfirmBatchPublisher()
+        if user_folder is None:
+            results.update(publisher.publish(workflows))
+            return results
+
+        folder_sig = self.get_create_user_folder_sig(
+            task_id=user_folder.task_id,
+            user_id=user_folder.user_id,
+            folder_name=user_folder.folder_name,
+        )
+        for plan in plans:
+            folder_sig.link_error(self._failure_sig(plan.failure))
+        workflow = (
+            chain(folder_sig, group(*workflows.values())) if workflows else folder_sig
+        )
+        error = publisher.publish({user_folder.task_id: workflow})[user_folder.task_id]
+        return {project_id: error for project_id in results}
+
+    def _failure_sig(self, failure: ProvisionFailureDTO):
+        return handle_monitoring_project_failure.si(failure.task_id, failure.project_id)
@@ -0,0 +1,168 @@
+from dataclasses import dataclass, field
+
+from celery import chain, chord, group
+from celery.canvas import Signature
+
+
+@dataclass
+class WorkflowStep:
+    name: str
+    signature: Signature
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class _Unit:
+    """
+    앞 단계의 유일한 후속이자 앞 단계 하나에만 의존하는 단계들을 묶은 직렬 구간.
+    (예: 대시보드 → 퍼블릭 대시보드) 그룹 경계에서 기다리지 않도록 chain 하나로 보낸다.
+    """
+
+    steps: list[WorkflowStep] = field(default_factory=list)
+    level: int = 0
+
+    def to_signature(self) -> Signature:
+        sigs = [step.signature for step in self.steps]
+        return sigs[0] if len(sigs) == 1 else chain(*sigs)
+
+
+class WorkflowDAG:
+    """
+    단계 간 의존관계를 선언하면 서로 독립적인 단계들을 group/chord로 병렬 실행하는
+    Celery canvas를 만든다.
+
+    dag = WorkflowDAG()
+    dag.add("folder", folder_sig)
+    dag.add("account", account_sig)
+    dag.add("permissions", perm_sig, depends_on=["folder", "account"])
+    canvas = dag.build(link_error=on_failure_sig)  # chord(group(folder, account), permissions)
+
+    - 등록되지 않은 단계에 대한 의존은 이미 충족된 것으로 본다. (이미 만들어진 리소스라 건너뛴 단계)
+    - 단계들을 의존 깊이(level)별 group으로 묶고, 각 group을 다음 level의 chord header로 둔다.
+      (각 group은 앞 group이 모두 끝난 뒤 실행된다)
+    """
+
+    def __init__(self):
+        self._steps: dict[str, WorkflowStep] = {}
+
+    def add(
+        self, name: str, signature: Signature, depends_on: list[str] | None = None
+    ) -> "WorkflowDAG":
+        if name in self._steps:
+            raise ValueError(f"이미 등록된 단계입니다: {name}")
+        self._steps[name] = WorkflowStep(name, signature, tuple(depends_on or ()))
+        return self
+
+    def build(self, link_error: Signature | None = None) -> Signature | None:
+        """
+        link_error: 어느 단계든 최종 실패하면 호출할 errback.
+        chord.link_error는 body에만 걸리므로(header 실패 시 바깥 chord의 errback이 누락됨)
+        canvas 전체가 아니라 각 단계 signature에 직접 건다.
+        """
+        if not self._steps:
+            return None
+
+        if link_error is not None:
+            for step in self._steps.values():
+                step.signature.link_error(link_error)
+
+        deps = {
+            name: [d for d in step.depends_on if d in self._steps]
+            for name, step in self._steps.items()
+        }
+        order = self._topological_order(deps)
+        deps = self._reduce(deps)
+        dependents: dict[str, list[str]] = {name: [] for name in self._steps}
+        for name in order:
+            for d in deps[name]:
+                dependents[d].append(name)
+
+        units = self._make_units(order, deps, dependents)
+        levels: list[list[_Unit]] = []
+        for unit in units:
+            while len(levels) <= unit.level:
+                levels.append([])
+            levels[unit.level].append(unit)
+
+        # 뒤에서부터 감싼다: 여러 단위가 있는 level은 chord(header=group, body=나머지)
+        workflow: Signature | None = None
+        for level in reversed(levels):
+            if workflow is not None and len(level) > 1:
+                # chord header의 결과가 저장돼야 body가 실행된다 (CELERY_TASK_IGNORE_RESULT 무시)
+                for unit in level:
+                    for step in unit.steps:
+                        step.signature.set(ignore_result=False)
+            sigs = [unit.to_signature() for unit in level]
+            if workflow is None:
+                workflow = sigs[0] if len(sigs) == 1 else group(*sigs)
+            elif len(sigs) == 1:
+                workflow = chain(sigs[0], workflow)
+            else:
+                workflow = chord(group(*sigs), workflow)
+        return workflow
+
+    @staticmethod
+    def _reduce(deps: dict[str, list[str]]) -> dict[str, list[str]]:
+        """
+        다른 의존을 거쳐 이미 보장되는 의존은 뺀다. (transitive reduction, 순환이 없다는 전제)
+        예: finalize → dashboard 는 finalize → public_dashboard → dashboard 로 보장됨
+        """
+
+        def ancestors(name: str, seen: set[str]) -> set[str]:
+            for d in deps[name]:
+                if d not in seen:
+                    seen.add(d)
+                    ancestors(d, seen)
+            return seen
+
+        reduced: dict[str, list[str]] = {}
+        for name, ds in deps.items():
+            implied: set[str] = set()
+            for d in ds:
+                implied |= ancestors(d, set())
+            reduced[name] = [d for d in ds if d not in implied]
+        return reduced
+
+    def _topological_order(self, deps: dict[str, list[str]]) -> list[str]:
+        # 등록 순서를 유지하는 Kahn 알고리즘
+        dependents: dict[str, list[str]] = {name: [] for name in deps}
+        for name, ds in deps.items():
+            for d in ds:
+                dependents[d].append(name)
+
+        remaining = {name: len(ds) for name, ds in deps.items()}
+        ready = [name for name in deps if remaining[name] == 0]
+        order: list[str] = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for nxt in dependents[name]:
+                remaining[nxt] -= 1
+                if remaining[nxt] == 0:
+                    ready.append(nxt)
+
+        if len(order) != len(deps):
+            cycle = [name for name in deps if name not in order]
+            raise ValueError(f"순환 의존이 있습니다: {cycle}")
+        return order
+
+    def _make_units(
+        self,
+        order: list[str],
+        deps: dict[str, list[str]],
+        dependents: dict[str, list[str]],
+    ) -> list[_Unit]:
+        unit_of: dict[str, _Unit] = {}
+        units: list[_Unit] = []
+        for name in order:
+            step = self._steps[name]
+            ds = deps[name]
+            if len(ds) == 1 and len(dependents[ds[0]]) == 1:
+                unit = unit_of[ds[0]]
+                unit.steps.append(step)
+            else:
+                unit = _Unit(steps=[step])
+                unit.level = max((unit_of[d].level + 1 for d in ds), default=0)
+                units.append(unit)
+            unit_of[name] = unit
+        return units
@@ -0,0 +1,91 @@
+import logging
+import threading
+import uuid
+
+from redis import Redis
+
+from config import settings
+from monitoring.domain.i_repo.i_task_result_repo import ITaskResultRepo
+
+logger = logging.getLogger(__name__)
+
+FLUSH_LOCK_KEY = "task_status:flush_lock"
+
+# KEYS[1]=lock 키 / ARGV[1]=token
+# flush가 lock ttl보다 길어져 다른 프로세스가 락을 가져간 경우 그 락은 지우지 않는다
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class TaskStatusFlusher:
+    """
+    버퍼에 쌓인 태스크 상태 전이를 주기적으로 DB에 반영하는 daemon 스레드.
+    워커 프로세스마다 하나씩 뜨지만 Redis 락으로 한 번에 한 프로세스만 flush 한다.
+    """
+
+    def __init__(
+        self,
+        repo: ITaskResultRepo,
+        client: Redis,
+        interval: float = settings.TASK_STATUS_FLUSH_INTERVAL,
+        batch_size: int = settings.TASK_STATUS_FLUSH_BATCH_SIZE,
+    ):
+        self.repo = repo
+        self.client = client
+        self.interval = interval
+        self.batch_size = batch_size
+        self._release = client.register_script(_RELEASE_SCRIPT)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="task-status-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """스레드를 멈추고 남은 버퍼를 마지막으로 한 번 더 반영"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._flush_safely()
+
+    def flush(self) -> int:
+        """다른 프로세스가 flush 중이면 건너뛴다. 반영한 개수를 반환"""
+        # 락 ttl은 한 번의 flush가 끝나기에 충분하고, 프로세스가 죽어도 다음 주기엔 풀리도록
+        lock_ttl_ms = max(int(self.interval * 1000) * 10, 10_000)
+        token = str(uuid.uuid4())
+        if not self.client.set(FLUSH_LOCK_KEY, token, nx=True, px=lock_ttl_ms):
+            return 0
+        try:
+            total = 0
+            while True:
+                flushed = self.repo.flush_buffered(self.batch_size)
+                total += flushed
+                if flushed < self.batch_size:
+                    return total
+        finally:
+            if not self._release(keys=[FLUSH_LOCK_KEY], args=[token]):
+                logger.warning("태스크 상태 flush 락이 이미 만료된 상태에서 해제")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._flush_safely()
+
+    def _flush_safely(self) -> None:
+        try:
+            flushed = self.flush()
+            if flushed:
+                logger.debug(f"태스크 상태 {flushed}건 DB 반영")
+        except Exception as e:
+            # 반영 못 한 항목은 버퍼에 남아 있으므로 다음 주기에 다시 시도
+            logger.warning(f"태스크 상태 flush 실패: {e}")
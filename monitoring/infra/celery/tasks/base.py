@@ -1,19 +1,30 @@
 import logging
-import uuid
+import random
 
+import httpx
 from celery import Task
 from celery.exceptions import Ignore
 from django.utils import timezone
 
+from common.container import container
+from config import settings
+from monitoring.domain.i_repo.i_task_result_repo import ITaskResultRepo
 from monitoring.domain.task_result import TaskStatus
-from monitoring.infra.models.task_result_model import TaskResultModel
+from monitoring.infra.grafana.grafana_http_client import parse_retry_after
 from monitoring.infra.redis.redis_client import redis_client
+from monitoring.infra.redis.task_lock import AcquireResult, TaskLock
+from monitoring.service.i_progress.i_provision_progress_notifier import (
+    IProvisionProgressNotifier,
+)
 
 logger = logging.getLogger(__name__)
 
 LOCK_EXPIRE = 10
 PROC_EXPIRE = 60 * 60 * 24
 
+task_result_repo = container.lazy(ITaskResultRepo)
+progress_notifier = container.lazy(IProvisionProgressNotifier)
+
 
 class LockingTask(Task):
     abstract = True
@@ -28,35 +39,48 @@ class LockingTask(Task):
             args = (task_result_id, *rest)
 
         task_result_id = args[0]
-        lock_key = f"lock:dashboard:{task_result_id}"
-        proc_key = f"done:dashboard:{task_result_id}"
-        token = str(uuid.uuid4())
+        lock = TaskLock(
+            redis_client,
+            lock_key=f"lock:dashboard:{task_result_id}",
+            done_key=f"done:dashboard:{task_result_id}",
+            lock_ttl=LOCK_EXPIRE,
+            done_ttl=PROC_EXPIRE,
+        )
 
         logger.info(f"태스크 실행 시작: {self.name}, ID: {task_result_id}")
 
         try:
-            if redis_client.exists(proc_key):
+            # 완료 여부 확인 + 락 획득을 한 번에
+            acquired = lock.acquire()
+            if acquired == AcquireResult.DONE:
                 if hasattr(self.request, "acknowledge"):
                     self.request.acknowledge()
                 raise Ignore(f"{task_result_id} already processed")
 
-            if not redis_client.set(lock_key, token, nx=True, ex=LOCK_EXPIRE):
+            if acquired == AcquireResult.BUSY:
                 if hasattr(self.request, "acknowledge"):
                     self.request.acknowledge()
                 raise Ignore(f"Task {task_result_id} is already running")
 
+            # 실행이 LOCK_EXPIRE보다 길어져도 다른 워커가 락을 가져가지 않도록 연장
+            lock.start_heartbeat()
+
             # 태스크 실행
             result = self.run(*args, **kwargs)
             logger.info(f"태스크 {task_result_id} 성공적으로 완료: {result}")
 
+            # 완료 표시 + 락 해제를 한 번에
+            lock.release_and_mark_done()
+
             # 성공 시 retries 카운트도 함께 저장
-            redis_client.set(proc_key, "1", ex=PROC_EXPIRE)
-            TaskResultModel.objects.filter(id=task_result_id).update(
+            task_result_repo.record_status(
+                task_result_id,
                 status=TaskStatus.SUCCESS,
                 result=result,
                 retries=self.request.retries,
                 date_done=timezone.now(),
             )
+            progress_notifier.publish_step_status(task_result_id, TaskStatus.SUCCESS)
             return result
 
         except Ignore:
@@ -65,12 +89,29 @@ class LockingTask(Task):
 
         except Exception as exc:
             logger.error(f"태스크 {task_result_id} 실행 중 오류: {exc}", exc_info=True)
-            raise self.retry(exc=exc)
+            raise self.retry(exc=exc, countdown=self._retry_countdown(exc))
 
         finally:
-            try:
-                if redis_client.get(lock_key) == token:
-                    redis_client.delete(lock_key)
-            except Exception as cleanup_exc:
-                logger.error(f"락 해제 중 오류: {cleanup_exc}")
-                raise self.retry(exc=cleanup_exc)
+            if lock.owned:
+                try:
+                    lock.release()
+                except Exception as cleanup_exc:
+                    logger.error(f"락 해제 중 오류: {cleanup_exc}")
+                    raise self.retry(
+                        exc=cleanup_exc, countdown=self._retry_countdown(cleanup_exc)
+                    )
+
+    def _retry_countdown(self, exc: Exception) -> float:
+        """
+        고정 간격 대신 full jitter 지수 backoff로 재시도 시각을 흩뜨린다.
+        서버가 기다릴 시간을 알려준 경우(GrafanaRateLimited, 429 Retry-After)에는 그 뒤로 미룬다.
+        """
+        base = self.default_retry_delay or 1
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is None and isinstance(exc, httpx.HTTPStatusError):
+            retry_after = parse_retry_after(exc.response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return retry_after + random.uniform(0, base)
+        return random.uniform(
+            0, min(settings.TASK_RETRY_BACKOFF_MAX, base * 2**self.request.retries)
+        )
@@ -3,6 +3,7 @@ from typing import Any
 
 from django.db import transaction
 
+from common.container import container
 from monitoring.domain.i_repo.i_task_result_repo import ITaskResultRepo
 from monitoring.domain.i_repo.i_visualization_platform_repo.i_dashbaord_repo import (
     IDashboardRepo,
@@ -28,31 +29,17 @@ from monitoring.domain.visualization_platform.folder import (
 )
 from monitoring.domain.visualization_platform.service_account import ServiceAccount
 from monitoring.infra.celery.tasks.utils import locking_task
-from monitoring.infra.grafana.grafana_api import GrafanaAPI
-from monitoring.infra.repo.task_result_repo import TaskResultRepo
-from monitoring.infra.repo.visualization_platform_repo.dashboard_repo import (
-    DashboardRepo,
-    PublicDashboardRepo,
-)
-from monitoring.infra.repo.visualization_platform_repo.folder_permission_repo import (
-    FolderPermissionRepo,
-)
-from monitoring.infra.repo.visualization_platform_repo.folder_repo import FolderRepo
-from monitoring.infra.repo.visualization_platform_repo.service_account_repo import (
-    ServiceAccountRepo,
-)
 from monitoring.service.i_visualization_platform.i_visualization_platform_provider import (
     VisualizationPlatformProvider,
 )
 
-# TODO: DI 적용 예정
-grafana_api: VisualizationPlatformProvider = GrafanaAPI()
-task_result_repo: ITaskResultRepo = TaskResultRepo()
-folder_repo: IFolderRepo = FolderRepo()
-service_account_repo: IServiceAccountRepo = ServiceAccountRepo()
-folder_permission_repo: IFolderPermissionRepo = FolderPermissionRepo()
-dashboard_repo: IDashboardRepo = DashboardRepo()
-public_dashboard_repo: IPublicDashboardRepo = PublicDashboardRepo()
+grafana_api = container.lazy(VisualizationPlatformProvider)
+task_result_repo = container.lazy(ITaskResultRepo)
+folder_repo = container.lazy(IFolderRepo)
+service_account_repo = container.lazy(IServiceAccountRepo)
+folder_permission_repo = container.lazy(IFolderPermissionRepo)
+dashboard_repo = container.lazy(IDashboardRepo)
+public_dashboard_repo = container.lazy(IPublicDashboardRepo)
 
 
 @locking_task(max_retries=3, default_retry_delay=2)
@@ -0,0 +1,18 @@
+import logging
+
+from celery import shared_task
+
+from monitoring.service.task_result_retention_service import TaskResultRetentionService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def purge_expired_task_results():
+    """
+    celery beat으로 매일 실행 (CELERY_BEAT_SCHEDULE).
+    LockingTask가 아니므로 task_result_model에 자기 상태를 남기지 않는다.
+    """
+    service = TaskResultRetentionService()
+    deleted = service.purge(service.default_policies())
+    logger.info(f"[task result 정리] 완료: {dict(deleted)}")
@@ -2,18 +2,21 @@ import logging
 
 from django.db import transaction
 
+from common.container import container
 from monitoring.domain.i_repo.i_monitoring_project_repo import IMonitoringProjectRepo
 from monitoring.domain.i_repo.i_visualization_platform_repo.i_folder_repo import (
     IFolderRepo,
 )
 from monitoring.domain.monitoring_project import ProjectStatus
 from monitoring.infra.celery.tasks.utils import locking_task
-from monitoring.infra.repo.monitoring_project_repo import MonitoringProjectRepo
-from monitoring.infra.repo.visualization_platform_repo.folder_repo import FolderRepo
+from monitoring.service.i_progress.i_provision_progress_notifier import (
+    IProvisionProgressNotifier,
+)
 
 logger = logging.getLogger(__name__)
-project_repo: IMonitoringProjectRepo = MonitoringProjectRepo()
-folder_repo: IFolderRepo = FolderRepo()
+project_repo = container.lazy(IMonitoringProjectRepo)
+folder_repo = container.lazy(IFolderRepo)
+progress_notifier = container.lazy(IProvisionProgressNotifier)
 
 
 @locking_task(max_retries=0, default_retry_delay=0)
@@ -32,6 +35,7 @@ def finalize_monitoring_project(
             status=ProjectStatus.READY.value,
             user_folder_id=user_folder_id,
         )
+    progress_notifier.publish_project_status(monitoring_project_id, ProjectStatus.READY)
     logger.info(f"[프로비저닝 완료] 프로젝트 {monitoring_project_id}")
 
 
@@ -40,4 +44,7 @@ def handle_monitoring_project_failure(self, task_id: str, monitoring_project_id:
     project_repo.update_fields(
         project_id=monitoring_project_id, status=ProjectStatus.FAILED.value
     )
+    progress_notifier.publish_project_status(
+        monitoring_project_id, ProjectStatus.FAILED
+    )
     logger.error(f"[프로비저닝 실패] 프로젝트")
@@ -2,15 +2,28 @@ from celery.exceptions import Ignore
 from celery.signals import task_failure, task_prerun
 from django.utils import timezone
 
+from common.container import container
 from monitoring.domain.i_repo.i_task_result_repo import ITaskResultRepo
 from monitoring.domain.task_result import TaskStatus
-from monitoring.infra.repo.task_result_repo import TaskResultRepo
+from monitoring.infra.celery.task_status_flusher import TaskStatusFlusher
+from monitoring.infra.celery.tasks.base import LockingTask
+from monitoring.infra.redis.redis_client import redis_client
+from monitoring.service.i_progress.i_provision_progress_notifier import (
+    IProvisionProgressNotifier,
+)
 
-repo: ITaskResultRepo = TaskResultRepo()
+repo = container.lazy(ITaskResultRepo)
+progress_notifier = container.lazy(IProvisionProgressNotifier)
+# 워커 프로세스 시작/종료 시 config.celery에서 start/stop
+status_flusher = TaskStatusFlusher(repo, redis_client)
 
 
 @task_prerun.connect
 def pre_task_handler(sender=None, task_id=None, task=None, args=None, **kwargs):
+    # task_result_model로 상태를 관리하는 태스크만 (beat 정리 작업 등은 제외)
+    if not isinstance(task, LockingTask):
+        return
+
     task_result_id = args[0]
 
     task_result = repo.find_by_task_id(task_result_id)
@@ -30,10 +43,13 @@ def pre_task_handler(sender=None, task_id=None, task=None, args=None, **kwargs):
         raise Ignore(f"{task_result_id} already failed")
 
     if task_result.status == TaskStatus.PENDING:
-        task_result.status = TaskStatus.STARTED
-        task_result.date_started = timezone.now()  # datetime 객체
-        task_result.date_done = None
-        repo.update(task_result)
+        repo.record_status(
+            task_result_id,
+            status=TaskStatus.STARTED,
+            date_started=timezone.now(),
+            date_done=None,
+        )
+        progress_notifier.publish_step_status(task_result_id, TaskStatus.STARTED)
         return
 
     if task_result.status == TaskStatus.STARTED:
@@ -51,12 +67,16 @@ def mark_failure(
     einfo=None,
     **_kwargs,
 ):
+    if not isinstance(sender, LockingTask):
+        return
+
     task_result_id = args[0]
     retries = getattr(sender.request, "retries", 0)
-    repo.update_fields(
-        task_id=task_result_id,
+    repo.record_status(
+        task_result_id,
         status=TaskStatus.FAILURE,
         traceback=str(exception),
         retries=retries,
         date_done=timezone.now(),
     )
+    progress_notifier.publish_step_status(task_result_id, TaskStatus.FAILURE)
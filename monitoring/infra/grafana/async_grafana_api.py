@@ -0,0 +1,156 @@
+import logging
+from typing import Any
+
+import httpx
+from typing_extensions import override
+
+from config import settings
+from config.settings import GRAFANA_ADMIN_API_KEY, GRAFANA_URL
+from monitoring.infra.grafana.grafana_api import build_public_dashboard_url
+from monitoring.infra.grafana.grafana_http_client import (
+    AsyncGrafanaHttpClient,
+    grafana_circuit_breaker,
+    grafana_rate_limiter,
+)
+from monitoring.service.i_visualization_platform.i_visualization_platform_provider import (
+    AsyncVisualizationPlatformProvider,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGrafanaAPI(AsyncVisualizationPlatformProvider):
+    """
+    GrafanaAPI의 httpx.AsyncClient 버전. 요청/응답 형식은 GrafanaAPI와 동일하다.
+
+    async with AsyncGrafanaAPI(pool_size=20) as grafana_api:
+        await grafana_api.create_folder("title")
+    """
+
+    def __init__(self, pool_size: int = settings.GRAFANA_BATCH_CONCURRENCY):
+        self.base_url = GRAFANA_URL
+        self.admin_api_key = GRAFANA_ADMIN_API_KEY
+        self.headers = {
+            "Authorization": f"Bearer {self.admin_api_key}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        self.pool_size = pool_size
+        self._http: AsyncGrafanaHttpClient | None = None
+
+    @override
+    async def __aenter__(self) -> "AsyncGrafanaAPI":
+        self._http = AsyncGrafanaHttpClient(
+            self.base_url,
+            self.headers,
+            pool_size=self.pool_size,
+            rate_limiter=grafana_rate_limiter(),
+            circuit_breaker=grafana_circuit_breaker(),
+        )
+        return self
+
+    @override
+    async def __aexit__(self, *exc: Any) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    @property
+    def http(self) -> AsyncGrafanaHttpClient:
+        if self._http is None:
+            raise RuntimeError(
+                "AsyncGrafanaAPI는 async with 블록 안에서 사용해야 합니다."
+            )
+        return self._http
+
+    async def _post(self, path: str, data: dict[str, Any]) -> httpx.Response:
+        response = await self.http.request("POST", path, json=data)
+        if response.status_code != 200:
+            logger.error(f"Grafana error response: {response.text}")
+            response.raise_for_status()
+        return response
+
+    async def _get(self, path: str) -> httpx.Response:
+        response = await self.http.request("GET", path)
+        response.raise_for_status()
+        return response
+
+    @override
+    async def create_folder(self, title: str) -> dict[str, Any]:
+        response = await self._post("/api/folders", {"title": title})
+        return response.json()
+
+    @override
+    async def create_service_account(
+        self, name: str, role: str = "Viewer"
+    ) -> dict[str, Any]:
+        response = await self._post(
+            "/api/serviceaccounts", {"name": name, "role": role}
+        )
+        return response.json()
+
+    @override
+    async def create_service_token(
+        self, service_account_id: str, token_name: str
+    ) -> dict[str, Any]:
+        response = await self._post(
+            f"/api/serviceaccounts/{service_account_id}/tokens", {"name": token_name}
+        )
+        return response.json()
+
+    @override
+    async def set_folder_permissions(
+        self, folder_uid: str, service_account_id: str, permission: int = 1
+    ) -> dict[str, Any]:
+        data = {
+            "items": [{"userId": int(service_account_id), "permission": permission}]
+        }
+        response = await self._post(f"/api/folders/{folder_uid}/permissions", data)
+        return response.json()
+
+    @override
+    async def create_dashboard(
+        self, dashboard_data: dict[str, Any], folder_uid: str
+    ) -> dict[str, Any]:
+        data = {
+            "dashboard": dashboard_data,
+            "overwrite": True,
+            "folderUid": folder_uid,
+        }
+        response = await self._post("/api/dashboards/db", data)
+        return response.json()
+
+    @override
+    async def create_public_dashboard(self, dashboard_uid: str) -> dict[str, Any]:
+        data = {
+            "isEnabled": True,
+            "timeSelectionEnabled": True,
+            "annotationsEnabled": True,
+            "share": "public",
+        }
+        response = await self._post(
+            f"/api/dashboards/uid/{dashboard_uid}/public-dashboards", data
+        )
+        result = response.json()
+        access_token = result.get("accessToken")
+
+        if access_token:
+            result["publicUrl"] = build_public_dashboard_url(
+                self.base_url, access_token
+            )
+        return result
+
+    @override
+    async def get_folders(self) -> list[dict[str, Any]]:
+        response = await self._get("/api/folders")
+        return response.json()
+
+    @override
+    async def get_public_dashboard(self, public_dashboard_uid: str) -> dict[str, Any]:
+        response = await self._get(f"/api/public-dashboards/{public_dashboard_uid}")
+        return response.json()
+
+    @override
+    async def get_dashboard(self, uid: str) -> dict[str, Any]:
+        response = await self._get(f"/api/dashboards/uid/{uid}")
+        return response.json()
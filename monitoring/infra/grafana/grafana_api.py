@@ -1,15 +1,29 @@
+import logging
 from typing import Any
 from unittest.util import strclass
 
-import requests
+import httpx
 from typing_extensions import override
 
 from config import settings
 from config.settings import GRAFANA_ADMIN_API_KEY, GRAFANA_URL
+from monitoring.infra.grafana.grafana_http_client import (
+    GrafanaHttpClient,
+    get_grafana_http_client,
+)
 from monitoring.service.i_visualization_platform.i_visualization_platform_provider import (
     VisualizationPlatformProvider,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def build_public_dashboard_url(base_url: str, access_token: str) -> str:
+    grafana_local_url = base_url
+    if settings.ENV == "localhost":
+        grafana_local_url = "http://localhost:3000"
+    return f"{grafana_local_url}/public-dashboards/{access_token}"
+
 
 class GrafanaAPI(VisualizationPlatformProvider):
     def __init__(self):
@@ -22,19 +36,33 @@ class GrafanaAPI(VisualizationPlatformProvider):
             "Accept": "application/json",
         }
 
+    @property
+    def http(self) -> GrafanaHttpClient:
+        # 워커 프로세스마다 커넥션 풀을 하나씩 두고 태스크 간에 재사용
+        return get_grafana_http_client(self.base_url, self.headers)
+
+    def _post(self, path: str, data: dict[str, Any]) -> httpx.Response:
+        response = self.http.request("POST", path, json=data)
+        if response.status_code != 200:
+            logger.error(f"Grafana error response: {response.text}")
+            response.raise_for_status()
+        return response
+
+    def _get(self, path: str) -> httpx.Response:
+        response = self.http.request("GET", path)
+        response.raise_for_status()
+        return response
+
     @override
     def create_folder(self, title: str) -> dict[str, Any]:
         """
         그라파나 폴더 생성
         param title: 폴더 제목
         """
-        url = f"{self.base_url}/api/folders"
+        path = "/api/folders"
         data = {"title": title}
 
-        response = requests.post(url, json=data, headers=self.headers)
-        if response.status_code != 200:
-            print("Error response:", response.text)
-            response.raise_for_status()
+        response = self._post(path, data)
         return response.json()
 
     @override
@@ -43,15 +71,12 @@ class GrafanaAPI(VisualizationPlatformProvider):
         서비스 계정 생성
         그라파나 12.0.0 버전 호환
         """
-        url = f"{self.base_url}/api/serviceaccounts"
+        path = "/api/serviceaccounts"
 
         # 그라파나 12.0.0 API 형식에 맞게 조정
         data = {"name": name, "role": role}
 
-        response = requests.post(url, json=data, headers=self.headers)
-        if response.status_code != 200:
-            print("Error response:", response.text)
-            response.raise_for_status()
+        response = self._post(path, data)
         return response.json()
 
     @override
@@ -63,13 +88,10 @@ class GrafanaAPI(VisualizationPlatformProvider):
         param service_account_id: 그라파나의 서비스 계정 ID
         return: token
         """
-        url = f"{self.base_url}/api/serviceaccounts/{service_account_id}/tokens"
+        path = f"/api/serviceaccounts/{service_account_id}/tokens"
         data = {"name": token_name}
 
-        response = requests.post(url, json=data, headers=self.headers)
-        if response.status_code != 200:
-            print("Error response:", response.text)
-            response.raise_for_status()
+        response = self._post(path, data)
         return response.json()
 
     @override
@@ -79,17 +101,14 @@ class GrafanaAPI(VisualizationPlatformProvider):
         """
         폴더 권한 설정 - Grafana 12.0.0 버전용
         """
-        url = f"{self.base_url}/api/folders/{folder_uid}/permissions"
+        path = f"/api/folders/{folder_uid}/permissions"
 
         # Grafana 12 호환 형식으로
         data = {
             "items": [{"userId": int(service_account_id), "permission": permission}]
         }
 
-        response = requests.post(url, json=data, headers=self.headers)
-        if response.status_code != 200:
-            print("Error response:", response.text)
-            response.raise_for_status()
+        response = self._post(path, data)
         return response.json()
 
     @override
@@ -99,17 +118,14 @@ class GrafanaAPI(VisualizationPlatformProvider):
         """
         대시보드 생성
         """
-        url = f"{self.base_url}/api/dashboards/db"
+        path = "/api/dashboards/db"
         data = {
             "dashboard": dashboard_data,
             "overwrite": True,
             "folderUid": folder_uid,
         }
 
-        response = requests.post(url, json=data, headers=self.headers)
-        if response.status_code != 200:
-            print("Error response:", response.text)
-            response.raise_for_status()
+        response = self._post(path, data)
 
         return response.json()
 
@@ -119,11 +135,7 @@ class GrafanaAPI(VisualizationPlatformProvider):
         퍼블릭 대시보드 생성 - 대시보드 UID를 받아 해당 대시보드의 퍼블릭 버전 생성
         생성된 퍼블릭 대시보드의 정보(UID, accessToken 등) 반환
         """
-        grafana_local_url = self.base_url
-        if settings.ENV == "localhost":
-            grafana_local_url = "http://localhost:3000"
-
-        url = f"{self.base_url}/api/dashboards/uid/{dashboard_uid}/public-dashboards"
+        path = f"/api/dashboards/uid/{dashboard_uid}/public-dashboards"
         data = {
             "isEnabled": True,
             "timeSelectionEnabled": True,
@@ -131,17 +143,13 @@ class GrafanaAPI(VisualizationPlatformProvider):
             "share": "public",  # 'public' 또는 'withToken'
         }
 
-        response = requests.post(url, json=data, headers=self.headers)
-
-        if response.status_code != 200:
-            print("Error response:", response.text)
-            response.raise_for_status()
+        response = self._post(path, data)
         result = response.json()
         access_token = result.get("accessToken")
 
         if access_token:
-            result["publicUrl"] = (
-                f"{grafana_local_url}/public-dashboards/{access_token}"
+            result["publicUrl"] = build_public_dashboard_url(
+                self.base_url, access_token
             )
         return result
 
@@ -150,10 +158,9 @@ class GrafanaAPI(VisualizationPlatformProvider):
         """
         view 권한을 가진 그라파나 폴더 목록 조회
         """
-        url = f"{self.base_url}/api/folders"
+        path = "/api/folders"
 
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
+        response = self._get(path)
 
         return response.json()
 
@@ -162,10 +169,9 @@ class GrafanaAPI(VisualizationPlatformProvider):
         """
         퍼블릭 대시보드 정보 조회
         """
-        url = f"{self.base_url}/api/public-dashboards/{public_dashboard_uid}"
+        path = f"/api/public-dashboards/{public_dashboard_uid}"
 
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
+        response = self._get(path)
         return response.json()
 
     @override
@@ -173,10 +179,9 @@ class GrafanaAPI(VisualizationPlatformProvider):
         """
         대시보드 정보 조회
         """
-        url = f"{self.base_url}/api/dashboards/uid/{uid}"
+        path = f"/api/dashboards/uid/{uid}"
 
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
+        response = self._get(path)
 
         return response.json()
 
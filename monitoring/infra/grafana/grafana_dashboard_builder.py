@@ -0,0 +1,90 @@
+import json
+import marshal
+import threading
+import uuid
+from typing import Any
+
+from monitoring.service.i_template_renderer.template_renderer import ITemplateRenderer
+
+JsonPath = tuple[str | int, ...]
+
+
+class DashboardSkeleton:
+    """
+    템플릿을 sentinel 값으로 한 번만 렌더링/파싱한 결과.
+    - payload: marshal로 직렬화한 대시보드 구조 (marshal.loads가 가장 싼 구조 복사)
+    - slots: 변수가 치환되는 문자열 위치(path)와 sentinel이 들어간 원본 문자열
+    """
+
+    def __init__(self, data: Any, sentinels: dict[str, str]):
+        self.sentinels = sentinels
+        self.slots: list[tuple[JsonPath, str]] = []
+        self._collect_slots(data, ())
+        self.payload = marshal.dumps(data)
+
+    def _collect_slots(self, node: Any, path: JsonPath) -> None:
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if any(sentinel in key for sentinel in self.sentinels.values()):
+                    raise ValueError(
+                        f"dict key에는 템플릿 변수를 쓸 수 없습니다: {key}"
+                    )
+                self._collect_slots(value, (*path, key))
+        elif isinstance(node, list):
+            for index, value in enumerate(node):
+                self._collect_slots(value, (*path, index))
+        elif isinstance(node, str):
+            if any(sentinel in node for sentinel in self.sentinels.values()):
+                self.slots.append((path, node))
+
+    def build(self, context: dict[str, Any]) -> dict[str, Any]:
+        data = marshal.loads(self.payload)
+        for path, raw in self.slots:
+            value = raw
+            for name, sentinel in self.sentinels.items():
+                if sentinel in value:
+                    value = value.replace(sentinel, str(context[name]))
+
+            node = data
+            for step in path[:-1]:
+                node = node[step]
+            node[path[-1]] = value
+        return data
+
+
+class GrafanaDashboardBuilder:
+    """
+    render → json.loads를 매 프로젝트마다 하지 않고,
+    미리 파싱해 둔 skeleton을 복사한 뒤 변수 위치만 patch 해서 대시보드 dict를 만든다.
+    문자열 값 안에만 변수가 들어가는 JSON 템플릿에 사용할 수 있다.
+    """
+
+    _skeletons: dict[str, DashboardSkeleton] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, template_renderer: ITemplateRenderer):
+        self.template_renderer = template_renderer
+
+    def build(self, template_name: str, context: dict[str, Any]) -> dict[str, Any]:
+        return self._get_skeleton(template_name, list(context.keys())).build(context)
+
+    def _get_skeleton(
+        self, template_name: str, variable_names: list[str]
+    ) -> DashboardSkeleton:
+        cache_key = f"{template_name}:{','.join(sorted(variable_names))}"
+        skeleton = self._skeletons.get(cache_key)
+        if skeleton is None:
+            with self._lock:
+                skeleton = self._skeletons.get(cache_key)
+                if skeleton is None:
+                    skeleton = self._parse(template_name, variable_names)
+                    self._skeletons[cache_key] = skeleton
+        return skeleton
+
+    def _parse(
+        self, template_name: str, variable_names: list[str]
+    ) -> DashboardSkeleton:
+        marker = uuid.uuid4().hex
+        sentinels = {name: f"@@{marker}:{name}@@" for name in variable_names}
+        rendered = self.template_renderer.render(template_name, sentinels)
+        return DashboardSkeleton(json.loads(rendered), sentinels)
@@ -0,0 +1,361 @@
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any
+
+import httpx
+
+from config import settings
+from monitoring.infra.redis.circuit_breaker import CircuitState, RedisCircuitBreaker
+from monitoring.infra.redis.rate_limiter import RedisRateLimiter, TokenBucket
+from monitoring.infra.redis.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+WRITE = "write"
+READ = "read"
+_READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+# 같은 요청을 다시 보내도 결과가 같은 메서드. POST는 5xx여도 이미 처리됐을 수 있다
+_IDEMPOTENT_METHODS = _READ_METHODS | {"PUT", "DELETE"}
+# Grafana가 살아 있지 않다고 볼 응답 (500은 요청 내용 때문에도 나므로 제외)
+_OUTAGE_STATUSES = {502, 503, 504}
+
+
+class GrafanaRateLimited(Exception):
+    """속도 제한 때문에 요청을 보내지 않은 경우. retry_after 뒤에 다시 시도하면 된다."""
+
+    def __init__(self, method: str, path: str, retry_after: float):
+        super().__init__(
+            f"Grafana 속도 제한 {method} {path}: {retry_after:.1f}s 뒤 재시도 필요"
+        )
+        self.retry_after = retry_after
+
+
+class GrafanaUnavailable(Exception):
+    """circuit이 열려 있어 요청을 보내지 않은 경우. retry_after 뒤에 다시 시도하면 된다."""
+
+    def __init__(self, method: str, path: str, retry_after: float):
+        super().__init__(
+            f"Grafana circuit open {method} {path}: {retry_after:.1f}s 뒤 재시도 필요"
+        )
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def grafana_rate_limiter() -> RedisRateLimiter | None:
+    if not settings.GRAFANA_RATE_LIMIT_ENABLED:
+        return None
+    return RedisRateLimiter(
+        redis_client,
+        buckets={
+            WRITE: TokenBucket(
+                rate=settings.GRAFANA_RATE_LIMIT_WRITE_RATE,
+                burst=settings.GRAFANA_RATE_LIMIT_WRITE_BURST,
+            ),
+            READ: TokenBucket(
+                rate=settings.GRAFANA_RATE_LIMIT_READ_RATE,
+                burst=settings.GRAFANA_RATE_LIMIT_READ_BURST,
+            ),
+        },
+        key_prefix="ratelimit:grafana:",
+        max_wait=settings.GRAFANA_RATE_LIMIT_MAX_WAIT,
+    )
+
+
+def grafana_circuit_breaker() -> RedisCircuitBreaker | None:
+    if not settings.GRAFANA_CIRCUIT_ENABLED:
+        return None
+    return RedisCircuitBreaker(
+        redis_client,
+        key="circuit:grafana",
+        failure_threshold=settings.GRAFANA_CIRCUIT_FAILURE_THRESHOLD,
+        failure_window=settings.GRAFANA_CIRCUIT_FAILURE_WINDOW,
+        recovery_timeout=settings.GRAFANA_CIRCUIT_RECOVERY_TIMEOUT,
+        success_threshold=settings.GRAFANA_CIRCUIT_SUCCESS_THRESHOLD,
+    )
+
+
+class _GrafanaRetryPolicy:
+    """
+    동기/비동기 client가 공유하는 재시도 + 속도 제한 + circuit breaker 정책.
+    - circuit이 열려 있으면 연결을 시도하지 않고 GrafanaUnavailable (재시도 중이던 요청도 중단)
+    - 요청마다 쓰기/읽기 버킷에서 토큰을 예약하고, 정해진 시간만큼 기다린 뒤 보낸다
+    - 연결 실패, 429, 멱등 메서드(GET/HEAD/OPTIONS/PUT/DELETE)의 5xx는 jitter를 준 지수 backoff로 재시도
+      (워커들이 같은 시각에 한꺼번에 다시 보내지 않도록)
+    - POST의 5xx는 재시도하지 않고 응답을 돌려준다 (태스크 단위 재시도에 맡김)
+    - Retry-After 헤더가 있으면 그 시간을 따르고, 같은 버킷을 쓰는 모든 워커도 멈추게 한다
+    """
+
+    def __init__(
+        self,
+        max_retries: int = settings.GRAFANA_HTTP_MAX_RETRIES,
+        backoff_factor: float = settings.GRAFANA_HTTP_BACKOFF_FACTOR,
+        backoff_max: float = settings.GRAFANA_HTTP_BACKOFF_MAX,
+        retry_statuses: list[int] = settings.GRAFANA_HTTP_RETRY_STATUSES,
+        rate_limiter: RedisRateLimiter | None = None,
+        circuit_breaker: RedisCircuitBreaker | None = None,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.retry_statuses = set(retry_statuses)
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+
+    def _admit(self, method: str, path: str) -> CircuitState:
+        """circuit이 요청을 허용하면 현재 상태, 아니면 GrafanaUnavailable"""
+        if self.circuit_breaker is None:
+            return CircuitState.CLOSED
+        decision = self.circuit_breaker.allow()
+        if not decision.allowed:
+            raise GrafanaUnavailable(method, path, decision.retry_after)
+        return decision.state
+
+    def _record_outcome(
+        self, state: CircuitState, response: httpx.Response | None
+    ) -> None:
+        """response가 None이면 연결/전송 실패"""
+        if self.circuit_breaker is None:
+            return
+        if response is None or response.status_code in _OUTAGE_STATUSES:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success(state)
+
+    @staticmethod
+    def _bucket(method: str) -> str:
+        return READ if method.upper() in _READ_METHODS else WRITE
+
+    def _reserve(self, method: str, path: str) -> float:
+        """요청 전에 기다릴 시간. 너무 오래 기다려야 하면 GrafanaRateLimited"""
+        if self.rate_limiter is None:
+            return 0.0
+        reservation = self.rate_limiter.reserve(self._bucket(method))
+        if not reservation.granted:
+            raise GrafanaRateLimited(method, path, reservation.wait)
+        return reservation.wait
+
+    def _pause_on_retry_after(self, method: str, response: httpx.Response) -> None:
+        if self.rate_limiter is None or response.status_code not in self.retry_statuses:
+            return
+        retry_after = self._retry_after(response)
+        if retry_after:
+            self.rate_limiter.pause(self._bucket(method), retry_after)
+
+    def _connect_failure_delay(
+        self, attempt: int, method: str, path: str, e: Exception
+    ) -> float | None:
+        """재시도할 경우 대기 시간, 포기할 경우 None"""
+        # 연결 자체가 안 된 경우는 요청이 처리되지 않았으므로 재시도해도 안전
+        if attempt >= self.max_retries:
+            return None
+        delay = self._backoff(attempt)
+        logger.warning(
+            f"Grafana 연결 실패 {method} {path}: {e}, {delay:.2f}s 후 재시도"
+        )
+        return delay
+
+    def _response_delay(
+        self, attempt: int, method: str, path: str, response: httpx.Response
+    ) -> float | None:
+        """재시도할 경우 대기 시간, 응답을 그대로 돌려줄 경우 None"""
+        if (
+            not self._is_retryable(method, response.status_code)
+            or attempt >= self.max_retries
+        ):
+            return None
+        delay = self._retry_after(response) or self._backoff(attempt)
+        logger.warning(
+            f"Grafana {response.status_code} {method} {path}, {delay:.2f}s 후 재시도"
+        )
+        return delay
+
+    def _is_retryable(self, method: str, status_code: int) -> bool:
+        if status_code not in self.retry_statuses:
+            return False
+        # 429는 요청을 처리하기 전에 거절한 것이라 메서드와 상관없이 재시도해도 안전
+        return status_code == 429 or method.upper() in _IDEMPOTENT_METHODS
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: 0 ~ min(상한, factor * 2^attempt)
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_factor * (2**attempt))
+        )
+
+    def _retry_after(self, response: httpx.Response) -> float | None:
+        return parse_retry_after(response.headers.get("Retry-After"))
+
+
+def _timeout(
+    connect_timeout: float, read_timeout: float, pool_timeout: float | None
+) -> httpx.Timeout:
+    return httpx.Timeout(
+        connect=connect_timeout,
+        read=read_timeout,
+        write=read_timeout,
+        pool=pool_timeout,
+    )
+
+
+def _limits(pool_size: int) -> httpx.Limits:
+    return httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+
+
+class GrafanaHttpClient(_GrafanaRetryPolicy):
+    """
+    Grafana 호출용 keep-alive 커넥션 풀 + 재시도 래퍼.
+    - 프로세스마다 하나의 httpx.Client를 공유 (get_grafana_http_client)
+    - connect/read timeout 적용
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        pool_size: int = settings.GRAFANA_HTTP_POOL_SIZE,
+        connect_timeout: float = settings.GRAFANA_HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = settings.GRAFANA_HTTP_READ_TIMEOUT,
+        **retry_options: Any,
+    ):
+        super().__init__(**retry_options)
+        self.client = httpx.Client(
+            base_url=base_url,
+            headers=headers,
+            timeout=_timeout(connect_timeout, read_timeout, connect_timeout),
+            limits=_limits(pool_size),
+        )
+
+    def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        attempt = 0
+        while True:
+            state = self._admit(method, path)
+            wait = self._reserve(method, path)
+            if wait:
+                time.sleep(wait)
+            try:
+                response = self.client.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                self._record_outcome(state, None)
+                if not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)):
+                    raise
+                delay = self._connect_failure_delay(attempt, method, path, e)
+                if delay is None:
+                    raise
+            else:
+                self._record_outcome(state, response)
+                self._pause_on_retry_after(method, response)
+                delay = self._response_delay(attempt, method, path, response)
+                if delay is None:
+                    return response
+
+            attempt += 1
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class AsyncGrafanaHttpClient(_GrafanaRetryPolicy):
+    """
+    GrafanaHttpClient의 asyncio 버전.
+    httpx.AsyncClient의 커넥션은 생성된 event loop에 묶이므로
+    프로세스 단위로 공유하지 않고, 사용하는 쪽에서 loop 안에서 만들고 닫는다.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        pool_size: int = settings.GRAFANA_HTTP_POOL_SIZE,
+        connect_timeout: float = settings.GRAFANA_HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = settings.GRAFANA_HTTP_READ_TIMEOUT,
+        **retry_options: Any,
+    ):
+        super().__init__(**retry_options)
+        # 동시 요청 수는 호출하는 쪽(batch의 semaphore)에서 제한하므로
+        # 풀 자리가 날 때까지 기다리는 시간에는 timeout을 두지 않는다
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=_timeout(connect_timeout, read_timeout, None),
+            limits=_limits(pool_size),
+        )
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        attempt = 0
+        while True:
+            # Redis 호출이 event loop를 막지 않도록 스레드에서
+            state = CircuitState.CLOSED
+            if self.circuit_breaker is not None:
+                state = await asyncio.to_thread(self._admit, method, path)
+            if self.rate_limiter is not None:
+                wait = await asyncio.to_thread(self._reserve, method, path)
+                if wait:
+                    await asyncio.sleep(wait)
+            try:
+                response = await self.client.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                if self.circuit_breaker is not None:
+                    await asyncio.to_thread(self._record_outcome, state, None)
+                if not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)):
+                    raise
+                delay = self._connect_failure_delay(attempt, method, path, e)
+                if delay is None:
+                    raise
+            else:
+                if self.circuit_breaker is not None and (
+                    state != CircuitState.CLOSED
+                    or response.status_code in _OUTAGE_STATUSES
+                ):
+                    await asyncio.to_thread(self._record_outcome, state, response)
+                if response.status_code in self.retry_statuses:
+                    await asyncio.to_thread(
+                        self._pause_on_retry_after, method, response
+                    )
+                delay = self._response_delay(attempt, method, path, response)
+                if delay is None:
+                    return response
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+_clients: dict[tuple[int, str], GrafanaHttpClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_grafana_http_client(
+    base_url: str, headers: dict[str, str]
+) -> GrafanaHttpClient:
+    """
+    프로세스(pid) 단위로 client를 재사용한다.
+    celery prefork처럼 fork 이후에는 부모의 소켓을 공유하지 않도록 새로 만든다.
+    """
+    key = (os.getpid(), base_url)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = GrafanaHttpClient(
+                    base_url=base_url,
+                    headers=headers,
+                    rate_limiter=grafana_rate_limiter(),
+                    circuit_breaker=grafana_circuit_breaker(),
+                )
+                _clients[key] = client
+    return client
@@ -0,0 +1,94 @@
+import json
+import multiprocessing
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+
+class _GrafanaStubHandler(BaseHTTPRequestHandler):
+    """
+    벤치마크/로컬 확인용 최소 Grafana 응답 흉내.
+    HTTP/1.1 keep-alive를 지원해서 커넥션 재사용 효과를 측정할 수 있다.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency: float = 0.0
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, body: Any, status: int = 200) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_GET(self) -> None:
+        if self.path == "/api/folders":
+            self._send([{"uid": "stub-folder", "title": "stub"}])
+        else:
+            self._send({"uid": "stub", "dashboard": {}})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+
+        if self.path == "/api/folders":
+            self._send({"uid": "stub-folder", "title": "stub", "orgId": 1})
+        elif self.path == "/api/serviceaccounts":
+            self._send({"id": 1, "name": "stub", "role": "Viewer", "isDisabled": False})
+        elif self.path.endswith("/tokens"):
+            self._send({"id": 1, "name": "stub", "key": "glsa_stub"})
+        elif self.path.endswith("/permissions"):
+            self._send({"message": "Folder permissions updated"})
+        elif self.path == "/api/dashboards/db":
+            self._send({"uid": "stub-dash", "url": "/d/stub-dash", "status": "success"})
+        elif self.path.endswith("/public-dashboards"):
+            self._send({"uid": "stub-public", "accessToken": "stub-token"})
+        else:
+            self._send({"message": "not found"}, status=404)
+
+
+def _serve(latency_ms: float, port_queue: "multiprocessing.Queue[int]") -> None:
+    handler = type(
+        "GrafanaStubHandler",
+        (_GrafanaStubHandler,),
+        {"latency": latency_ms / 1000},
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+class GrafanaStubServer:
+    """
+    별도 프로세스에서 stub을 띄운다.
+    같은 프로세스의 스레드로 띄우면 측정 대상 client와 GIL을 나눠 쓰느라 수치가 왜곡된다.
+    """
+
+    def __init__(self, latency_ms: float = 0.0):
+        port_queue: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+        self.process = multiprocessing.Process(
+            target=_serve, args=(latency_ms, port_queue), daemon=True
+        )
+        self.port_queue = port_queue
+        self.port: int | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "GrafanaStubServer":
+        self.process.start()
+        self.port = self.port_queue.get(timeout=10)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.process.terminate()
+        self.process.join()
@@ -1,7 +1,8 @@
 import json
 from typing import Any
 
-from monitoring.infra.jinja2.jinja2_template_renderer import Jinja2TemplateRenderer
+from common.container import container
+from monitoring.infra.grafana.grafana_dashboard_builder import GrafanaDashboardBuilder
 from monitoring.service.i_template_renderer.template_renderer import ITemplateRenderer
 from monitoring.service.i_visualization_platform.i_template_provider import (
     VisualizationPlatformTemplateProvider,
@@ -10,8 +11,8 @@ from monitoring.service.i_visualization_platform.i_template_provider import (
 
 class GrafanaTemplateProvider(VisualizationPlatformTemplateProvider):
     def __init__(self):
-        # TODO: DI
-        self.template_provider: ITemplateRenderer = Jinja2TemplateRenderer()
+        self.template_provider = container.resolve(ITemplateRenderer)
+        self.dashboard_builder = GrafanaDashboardBuilder(self.template_provider)
 
     def render_logs_dashboard_json(
         self,
@@ -20,16 +21,16 @@ class GrafanaTemplateProvider(VisualizationPlatformTemplateProvider):
         dashboard_uid: str,
         data_source_uid: str = "Elasticsearch",
     ) -> dict[str, Any]:
-        dash_board_json = self.template_provider.render(
-            "grafana_log_dashboard_json.j2",
-            {
-                "project_id": project_id,
-                "dashboard_title": dashboard_title,
-                "dashboard_uid": dashboard_uid,
-                "data_source_uid": data_source_uid,
-            },
-        )
+        # 템플릿은 최초 1회만 파싱하고, 이후에는 skeleton 복사 + 변수 위치 patch
         try:
-            return json.loads(dash_board_json)
+            return self.dashboard_builder.build(
+                "grafana_log_dashboard_json.j2",
+                {
+                    "project_id": project_id,
+                    "dashboard_title": dashboard_title,
+                    "dashboard_uid": dashboard_uid,
+                    "data_source_uid": data_source_uid,
+                },
+            )
         except json.JSONDecodeError as e:
             raise RuntimeError(f"로그 대시보드 JSON 파싱 실패: {e}")
@@ -1,6 +1,8 @@
+import threading
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
+from django.conf import settings
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from monitoring.service.i_template_renderer.template_renderer import ITemplateRenderer
 
@@ -8,12 +10,51 @@ from monitoring.service.i_template_renderer.template_renderer import ITemplateRe
 class Jinja2TemplateRenderer(ITemplateRenderer):
     """
     Jinja2로 템플릿을 렌더링하는 구현체.
+    Environment는 프로세스 전체에서 하나만 만들어 공유한다.
+    (인스턴스마다 Environment를 만들면 템플릿 파싱/컴파일 캐시를 매번 새로 채우게 됨)
     """
 
     DEFAULT_TEMPLATE_PATH = Path(__file__).parent / "template"
 
+    _shared_env: Environment | None = None
+    _env_lock = threading.Lock()
+
     def __init__(self):
-        self.env = Environment(loader=FileSystemLoader(self.DEFAULT_TEMPLATE_PATH))
+        self.env = self.get_shared_environment()
+
+    @classmethod
+    def get_shared_environment(cls) -> Environment:
+        if cls._shared_env is None:
+            with cls._env_lock:
+                if cls._shared_env is None:
+                    cls._shared_env = cls._create_environment()
+        return cls._shared_env
+
+    @classmethod
+    def _create_environment(cls) -> Environment:
+        cache_dir = settings.JINJA2_BYTECODE_CACHE_DIR
+        if cache_dir:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+
+        return Environment(
+            loader=FileSystemLoader(cls.DEFAULT_TEMPLATE_PATH),
+            # 컴파일된 바이트코드를 파일로 저장 → 프로세스 재시작/워커 fork 후에도 재사용
+            bytecode_cache=FileSystemBytecodeCache(directory=cache_dir or None),
+            # 운영에서는 매 렌더링마다 템플릿 파일 mtime을 확인하지 않음
+            auto_reload=settings.DEBUG,
+        )
+
+    @classmethod
+    def warm_up(cls) -> list[str]:
+        """
+        템플릿 디렉토리의 모든 템플릿을 미리 컴파일한다. (web/worker 시작 시 호출)
+        :return: 컴파일한 템플릿 이름 목록
+        """
+        env = cls.get_shared_environment()
+        names = env.list_templates(extensions=["j2"])
+        for name in names:
+            env.get_template(name)
+        return names
 
     def render(self, template_name: str, context: dict) -> str:
         tpl = self.env.get_template(template_name)
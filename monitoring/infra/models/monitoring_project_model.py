@@ -78,3 +78,10 @@ class MonitoringProjectModel(models.Model):
 
     class Meta:
         db_table = "monitoring_project"
+        indexes = [
+            # 내 프로젝트 목록 keyset 페이징용 (user_id, created_at, id)
+            models.Index(
+                fields=["user", "created_at", "id"],
+                name="mon_project_user_created_idx",
+            ),
+        ]
@@ -22,3 +22,11 @@ class TaskResultModel(models.Model):
 
     class Meta:
         db_table = "task_result_model"
+        indexes = [
+            # status별 보관 기간 정리: status = ? 안에서 (date_created, id) 순서로 chunk를 읽음
+            models.Index(
+                fields=["status", "date_created", "id"],
+                name="task_result_status_created",
+            ),
+            models.Index(fields=["date_created"], name="task_result_created"),
+        ]
@@ -0,0 +1,183 @@
+import logging
+from enum import Enum
+from typing import Any, NamedTuple
+
+from redis import Redis, RedisError
+
+logger = logging.getLogger(__name__)
+
+# 시각은 워커마다 시계가 다를 수 있으므로 Redis TIME을 쓴다.
+# KEYS[1]=상태 hash / ARGV[1]=recovery timeout(s)
+# 반환: {상태, 허용 여부, 다시 시도할 때까지 남은 시간(s)}
+_ALLOW_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local s = redis.call('HMGET', KEYS[1], 'state', 'open_until', 'issued', 'successes', 'probe_at')
+local state = s[1] or 'closed'
+if state == 'closed' then
+    return {state, 1, '0'}
+end
+local recovery = tonumber(ARGV[1])
+if state == 'open' then
+    local remaining = tonumber(s[2]) - now
+    if remaining > 0 then
+        return {state, 0, tostring(remaining)}
+    end
+    redis.call('HSET', KEYS[1], 'state', 'half_open', 'issued', 1, 'successes', 0, 'probe_at', now)
+    return {'half_open', 1, '0'}
+end
+-- half_open: probe가 하나 성공할 때마다 두 건씩 더 내보낸다 (1, 3, 5, ...)
+-- 결과를 알리지 못한 probe(워커 종료 등) 때문에 멈추지 않도록 recovery timeout이 지나면 다시 내보낸다
+local issued = tonumber(s[3])
+local idle = now - tonumber(s[5])
+if issued < 1 + 2 * tonumber(s[4]) or idle > recovery then
+    redis.call('HSET', KEYS[1], 'issued', issued + 1, 'probe_at', now)
+    return {state, 1, '0'}
+end
+return {state, 0, tostring(recovery - idle)}
+"""
+
+# KEYS[1]=상태 hash / ARGV[1]=닫기 위한 연속 성공 수
+_SUCCESS_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'state') ~= 'half_open' then
+    return 0
+end
+local t = redis.call('TIME')
+local successes = redis.call('HINCRBY', KEYS[1], 'successes', 1)
+if successes >= tonumber(ARGV[1]) then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+redis.call('HSET', KEYS[1], 'probe_at', tonumber(t[1]) + tonumber(t[2]) / 1000000)
+return 0
+"""
+
+# KEYS[1]=상태 hash, KEYS[2]=실패 카운터
+# ARGV[1]=열기 위한 실패 수, ARGV[2]=실패 집계 구간(s), ARGV[3]=recovery timeout(s)
+_FAILURE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HGET', KEYS[1], 'state') or 'closed'
+if state == 'open' then
+    return 0
+end
+if state == 'closed' then
+    local failures = redis.call('INCR', KEYS[2])
+    if failures == 1 then
+        redis.call('EXPIRE', KEYS[2], ARGV[2])
+    end
+    if failures < tonumber(ARGV[1]) then
+        return 0
+    end
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+redis.call('HSET', KEYS[1], 'state', 'open', 'open_until', now + tonumber(ARGV[3]))
+return 1
+"""
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitDecision(NamedTuple):
+    state: CircuitState
+    allowed: bool
+    retry_after: float  # 허용되지 않았을 때 다시 시도해볼 만한 시간
+
+
+class RedisCircuitBreaker:
+    """
+    모든 워커 프로세스가 Redis로 상태를 공유하는 circuit breaker.
+    - closed: failure_window 안에 실패가 failure_threshold번 쌓이면 open
+    - open: recovery_timeout 동안 요청을 보내지 않고 바로 거절
+    - half_open: probe를 1건부터 성공할 때마다 늘려가며 내보내고,
+      success_threshold번 성공하면 closed, 한 번이라도 실패하면 다시 open
+    - closed 상태의 성공은 기록하지 않으므로 정상 시 요청당 Redis 호출은 allow 한 번
+    - Redis 장애 시에는 요청을 막지 않는다 (fail open)
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        key: str,
+        failure_threshold: int,
+        failure_window: int,
+        recovery_timeout: float,
+        success_threshold: int,
+    ):
+        self.client = client
+        self.key = key
+        self.failures_key = f"{key}:failures"
+        self.failure_threshold = failure_threshold
+        self.failure_window = failure_window
+        self.recovery_timeout = recovery_timeout
+        self.success_threshold = success_threshold
+        self._allow = client.register_script(_ALLOW_SCRIPT)
+        self._success = client.register_script(_SUCCESS_SCRIPT)
+        self._failure = client.register_script(_FAILURE_SCRIPT)
+
+    def allow(self) -> CircuitDecision:
+        try:
+            state, allowed, retry_after = self._allow(
+                keys=[self.key], args=[self.recovery_timeout]
+            )
+        except RedisError as e:
+            logger.warning(f"[circuit] {self.key} 상태 조회 실패, 그대로 진행: {e}")
+            return CircuitDecision(CircuitState.CLOSED, True, 0.0)
+        return CircuitDecision(CircuitState(state), bool(allowed), float(retry_after))
+
+    def record_success(self, state: CircuitState) -> None:
+        if state != CircuitState.HALF_OPEN:
+            return
+        try:
+            if self._success(keys=[self.key], args=[self.success_threshold]):
+                logger.info(f"[circuit] {self.key} 복구 확인, closed로 전환")
+        except RedisError as e:
+            logger.warning(f"[circuit] {self.key} 성공 기록 실패: {e}")
+
+    def record_failure(self) -> None:
+        try:
+            opened = self._failure(
+                keys=[self.key, self.failures_key],
+                args=[
+                    self.failure_threshold,
+                    self.failure_window,
+                    self.recovery_timeout,
+                ],
+            )
+        except RedisError as e:
+            logger.warning(f"[circuit] {self.key} 실패 기록 실패: {e}")
+            return
+        if opened:
+            logger.error(
+                f"[circuit] {self.key} open: {self.recovery_timeout}s 동안 요청 차단"
+            )
+
+    def snapshot(self) -> dict[str, Any]:
+        """health/metrics 노출용 현재 상태"""
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.hgetall(self.key)
+            pipe.get(self.failures_key)
+            pipe.time()
+            raw, failures, (seconds, micros) = pipe.execute()
+        except RedisError as e:
+            return {"state": "unknown", "error": str(e)}
+
+        now = seconds + micros / 1_000_000
+        state = raw.get("state", CircuitState.CLOSED.value)
+        snapshot: dict[str, Any] = {
+            "state": state,
+            "recent_failures": int(failures or 0),
+            "failure_threshold": self.failure_threshold,
+        }
+        if state == CircuitState.OPEN:
+            snapshot["open_for"] = round(max(0.0, float(raw["open_until"]) - now), 3)
+        elif state == CircuitState.HALF_OPEN:
+            snapshot["probes_issued"] = int(raw["issued"])
+            snapshot["probe_successes"] = int(raw["successes"])
+            snapshot["success_threshold"] = self.success_threshold
+        return snapshot
@@ -0,0 +1,212 @@
+import json
+import logging
+import time
+from typing import AsyncIterator, Iterator
+
+from django.utils import timezone
+from redis import Redis, RedisError
+from redis.asyncio import Redis as AsyncRedis
+from typing_extensions import override
+
+from config import settings
+from monitoring.domain.monitoring_project import ProjectStatus
+from monitoring.domain.provision_progress import (
+    ProvisionEventType,
+    ProvisionProgressEvent,
+)
+from monitoring.domain.task_result import TaskStatus
+from monitoring.infra.redis.redis_client import async_redis_client, redis_client
+from monitoring.service.i_progress.i_provision_progress_notifier import (
+    IProvisionProgressNotifier,
+)
+
+logger = logging.getLogger(__name__)
+
+TASK_KEY_PREFIX = "provision:task:"  # task_id → {project, step}
+PROGRESS_KEY_PREFIX = "provision:progress:"  # project_id → {step: 최신 이벤트}
+CHANNEL_PREFIX = "provision:events:"  # project_id별 pub/sub 채널
+PROJECT_FIELD = "__project__"
+
+# 태스크 → 프로젝트/단계 조회, 스냅샷 갱신, PUBLISH를 한 번에 (1 round trip)
+# KEYS[1]=task 키 / ARGV: status, timestamp, progress prefix, channel prefix, ttl
+_PUBLISH_STEP_SCRIPT = """
+local info = redis.call('HMGET', KEYS[1], 'project', 'step')
+if not info[1] then
+    return -1
+end
+local event = cjson.encode({
+    project_id = info[1], type = 'step', step = info[2],
+    status = ARGV[1], timestamp = ARGV[2],
+})
+local progress = ARGV[3] .. info[1]
+redis.call('HSET', progress, info[2], event)
+redis.call('EXPIRE', progress, ARGV[5])
+return redis.call('PUBLISH', ARGV[4] .. info[1], event)
+"""
+
+
+class RedisProvisionProgressNotifier(IProvisionProgressNotifier):
+    """
+    Redis pub/sub 기반 프로비저닝 진행 상황 알림.
+    - 구독 전에 지나간 이벤트도 볼 수 있도록 단계별 최신 이벤트를 hash(스냅샷)에 함께 남긴다
+    - listen은 구독을 먼저 건 뒤 스냅샷을 읽으므로 그 사이에 발행된 이벤트도 놓치지 않는다
+      (같은 이벤트가 두 번 올 수는 있음)
+    """
+
+    def __init__(
+        self,
+        client: Redis = redis_client,
+        ttl: int = settings.PROVISION_PROGRESS_TTL,
+        async_client: AsyncRedis = async_redis_client,
+    ):
+        self.client = client
+        self.async_client = async_client
+        self.ttl = ttl
+        self._publish_step = client.register_script(_PUBLISH_STEP_SCRIPT)
+
+    @override
+    def register_steps(self, project_id: str, steps: dict[str, str]) -> None:
+        self.register_steps_bulk({project_id: steps})
+
+    @override
+    def register_steps_bulk(self, steps_by_project: dict[str, dict[str, str]]) -> None:
+        steps_by_project = {
+            pid: steps for pid, steps in steps_by_project.items() if steps
+        }
+        if not steps_by_project:
+            return
+        now = timezone.now().isoformat()
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            for project_id, steps in steps_by_project.items():
+                progress_key = f"{PROGRESS_KEY_PREFIX}{project_id}"
+                # 재시도(FAILED 후 다시 step2)면 이전 진행 상황은 지운다
+                pipe.delete(progress_key)
+                for task_id, step in steps.items():
+                    key = f"{TASK_KEY_PREFIX}{task_id}"
+                    pipe.hset(key, mapping={"project": project_id, "step": step})
+                    pipe.expire(key, self.ttl)
+                    event = ProvisionProgressEvent(
+                        project_id=project_id,
+                        type=ProvisionEventType.STEP,
+                        status=TaskStatus.PENDING,
+                        step=step,
+                        timestamp=now,
+                    )
+                    pipe.hset(progress_key, step, self._encode(event))
+                pipe.expire(progress_key, self.ttl)
+            pipe.execute()
+        except RedisError as e:
+            logger.warning(
+                f"[진행 알림] 프로젝트 {list(steps_by_project)} 단계 등록 실패: {e}"
+            )
+
+    @override
+    def publish_step_status(self, task_id: str, status: TaskStatus) -> None:
+        try:
+            self._publish_step(
+                keys=[f"{TASK_KEY_PREFIX}{task_id}"],
+                args=[
+                    status.value,
+                    timezone.now().isoformat(),
+                    PROGRESS_KEY_PREFIX,
+                    CHANNEL_PREFIX,
+                    self.ttl,
+                ],
+            )
+        except RedisError as e:
+            logger.warning(f"[진행 알림] 태스크 {task_id} 상태 발행 실패: {e}")
+
+    @override
+    def publish_project_status(self, project_id: str, status: ProjectStatus) -> None:
+        event = self._encode(
+            ProvisionProgressEvent(
+                project_id=project_id,
+                type=ProvisionEventType.PROJECT,
+                status=status.value,
+                timestamp=timezone.now().isoformat(),
+            )
+        )
+        progress_key = f"{PROGRESS_KEY_PREFIX}{project_id}"
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.hset(progress_key, PROJECT_FIELD, event)
+            pipe.expire(progress_key, self.ttl)
+            pipe.publish(f"{CHANNEL_PREFIX}{project_id}", event)
+            pipe.execute()
+        except RedisError as e:
+            logger.warning(f"[진행 알림] 프로젝트 {project_id} 상태 발행 실패: {e}")
+
+    @override
+    def listen(
+        self, project_id: str, timeout: float, heartbeat: float
+    ) -> Iterator[ProvisionProgressEvent | None]:
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(f"{CHANNEL_PREFIX}{project_id}")
+
+            snapshot = self.client.hgetall(f"{PROGRESS_KEY_PREFIX}{project_id}")
+            events = self._snapshot_events(snapshot)
+            yield from events
+            if events and events[-1].is_terminal:
+                return
+
+            deadline = time.monotonic() + timeout
+            while (remaining := deadline - time.monotonic()) > 0:
+                message = pubsub.get_message(timeout=min(heartbeat, remaining))
+                if message is None:
+                    yield None
+                    continue
+                event = self._decode(message["data"])
+                yield event
+                if event.is_terminal:
+                    return
+        finally:
+            pubsub.close()
+
+    @override
+    async def alisten(
+        self, project_id: str, timeout: float, heartbeat: float
+    ) -> AsyncIterator[ProvisionProgressEvent | None]:
+        pubsub = self.async_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(f"{CHANNEL_PREFIX}{project_id}")
+
+            snapshot = await self.async_client.hgetall(
+                f"{PROGRESS_KEY_PREFIX}{project_id}"
+            )
+            events = self._snapshot_events(snapshot)
+            for event in events:
+                yield event
+            if events and events[-1].is_terminal:
+                return
+
+            deadline = time.monotonic() + timeout
+            while (remaining := deadline - time.monotonic()) > 0:
+                message = await pubsub.get_message(timeout=min(heartbeat, remaining))
+                if message is None:
+                    yield None
+                    continue
+                event = self._decode(message["data"])
+                yield event
+                if event.is_terminal:
+                    return
+        finally:
+            await pubsub.aclose()
+
+    @classmethod
+    def _snapshot_events(cls, snapshot: dict[str, str]) -> list[ProvisionProgressEvent]:
+        """단계별 최신 이벤트. 프로젝트 이벤트가 있으면 맨 뒤에 둔다"""
+        project_event = snapshot.pop(PROJECT_FIELD, None)
+        events = [cls._decode(raw) for raw in snapshot.values()]
+        if project_event:
+            events.append(cls._decode(project_event))
+        return events
+
+    @staticmethod
+    def _encode(event: ProvisionProgressEvent) -> str:
+        return json.dumps(event.to_dict(), ensure_ascii=False)
+
+    @staticmethod
+    def _decode(raw: str) -> ProvisionProgressEvent:
+        return ProvisionProgressEvent.from_dict(json.loads(raw))
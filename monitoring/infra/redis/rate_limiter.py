@@ -0,0 +1,96 @@
+import logging
+from typing import NamedTuple
+
+from redis import Redis, RedisError
+
+logger = logging.getLogger(__name__)
+
+# 토큰 버킷을 GCRA(다음 토큰이 생기는 이론상 시각 TAT 하나)로 표현한다.
+# 시각은 워커마다 시계가 다를 수 있으므로 Redis TIME을 쓴다.
+# KEYS[1]=버킷 키 / ARGV[1]=초당 토큰, ARGV[2]=burst, ARGV[3]=최대 대기(s)
+# 반환: {예약 여부, 대기 시간(s)} - 대기가 최대 대기보다 길면 예약하지 않는다
+_RESERVE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local interval = 1 / tonumber(ARGV[1])
+local tolerance = interval * (tonumber(ARGV[2]) - 1)
+local tat = math.max(tonumber(redis.call('GET', KEYS[1]) or now), now)
+local wait = tat - tolerance - now
+if wait > tonumber(ARGV[3]) then
+    return {0, tostring(wait)}
+end
+tat = tat + interval
+redis.call('SET', KEYS[1], string.format('%.6f', tat),
+    'PX', math.ceil((tat - now) * 1000) + 1000)
+return {1, tostring(math.max(wait, 0))}
+"""
+
+# KEYS[1]=버킷 키 / ARGV[1]=초당 토큰, ARGV[2]=burst, ARGV[3]=멈출 시간(s)
+# 멈춘 동안은 토큰을 내주지 않고, 재개 후에도 burst 없이 초당 토큰 속도로 다시 시작한다
+_PAUSE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local interval = 1 / tonumber(ARGV[1])
+local tolerance = interval * (tonumber(ARGV[2]) - 1)
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+tat = math.max(tat, now + tonumber(ARGV[3]) + tolerance)
+redis.call('SET', KEYS[1], string.format('%.6f', tat),
+    'PX', math.ceil((tat - now) * 1000) + 1000)
+return 1
+"""
+
+
+class TokenBucket(NamedTuple):
+    rate: float  # 초당 토큰
+    burst: int  # 한 번에 몰아서 쓸 수 있는 토큰 수
+
+
+class Reservation(NamedTuple):
+    granted: bool
+    wait: float  # granted면 요청 전에 기다릴 시간, 아니면 토큰이 생길 때까지 남은 시간
+
+
+class RedisRateLimiter:
+    """
+    여러 워커 프로세스가 공유하는 Redis 토큰 버킷.
+    - 버킷은 이름별로 따로 둔다 (예: Grafana 쓰기/읽기)
+    - reserve: 토큰 예약 + 대기 시간 계산을 Lua 스크립트 한 번으로 (1 round trip)
+      폴링 없이 예약한 순서대로 간격을 두고 요청이 나가므로 처리량이 버킷 속도로 고르게 유지된다
+    - pause: 서버가 Retry-After를 주면 모든 워커가 그 시간 동안 요청을 멈추도록 버킷을 미룬다
+    - Redis 장애 시에는 요청을 막지 않는다 (fail open)
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        buckets: dict[str, TokenBucket],
+        key_prefix: str,
+        max_wait: float,
+    ):
+        self.buckets = buckets
+        self.key_prefix = key_prefix
+        self.max_wait = max_wait
+        self._reserve = client.register_script(_RESERVE_SCRIPT)
+        self._pause = client.register_script(_PAUSE_SCRIPT)
+
+    def reserve(self, name: str) -> Reservation:
+        bucket = self.buckets[name]
+        try:
+            granted, wait = self._reserve(
+                keys=[f"{self.key_prefix}{name}"],
+                args=[bucket.rate, bucket.burst, self.max_wait],
+            )
+        except RedisError as e:
+            logger.warning(f"[rate limit] {name} 버킷 조회 실패, 제한 없이 진행: {e}")
+            return Reservation(granted=True, wait=0.0)
+        return Reservation(granted=bool(granted), wait=float(wait))
+
+    def pause(self, name: str, seconds: float) -> None:
+        bucket = self.buckets[name]
+        try:
+            self._pause(
+                keys=[f"{self.key_prefix}{name}"],
+                args=[bucket.rate, bucket.burst, seconds],
+            )
+        except RedisError as e:
+            logger.warning(f"[rate limit] {name} 버킷 일시 정지 실패: {e}")
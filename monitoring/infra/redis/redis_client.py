@@ -1,4 +1,5 @@
 import redis
+import redis.asyncio
 from django.conf import settings
 
 redis_client = redis.Redis(
@@ -7,3 +8,11 @@ redis_client = redis.Redis(
     db=settings.REDIS_DB,
     decode_responses=True,  # 문자열 응답을 위해
 )
+
+# async view의 pub/sub 구독용 (이벤트 루프를 막지 않는다)
+async_redis_client = redis.asyncio.Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    decode_responses=True,
+)
@@ -0,0 +1,154 @@
+import logging
+import threading
+import uuid
+from enum import IntEnum
+
+from redis import Redis
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]=done 키, KEYS[2]=lock 키 / ARGV[1]=token, ARGV[2]=lock ttl(ms)
+_ACQUIRE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 2
+end
+if redis.call('SET', KEYS[2], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    return 1
+end
+return 0
+"""
+
+# KEYS[1]=lock 키, KEYS[2]=done 키 / ARGV[1]=token, ARGV[2]=done ttl(s)
+# 락을 잃었더라도(만료 후 다른 워커가 획득) 작업 자체는 끝났으므로 done은 기록한다
+_RELEASE_AND_MARK_DONE_SCRIPT = """
+redis.call('SET', KEYS[2], '1', 'EX', ARGV[2])
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+return 0
+"""
+
+# KEYS[1]=lock 키 / ARGV[1]=token
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# KEYS[1]=lock 키 / ARGV[1]=token, ARGV[2]=lock ttl(ms)
+_EXTEND_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class AcquireResult(IntEnum):
+    BUSY = 0  # 다른 워커가 실행 중
+    ACQUIRED = 1
+    DONE = 2  # 이미 처리 완료
+
+
+class TaskLock:
+    """
+    태스크 중복 실행 방지용 Redis 락.
+    - acquire: done 여부 확인 + 락 획득을 Lua 스크립트 한 번으로 (1 round trip)
+    - release_and_mark_done: done 기록 + 내 락이면 해제를 한 번에 (1 round trip)
+    - heartbeat: 실행이 lock ttl보다 길어져도 락이 만료되지 않도록 주기적으로 연장
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        lock_key: str,
+        done_key: str,
+        lock_ttl: int,
+        done_ttl: int,
+    ):
+        self.client = client
+        self.lock_key = lock_key
+        self.done_key = done_key
+        self.lock_ttl_ms = lock_ttl * 1000
+        self.done_ttl = done_ttl
+        self.token = str(uuid.uuid4())
+        self.owned = False
+        self._scripts = _Scripts(client)
+        self._stop_heartbeat = threading.Event()
+        self._heartbeat: threading.Thread | None = None
+
+    def acquire(self) -> AcquireResult:
+        result = AcquireResult(
+            self._scripts.acquire(
+                keys=[self.done_key, self.lock_key],
+                args=[self.token, self.lock_ttl_ms],
+            )
+        )
+        self.owned = result == AcquireResult.ACQUIRED
+        return result
+
+    def release_and_mark_done(self) -> bool:
+        self.stop_heartbeat()
+        released = self._scripts.release_and_mark_done(
+            keys=[self.lock_key, self.done_key], args=[self.token, self.done_ttl]
+        )
+        self.owned = False
+        if not released:
+            logger.warning(f"락 {self.lock_key}을 이미 잃은 상태에서 완료 처리")
+        return bool(released)
+
+    def release(self) -> bool:
+        self.stop_heartbeat()
+        released = self._scripts.release(keys=[self.lock_key], args=[self.token])
+        self.owned = False
+        return bool(released)
+
+    def extend(self) -> bool:
+        return bool(
+            self._scripts.extend(
+                keys=[self.lock_key], args=[self.token, self.lock_ttl_ms]
+            )
+        )
+
+    def start_heartbeat(self) -> None:
+        """ttl의 1/3 주기로 락을 연장하는 daemon 스레드 시작"""
+        self._stop_heartbeat.clear()
+        self._heartbeat = threading.Thread(
+            target=self._run_heartbeat,
+            name=f"lock-heartbeat:{self.lock_key}",
+            daemon=True,
+        )
+        self._heartbeat.start()
+
+    def stop_heartbeat(self) -> None:
+        self._stop_heartbeat.set()
+        if (
+            self._heartbeat is not None
+            and self._heartbeat is not threading.current_thread()
+        ):
+            self._heartbeat.join()
+        self._heartbeat = None
+
+    def _run_heartbeat(self) -> None:
+        interval = self.lock_ttl_ms / 1000 / 3
+        while not self._stop_heartbeat.wait(interval):
+            try:
+                if not self.extend():
+                    logger.warning(f"락 {self.lock_key} 연장 실패: 이미 만료됨")
+                    return
+            except Exception as e:
+                # 일시적인 Redis 오류는 다음 주기에 다시 시도 (ttl 안에 복구되면 유지됨)
+                logger.warning(f"락 {self.lock_key} 연장 중 오류: {e}")
+
+
+class _Scripts:
+    # Script 객체는 sha로 EVALSHA 호출 (서버에 없으면 NOSCRIPT 후 자동 로드해서 재시도)
+    def __init__(self, client: Redis):
+        self.acquire = client.register_script(_ACQUIRE_SCRIPT)
+        self.release_and_mark_done = client.register_script(
+            _RELEASE_AND_MARK_DONE_SCRIPT
+        )
+        self.release = client.register_script(_RELEASE_SCRIPT)
+        self.extend = client.register_script(_EXTEND_SCRIPT)
@@ -0,0 +1,103 @@
+import json
+from datetime import datetime
+from typing import Any
+
+from redis import Redis
+
+PENDING_KEY_PREFIX = "task_status:pending:"
+DIRTY_SET_KEY = "task_status:dirty"
+VERSION_FIELD = "__v"
+DATETIME_FIELDS = {"date_started", "date_done"}
+
+# DB 반영이 끝난 항목 정리. 반영 중에 새 전이가 기록됐으면(버전이 바뀌었으면) 남겨둔다
+# 접근하는 키는 모두 KEYS로 넘긴다 / KEYS[1]=dirty set, KEYS[2..]=태스크 hash
+# ARGV: id1, v1, id2, v2, ... (KEYS[i + 1]이 ARGV[2i - 1]의 hash)
+_ACK_SCRIPT = """
+local removed = 0
+for i = 2, #KEYS do
+    local id, expected = ARGV[2 * i - 3], ARGV[2 * i - 2]
+    local version = redis.call('HGET', KEYS[i], 'VERSION_FIELD')
+    if (not version) or version == expected then
+        redis.call('DEL', KEYS[i])
+        redis.call('SREM', KEYS[1], id)
+        removed = removed + 1
+    end
+end
+return removed
+""".replace(
+    "VERSION_FIELD", VERSION_FIELD
+)
+
+
+class TaskStatusBuffer:
+    """
+    TaskResultModel 상태 전이 write-behind 버퍼 (Redis).
+    - record: 태스크별 hash에 변경 필드를 덮어쓰고 dirty set에 등록 (1 round trip)
+    - get: 아직 DB에 반영되지 않은 필드 조회 (읽기 경로에서 DB 값 위에 덮어씀)
+    - take/ack: flusher가 모아서 DB에 반영한 뒤 정리. 반영 도중 새로 기록된 항목은 유지된다
+      (take는 id 조회 후 hash를 pipeline으로 읽어 2 round trip, ack는 Lua 1회)
+    같은 태스크의 전이는 필드 단위로 합쳐지므로(STARTED → SUCCESS) DB에는 최종 상태만 한 번 쓰인다.
+    """
+
+    def __init__(self, client: Redis, ttl: int):
+        self.client = client
+        self.ttl = ttl
+        self._ack = client.register_script(_ACK_SCRIPT)
+
+    def record(self, task_id: str, fields: dict[str, Any]) -> None:
+        key = f"{PENDING_KEY_PREFIX}{task_id}"
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hset(key, mapping={k: self._encode(v) for k, v in fields.items()})
+        pipe.hincrby(key, VERSION_FIELD, 1)
+        # flusher가 오래 멈춰 있어도 Redis에 무한히 쌓이지 않도록
+        pipe.expire(key, self.ttl)
+        pipe.sadd(DIRTY_SET_KEY, task_id)
+        pipe.execute()
+
+    def get(self, task_id: str) -> dict[str, Any]:
+        raw = self.client.hgetall(f"{PENDING_KEY_PREFIX}{task_id}")
+        raw.pop(VERSION_FIELD, None)
+        return {k: self._decode(k, v) for k, v in raw.items()}
+
+    def take(self, limit: int) -> dict[str, tuple[str, dict[str, Any]]]:
+        """
+        {task_id: (version, fields)}
+        dirty set에서 최대 limit개를 골라 버퍼 내용과 함께 반환한다. (set에서 빼지는 않음)
+        """
+        task_ids = self.client.srandmember(DIRTY_SET_KEY, limit)
+        if not task_ids:
+            return {}
+        pipe = self.client.pipeline(transaction=False)
+        for task_id in task_ids:
+            pipe.hgetall(f"{PENDING_KEY_PREFIX}{task_id}")
+        entries: dict[str, tuple[str, dict[str, Any]]] = {}
+        for task_id, values in zip(task_ids, pipe.execute()):
+            version = values.pop(VERSION_FIELD, "")
+            entries[task_id] = (
+                version,
+                {k: self._decode(k, v) for k, v in values.items()},
+            )
+        return entries
+
+    def ack(self, versions: dict[str, str]) -> int:
+        if not versions:
+            return 0
+        keys = [DIRTY_SET_KEY]
+        args: list[str] = []
+        for task_id, version in versions.items():
+            keys.append(f"{PENDING_KEY_PREFIX}{task_id}")
+            args += [task_id, version]
+        return self._ack(keys=keys, args=args)
+
+    @staticmethod
+    def _encode(value: Any) -> str:
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        return json.dumps(value, default=str)
+
+    @staticmethod
+    def _decode(field: str, raw: str) -> Any:
+        value = json.loads(raw)
+        if field in DATETIME_FIELDS and isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return value
@@ -1,5 +1,10 @@
 from dataclasses import fields
 
+from django.db import connection
+from django.db.models import Q, QuerySet
+
+from common.domain import CursorPagedResult, PagedResult
+from common.service.paging import CursorPaginator, Paginator
 from monitoring.domain.i_repo.i_monitoring_project_repo import IMonitoringProjectRepo
 from monitoring.domain.monitoring_project import (
     AgentProvisioningContext,
@@ -9,59 +14,115 @@ from monitoring.domain.monitoring_project import (
     MonitoringProjectWithPublicDashboardDto,
     MonitoringType,
     ProjectStatus,
+    ProvisioningSnapshot,
 )
 from monitoring.domain.visualization_platform.dashboard import (
     Dashboard,
     PublicDashboard,
 )
+from monitoring.domain.visualization_platform.folder import (
+    FolderPermission,
+    FolderPermissionLevel,
+    UserFolder,
+)
+from monitoring.domain.visualization_platform.service_account import ServiceAccount
 from monitoring.infra.models.monitoring_project_model import MonitoringProjectModel
 
+# 폴더는 사용자 기준, 나머지는 프로젝트 기준 (폴더 권한은 서비스 계정의 account_id로 연결)
+# 각 JOIN 키는 unique/FK 인덱스를 타고, 리소스가 없으면 해당 컬럼들이 NULL로 남는다
+_SNAPSHOT_COLUMNS = """
+       f.id, f.uid, f.user_id, f.name, f.org_id, f.created_by_task,
+       sa.id, sa.account_id, sa.project_id, sa.user_id, sa.name,
+       sa.is_disabled, sa.role, sa.token,
+       fp.id, fp.service_account_id, fp.folder_uid, fp.permission,
+       d.id, d.uid, d.title, d.user_id, d.project_id, d.org_id, d.folder_uid, d.url,
+       pd.id, pd.uid, pd.project_id, pd.dashboard_id, pd.public_url
+"""
+_SNAPSHOT_JOINS = """
+LEFT JOIN visualization_folder f ON f.user_id = {user_id}
+LEFT JOIN visualization_service_account sa ON sa.project_id = {project_id}
+LEFT JOIN visualization_folder_permission fp ON fp.service_account_id = sa.account_id
+LEFT JOIN visualization_dashboard d ON d.project_id = {project_id}
+LEFT JOIN visualization_public_dashboard pd ON pd.project_id = {project_id}
+"""
+_PROVISIONING_SNAPSHOT_SQL = (
+    f"SELECT {_SNAPSHOT_COLUMNS}"
+    "FROM (SELECT CAST(%s AS varchar(64)) AS user_id, "
+    "CAST(%s AS varchar(64)) AS project_id) k"
+    + _SNAPSHOT_JOINS.format(user_id="k.user_id", project_id="k.project_id")
+    + "LIMIT 1"
+)
+# 프로젝트 컬럼(agent_context 제외) + 스냅샷 컬럼, WHERE p.id IN (...)은 호출 시 붙인다
+_PROVISIONING_SNAPSHOTS_SQL = (
+    "SELECT p.id, p.user_id, p.name, p.description, p.project_type, p.status, "
+    "p.dashboard_id, p.public_dashboard_id, p.service_account_id, p.user_folder_id,"
+    f"{_SNAPSHOT_COLUMNS}"
+    "FROM monitoring_project p"
+    + _SNAPSHOT_JOINS.format(user_id="p.user_id", project_id="p.id")
+)
+_PROJECT_COLUMN_COUNT = 10
+
 
 class MonitoringProjectRepo(IMonitoringProjectRepo):
     def save(self, project: MonitoringProject) -> None:
         MonitoringProjectModel.objects.update_or_create(
-            id=project.id,
-            defaults={
-                "user_id": project.user_id,
-                "name": project.name,
-                "description": project.description,
-                "project_type": project.project_type.value,
-                "status": project.status.value,
-                "dashboard_id": project.dashboard_id,
-                "public_dashboard_id": project.public_dashboard_id,
-                "service_account_id": project.service_account_id,
-                "user_folder_id": project.user_folder_id,
-                "agent_context": (
-                    project.agent_context.model_dump()
-                    if project.agent_context
-                    else None
-                ),
-            },
+            id=project.id, defaults=self._to_model_fields(project)
+        )
+
+    async def asave(self, project: MonitoringProject) -> None:
+        await MonitoringProjectModel.objects.aupdate_or_create(
+            id=project.id, defaults=self._to_model_fields(project)
         )
 
+    def _to_model_fields(self, project: MonitoringProject) -> dict[str, object]:
+        return {
+            "user_id": project.user_id,
+            "name": project.name,
+            "description": project.description,
+            "project_type": project.project_type.value,
+            "status": project.status.value,
+            "dashboard_id": project.dashboard_id,
+            "public_dashboard_id": project.public_dashboard_id,
+            "service_account_id": project.service_account_id,
+            "user_folder_id": project.user_folder_id,
+            "agent_context": (
+                project.agent_context.model_dump() if project.agent_context else None
+            ),
+        }
+
     def find_by_id(self, project_id: str) -> MonitoringProject | None:
         try:
-            obj = MonitoringProjectModel.objects.get(id=project_id)
-            return MonitoringProject(
-                id=obj.id,
-                user_id=obj.user_id,
-                name=obj.name,
-                description=obj.description,
-                project_type=MonitoringType(obj.project_type),
-                status=ProjectStatus(obj.status),
-                dashboard_id=obj.dashboard_id,
-                public_dashboard_id=obj.public_dashboard_id,
-                user_folder_id=obj.user_folder_id,
-                agent_context=(
-                    AgentProvisioningContext(**obj.agent_context)
-                    if obj.agent_context
-                    else None
-                ),
-                service_account_id=obj.service_account_id,
+            return self._to_domain(MonitoringProjectModel.objects.get(id=project_id))
+        except MonitoringProjectModel.DoesNotExist:
+            return None
+
+    async def afind_by_id(self, project_id: str) -> MonitoringProject | None:
+        try:
+            return self._to_domain(
+                await MonitoringProjectModel.objects.aget(id=project_id)
             )
         except MonitoringProjectModel.DoesNotExist:
             return None
 
+    def _to_domain(self, obj: MonitoringProjectModel) -> MonitoringProject:
+        return MonitoringProject(
+            id=obj.id,
+            user_id=obj.user_id,
+            name=obj.name,
+            description=obj.description,
+            project_type=MonitoringType(obj.project_type),
+            status=ProjectStatus(obj.status),
+            dashboard_id=obj.dashboard_id,
+            public_dashboard_id=obj.public_dashboard_id,
+            user_folder_id=obj.user_folder_id,
+            agent_context=(
+                AgentProvisioningContext(**obj.agent_context)
+                if obj.agent_context
+                else None
+            ),
+            service_account_id=obj.service_account_id,
+        )
+
     def update_status(self, project_id: str, status: str) -> None:
         MonitoringProjectModel.objects.filter(id=project_id).update(status=status)
 
@@ -73,6 +134,11 @@ class MonitoringProjectRepo(IMonitoringProjectRepo):
             id=project_id, user_id=user_id
         ).exists()
 
+    async def aexists_by_id_and_user_id(self, project_id: str, user_id: str) -> bool:
+        return await MonitoringProjectModel.objects.filter(
+            id=project_id, user_id=user_id
+        ).aexists()
+
     def find_with_dashboard_dto(
         self, project_id: str
     ) -> MonitoringProjectWithDashboardDto | None:
@@ -178,71 +244,302 @@ class MonitoringProjectRepo(IMonitoringProjectRepo):
 
         return MonitoringProjectWithPublicDashboardDto.from_dict(combined)
 
-    def find_all_with_full_dashboard_dto_by_user(
-        self, user_id: str
-    ) -> list[MonitoringProjectWithBothDashboardsDto]:
-        # 1) 사용자 프로젝트 ID 목록 조회
-        ids = MonitoringProjectModel.objects.filter(user_id=user_id).values_list(
-            "id", flat=True
+    def find_page_with_full_dashboard_dto_by_user(
+        self, user_id: str, page: int = 1, page_size: int = 10
+    ) -> PagedResult[MonitoringProjectWithBothDashboardsDto]:
+        """
+        COUNT 1회 + LIMIT/OFFSET 조회 1회로 페이지 단위 DTO 목록을 만든다.
+        dashboard, public_dashboard는 select_related로 함께 가져온다.
+        """
+        Paginator.validate_params(page, page_size)
+
+        queryset = MonitoringProjectModel.objects.filter(user_id=user_id)
+
+        # 1) 전체 개수
+        total_items = queryset.count()
+        total_pages = Paginator.get_total_pages(total_items, page, page_size)
+
+        # 2) 해당 페이지만 조회
+        offset = Paginator.get_offset(page, page_size)
+        rows = self._with_dashboards(queryset)[offset : offset + page_size]
+
+        # 3) row → DTO
+        items = [self._to_full_dashboard_dto(row) for row in rows]
+        return Paginator.to_paged_result(
+            items, total_items, total_pages, page, page_size
         )
 
-        # 2) 각 ID별로 DTO 생성
-        dtos: list[MonitoringProjectWithBothDashboardsDto] = []
-        for pid in ids:
-            dto = self.find_with_full_dashboard_dto(pid)
-            if dto is not None:
-                dtos.append(dto)
-        return dtos
+    async def afind_page_with_full_dashboard_dto_by_user(
+        self, user_id: str, page: int = 1, page_size: int = 10
+    ) -> PagedResult[MonitoringProjectWithBothDashboardsDto]:
+        Paginator.validate_params(page, page_size)
+
+        queryset = MonitoringProjectModel.objects.filter(user_id=user_id)
+        total_items = await queryset.acount()
+        total_pages = Paginator.get_total_pages(total_items, page, page_size)
+
+        offset = Paginator.get_offset(page, page_size)
+        items = [
+            self._to_full_dashboard_dto(row)
+            async for row in self._with_dashboards(queryset)[
+                offset : offset + page_size
+            ]
+        ]
+        return Paginator.to_paged_result(
+            items, total_items, total_pages, page, page_size
+        )
+
+    def find_cursor_page_with_full_dashboard_dto_by_user(
+        self, user_id: str, cursor: str | None = None, page_size: int = 10
+    ) -> CursorPagedResult[MonitoringProjectWithBothDashboardsDto]:
+        """
+        (created_at, id) keyset 페이징.
+        (user_id, created_at, id) 인덱스를 타므로 스크롤 깊이와 관계없이 비용이 일정하다.
+        다음 페이지 존재 여부는 page_size + 1개를 조회해서 판단한다.
+        """
+        Paginator.validate_params(1, page_size)
+
+        queryset = self._cursor_queryset(user_id, cursor)
+        rows = list(queryset[: page_size + 1])
+        return self._to_cursor_page(rows, page_size)
+
+    async def afind_cursor_page_with_full_dashboard_dto_by_user(
+        self, user_id: str, cursor: str | None = None, page_size: int = 10
+    ) -> CursorPagedResult[MonitoringProjectWithBothDashboardsDto]:
+        Paginator.validate_params(1, page_size)
+
+        queryset = self._cursor_queryset(user_id, cursor)
+        rows = [row async for row in queryset[: page_size + 1]]
+        return self._to_cursor_page(rows, page_size)
+
+    def _cursor_queryset(self, user_id: str, cursor: str | None) -> QuerySet:
+        queryset = MonitoringProjectModel.objects.filter(user_id=user_id)
+        if cursor:
+            created_at, last_id = CursorPaginator.decode(cursor)
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id)
+            )
+        return self._with_dashboards(queryset)
+
+    def _to_cursor_page(
+        self, rows: list[MonitoringProjectModel], page_size: int
+    ) -> CursorPagedResult[MonitoringProjectWithBothDashboardsDto]:
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = (
+            CursorPaginator.encode(rows[-1].created_at, rows[-1].id)
+            if has_next
+            else None
+        )
+
+        return CursorPagedResult(
+            items=[self._to_full_dashboard_dto(row) for row in rows],
+            page_size=page_size,
+            has_next=has_next,
+            next_cursor=next_cursor,
+        )
 
     def find_with_full_dashboard_dto(
         self, project_id: str
     ) -> MonitoringProjectWithBothDashboardsDto | None:
-        # 1) 조회 대상 project Domain
-        project_domain = self.find_by_id(project_id)
-        if project_domain is None:
+        # dashboard 및 public_dashboard를 한 번에 가져오기
+        try:
+            proj = self._with_dashboards(MonitoringProjectModel.objects).get(
+                id=project_id
+            )
+        except MonitoringProjectModel.DoesNotExist:
             return None
-        project_dict = project_domain.to_dict(
-            excludes=[MonitoringProject.FIELD_AGENT_CONTEXT]
-        )
 
-        # 2) dashboard 및 public_dashboard를 한 번에 가져오기
+        return self._to_full_dashboard_dto(proj)
+
+    async def afind_with_full_dashboard_dto(
+        self, project_id: str
+    ) -> MonitoringProjectWithBothDashboardsDto | None:
         try:
-            proj = MonitoringProjectModel.objects.select_related(
-                "dashboard", "public_dashboard"
-            ).get(id=project_id)
+            proj = await self._with_dashboards(MonitoringProjectModel.objects).aget(
+                id=project_id
+            )
         except MonitoringProjectModel.DoesNotExist:
             return None
 
-        # 3) dashboard data
-        DASH_KEYS = [
-            Dashboard.FIELD_ID,
-            Dashboard.FIELD_UID,
-            Dashboard.FIELD_TITLE,
-            Dashboard.FIELD_FOLDER_UID,
-            Dashboard.FIELD_URL,
-        ]
+        return self._to_full_dashboard_dto(proj)
+
+    def _with_dashboards(self, queryset) -> QuerySet:
+        """목록/상세 조회 공통: 대시보드 join, 큰 JSON 컬럼 제외, 최신순"""
+        return (
+            queryset.select_related("dashboard", "public_dashboard")
+            .defer("agent_context", "dashboard__config_json")
+            .order_by("-created_at", "-id")
+        )
+
+    def _to_full_dashboard_dto(
+        self, proj: MonitoringProjectModel
+    ) -> MonitoringProjectWithBothDashboardsDto:
+        """
+        select_related("dashboard", "public_dashboard")로 조회한 row를
+        추가 쿼리 없이 DTO로 변환한다. (agent_context는 포함하지 않음)
+        """
         dash = proj.dashboard
-        dashboard_data = (
-            None if dash is None else {key: getattr(dash, key) for key in DASH_KEYS}
+        dashboard = (
+            None
+            if dash is None
+            else Dashboard(
+                id=dash.id,
+                uid=dash.uid,
+                title=dash.title,
+                user_id=None,
+                project_id=None,
+                org_id=None,
+                folder_uid=dash.folder_uid,
+                url=dash.url,
+            )
         )
 
-        # 4) public_dashboard data
-        PUB_KEYS = [
-            PublicDashboard.FIELD_ID,
-            PublicDashboard.FIELD_UID,
-            PublicDashboard.FIELD_PROJECT_ID,
-            PublicDashboard.FIELD_DASHBOARD_ID,
-            PublicDashboard.FIELD_PUBLIC_URL,
-        ]
         pub = proj.public_dashboard
-        public_dashboard_data = (
-            None if pub is None else {key: getattr(pub, key) for key in PUB_KEYS}
+        public_dashboard = (
+            None
+            if pub is None
+            else PublicDashboard(
+                id=pub.id,
+                uid=pub.uid,
+                project_id=pub.project_id,
+                dashboard_id=pub.dashboard_id,
+                public_url=pub.public_url,
+            )
         )
 
-        # 5) combined dict → DTO
-        combined = {
-            **project_dict,
-            "dashboard": dashboard_data,
-            "public_dashboard": public_dashboard_data,
-        }
-        return MonitoringProjectWithBothDashboardsDto.from_dict(combined)
+        return MonitoringProjectWithBothDashboardsDto(
+            id=proj.id,
+            user_id=proj.user_id,
+            name=proj.name,
+            project_type=MonitoringType(proj.project_type),
+            status=ProjectStatus(proj.status),
+            service_account_id=proj.service_account_id,
+            description=proj.description,
+            user_folder_id=proj.user_folder_id,
+            dashboard=dashboard,
+            public_dashboard=public_dashboard,
+        )
+
+    def find_provisioning_snapshot(
+        self, user_id: str, project_id: str
+    ) -> ProvisioningSnapshot:
+        """
+        폴더/서비스 계정/폴더 권한/대시보드/퍼블릭 대시보드 존재 여부를 LEFT JOIN 쿼리 1회로 조회한다.
+        dashboard의 config_json 등 큰 JSON 컬럼은 가져오지 않는다.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(_PROVISIONING_SNAPSHOT_SQL, [user_id, project_id])
+            row = cursor.fetchone()
+        return self._to_provisioning_snapshot(row)
+
+    def find_provisioning_snapshots(
+        self, project_ids: list[str]
+    ) -> dict[str, ProvisioningSnapshot]:
+        """
+        여러 프로젝트의 스냅샷(프로젝트 포함)을 쿼리 1회로 조회한다.
+        폴더는 각 프로젝트 소유자 기준이며, 없는 프로젝트 ID는 결과에서 빠진다.
+        """
+        if not project_ids:
+            return {}
+
+        placeholders = ", ".join(["%s"] * len(project_ids))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"{_PROVISIONING_SNAPSHOTS_SQL}WHERE p.id IN ({placeholders})",
+                list(project_ids),
+            )
+            rows = cursor.fetchall()
+
+        snapshots: dict[str, ProvisioningSnapshot] = {}
+        for row in rows:
+            project_id = row[0]
+            if project_id in snapshots:
+                continue  # 폴더 권한이 여러 개면 같은 프로젝트가 여러 행으로 나온다
+            snapshot = self._to_provisioning_snapshot(row[_PROJECT_COLUMN_COUNT:])
+            snapshot.project = MonitoringProject(
+                id=row[0],
+                user_id=row[1],
+                name=row[2],
+                description=row[3],
+                project_type=MonitoringType(row[4]),
+                status=ProjectStatus(row[5]),
+                dashboard_id=row[6],
+                public_dashboard_id=row[7],
+                service_account_id=row[8],
+                user_folder_id=row[9],
+            )
+            snapshots[project_id] = snapshot
+        return snapshots
+
+    def _to_provisioning_snapshot(self, row: tuple) -> ProvisioningSnapshot:
+        folder, account, perm, dash, pub = (
+            row[0:6],
+            row[6:14],
+            row[14:18],
+            row[18:26],
+            row[26:31],
+        )
+        return ProvisioningSnapshot(
+            user_folder=(
+                UserFolder(
+                    id=folder[0],
+                    uid=folder[1],
+                    user_id=folder[2],
+                    name=folder[3],
+                    org_id=folder[4],
+                    created_by_task=folder[5],
+                )
+                if folder[0] is not None
+                else None
+            ),
+            service_account=(
+                ServiceAccount(
+                    id=account[0],
+                    account_id=account[1],
+                    project_id=account[2],
+                    user_id=account[3],
+                    name=account[4],
+                    is_disabled=bool(account[5]),
+                    role=account[6],
+                    token=account[7],
+                )
+                if account[0] is not None
+                else None
+            ),
+            folder_permission=(
+                FolderPermission(
+                    id=perm[0],
+                    service_account_id=perm[1],
+                    folder_uid=perm[2],
+                    permission=FolderPermissionLevel(perm[3]),
+                )
+                if perm[0] is not None
+                else None
+            ),
+            dashboard=(
+                Dashboard(
+                    id=dash[0],
+                    uid=dash[1],
+                    title=dash[2],
+                    user_id=dash[3],
+                    project_id=dash[4],
+                    org_id=dash[5],
+                    folder_uid=dash[6],
+                    url=dash[7],
+                )
+                if dash[0] is not None
+                else None
+            ),
+            public_dashboard=(
+                PublicDashboard(
+                    id=pub[0],
+                    uid=pub[1],
+                    project_id=pub[2],
+                    dashboard_id=pub[3],
+                    public_url=pub[4],
+                )
+                if pub[0] is not None
+                else None
+            ),
+        )
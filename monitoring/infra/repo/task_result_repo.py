@@ -1,34 +1,53 @@
+import logging
+from collections import defaultdict
+from datetime import datetime
 from typing import Any
 
+from django.db.models import Q
 from django.forms import model_to_dict
+from redis import RedisError
 from typing_extensions import override
 
+from common.container import container
+from config import settings
 from monitoring.domain.i_repo.i_task_result_repo import ITaskResultRepo
 from monitoring.domain.task_result import TaskResult, TaskStatus
 from monitoring.infra.models.task_result_model import TaskResultModel
+from monitoring.infra.redis.task_status_buffer import TaskStatusBuffer
+
+logger = logging.getLogger(__name__)
 
 
 class TaskResultRepo(ITaskResultRepo):
+    def __init__(self, buffer: TaskStatusBuffer | None = None):
+        self.buffer = buffer or container.resolve(TaskStatusBuffer)
+        self.write_behind = settings.TASK_STATUS_WRITE_BEHIND
+
     @override
     def find_by_task_id(self, task_id: str) -> TaskResult | None:
         try:
             model = TaskResultModel.objects.get(id=task_id)
-            return TaskResult(
-                id=model.id,
-                task_name=model.task_name,
-                status=TaskStatus(model.status),
-                result=model.result,
-                date_created=model.date_created.isoformat(),
-                date_started=(
-                    model.date_started.isoformat() if model.date_started else None
-                ),
-                date_done=model.date_done.isoformat() if model.date_done else None,
-                traceback=model.traceback,
-                retries=model.retries,
-            )
         except TaskResultModel.DoesNotExist:
             return None
 
+        # 아직 flush되지 않은 상태 전이를 DB 값 위에 덮어쓴다
+        for field, value in self._buffered_fields(task_id).items():
+            setattr(model, field, value)
+
+        return TaskResult(
+            id=model.id,
+            task_name=model.task_name,
+            status=TaskStatus(model.status),
+            result=model.result,
+            date_created=model.date_created.isoformat(),
+            date_started=(
+                model.date_started.isoformat() if model.date_started else None
+            ),
+            date_done=model.date_done.isoformat() if model.date_done else None,
+            traceback=model.traceback,
+            retries=model.retries,
+        )
+
     @override
     def save(self, task_result: TaskResult) -> None:
         TaskResultModel.objects.update_or_create(
@@ -45,6 +64,78 @@ class TaskResultRepo(ITaskResultRepo):
     def update_fields(self, task_id: str, **fields: Any) -> None:
         TaskResultModel.objects.filter(id=task_id).update(**fields)
 
+    @override
+    def record_status(self, task_id: str, **fields: Any) -> None:
+        if self.write_behind:
+            try:
+                self.buffer.record(task_id, fields)
+                return
+            except RedisError as e:
+                logger.warning(f"태스크 상태 버퍼 기록 실패, DB에 바로 반영: {e}")
+        self.update_fields(task_id, **fields)
+
+    @override
+    def flush_buffered(self, limit: int) -> int:
+        """
+        같은 필드 조합끼리 묶어 bulk_update (UPDATE ... SET col = CASE id WHEN ... END) 한다.
+        pk만 채운 인스턴스로 갱신하므로 SELECT는 없다.
+        DB 반영이 끝난 뒤에 버퍼에서 지우므로 중간에 실패하면 다음 flush에서 다시 반영된다.
+        """
+        entries = self.buffer.take(limit)
+        if not entries:
+            return 0
+
+        groups: dict[tuple[str, ...], list[TaskResultModel]] = defaultdict(list)
+        for task_id, (_, fields) in entries.items():
+            if not fields:
+                continue
+            groups[tuple(sorted(fields))].append(TaskResultModel(id=task_id, **fields))
+
+        for field_names, models in groups.items():
+            TaskResultModel.objects.bulk_update(models, list(field_names))
+
+        self.buffer.ack({task_id: version for task_id, (version, _) in entries.items()})
+        return len(entries)
+
+    @override
+    def find_expired_keys(
+        self,
+        status: TaskStatus,
+        created_before: datetime | None,
+        after: tuple[datetime, str] | None,
+        limit: int,
+    ) -> list[tuple[datetime, str]]:
+        # (status, date_created, id) 인덱스를 순서대로 읽고 limit에서 멈춘다 (정렬 없음)
+        qs = TaskResultModel.objects.filter(status=status)
+        if created_before is not None:
+            qs = qs.filter(date_created__lt=created_before)
+        if after is not None:
+            after_created, after_id = after
+            # (date_created, id) > after. 앞의 >= 조건으로 인덱스 범위 스캔이 되도록
+            qs = qs.filter(date_created__gte=after_created).filter(
+                Q(date_created__gt=after_created) | Q(id__gt=after_id)
+            )
+        return list(
+            qs.order_by("date_created", "id").values_list("date_created", "id")[:limit]
+        )
+
+    @override
+    def delete_by_ids(self, ids: list[str]) -> int:
+        if not ids:
+            return 0
+        # 연관 모델/시그널이 없으므로 collector가 행을 읽지 않고 DELETE ... WHERE id IN 한 번으로 처리
+        deleted, _ = TaskResultModel.objects.filter(id__in=ids).delete()
+        return deleted
+
+    def _buffered_fields(self, task_id: str) -> dict[str, Any]:
+        if not self.write_behind:
+            return {}
+        try:
+            return self.buffer.get(task_id)
+        except RedisError as e:
+            logger.warning(f"태스크 상태 버퍼 조회 실패, DB 값만 사용: {e}")
+            return {}
+
     @override
     def bulk_upsert(self, task_results: list[TaskResult]) -> None:
         """
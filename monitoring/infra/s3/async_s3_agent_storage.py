@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import ssl
+from functools import cache
+from typing import Any
+from urllib.parse import quote
+
+import httpx
+from botocore.auth import S3SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+from typing_extensions import override
+
+from config import settings
+from monitoring.domain.log_agent.rendered_config import RenderedConfigFile
+from monitoring.infra.s3.s3_agent_storage import S3AgentStorageProvider
+from monitoring.service.i_storage.i_storage_provider import AsyncAgentStorageProvider
+
+logger = logging.getLogger(__name__)
+
+
+@cache
+def _ssl_context() -> ssl.SSLContext:
+    # 인증서 번들 로딩이 요청마다 수십 ms라 프로세스에서 한 번만 만든다
+    return httpx.create_ssl_context()
+
+
+class AsyncS3AgentStorageProvider(AsyncAgentStorageProvider):
+    """
+    S3AgentStorageProvider의 httpx.AsyncClient 버전. (aioboto3 없이 botocore로 SigV4 서명만 한다)
+    버킷/키/URL, content-addressed 인덱스는 S3AgentStorageProvider 설정을 그대로 따른다.
+
+    async with AsyncS3AgentStorageProvider(storage) as async_storage:
+        urls = await async_storage.upload_batch(files)
+    """
+
+    def __init__(self, storage: S3AgentStorageProvider):
+        self.storage = storage
+        self.signer = S3SigV4Auth(
+            Credentials(
+                settings.S3_AWS_ACCESS_KEY_ID, settings.S3_AWS_SECRET_ACCESS_KEY
+            ),
+            "s3",
+            storage.region,
+        )
+        self._http: httpx.AsyncClient | None = None
+
+    @override
+    async def __aenter__(self) -> "AsyncS3AgentStorageProvider":
+        self._http = httpx.AsyncClient(
+            verify=_ssl_context(),
+            timeout=httpx.Timeout(self.storage.upload_timeout),
+            limits=httpx.Limits(
+                max_connections=self.storage.max_workers,
+                max_keepalive_connections=self.storage.max_workers,
+            ),
+        )
+        return self
+
+    @override
+    async def __aexit__(self, *exc: Any) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._http is None:
+            raise RuntimeError(
+                "AsyncS3AgentStorageProvider는 async with 블록 안에서만 사용할 수 있습니다."
+            )
+        return self._http
+
+    @override
+    async def upload(
+        self, data: bytes, key: str, content_type: str = "application/octet-stream"
+    ) -> str:
+        try:
+            response = await self._send(
+                "PUT", key, data, {"Content-Type": content_type}
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"S3 upload failed: {e}")
+
+        return self.storage.get_object_url(key)
+
+    @override
+    async def upload_batch(
+        self, files: dict[str, RenderedConfigFile]
+    ) -> dict[str, str]:
+        """
+        S3AgentStorageProvider.upload_batch와 같은 동작을 스레드 없이 event loop 위에서 한다.
+        content-addressed 인덱스(Redis) 조회만 짧은 블로킹 호출이라 스레드로 넘긴다.
+        """
+        existing = await asyncio.to_thread(
+            self.storage.find_existing_content_keys, list(files.keys())
+        )
+        urls = {key: self.storage.get_object_url(key) for key in existing}
+
+        to_upload = {key: f for key, f in files.items() if key not in existing}
+        urls.update(await self._upload_concurrently(to_upload))
+
+        await asyncio.to_thread(self.storage.mark_content_keys, list(to_upload.keys()))
+        return urls
+
+    async def _upload_concurrently(
+        self, files: dict[str, RenderedConfigFile]
+    ) -> dict[str, str]:
+        """
+        timeout은 httpx client 설정으로 요청(파일)마다 걸린다.
+        하나라도 실패하면 나머지 업로드는 취소한다.
+        """
+        if not files:
+            return {}
+
+        tasks = {
+            asyncio.create_task(self.upload(f.content, key, f.content_type)): key
+            for key, f in files.items()
+        }
+        done, not_done = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in not_done:
+            task.cancel()
+
+        urls: dict[str, str] = {}
+        errors: list[str] = []
+        failed_key = None
+        for task in done:
+            key = tasks[task]
+            try:
+                urls[key] = task.result()
+            except Exception as e:
+                errors.append(f"{key}: {e}")
+                failed_key = failed_key or key
+        for task in not_done:
+            errors.append(f"{tasks[task]}: cancelled after {failed_key} failed")
+
+        if errors:
+            # all-or-nothing: 취소된 요청도 서버에는 반영됐을 수 있으므로 배치 키를 전부 지운다
+            await self.delete_batch(list(files.keys()))
+            raise RuntimeError(f"S3 batch upload failed: {errors}")
+
+        return urls
+
+    @override
+    async def delete_batch(self, keys: list[str]) -> None:
+        # content-addressed 객체는 같은 내용을 쓰는 다른 요청이 공유할 수 있으므로 지우지 않는다
+        keys = [key for key in keys if not self.storage.is_content_key(key)]
+        results = await asyncio.gather(
+            *(self._send("DELETE", key) for key in keys), return_exceptions=True
+        )
+        failed = [
+            key
+            for key, result in zip(keys, results)
+            if isinstance(result, BaseException) or result.is_error
+        ]
+        if failed:
+            logger.error(f"S3 업로드 롤백 실패 {failed}")
+
+    async def _send(
+        self,
+        method: str,
+        key: str,
+        data: bytes = b"",
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        request = AWSRequest(
+            method=method, url=self._url(key), data=data, headers=headers or {}
+        )
+        self.signer.add_auth(request)
+        return await self.http.request(
+            method, request.url, content=data, headers=dict(request.headers.items())
+        )
+
+    def _url(self, key: str) -> str:
+        path = quote(key, safe="/~")
+        if self.storage.endpoint_url:
+            return (
+                f"{self.storage.endpoint_url.rstrip('/')}/{self.storage.bucket}/{path}"
+            )
+        if self.storage.region == "us-east-1":
+            return f"https://{self.storage.bucket}.s3.amazonaws.com/{path}"
+        return f"https://{self.storage.bucket}.s3.{self.storage.region}.amazonaws.com/{path}"
@@ -1,26 +1,64 @@
+import hashlib
+import logging
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+
 import boto3
-from botocore.exceptions import ClientError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from redis import RedisError
 from typing_extensions import override
 
 from config import settings
+from monitoring.domain.log_agent.rendered_config import RenderedConfigFile
+from monitoring.infra.redis.redis_client import redis_client
 from monitoring.service.i_storage.i_storage_provider import IAgentStorageProvider
 
+logger = logging.getLogger(__name__)
+
 
 class S3AgentStorageProvider(IAgentStorageProvider):
+    CONTENT_KEY_PREFIX = "configs/sha256/"
+    CONTENT_INDEX_PREFIX = "s3:content:"
+
     def __init__(self):
         self.bucket = settings.S3_BUCKET_NAME
         self.region = settings.S3_AWS_REGION
+        self.max_workers = settings.S3_UPLOAD_MAX_WORKERS
+        self.upload_timeout = settings.S3_UPLOAD_TIMEOUT
+        self.content_addressed = settings.S3_CONTENT_ADDRESSED
+        self.content_index_ttl = settings.S3_CONTENT_INDEX_TTL
+        # S3 호환 저장소(로컬 stand-in 등)를 쓸 때만 지정, path-style로 접근한다
+        self.endpoint_url = settings.S3_ENDPOINT_URL or None
         self.client = boto3.client(
             "s3",
             region_name="ap-northeast-2",
+            endpoint_url=self.endpoint_url,
             aws_access_key_id=settings.S3_AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.S3_AWS_SECRET_ACCESS_KEY,
+            config=Config(
+                connect_timeout=self.upload_timeout,
+                read_timeout=self.upload_timeout,
+                max_pool_connections=max(10, self.max_workers),
+                s3={"addressing_style": "path" if self.endpoint_url else "auto"},
+            ),
         )
 
     @override
     def get_object_key(self, resource_id: str, ts: int, filename: str) -> str:
         return f"configs/{resource_id}/{ts}/{filename}"
 
+    @override
+    def get_file_object_key(
+        self, resource_id: str, ts: int, file: RenderedConfigFile
+    ) -> str:
+        if not (self.content_addressed and file.shareable):
+            return self.get_object_key(resource_id, ts, file.filename)
+
+        # 파일명에는 project_id가 들어가므로 키에는 확장자만 남긴다
+        digest = hashlib.sha256(file.content).hexdigest()
+        ext = file.filename.rsplit(".", 1)[-1]
+        return f"{self.CONTENT_KEY_PREFIX}{digest}.{ext}"
+
     @override
     def get_object_url(self, key: str) -> str:
         if self.region == "us-east-1":
@@ -45,3 +83,112 @@ class S3AgentStorageProvider(IAgentStorageProvider):
             raise RuntimeError(f"S3 upload failed: {e}")
 
         return self.get_object_url(key)
+
+    @override
+    def upload_batch(self, files: dict[str, RenderedConfigFile]) -> dict[str, str]:
+        """
+        boto3 client는 thread-safe 하므로 같은 client로 병렬 put_object 수행.
+        소요 시간은 업로드 합(sum)이 아니라 가장 느린 업로드(max)에 가까워진다.
+        content-addressed 키 중 이미 올라가 있는 것은 업로드를 건너뛴다.
+        """
+        existing = self.find_existing_content_keys(list(files.keys()))
+        urls = {key: self.get_object_url(key) for key in existing}
+
+        to_upload = {key: f for key, f in files.items() if key not in existing}
+        urls.update(self._upload_parallel(to_upload))
+
+        self.mark_content_keys(list(to_upload.keys()))
+        return urls
+
+    def _upload_parallel(self, files: dict[str, RenderedConfigFile]) -> dict[str, str]:
+        """
+        timeout은 client 설정(요청마다 connect/read timeout)으로 파일별로 걸린다.
+        하나라도 실패하면 나머지는 기다리지 않는다.
+        """
+        if not files:
+            return {}
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(files)),
+            thread_name_prefix="s3-upload",
+        )
+        futures = {
+            executor.submit(self.upload, f.content, key, f.content_type): key
+            for key, f in files.items()
+        }
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        urls: dict[str, str] = {}
+        errors: list[str] = []
+        failed_key = None
+        for future in done:
+            key = futures[future]
+            try:
+                urls[key] = future.result()
+            except Exception as e:
+                errors.append(f"{key}: {e}")
+                failed_key = failed_key or key
+        for future in not_done:
+            key = futures[future]
+            errors.append(f"{key}: cancelled after {failed_key} failed")
+            # 이미 시작된 업로드는 멈출 수 없으므로 늦게 성공하면 지운다
+            future.add_done_callback(
+                lambda f, key=key: (
+                    self.delete_batch([key])
+                    if not f.cancelled() and f.exception() is None
+                    else None
+                )
+            )
+
+        if errors:
+            # all-or-nothing: 올라간 파일은 지운다
+            self.delete_batch(list(urls.keys()))
+            raise RuntimeError(f"S3 batch upload failed: {errors}")
+
+        return urls
+
+    def is_content_key(self, key: str) -> bool:
+        return key.startswith(self.CONTENT_KEY_PREFIX)
+
+    def find_existing_content_keys(self, keys: list[str]) -> set[str]:
+        content_keys = [key for key in keys if self.is_content_key(key)]
+        if not content_keys:
+            return set()
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for key in content_keys:
+                pipe.exists(f"{self.CONTENT_INDEX_PREFIX}{key}")
+            found = pipe.execute()
+        except RedisError as e:
+            logger.warning(f"S3 content index 조회 실패, 전부 업로드: {e}")
+            return set()
+        return {key for key, hit in zip(content_keys, found) if hit}
+
+    def mark_content_keys(self, keys: list[str]) -> None:
+        content_keys = [key for key in keys if self.is_content_key(key)]
+        if not content_keys:
+            return
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for key in content_keys:
+                pipe.set(
+                    f"{self.CONTENT_INDEX_PREFIX}{key}", "1", ex=self.content_index_ttl
+                )
+            pipe.execute()
+        except RedisError as e:
+            logger.warning(f"S3 content index 저장 실패: {e}")
+
+    @override
+    def delete_batch(self, keys: list[str]) -> None:
+        # content-addressed 객체는 같은 내용을 쓰는 다른 요청이 공유할 수 있으므로 지우지 않는다
+        keys = [key for key in keys if not self.is_content_key(key)]
+        if not keys:
+            return
+        try:
+            self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
+        except (ClientError, BotoCoreError) as e:
+            logger.error(f"S3 업로드 롤백 실패 {keys}: {e}")
@@ -53,3 +53,15 @@ class PagedProjectsResponse(BaseModel):
 class APIResponseList(BaseModel):
     data: PagedProjectsResponse
     message: str
+
+
+class CursorPagedProjectsResponse(BaseModel):
+    items: List[MonitoringProjectWithBothDashboardsResponse]
+    page_size: int
+    has_next: bool
+    next_cursor: Optional[str] = None
+
+
+class APIResponseCursorList(BaseModel):
+    data: CursorPagedProjectsResponse
+    message: str
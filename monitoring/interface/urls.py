@@ -1,20 +1,33 @@
 from django.urls import path
 
+from config import settings
 from monitoring.interface.views.log_monitoring_project_views import (
+    AsyncLogMonitoringProjectStep1View,
     LogMonitoringProjectStep1View,
+    LogMonitoringProjectStep2BulkView,
     LogMonitoringProjectStep2View,
 )
 from monitoring.interface.views.my_monitoring_project_views import (
+    AsyncMyMonitoringProjectProgressView,
+    AsyncMyMonitoringProjectView,
+    MyMonitoringProjectProgressView,
     MyMonitoringProjectView,
 )
 from monitoring.interface.views.my_monitoring_projects_view import (
+    AsyncMyMonitoringProjectsView,
     MyMonitoringProjectsView,
 )
 
+
+def _view(sync_view, async_view):
+    """ASGI로 띄울 때(scripts/start-django-asgi.sh)는 네트워크 대기가 긴 endpoint를 async view로"""
+    return (async_view if settings.ASYNC_VIEWS_ENABLED else sync_view).as_view()
+
+
 urlpatterns = [
     path(
         "monitoring/log-project/step1",
-        LogMonitoringProjectStep1View.as_view(),
+        _view(LogMonitoringProjectStep1View, AsyncLogMonitoringProjectStep1View),
         name="logProjectStep1",
     ),
     path(
@@ -22,14 +35,24 @@ urlpatterns = [
         LogMonitoringProjectStep2View.as_view(),
         name="logProjectStep2",
     ),
+    path(  # 여러 프로젝트 step2 일괄 처리
+        "monitoring/log-project/step2/bulk",
+        LogMonitoringProjectStep2BulkView.as_view(),
+        name="logProjectStep2Bulk",
+    ),
     path(  # 내 모니터링 프로젝트 목록
         "monitoring/project/<str:project_id>/",
-        MyMonitoringProjectView.as_view(),
+        _view(MyMonitoringProjectView, AsyncMyMonitoringProjectView),
         name="monitoring-project-detail",
     ),
+    path(  # 프로비저닝 진행 상황 (SSE)
+        "monitoring/project/<str:project_id>/events/",
+        _view(MyMonitoringProjectProgressView, AsyncMyMonitoringProjectProgressView),
+        name="monitoring-project-events",
+    ),
     path(
         "monitoring/projects/",
-        MyMonitoringProjectsView.as_view(),
+        _view(MyMonitoringProjectsView, AsyncMyMonitoringProjectsView),
         name="monitoring-projects-list",
     ),
 ]
@@ -1,12 +1,16 @@
 import uuid
+from dataclasses import asdict
 
 from drf_spectacular.utils import OpenApiResponse, extend_schema
 from pydantic import BaseModel, Field
 from rest_framework import status
 from rest_framework.views import APIView
 
+from common.container import container
+from common.interface.async_api_view import AsyncAPIView
 from common.interface.response import ErrorResponse, error_response, success_response
 from common.interface.validators import validate_body
+from config import settings
 from monitoring.domain.log_agent.agent_provision_context import PlatformType
 from monitoring.domain.log_agent.log_collector import (
     FilterCondition,
@@ -15,6 +19,7 @@ from monitoring.domain.log_agent.log_collector import (
     LogInputType,
 )
 from monitoring.domain.log_agent.log_router import LogRouterConfigContext
+from monitoring.domain.monitoring_project import MonitoringProject
 from monitoring.service.exceptions import MonitoringProjectException
 from monitoring.service.monitoring_project_service import MonitoringProjectService
 from user.domain.user import User
@@ -43,10 +48,7 @@ class LogMonitoringProjectStep1View(APIView):
         filters: list[FilterCondition] = []
         platform: PlatformType = PlatformType.WINDOWS
 
-    def __init__(self):
-        self.project_service = MonitoringProjectService()
-
-    @extend_schema(
+    POST_SCHEMA = dict(
         summary="로그 프로젝트 생성 (1단계)",
         request=PydanticToDjangoSerializer.convert(Step1Request),
         responses={
@@ -69,6 +71,11 @@ class LogMonitoringProjectStep1View(APIView):
             ),
         },
     )
+
+    def __init__(self):
+        self.project_service = container.resolve(MonitoringProjectService)
+
+    @extend_schema(**POST_SCHEMA)
     @validate_token(
         roles=[UserRole.USER, UserRole.USER], validate_type=UserTokenType.ACCESS
     )
@@ -78,6 +85,23 @@ class LogMonitoringProjectStep1View(APIView):
             user = UserService.get_user_from_token_payload(token_payload)
         except ValueError as e:
             return error_response(status=status.HTTP_403_FORBIDDEN, message=str(e))
+
+        collector_ctx, router_ctx = self._build_agent_contexts(body)
+        project = self.project_service.start_log_project_step1(
+            user=user,
+            project_name=body.project_name,
+            project_description=body.project_description,
+            log_collector_ctx=collector_ctx,
+            log_router_ctx=router_ctx,
+            platform=body.platform,
+        )
+
+        return self._created_response(project)
+
+    @staticmethod
+    def _build_agent_contexts(
+        body: Step1Request,
+    ) -> tuple[LogCollectorConfigContext, LogRouterConfigContext]:
         # TODO: hash테이블 적용해서 알맞은 큐에 집어넣는 로직 추가해야함
         project_id = str(uuid.uuid4())
 
@@ -112,12 +136,44 @@ class LogMonitoringProjectStep1View(APIView):
             mq_persistent=True,
             mq_heartbeat=30,
         )
+        return collector_ctx, router_ctx
+
+    @staticmethod
+    def _created_response(project: MonitoringProject):
+        return success_response(
+            status=status.HTTP_200_OK,
+            message="OK",
+            data={
+                "project_id": project.id,
+                "set_up_script_url": project.agent_context.set_up_script_url,
+            },
+        )
+
+
+class AsyncLogMonitoringProjectStep1View(AsyncAPIView, LogMonitoringProjectStep1View):
+    """
+    step1의 async 버전 (ASYNC_VIEWS_ENABLED). 템플릿 렌더링 후 S3 업로드 3건을
+    기다리는 동안 워커 스레드를 잡지 않으므로 적은 프로세스로 많은 동시 요청을 받는다.
+    """
+
+    @extend_schema(**LogMonitoringProjectStep1View.POST_SCHEMA)
+    @validate_token(
+        roles=[UserRole.USER, UserRole.USER], validate_type=UserTokenType.ACCESS
+    )
+    @validate_body(LogMonitoringProjectStep1View.Step1Request)
+    async def post(
+        self,
+        request,
+        token_payload: UserTokenPayload,
+        body: LogMonitoringProjectStep1View.Step1Request,
+    ):
         try:
-            user = UserService.get_user_from_token_payload(token_payload)
+            user = await UserService.aget_user_from_token_payload(token_payload)
         except ValueError as e:
             return error_response(status=status.HTTP_403_FORBIDDEN, message=str(e))
 
-        project = self.project_service.start_log_project_step1(
+        collector_ctx, router_ctx = self._build_agent_contexts(body)
+        project = await self.project_service.astart_log_project_step1(
             user=user,
             project_name=body.project_name,
             project_description=body.project_description,
@@ -126,14 +182,7 @@ class LogMonitoringProjectStep1View(APIView):
             platform=body.platform,
         )
 
-        return success_response(
-            status=status.HTTP_200_OK,
-            message="OK",
-            data={
-                "project_id": project.id,
-                "set_up_script_url": project.agent_context.set_up_script_url,
-            },
-        )
+        return self._created_response(project)
 
 
 class LogMonitoringProjectStep2View(APIView):
@@ -141,7 +190,7 @@ class LogMonitoringProjectStep2View(APIView):
         project_id: str = Field(min_length=32)
 
     def __init__(self):
-        self.project_service = MonitoringProjectService()
+        self.project_service = container.resolve(MonitoringProjectService)
 
     @extend_schema(
         summary="로그 프로젝트 설정 완료 처리 (2단계)",
@@ -177,3 +226,61 @@ class LogMonitoringProjectStep2View(APIView):
                 message=e.message,
                 detail=e.detail,
             )
+
+
+class LogMonitoringProjectStep2BulkView(APIView):
+    class Step2BulkRequest(BaseModel):
+        project_ids: list[str] = Field(
+            min_length=1, max_length=settings.PROVISION_BULK_MAX_PROJECTS
+        )
+
+    def __init__(self):
+        self.project_service = container.resolve(MonitoringProjectService)
+
+    @extend_schema(
+        summary="로그 프로젝트 설정 완료 일괄 처리 (2단계)",
+        request=PydanticToDjangoSerializer.convert(Step2BulkRequest),
+        responses={
+            200: OpenApiResponse(
+                description="프로젝트별 프로비저닝 발행 결과 (요청 순서)",
+                response={
+                    "type": "object",
+                    "properties": {
+                        "results": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "project_id": {"type": "string"},
+                                    "dispatched": {"type": "boolean"},
+                                    "code": {"type": "string", "nullable": True},
+                                    "message": {"type": "string", "nullable": True},
+                                },
+                            },
+                        },
+                    },
+                },
+            ),
+            403: OpenApiResponse(
+                response=PydanticToDjangoSerializer.convert(ErrorResponse)
+            ),
+        },
+    )
+    @validate_token(
+        roles=[UserRole.USER, UserRole.USER], validate_type=UserTokenType.ACCESS
+    )
+    @validate_body(Step2BulkRequest)
+    def post(self, request, token_payload: UserTokenPayload, body: Step2BulkRequest):
+        try:
+            user = UserService.get_user_from_token_payload(token_payload)
+        except ValueError as e:
+            return error_response(status=status.HTTP_403_FORBIDDEN, message=str(e))
+
+        results = self.project_service.start_log_project_step2_bulk(
+            user=user, project_ids=body.project_ids
+        )
+        return success_response(
+            status=status.HTTP_200_OK,
+            message="OK",
+            data={"results": [asdict(result) for result in results]},
+        )
@@ -1,10 +1,23 @@
+from typing import AsyncIterator, Iterator
+
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.views import APIView
 
-from common.interface.response import ErrorResponse, error_response, success_response
+from common.container import container
+from common.interface.async_api_view import AsyncAPIView
+from common.interface.response import (
+    ErrorResponse,
+    EventStreamRenderer,
+    error_response,
+    event_stream_response,
+    sse_message,
+    success_response,
+)
 from monitoring.domain.monitoring_project import MonitoringProjectWithBothDashboardsDto
+from monitoring.domain.provision_progress import ProvisionProgressEvent
 from monitoring.interface.DTO.responseDTO import APIResponseList
 from monitoring.service.exceptions import MonitoringProjectException
 from monitoring.service.monitoring_project_service import MonitoringProjectService
@@ -16,10 +29,7 @@ from util.pydantic_serializer import PydanticToDjangoSerializer
 
 
 class MyMonitoringProjectView(APIView):
-    def __init__(self):
-        self.project_service = MonitoringProjectService()
-
-    @extend_schema(
+    GET_SCHEMA = dict(
         summary="내 모니터링 프로젝트 가져오기",
         parameters=[
             OpenApiParameter(
@@ -40,6 +50,11 @@ class MyMonitoringProjectView(APIView):
             ),
         },
     )
+
+    def __init__(self):
+        self.project_service = container.resolve(MonitoringProjectService)
+
+    @extend_schema(**GET_SCHEMA)
     @validate_token(
         roles=[UserRole.USER, UserRole.ADMIN],
         validate_type=UserTokenType.ACCESS,
@@ -74,3 +89,152 @@ class MyMonitoringProjectView(APIView):
                 message=e.message,
                 detail=e.detail,
             )
+
+
+class AsyncMyMonitoringProjectView(AsyncAPIView, MyMonitoringProjectView):
+    @extend_schema(**MyMonitoringProjectView.GET_SCHEMA)
+    @validate_token(
+        roles=[UserRole.USER, UserRole.ADMIN],
+        validate_type=UserTokenType.ACCESS,
+    )
+    async def get(self, request, project_id: str, token_payload: UserTokenPayload):
+        try:
+            user = await UserService.aget_user_from_token_payload(token_payload)
+        except ValueError as e:
+            return error_response(
+                status=status.HTTP_403_FORBIDDEN,
+                message=str(e),
+            )
+
+        try:
+            await self.project_service.acheck_permission(user, project_id)
+            dto = await self.project_service.aget_project_detail(project_id=project_id)
+            return success_response(
+                status=status.HTTP_200_OK,
+                message="OK",
+                data=dto.to_dict(),
+            )
+
+        except MonitoringProjectException as e:
+            return error_response(
+                message=e.message,
+                detail=e.detail,
+            )
+
+
+class MyMonitoringProjectProgressView(APIView):
+    """
+    프로비저닝 진행 상황 SSE 스트림. step2 이후 상세 조회를 polling 하는 대신 사용.
+    - event: project → 프로젝트 상태 (READY/FAILED면 스트림 종료)
+    - event: step → 단계(태스크)별 상태
+    토큰은 Authorization 헤더로 받으므로 브라우저 기본 EventSource 대신 fetch 기반 클라이언트 사용
+    """
+
+    renderer_classes = [EventStreamRenderer, JSONRenderer]
+
+    GET_SCHEMA = dict(
+        summary="내 모니터링 프로젝트 프로비저닝 진행 상황 (SSE)",
+        parameters=[
+            OpenApiParameter(
+                name="project_id",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description="프로젝트 UUID",
+                required=True,
+            ),
+        ],
+        responses={
+            (200, "text/event-stream"): OpenApiResponse(
+                response=OpenApiTypes.STR,
+                description="event: project|step, data: 진행 상황 이벤트 JSON",
+            ),
+            403: OpenApiResponse(
+                response=PydanticToDjangoSerializer.convert(ErrorResponse)
+            ),
+            503: OpenApiResponse(
+                response=PydanticToDjangoSerializer.convert(ErrorResponse)
+            ),
+        },
+    )
+
+    def __init__(self):
+        self.project_service = container.resolve(MonitoringProjectService)
+
+    @extend_schema(**GET_SCHEMA)
+    @validate_token(
+        roles=[UserRole.USER, UserRole.ADMIN],
+        validate_type=UserTokenType.ACCESS,
+    )
+    def get(self, request, project_id: str, token_payload: UserTokenPayload):
+        try:
+            user = UserService.get_user_from_token_payload(token_payload)
+        except ValueError as e:
+            return error_response(
+                status=status.HTTP_403_FORBIDDEN,
+                message=str(e),
+            )
+
+        try:
+            self.project_service.check_permission(user, project_id)
+            events = self.project_service.stream_provision_progress(project_id)
+        except MonitoringProjectException as e:
+            return error_response(
+                message=e.message,
+                detail=e.detail,
+            )
+
+        return event_stream_response(self._to_messages(events))
+
+    @staticmethod
+    def _to_messages(
+        events: Iterator[ProvisionProgressEvent | None],
+    ) -> Iterator[str]:
+        for event in events:
+            if event is None:
+                yield sse_message()
+            else:
+                yield sse_message(event.type, event.to_dict())
+
+
+class AsyncMyMonitoringProjectProgressView(
+    AsyncAPIView, MyMonitoringProjectProgressView
+):
+    """
+    진행 상황 SSE의 async 버전. ASGI에서 sync iterator 응답은 Django가 끝까지 모아서 보내므로
+    async iterator로 내보낸다. Redis 구독도 async라 스트림마다 스레드를 잡지 않는다.
+    """
+
+    @extend_schema(**MyMonitoringProjectProgressView.GET_SCHEMA)
+    @validate_token(
+        roles=[UserRole.USER, UserRole.ADMIN],
+        validate_type=UserTokenType.ACCESS,
+    )
+    async def get(self, request, project_id: str, token_payload: UserTokenPayload):
+        try:
+            user = await UserService.aget_user_from_token_payload(token_payload)
+        except ValueError as e:
+            return error_response(
+                status=status.HTTP_403_FORBIDDEN,
+                message=str(e),
+            )
+
+        try:
+            await self.project_service.acheck_permission(user, project_id)
+            events = await self.project_service.astream_provision_progress(project_id)
+        except MonitoringProjectException as e:
+            return error_response(
+                message=e.message,
+                detail=e.detail,
+            )
+
+        return event_stream_response(self._to_async_messages(events))
+
+    @staticmethod
+    async def _to_async_messages(
+        events: AsyncIterator[ProvisionProgressEvent | None],
+    ) -> AsyncIterator[str]:
+        async for event in events:
+            if event is None:
+                yield sse_message()
+            else:
+                yield sse_message(event.type, event.to_dict())
@@ -1,14 +1,23 @@
+from enum import StrEnum
+
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
 from pydantic import BaseModel, Field
 from rest_framework import status
 from rest_framework.views import APIView
 
-from common.interface.response import ErrorResponse, success_response
+from common.container import container
+from common.domain import CursorPagedResult, PagedResult
+from common.interface.async_api_view import AsyncAPIView
+from common.interface.response import ErrorResponse, error_response, success_response
 from common.interface.validators import validate_query_params
 from common.service.paging import Paginator
+from common.service.token.exception import PagingException
+from monitoring.domain.monitoring_project import MonitoringProjectWithBothDashboardsDto
 from monitoring.interface.DTO.responseDTO import (
+    APIResponseCursorList,
     APIResponseList,
+    CursorPagedProjectsResponse,
     MonitoringProjectWithBothDashboardsResponse,
     PagedProjectsResponse,
 )
@@ -20,7 +29,16 @@ from user.service.user_service import UserService
 from util.pydantic_serializer import PydanticToDjangoSerializer
 
 
+class PaginationType(StrEnum):
+    PAGE = "page"  # page/page_size 기반 (기본)
+    CURSOR = "cursor"  # (created_at, id) keyset 기반
+
+
 class MyProjectsQueryParams(BaseModel):
+    pagination: PaginationType = Field(
+        PaginationType.PAGE, description="페이징 방식 (page | cursor)"
+    )
+    cursor: str | None = Field(None, description="cursor 모드의 다음 페이지 커서")
     page: int = Field(1, ge=1, description="페이지 번호")
     page_size: int = Field(
         10,
@@ -31,12 +49,24 @@ class MyProjectsQueryParams(BaseModel):
 
 
 class MyMonitoringProjectsView(APIView):
-    def __init__(self):
-        self.project_service = MonitoringProjectService()
-
-    @extend_schema(
+    GET_SCHEMA = dict(
         summary="내 모든 모니터링 프로젝트 상세 조회",
         parameters=[
+            OpenApiParameter(
+                name="pagination",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="페이징 방식 page | cursor (기본:page)",
+                required=False,
+                enum=[t.value for t in PaginationType],
+            ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="cursor 모드에서 이전 응답의 next_cursor (첫 페이지는 생략)",
+                required=False,
+            ),
             OpenApiParameter(
                 name="page",
                 type=OpenApiTypes.INT,
@@ -55,7 +85,14 @@ class MyMonitoringProjectsView(APIView):
         responses={
             200: OpenApiResponse(
                 response=PydanticToDjangoSerializer.convert(APIResponseList),
-                description="페이징된 프로젝트 리스트",
+                description=(
+                    "페이징된 프로젝트 리스트. "
+                    "pagination=cursor 이면 data는 "
+                    "{items, page_size, has_next, next_cursor} 형태"
+                ),
+            ),
+            400: OpenApiResponse(
+                response=PydanticToDjangoSerializer.convert(ErrorResponse)
             ),
             403: OpenApiResponse(
                 response=PydanticToDjangoSerializer.convert(ErrorResponse)
@@ -65,6 +102,11 @@ class MyMonitoringProjectsView(APIView):
             ),
         },
     )
+
+    def __init__(self):
+        self.project_service = container.resolve(MonitoringProjectService)
+
+    @extend_schema(**GET_SCHEMA)
     @validate_token(
         roles=[UserRole.USER, UserRole.ADMIN],
         validate_type=UserTokenType.ACCESS,
@@ -79,13 +121,36 @@ class MyMonitoringProjectsView(APIView):
         # user 추출
         user = UserService.get_user_from_token_payload(token_payload)
 
+        try:
+            if params.pagination == PaginationType.CURSOR:
+                return self._get_by_cursor(user.id, params)
+            return self._get_by_page(user.id, params)
+        except PagingException as e:
+            return error_response(
+                code=e.code,
+                message=str(e),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+    def _get_by_page(self, user_id: str, params: MyProjectsQueryParams):
         # 서비스 호출 (paging은 서비스 레이어에서 처리됨)
         paged = self.project_service.get_my_projects_detail(
-            user_id=user.id,
+            user_id=user_id,
             page=params.page,
             page_size=params.page_size,
         )
+        return self._page_response(paged)
 
+    def _get_by_cursor(self, user_id: str, params: MyProjectsQueryParams):
+        paged = self.project_service.get_my_projects_detail_by_cursor(
+            user_id=user_id,
+            cursor=params.cursor,
+            page_size=params.page_size,
+        )
+        return self._cursor_page_response(paged)
+
+    @staticmethod
+    def _page_response(paged: PagedResult[MonitoringProjectWithBothDashboardsDto]):
         # DTO → Pydantic 변환
         items: list[MonitoringProjectWithBothDashboardsResponse] = [
             MonitoringProjectWithBothDashboardsResponse(**dto.to_dict())
@@ -107,5 +172,67 @@ class MyMonitoringProjectsView(APIView):
         return success_response(
             status=status.HTTP_200_OK,
             message=payload.message,
-            data=payload.data.model_dump(),
+            data=payload.data,
+        )
+
+    @staticmethod
+    def _cursor_page_response(
+        paged: CursorPagedResult[MonitoringProjectWithBothDashboardsDto],
+    ):
+        items: list[MonitoringProjectWithBothDashboardsResponse] = [
+            MonitoringProjectWithBothDashboardsResponse(**dto.to_dict())
+            for dto in paged.items
+        ]
+        payload = APIResponseCursorList(
+            data=CursorPagedProjectsResponse(
+                items=items,
+                page_size=paged.page_size,
+                has_next=paged.has_next,
+                next_cursor=paged.next_cursor,
+            ),
+            message="OK",
+        )
+
+        return success_response(
+            status=status.HTTP_200_OK,
+            message=payload.message,
+            data=payload.data,
         )
+
+
+class AsyncMyMonitoringProjectsView(AsyncAPIView, MyMonitoringProjectsView):
+    @extend_schema(**MyMonitoringProjectsView.GET_SCHEMA)
+    @validate_token(
+        roles=[UserRole.USER, UserRole.ADMIN],
+        validate_type=UserTokenType.ACCESS,
+    )
+    @validate_query_params(MyProjectsQueryParams)
+    async def get(
+        self,
+        request,
+        token_payload: UserTokenPayload,
+        params: MyProjectsQueryParams,
+    ):
+        user = await UserService.aget_user_from_token_payload(token_payload)
+
+        try:
+            if params.pagination == PaginationType.CURSOR:
+                paged = await self.project_service.aget_my_projects_detail_by_cursor(
+                    user_id=user.id,
+                    cursor=params.cursor,
+                    page_size=params.page_size,
+                )
+                return self._cursor_page_response(paged)
+
+            paged = await self.project_service.aget_my_projects_detail(
+                user_id=user.id,
+                page=params.page,
+                page_size=params.page_size,
+            )
+            return self._page_response(paged)
+        except PagingException as e:
+            return error_response(
+                code=e.code,
+                message=str(e),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
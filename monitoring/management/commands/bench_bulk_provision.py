@@ -0,0 +1,94 @@
+import time
+import uuid
+
+from celery.signals import after_task_publish
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from config.celery import app
+from monitoring.infra.models.monitoring_project_model import MonitoringProjectModel
+from monitoring.infra.models.visualization_platform_model import UserFolderModel
+from monitoring.service.monitoring_project_service import MonitoringProjectService
+from user.domain.user import OAuthType, User
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "step2 N건: 프로젝트별 start_log_project_step2 반복 vs start_log_project_step2_bulk 1회. "
+        "합성 프로젝트는 트랜잭션 안에서 만들고 롤백한다. (Redis 필요, broker 기본값은 memory://)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--projects", type=int, default=50)
+        parser.add_argument(
+            "--broker",
+            default="memory://",
+            help="실제 broker로 confirm 포함 비교 시 지정 (발행된 태스크는 워커가 실행하므로 주의)",
+        )
+
+    def handle(self, *args, **options):
+        app.conf.broker_url = app.conf.broker_write_url = options["broker"]
+        count = options["projects"]
+
+        published: list[str] = []
+
+        def on_publish(sender=None, **kwargs):
+            published.append(sender)
+
+        after_task_publish.connect(on_publish, weak=False)
+        try:
+            for label, bulk in [("single", False), ("bulk", True)]:
+                published.clear()
+                try:
+                    with transaction.atomic():
+                        user, project_ids = self.populate(count)
+                        service = MonitoringProjectService()
+                        with CaptureQueriesContext(connection) as queries:
+                            start = time.perf_counter()
+                            if bulk:
+                                service.start_log_project_step2_bulk(user, project_ids)
+                            else:
+                                for project_id in project_ids:
+                                    service.start_log_project_step2(user, project_id)
+                            elapsed = time.perf_counter() - start
+                        raise _Rollback
+                except _Rollback:
+                    pass
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"[{label}] {count} projects: {elapsed * 1000:.0f}ms, "
+                        f"{len(queries)} SQL statements, {len(published)} messages"
+                    )
+                )
+        finally:
+            after_task_publish.disconnect(on_publish)
+
+    def populate(self, count: int) -> tuple[User, list[str]]:
+        user = User(
+            id=str(uuid.uuid4()),
+            name="bench",
+            email=None,
+            mobile_no=None,
+            oauth_type=OAuthType.GOOGLE,
+            oauth_id="bench",
+            tos_agreed=True,
+            created_at="",
+            updated_at="",
+        )
+        # 폴더가 이미 있는 사용자: 프로젝트마다 워크플로우가 따로 발행된다
+        UserFolderModel.objects.create(
+            id=str(uuid.uuid4()), user_id=user.id, uid=str(uuid.uuid4()), name="bench"
+        )
+        project_ids = [uuid.uuid4().hex for _ in range(count)]
+        MonitoringProjectModel.objects.bulk_create(
+            MonitoringProjectModel(
+                id=project_id, user_id=user.id, name=f"bench-{i}", project_type="LOG"
+            )
+            for i, project_id in enumerate(project_ids)
+        )
+        return user, project_ids
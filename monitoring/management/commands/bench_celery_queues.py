@@ -0,0 +1,128 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from celery import Celery
+from celery.contrib.testing.worker import start_worker
+from django.core.management.base import BaseCommand
+
+from config.celery import app
+from monitoring.infra.grafana.grafana_http_client import GrafanaHttpClient
+
+# 실제 broker 없이 워커 pool만 비교하기 위한 in-memory app
+bench_app = Celery("bench_celery_queues", broker="memory://", backend="cache+memory://")
+bench_app.conf.broker_transport_options = {"polling_interval": 0.01}
+bench_app.conf.task_ignore_result = True
+
+_state: dict = {"client": None, "done": 0}
+_lock = threading.Lock()
+_finished = threading.Event()
+
+
+@bench_app.task(name="bench.grafana_call")
+def bench_grafana_call(total: int):
+    _state["client"].request("GET", "/api/folders")
+    with _lock:
+        _state["done"] += 1
+        if _state["done"] == total:
+            _finished.set()
+
+
+def _stub_grafana(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True  # 헤더/본문을 나눠 쓸 때 delayed ACK 대기 방지
+
+        def do_GET(self):
+            time.sleep(latency)
+            body = json.dumps([]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class Command(BaseCommand):
+    help = (
+        "Grafana 호출 태스크 처리량: 기존 단일 슬롯(--concurrency=1) vs threads pool. "
+        "지연을 주는 로컬 stub Grafana와 in-memory broker 사용. 현재 라우팅 표도 함께 출력"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=200)
+        parser.add_argument("--latency", type=float, default=0.05)
+        parser.add_argument("--concurrency", type=int, default=32)
+
+    def handle(self, *args, **options):
+        self.print_routes()
+
+        server = _stub_grafana(options["latency"])
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            single = self.run_serial(base_url, options["tasks"])
+            threads = self.run(
+                base_url, options["tasks"], "threads", options["concurrency"]
+            )
+        finally:
+            server.shutdown()
+
+        tasks = options["tasks"]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{tasks} Grafana calls, {options['latency'] * 1000:.0f}ms latency: "
+                f"single slot {single:.2f}s ({tasks / single:.0f}/s, broker 오버헤드 제외), "
+                f"threads x{options['concurrency']} {threads:.2f}s "
+                f"({tasks / threads:.0f}/s)"
+            )
+        )
+
+    def print_routes(self) -> None:
+        router = app.amqp.router
+        for name in sorted(app.tasks):
+            if name.startswith("monitoring."):
+                queue = router.route({}, name)["queue"].name
+                self.stdout.write(f"{queue:<20} {name}")
+
+    def run_serial(self, base_url: str, total: int) -> float:
+        """
+        기존 단일 슬롯 워커(--concurrency=1)의 상한: 태스크를 하나씩 순서대로 실행한 시간
+        """
+        client = GrafanaHttpClient(base_url=base_url, headers={}, pool_size=1)
+        _state.update(client=client, done=0)
+        try:
+            start = time.perf_counter()
+            for _ in range(total):
+                bench_grafana_call.apply(args=(total,))
+            return time.perf_counter() - start
+        finally:
+            client.close()
+
+    def run(self, base_url: str, total: int, pool: str, concurrency: int) -> float:
+        client = GrafanaHttpClient(base_url=base_url, headers={}, pool_size=concurrency)
+        _state.update(client=client, done=0)
+        _finished.clear()
+        try:
+            with start_worker(
+                bench_app,
+                pool=pool,
+                concurrency=concurrency,
+                perform_ping_check=False,
+            ):
+                start = time.perf_counter()
+                for _ in range(total):
+                    bench_grafana_call.delay(total)
+                if not _finished.wait(timeout=total * 2 + 30):
+                    raise RuntimeError("태스크가 제한 시간 안에 끝나지 않았습니다.")
+                return time.perf_counter() - start
+        finally:
+            client.close()
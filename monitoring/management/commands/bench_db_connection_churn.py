@@ -0,0 +1,75 @@
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.utils import load_backend
+
+
+class Command(BaseCommand):
+    help = (
+        "요청/태스크마다 커넥션을 열고 닫는 패턴(Django 기본 postgresql 엔진) vs "
+        "풀 엔진(common.db.backends.postgresql_pool) 비교. Postgres가 필요하다"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=500)
+        parser.add_argument("--threads", type=int, default=16)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        threads = options["threads"]
+        base = connections.settings[DEFAULT_DB_ALIAS]
+
+        for engine in (
+            "django.db.backends.postgresql",
+            "common.db.backends.postgresql_pool",
+        ):
+            settings_dict = copy.deepcopy(base)
+            settings_dict["ENGINE"] = engine
+            settings_dict["CONN_MAX_AGE"] = 0
+            backend = load_backend(engine)
+            # 실제 "default" 풀과 섞이지 않도록 별도 alias
+            alias = f"bench_{engine.rsplit('.', 1)[-1]}"
+
+            def request_cycle():
+                """요청 하나: 쿼리 한 번 후 request_finished처럼 close"""
+                wrapper = backend.DatabaseWrapper(settings_dict, alias)
+                start = time.perf_counter()
+                with wrapper.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                wrapper.close()
+                return time.perf_counter() - start
+
+            request_cycle()  # 풀 생성/첫 연결은 제외
+
+            start = time.perf_counter()
+            serial = [request_cycle() for _ in range(iterations)]
+            serial_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                concurrent = list(
+                    executor.map(lambda _: request_cycle(), range(iterations))
+                )
+            concurrent_elapsed = time.perf_counter() - start
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[{engine}] serial {serial_elapsed / iterations * 1000:.2f}ms/req "
+                    f"(p99 {self.p99(serial) * 1000:.2f}ms) | "
+                    f"{threads} threads {iterations / concurrent_elapsed:.0f} req/s "
+                    f"(p99 {self.p99(concurrent) * 1000:.2f}ms)"
+                )
+            )
+
+            pool = getattr(backend.DatabaseWrapper(settings_dict, alias), "pool", None)
+            if pool is not None:
+                self.stdout.write(f"  pool stats: {pool.stats()}")
+                pool.close()
+
+    @staticmethod
+    def p99(samples: list[float]) -> float:
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
@@ -0,0 +1,71 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from common.container import container
+from monitoring.interface.views.log_monitoring_project_views import (
+    LogMonitoringProjectStep2View,
+)
+from monitoring.interface.views.my_monitoring_projects_view import (
+    MyMonitoringProjectsView,
+)
+from user.interface.views.user_views import OAuthLoginView
+
+
+class Command(BaseCommand):
+    help = (
+        "요청마다 생성되는 APIView 인스턴스 비용: 의존성 전체를 매번 새로 생성(기존 방식, "
+        "컨테이너 싱글턴을 매번 비움) vs 컨테이너 싱글턴 재사용"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        views = [
+            MyMonitoringProjectsView,
+            LogMonitoringProjectStep2View,
+            OAuthLoginView,
+        ]
+        for view_cls in views:
+            per_request = self.measure(view_cls, iterations, fresh=True)
+            shared = self.measure(view_cls, iterations, fresh=False)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[{view_cls.__name__}] per-request graph "
+                    f"{per_request[0]:.0f}us, {per_request[1] / 1024:.0f}KiB "
+                    f"| container {shared[0]:.1f}us, {shared[1] / 1024:.1f}KiB"
+                )
+            )
+        container.reset()
+
+    def measure(self, view_cls, iterations: int, fresh: bool) -> tuple[float, float]:
+        """:return: (요청당 평균 us, 요청당 평균 최대 메모리 증가 bytes)"""
+        container.reset()
+        view_cls()  # 모듈 import, 템플릿 Environment 등 프로세스당 한 번인 비용은 제외
+
+        total = 0.0
+        for _ in range(iterations):
+            if fresh:
+                container.reset()
+            start = time.perf_counter()
+            view_cls()
+            total += time.perf_counter() - start
+
+        # tracemalloc은 시간 측정을 왜곡하므로 따로 돈다
+        memory = 0
+        tracemalloc.start()
+        try:
+            for _ in range(iterations):
+                if fresh:
+                    container.reset()
+                before, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                view_cls()
+                _, peak = tracemalloc.get_traced_memory()
+                memory += peak - before
+        finally:
+            tracemalloc.stop()
+        return total / iterations * 1_000_000, memory / iterations
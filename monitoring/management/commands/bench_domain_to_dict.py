@@ -0,0 +1,77 @@
+import json
+import time
+from dataclasses import asdict
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from common.domain import Domain
+from common.utils.base import remove_none
+from monitoring.management.commands.bench_response_serialization import (
+    Command as ResponseBench,
+)
+
+
+def legacy_to_dict(obj: Domain, excludes: list[str] = []) -> dict[str, Any]:
+    # 변경 전 Domain.to_dict
+    dto = remove_none(json.dumps(asdict(obj), default=str))
+    if excludes:
+        return {key: value for key, value in dto.items() if key not in excludes}
+    return dto
+
+
+class Command(BaseCommand):
+    help = "Domain.to_dict 비교: asdict + json 왕복 + deepcopy(기존) vs 필드 한 번 순회"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        page = ResponseBench.make_page(100, 6).items
+        dashboard = page[0].dashboard
+        dashboard.config_json = self.config_json(14 * 1024)
+        config_kib = len(json.dumps(dashboard.config_json)) // 1024
+        cases = {
+            "프로젝트 DTO 100건 (대시보드 패널 6개)": page,
+            f"대시보드 (config_json {config_kib} KiB)": [dashboard],
+        }
+
+        for name, objs in cases.items():
+            start = time.perf_counter()
+            for _ in range(iterations):
+                for obj in objs:
+                    legacy_to_dict(obj)
+            before = (time.perf_counter() - start) / iterations * 1000
+
+            start = time.perf_counter()
+            for _ in range(iterations):
+                for obj in objs:
+                    obj.to_dict()
+            after = (time.perf_counter() - start) / iterations * 1000
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{name}: before {before:.3f} ms, after {after:.3f} ms "
+                    f"({before / after:.1f}x)"
+                )
+            )
+
+    @staticmethod
+    def config_json(size: int) -> dict[str, Any]:
+        # Grafana dashboard JSON 비슷한 모양으로 size 바이트 정도
+        panels = []
+        while len(json.dumps(panels)) < size:
+            i = len(panels)
+            panels.append(
+                {
+                    "id": i,
+                    "type": "logs",
+                    "title": f"panel {i}",
+                    "datasource": {"type": "elasticsearch", "uid": None},
+                    "gridPos": {"h": 8, "w": 12, "x": (i % 2) * 12, "y": i * 8},
+                    "options": {"showTime": True, "wrapLogMessage": False},
+                    "targets": [{"refId": "A", "query": "*", "metrics": []}],
+                }
+            )
+        return {"title": "Logs", "uid": None, "panels": panels, "schemaVersion": 39}
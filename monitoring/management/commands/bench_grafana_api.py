@@ -0,0 +1,73 @@
+import time
+
+import httpx
+from django.core.management.base import BaseCommand
+
+from monitoring.infra.grafana.grafana_api import GrafanaAPI
+from monitoring.infra.grafana.grafana_stub_server import GrafanaStubServer
+
+
+class Command(BaseCommand):
+    help = "로컬 stub Grafana 대상 프로비저닝 체인(6회 호출) 지연시간: 호출마다 새 연결 vs 커넥션 풀"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chains", type=int, default=200)
+        parser.add_argument(
+            "--latency-ms", type=float, default=0.0, help="stub 응답 지연"
+        )
+
+    def run_chain_without_pool(self, base_url: str, headers: dict) -> None:
+        # 기존 방식: 모듈 레벨 함수 호출 → 매번 새 TCP 연결
+        def post(path: str, data: dict) -> dict:
+            response = httpx.request(
+                "POST", f"{base_url}{path}", json=data, headers=headers
+            )
+            response.raise_for_status()
+            return response.json()
+
+        post("/api/folders", {"title": "bench"})
+        post("/api/serviceaccounts", {"name": "bench", "role": "Viewer"})
+        post("/api/serviceaccounts/1/tokens", {"name": "bench"})
+        post(
+            "/api/folders/stub-folder/permissions",
+            {"items": [{"userId": 1, "permission": 1}]},
+        )
+        post(
+            "/api/dashboards/db",
+            {"dashboard": {}, "overwrite": True, "folderUid": "stub-folder"},
+        )
+        post("/api/dashboards/uid/stub-dash/public-dashboards", {"isEnabled": True})
+
+    def run_chain_with_pool(self, grafana_api: GrafanaAPI) -> None:
+        folder = grafana_api.create_folder("bench")
+        account = grafana_api.create_service_account("bench")
+        grafana_api.create_service_token(str(account["id"]), "bench")
+        grafana_api.set_folder_permissions(folder["uid"], str(account["id"]))
+        dashboard = grafana_api.create_dashboard({}, folder["uid"])
+        grafana_api.create_public_dashboard(dashboard["uid"])
+
+    def handle(self, *args, **options):
+        chains = options["chains"]
+
+        with GrafanaStubServer(latency_ms=options["latency_ms"]) as stub:
+            grafana_api = GrafanaAPI()
+            grafana_api.base_url = stub.url
+            grafana_api.headers["Authorization"] = "Bearer stub"
+
+            start = time.perf_counter()
+            for _ in range(chains):
+                self.run_chain_without_pool(stub.url, grafana_api.headers)
+            before = (time.perf_counter() - start) / chains * 1000
+
+            self.run_chain_with_pool(grafana_api)  # 커넥션 수립
+            start = time.perf_counter()
+            for _ in range(chains):
+                self.run_chain_with_pool(grafana_api)
+            after = (time.perf_counter() - start) / chains * 1000
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"chain(6 calls) 새 연결 {before:.2f} ms, 커넥션 풀 {after:.2f} ms "
+                f"({before / after:.1f}x)"
+            )
+        )
@@ -0,0 +1,96 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+
+from monitoring.infra.grafana.async_grafana_api import AsyncGrafanaAPI
+from monitoring.infra.grafana.grafana_api import GrafanaAPI
+from monitoring.infra.grafana.grafana_stub_server import GrafanaStubServer
+from monitoring.service.i_executors.excutor_DTO import ProjectProvisionRequest
+from monitoring.service.visualization_platform_batch_provisioner import (
+    VisualizationPlatformBatchProvisioner,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "로컬 stub Grafana 대상 N개 프로젝트 프로비저닝 시간: "
+        "동기 GrafanaAPI 순차 호출 vs 비동기 일괄 프로비저닝 (DB 저장 제외)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--projects", type=int, default=100)
+        parser.add_argument("--users", type=int, default=20)
+        parser.add_argument("--concurrency", type=int, default=20)
+        parser.add_argument(
+            "--latency-ms", type=float, default=20.0, help="stub 응답 지연"
+        )
+
+    def make_requests(self, projects: int, users: int) -> list[ProjectProvisionRequest]:
+        requests = []
+        for i in range(projects):
+            user_id = f"user-{i % users}"
+            project_id = str(uuid.uuid4())
+            requests.append(
+                ProjectProvisionRequest(
+                    user_id=user_id,
+                    project_id=project_id,
+                    folder_name=f"User_{user_id}'s Folder",
+                    account_name=f"service-{user_id}-{project_id}",
+                    token_name=f"token-{user_id}-{project_id}",
+                    dashboard_title=f"Logs Dashboard for {project_id}",
+                    dashboard_config={"title": project_id, "panels": []},
+                )
+            )
+        return requests
+
+    def provision_sequentially(
+        self, grafana_api: GrafanaAPI, requests: list[ProjectProvisionRequest]
+    ) -> None:
+        # Celery 체인 하나가 하는 일과 같은 순서/횟수 (유저 폴더는 유저당 1회)
+        folders: dict[str, str] = {}
+        for req in requests:
+            if req.user_id not in folders:
+                folders[req.user_id] = grafana_api.create_folder(req.folder_name)["uid"]
+            account = grafana_api.create_service_account(req.account_name)
+            grafana_api.create_service_token(str(account["id"]), req.token_name)
+            grafana_api.set_folder_permissions(folders[req.user_id], str(account["id"]))
+            dashboard = grafana_api.create_dashboard(
+                req.dashboard_config, folders[req.user_id]
+            )
+            grafana_api.create_public_dashboard(dashboard["uid"])
+
+    def handle(self, *args, **options):
+        requests = self.make_requests(options["projects"], options["users"])
+
+        with GrafanaStubServer(latency_ms=options["latency_ms"]) as stub:
+            grafana_api = GrafanaAPI()
+            grafana_api.base_url = stub.url
+            grafana_api.headers["Authorization"] = "Bearer stub"
+
+            start = time.perf_counter()
+            self.provision_sequentially(grafana_api, requests)
+            sequential = time.perf_counter() - start
+
+            async_grafana_api = AsyncGrafanaAPI(pool_size=options["concurrency"])
+            async_grafana_api.base_url = stub.url
+            async_grafana_api.headers["Authorization"] = "Bearer stub"
+            provisioner = VisualizationPlatformBatchProvisioner(
+                async_grafana_api, concurrency=options["concurrency"]
+            )
+
+            start = time.perf_counter()
+            results = provisioner.provision(requests)
+            batch = time.perf_counter() - start
+
+        failed = [r for r in results if not r.succeeded]
+        if failed:
+            self.stderr.write(f"실패 {len(failed)}건: {failed[0].error}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(requests)} projects / {options['users']} users, "
+                f"latency {options['latency_ms']}ms: 순차 {sequential:.2f}s, "
+                f"일괄(concurrency={options['concurrency']}) {batch:.2f}s "
+                f"({sequential / batch:.1f}x)"
+            )
+        )
@@ -0,0 +1,48 @@
+import json
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+
+from monitoring.infra.grafana.grafana_template_provider import GrafanaTemplateProvider
+from monitoring.infra.jinja2.jinja2_template_renderer import Jinja2TemplateRenderer
+
+TEMPLATE_NAME = "grafana_log_dashboard_json.j2"
+
+
+class Command(BaseCommand):
+    help = "로그 대시보드 생성: render+json.loads(기존) vs skeleton patch 벤치마크"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=2000)
+
+    def render_and_parse(self, renderer: Jinja2TemplateRenderer, context: dict):
+        return json.loads(renderer.render(TEMPLATE_NAME, context))
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        renderer = Jinja2TemplateRenderer()
+        provider = GrafanaTemplateProvider()
+
+        context = {
+            "project_id": str(uuid.uuid4()),
+            "dashboard_title": "Logs Dashboard for project-0",
+            "dashboard_uid": str(uuid.uuid4()),
+            "data_source_uid": "Elasticsearch",
+        }
+        start = time.perf_counter()
+        for _ in range(iterations):
+            self.render_and_parse(renderer, context)
+        before = (time.perf_counter() - start) / iterations * 1_000_000
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            provider.render_logs_dashboard_json(**context)
+        after = (time.perf_counter() - start) / iterations * 1_000_000
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"render+json.loads {before:.1f} us, skeleton patch {after:.1f} us "
+                f"({before / after:.1f}x)"
+            )
+        )
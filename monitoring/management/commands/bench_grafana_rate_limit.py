@@ -0,0 +1,134 @@
+import collections
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+from django.core.management.base import BaseCommand
+
+from monitoring.infra.grafana.grafana_http_client import READ, WRITE, GrafanaHttpClient
+from monitoring.infra.redis.rate_limiter import RedisRateLimiter, TokenBucket
+from monitoring.infra.redis.redis_client import redis_client
+
+
+class _CapacityStub:
+    """초당 capacity건까지만 처리하고 넘치면 429 + Retry-After: 1을 주는 stub Grafana"""
+
+    def __init__(self, capacity: int, latency: float):
+        self.lock = threading.Lock()
+        self.window = 0
+        self.count = 0
+        self.rejected = 0
+        self.served: collections.Counter[int] = collections.Counter()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                second = int(time.monotonic())
+                with stub.lock:
+                    if second != stub.window:
+                        stub.window, stub.count = second, 0
+                    stub.count += 1
+                    accepted = stub.count <= capacity
+                    if accepted:
+                        stub.served[second] += 1
+                    else:
+                        stub.rejected += 1
+                if accepted:
+                    time.sleep(latency)
+                body = json.dumps({"status": "success"}).encode()
+                self.send_response(200 if accepted else 429)
+                if not accepted:
+                    self.send_header("Retry-After", "1")
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+
+class Command(BaseCommand):
+    help = (
+        "초당 처리량이 제한된 stub Grafana에 여러 워커가 동시에 쓰기 요청: "
+        "속도 제한 없음(429 후 backoff 재시도) vs Redis 토큰 버킷. Redis 필요"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=300)
+        parser.add_argument("--workers", type=int, default=32)
+        parser.add_argument("--capacity", type=int, default=50, help="stub 초당 처리량")
+        parser.add_argument("--latency", type=float, default=0.02)
+
+    def handle(self, *args, **options):
+        capacity = options["capacity"]
+        limiter = RedisRateLimiter(
+            redis_client,
+            buckets={
+                WRITE: TokenBucket(rate=capacity * 0.9, burst=max(1, capacity // 5)),
+                READ: TokenBucket(rate=capacity * 0.9, burst=max(1, capacity // 5)),
+            },
+            key_prefix=f"bench:ratelimit:{uuid.uuid4().hex}:",
+            max_wait=60.0,
+        )
+        for label, rate_limiter in [("no limit", None), ("token bucket", limiter)]:
+            # 이전 실행의 429 창이 남지 않도록 stub은 매번 새로 띄운다
+            stub = _CapacityStub(capacity, options["latency"])
+            try:
+                self.run(label, stub, rate_limiter, options)
+            finally:
+                stub.server.shutdown()
+
+    def run(
+        self,
+        label: str,
+        stub: _CapacityStub,
+        rate_limiter: RedisRateLimiter | None,
+        options: dict,
+    ) -> None:
+        client = GrafanaHttpClient(
+            base_url=stub.url,
+            headers={},
+            pool_size=options["workers"],
+            rate_limiter=rate_limiter,
+        )
+
+        def call(_):
+            try:
+                return client.request("POST", "/api/dashboards/db", json={}).status_code
+            except httpx.HTTPError:
+                return None
+
+        try:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(options["workers"]) as pool:
+                statuses = list(pool.map(call, range(options["requests"])))
+            elapsed = time.perf_counter() - start
+        finally:
+            client.close()
+
+        succeeded = statuses.count(200)
+        per_second = [stub.served[s] for s in sorted(stub.served)]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"[{label}] {succeeded}/{len(statuses)} succeeded in {elapsed:.2f}s "
+                f"({succeeded / elapsed:.0f}/s), 429 responses {stub.rejected}, "
+                f"served per second {per_second}"
+            )
+        )
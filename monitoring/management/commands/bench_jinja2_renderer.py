@@ -0,0 +1,71 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from jinja2 import Environment, FileSystemLoader
+
+from monitoring.domain.log_agent.log_router import LogRouterConfigContext
+from monitoring.infra.jinja2.jinja2_template_renderer import Jinja2TemplateRenderer
+
+
+class Command(BaseCommand):
+    help = (
+        "Jinja2 렌더링 지연시간 비교: 인스턴스별 Environment(기존) vs 공유 Environment"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=500)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+
+        cases = {
+            "grafana_log_dashboard_json.j2": {
+                "project_id": str(uuid.uuid4()),
+                "dashboard_title": "Logs Dashboard for bench",
+                "dashboard_uid": str(uuid.uuid4()),
+                "data_source_uid": "Elasticsearch",
+            },
+            "logstash_conf.j2": LogRouterConfigContext(
+                project_id="bench",
+                beats_port=5044,
+                mq_host="127.0.0.1",
+                mq_port=5672,
+                mq_user="guest",
+                mq_password="guest",
+                mq_vhost="/",
+                mq_exchange="app_logs_exchange",
+                mq_exchange_type="direct",
+                mq_routing_key="logs_1",
+                mq_persistent=True,
+                mq_heartbeat=30,
+            ).model_dump(),
+        }
+
+        warmed = Jinja2TemplateRenderer.warm_up()
+        self.stdout.write(f"warm-up 완료: {warmed}")
+
+        for template_name, context in cases.items():
+            # 기존: 뷰/서비스 인스턴스마다 Environment 생성 → 매번 파싱/컴파일
+            start = time.perf_counter()
+            for _ in range(iterations):
+                env = Environment(
+                    loader=FileSystemLoader(
+                        Jinja2TemplateRenderer.DEFAULT_TEMPLATE_PATH
+                    )
+                )
+                env.get_template(template_name).render(**context)
+            before = (time.perf_counter() - start) / iterations * 1000
+
+            # 개선: 프로세스 공유 Environment (컴파일 결과 재사용)
+            start = time.perf_counter()
+            for _ in range(iterations):
+                Jinja2TemplateRenderer().render(template_name, context)
+            after = (time.perf_counter() - start) / iterations * 1000
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{template_name}: before {before:.3f} ms/render, "
+                    f"after {after:.3f} ms/render ({before / after:.1f}x)"
+                )
+            )
@@ -0,0 +1,143 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from monitoring.domain.visualization_platform.folder import FolderPermissionLevel
+from monitoring.infra.models.visualization_platform_model import (
+    DashboardModel,
+    FolderPermissionModel,
+    PublicDashboardModel,
+    ServiceAccountModel,
+    UserFolderModel,
+)
+from monitoring.infra.repo.monitoring_project_repo import MonitoringProjectRepo
+from monitoring.infra.repo.visualization_platform_repo.dashboard_repo import (
+    DashboardRepo,
+    PublicDashboardRepo,
+)
+from monitoring.infra.repo.visualization_platform_repo.folder_permission_repo import (
+    FolderPermissionRepo,
+)
+from monitoring.infra.repo.visualization_platform_repo.folder_repo import FolderRepo
+from monitoring.infra.repo.visualization_platform_repo.service_account_repo import (
+    ServiceAccountRepo,
+)
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "프로비저닝 상태 조회: repo별 개별 조회(최대 5쿼리) vs LEFT JOIN 스냅샷(1쿼리). "
+        "합성 리소스를 트랜잭션 안에서 만들고 끝나면 롤백한다"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        try:
+            with transaction.atomic():
+                user_id, provisioned, empty = self.populate()
+                for label, project_id in [
+                    ("provisioned", provisioned),
+                    ("empty", empty),
+                ]:
+                    self.compare(user_id, project_id, label, iterations)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def compare(
+        self, user_id: str, project_id: str, label: str, iterations: int
+    ) -> None:
+        folder_repo = FolderRepo()
+        account_repo = ServiceAccountRepo()
+        permission_repo = FolderPermissionRepo()
+        dashboard_repo = DashboardRepo()
+        public_dashboard_repo = PublicDashboardRepo()
+        project_repo = MonitoringProjectRepo()
+
+        def separate():
+            folder = folder_repo.find_by_user_id(user_id)
+            account = account_repo.find_by_project_id(project_id)
+            perm = (
+                permission_repo.find_by_service_account_id(account.account_id)
+                if account
+                else None
+            )
+            dashboard = dashboard_repo.find_by_project_id(project_id)
+            public = public_dashboard_repo.find_by_project_id(project_id)
+            return folder, account, perm, dashboard, public
+
+        def snapshot():
+            s = project_repo.find_provisioning_snapshot(user_id, project_id)
+            return (
+                s.user_folder,
+                s.service_account,
+                s.folder_permission,
+                s.dashboard,
+                s.public_dashboard,
+            )
+
+        results = []
+        for name, fn in [("separate", separate), ("snapshot", snapshot)]:
+            with CaptureQueriesContext(connection) as queries:
+                fn()
+            start = time.perf_counter()
+            for _ in range(iterations):
+                fn()
+            elapsed = time.perf_counter() - start
+            results.append(
+                f"{name} {len(queries)} queries, "
+                f"{elapsed / iterations * 1_000_000:.0f}us/call"
+            )
+        self.stdout.write(self.style.SUCCESS(f"[{label}] " + " | ".join(results)))
+
+    def populate(self) -> tuple[str, str, str]:
+        user_id = str(uuid.uuid4())
+        provisioned = str(uuid.uuid4())
+        empty = str(uuid.uuid4())
+        account_id = str(uuid.uuid4())
+        dashboard_id = str(uuid.uuid4())
+        folder_uid = str(uuid.uuid4())
+
+        UserFolderModel.objects.create(
+            id=str(uuid.uuid4()), user_id=user_id, uid=folder_uid, name="bench"
+        )
+        ServiceAccountModel.objects.create(
+            id=str(uuid.uuid4()),
+            account_id=account_id,
+            user_id=user_id,
+            project_id=provisioned,
+            name="bench",
+            role="Viewer",
+            token="bench",
+        )
+        FolderPermissionModel.objects.create(
+            id=str(uuid.uuid4()),
+            service_account_id=account_id,
+            folder_uid=folder_uid,
+            permission=FolderPermissionLevel.VIEW.value,
+        )
+        DashboardModel.objects.create(
+            id=dashboard_id,
+            uid=str(uuid.uuid4()),
+            user_id=user_id,
+            project_id=provisioned,
+            folder_uid=folder_uid,
+            config_json={"panels": [{"id": i} for i in range(50)]},
+        )
+        PublicDashboardModel.objects.create(
+            id=str(uuid.uuid4()),
+            uid=str(uuid.uuid4()),
+            dashboard_id=dashboard_id,
+            project_id=provisioned,
+        )
+        return user_id, provisioned, empty
@@ -0,0 +1,111 @@
+import threading
+import time
+
+from celery import Celery
+from celery.backends.cache import CacheBackend
+from celery.contrib.testing.worker import start_worker
+from django.core.management.base import BaseCommand
+
+from monitoring.infra.celery.task_executor.grafana_executor import (
+    PROVISION_STEP_DEPENDENCIES,
+    ProvisionStep,
+)
+from monitoring.infra.celery.task_executor.workflow_dag import WorkflowDAG
+
+
+class BenchCacheBackend(CacheBackend):
+    # 운영 backend(django-db)처럼 chord fan-in을 join_native 대신 결과별 조회로 처리
+    # (cache backend의 get_many는 결과가 다 모여도 interval만큼 한 번 더 잔다)
+    supports_native_join = False
+
+
+# 실제 broker/DB 없이 canvas 모양만 비교하기 위한 in-memory app
+bench_app = Celery(
+    "bench_provision_workflow",
+    broker="memory://",
+    backend=f"{__name__}:BenchCacheBackend",
+)
+bench_app.conf.cache_backend = "memory://"
+bench_app.conf.broker_transport_options = {"polling_interval": 0.01}
+bench_app.conf.task_ignore_result = True  # 운영 설정(CELERY_TASK_IGNORE_RESULT)과 동일
+
+_events: dict[str, tuple[float, float]] = {}
+_failed = threading.Event()
+_done = threading.Event()
+
+
+@bench_app.task(name="bench.step")
+def bench_step(name: str, seconds: float, fail: bool = False):
+    start = time.perf_counter()
+    time.sleep(seconds)
+    _events[name] = (start, time.perf_counter())
+    if fail:
+        raise RuntimeError(f"{name} failed")
+    if name == ProvisionStep.FINALIZE:
+        _done.set()
+    return name
+
+
+@bench_app.task(name="bench.on_failure")
+def bench_on_failure(*args):
+    _failed.set()
+
+
+class Command(BaseCommand):
+    help = "프로비저닝 워크플로우 wall-clock: 기존 선형 chain vs 의존관계 DAG (in-memory Celery)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--step-seconds", type=float, default=0.3)
+        parser.add_argument(
+            "--fail-step",
+            choices=[step.value for step in ProvisionStep],
+            help="해당 단계를 실패시켜 link_error 경로 확인",
+        )
+
+    def build(self, linear: bool, seconds: float, fail_step: str | None):
+        dag = WorkflowDAG()
+        prev: list[str] = []
+        for step, deps in PROVISION_STEP_DEPENDENCIES.items():
+            sig = bench_step.si(step.value, seconds, step.value == fail_step)
+            dag.add(step, sig, prev if linear else deps)
+            prev = [step]
+        return dag.build(link_error=bench_on_failure.si())
+
+    def run(self, workflow, timeout: float) -> float:
+        _events.clear()
+        _done.clear()
+        _failed.clear()
+        start = time.perf_counter()
+        workflow.apply_async()
+        while not (_done.is_set() or _failed.is_set()):
+            if time.perf_counter() - start > timeout:
+                raise RuntimeError("워크플로우가 제한 시간 안에 끝나지 않았습니다.")
+            time.sleep(0.005)
+        return time.perf_counter() - start
+
+    def handle(self, *args, **options):
+        seconds = options["step_seconds"]
+        fail_step = options["fail_step"]
+        timeout = seconds * len(PROVISION_STEP_DEPENDENCIES) * 5 + 5
+
+        with start_worker(
+            bench_app, pool="threads", concurrency=8, perform_ping_check=False
+        ):
+            if fail_step:
+                self.run(self.build(False, seconds, fail_step), timeout)
+                ran = sorted(_events)
+                self.stdout.write(
+                    f"failure callback 호출: {_failed.is_set()}, 실행된 단계: {ran}"
+                )
+                return
+
+            linear = self.run(self.build(True, seconds, None), timeout)
+            dag = self.run(self.build(False, seconds, None), timeout)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"step {seconds}s x {len(PROVISION_STEP_DEPENDENCIES)}: "
+                f"chain {linear:.2f}s, DAG {dag:.2f}s (critical path 4 steps = "
+                f"{seconds * 4:.2f}s)"
+            )
+        )
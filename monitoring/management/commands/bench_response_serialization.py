@@ -0,0 +1,130 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.http import JsonResponse
+
+from common.domain import PagedResult
+from common.interface.response import SuccessResponse, success_response
+from monitoring.domain.monitoring_project import (
+    MonitoringProjectWithBothDashboardsDto,
+    MonitoringType,
+    ProjectStatus,
+)
+from monitoring.domain.visualization_platform.dashboard import (
+    Dashboard,
+    PublicDashboard,
+)
+from monitoring.interface.DTO.responseDTO import (
+    MonitoringProjectWithBothDashboardsResponse,
+    PagedProjectsResponse,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "프로젝트 목록 응답 직렬화 비교: model_dump() + JsonResponse(기존) "
+        "vs pydantic-core로 바로 bytes (success_response). dto.to_dict()는 제외"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=100)
+        parser.add_argument("--iterations", type=int, default=200)
+        parser.add_argument("--panels", type=int, default=6, help="대시보드당 패널 수")
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        paged = self.make_page(options["items"], options["panels"])
+        # 응답 모델 생성(dto.to_dict() 포함)은 두 방식이 같으므로 한 번만 만들고 직렬화만 잰다
+        data = PagedProjectsResponse(
+            items=[
+                MonitoringProjectWithBothDashboardsResponse(**dto.to_dict())
+                for dto in paged.items
+            ],
+            total_items=paged.total_items,
+            total_pages=paged.total_pages,
+            current_page=paged.current_page,
+            page_size=paged.page_size,
+            has_previous=paged.has_previous,
+            has_next=paged.has_next,
+        )
+
+        # 기존: model_dump() dict → SuccessResponse 검증 → model_dump() → json.dumps
+        start = time.perf_counter()
+        for _ in range(iterations):
+            old = JsonResponse(
+                SuccessResponse(data=data.model_dump(), message="OK").model_dump(),
+                status=200,
+                content_type="application/json; charset=utf-8",
+            )
+        before = (time.perf_counter() - start) / iterations * 1000
+
+        # 개선: 모델을 그대로 넘겨 pydantic-core가 bytes로 한 번에 직렬화
+        start = time.perf_counter()
+        for _ in range(iterations):
+            new = success_response(data=data, message="OK")
+        after = (time.perf_counter() - start) / iterations * 1000
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{options['items']} items: before {before:.3f} ms/response "
+                f"({len(old.content) / 1024:.0f} KiB), after {after:.3f} ms/response "
+                f"({len(new.content) / 1024:.0f} KiB) ({before / after:.1f}x)"
+            )
+        )
+
+    @staticmethod
+    def make_page(n: int, panels: int) -> PagedResult:
+        items = []
+        for i in range(n):
+            project_id, dashboard_id = str(uuid.uuid4()), str(uuid.uuid4())
+            items.append(
+                MonitoringProjectWithBothDashboardsDto(
+                    id=project_id,
+                    user_id="bench-user",
+                    name=f"프로젝트 {i}",
+                    project_type=MonitoringType.LOG,
+                    status=ProjectStatus.READY,
+                    service_account_id=str(i),
+                    description="벤치마크용 프로젝트",
+                    user_folder_id="folder",
+                    dashboard=Dashboard(
+                        id=dashboard_id,
+                        uid=dashboard_id[:8],
+                        title=f"Logs Dashboard {i}",
+                        user_id="bench-user",
+                        project_id=project_id,
+                        org_id="1",
+                        folder_uid="folder",
+                        url=f"/d/{dashboard_id[:8]}",
+                        panels=[
+                            {
+                                "id": p,
+                                "type": "logs",
+                                "title": f"panel {p}",
+                                "gridPos": {"h": 8, "w": 12, "x": 0, "y": p * 8},
+                                "targets": [{"refId": "A", "query": "*"}],
+                            }
+                            for p in range(panels)
+                        ],
+                        tags=["log", "bench"],
+                        data_sources=["Elasticsearch"],
+                    ),
+                    public_dashboard=PublicDashboard(
+                        id=str(uuid.uuid4()),
+                        uid=dashboard_id[8:16],
+                        project_id=project_id,
+                        dashboard_id=dashboard_id,
+                        public_url=f"/public-dashboards/{dashboard_id[8:16]}",
+                    ),
+                )
+            )
+        return PagedResult(
+            items=items,
+            total_items=n * 3,
+            total_pages=3,
+            current_page=1,
+            page_size=n,
+            has_previous=False,
+            has_next=True,
+        )
@@ -0,0 +1,188 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from common.container import container
+from config import settings
+from monitoring.interface.views.log_monitoring_project_views import (
+    LogMonitoringProjectStep1View,
+)
+from monitoring.service.harvester_agent_service import HarvesterAgentService
+
+
+class _S3StandIn:
+    """
+    PUT/DELETE에 latency초 뒤 200/204로 답하는 로컬 S3 대역.
+    (keep-alive, chunked body, boto3가 보내는 Expect: 100-continue 지원)
+    별도 스레드의 event loop에서 돌기 때문에 측정 대상과 CPU를 덜 나눠 쓴다.
+    """
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.requests = 0
+        self.url = ""
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "_S3StandIn":
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0, backlog=4096)
+        )
+        host, port = server.sockets[0].getsockname()[:2]
+        self.url = f"http://{host}:{port}"
+        self._ready.set()
+        self._loop.run_forever()
+
+        server.close()
+        tasks = asyncio.all_tasks(self._loop)
+        for task in tasks:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._loop.close()
+
+    async def _handle(self, reader, writer) -> None:
+        try:
+            while request_line := await reader.readline():
+                method = request_line.split(b" ", 1)[0]
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if headers.get("expect", "").lower() == "100-continue":
+                    writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                await self._read_body(reader, headers)
+
+                self.requests += 1
+                await asyncio.sleep(self.latency)
+                status = b"204 No Content" if method == b"DELETE" else b"200 OK"
+                writer.write(
+                    b"HTTP/1.1 " + status + b"\r\n"
+                    b'ETag: "stand-in"\r\nContent-Length: 0\r\n\r\n'
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # 클라이언트 종료 / 벤치 종료
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_body(reader, headers: dict[str, str]) -> None:
+        if headers.get("transfer-encoding") == "chunked":
+            while size := int((await reader.readline()).split(b";")[0], 16):
+                await reader.readexactly(size + 2)
+            while (await reader.readline()) not in (b"\r\n", b""):
+                pass  # trailer
+        elif length := int(headers.get("content-length", 0)):
+            await reader.readexactly(length)
+
+
+class Command(BaseCommand):
+    help = (
+        "step1의 네트워크 구간(템플릿 렌더링 + S3 업로드 3건) 동시 요청 처리량: "
+        "WSGI(요청마다 워커 스레드, boto3) vs ASGI(event loop 1개, httpx). 로컬 S3 대역 사용. "
+        "DB 저장(쿼리 1회)은 포함하지 않는다"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=300)
+        parser.add_argument(
+            "--threads", type=int, default=16, help="WSGI 워커 스레드 수 (gthread)"
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=300, help="ASGI 동시 처리 요청 수"
+        )
+        parser.add_argument(
+            "--latency", type=float, default=0.05, help="S3 대역 응답 지연 (초)"
+        )
+
+    def handle(self, *args, **options):
+        n = options["requests"]
+        original = (settings.S3_ENDPOINT_URL, settings.S3_CONTENT_ADDRESSED)
+        with _S3StandIn(options["latency"]) as s3:
+            settings.S3_ENDPOINT_URL, settings.S3_CONTENT_ADDRESSED = s3.url, False
+            container.reset()
+            try:
+                service = container.resolve(HarvesterAgentService)
+                body = LogMonitoringProjectStep1View.Step1Request(
+                    log_paths=["/var/log/app/*.log"],
+                    custom_plain_fields=["timestamp", "level", "msg_detail"],
+                    project_name="bench",
+                    project_description="bench",
+                )
+                # 템플릿 컴파일, 커넥션 등 첫 요청 비용 제외
+                self.run_sync(service, body, 1, 1)
+                asyncio.run(self.run_async(service, body, 1, 1))
+
+                wsgi = self.run_sync(service, body, n, options["threads"])
+                asgi = asyncio.run(
+                    self.run_async(service, body, n, options["concurrency"])
+                )
+            finally:
+                settings.S3_ENDPOINT_URL, settings.S3_CONTENT_ADDRESSED = original
+                container.reset()
+
+        for name, workers, (elapsed, latencies) in (
+            ("WSGI", f"{options['threads']} threads", wsgi),
+            ("ASGI", f"1 loop, {options['concurrency']} in flight", asgi),
+        ):
+            latencies.sort()
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[{name} / {workers}] {n / elapsed:.0f} req/s, "
+                    f"p50 {latencies[len(latencies) // 2] * 1000:.0f}ms, "
+                    f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.0f}ms"
+                )
+            )
+        self.stdout.write(f"S3 stand-in requests: {s3.requests}")
+
+    @staticmethod
+    def run_sync(service, body, n: int, threads: int) -> tuple[float, list[float]]:
+        def step1() -> float:
+            start = time.perf_counter()
+            collector_ctx, router_ctx = (
+                LogMonitoringProjectStep1View._build_agent_contexts(body)
+            )
+            service.download_log_agent_set_up_script(
+                collector_ctx.project_id, collector_ctx, router_ctx, body.platform
+            )
+            return time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            latencies = list(executor.map(lambda _: step1(), range(n)))
+        return time.perf_counter() - start, latencies
+
+    @staticmethod
+    async def run_async(
+        service, body, n: int, concurrency: int
+    ) -> tuple[float, list[float]]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def step1() -> float:
+            async with semaphore:
+                start = time.perf_counter()
+                collector_ctx, router_ctx = (
+                    LogMonitoringProjectStep1View._build_agent_contexts(body)
+                )
+                await service.adownload_log_agent_set_up_script(
+                    collector_ctx.project_id, collector_ctx, router_ctx, body.platform
+                )
+                return time.perf_counter() - start
+
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(step1() for _ in range(n)))
+        return time.perf_counter() - start, list(latencies)
@@ -0,0 +1,132 @@
+import hashlib
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from monitoring.domain.task_result import TaskStatus
+from monitoring.infra.models.task_result_model import TaskResultModel
+from monitoring.service.task_result_retention_service import TaskResultRetentionService
+
+STATUSES = [status.value for status in TaskStatus]
+DAYS = 60
+
+
+class Command(BaseCommand):
+    help = (
+        "task_result_model 보관 기간 정리: status별 DELETE 한 번 vs (date_created, pk) 순서 chunk 삭제. "
+        "합성 행(기본 5M, 생성일 0~60일 분산)을 만들어 비교하므로 빈 DB에서 실행"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5_000_000)
+        parser.add_argument("--chunk-size", type=int, default=5000)
+        parser.add_argument("--sleep", type=float, default=0.0)
+
+    def handle(self, *args, **options):
+        if TaskResultModel.objects.exists():
+            raise CommandError(
+                "task_result_model이 비어 있는 DB에서만 실행할 수 있습니다."
+            )
+
+        rows = options["rows"]
+        service = TaskResultRetentionService(
+            chunk_size=options["chunk_size"], chunk_sleep=options["sleep"]
+        )
+        policies = service.default_policies()
+        now = timezone.now()
+
+        try:
+            self.populate(rows, now)
+            self.analyze()
+            with self.timed_statements() as statements:
+                start = time.perf_counter()
+                for policy in policies:
+                    TaskResultModel.objects.filter(
+                        status=policy.status, date_created__lt=now - policy.max_age
+                    ).delete()
+                single = time.perf_counter() - start
+            single_longest = max(duration for _, duration in statements)
+
+            TaskResultModel.objects.all().delete()
+            self.populate(rows, now)
+            self.analyze()
+            with self.timed_statements() as statements:
+                start = time.perf_counter()
+                chunked_deleted = sum(service.purge(policies, now=now).values())
+                chunked = time.perf_counter() - start
+            deletes = [d for sql, d in statements if sql.startswith("DELETE")]
+            selects = [d for sql, d in statements if sql.startswith("SELECT")]
+        finally:
+            TaskResultModel.objects.all().delete()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{rows} rows, {chunked_deleted} expired: "
+                f"single DELETE {single:.2f}s (longest statement {single_longest:.2f}s), "
+                f"chunked {chunked:.2f}s in {len(deletes)} DELETEs "
+                f"(longest DELETE {max(deletes, default=0) * 1000:.1f}ms, "
+                f"longest SELECT {max(selects, default=0) * 1000:.1f}ms)"
+            )
+        )
+
+    @transaction.atomic
+    def populate(self, rows: int, now) -> None:
+        start = time.perf_counter()
+        if connection.vendor == "postgresql":
+            # md5 id로 pk 순서와 생성일이 서로 무관하도록
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO task_result_model
+                        (id, task_name, status, date_created, retries)
+                    SELECT md5(g::text), 'bench', (%s::text[])[1 + g %% 4],
+                           %s - (g %% %s) * interval '1 day', 0
+                    FROM generate_series(1, %s) AS g
+                    """,
+                    [STATUSES, now, DAYS, rows],
+                )
+        else:
+            # date_created는 auto_now_add라 bulk_create로는 과거 시각을 넣을 수 없다
+            batch = 10_000
+            with connection.cursor() as cursor:
+                for offset in range(0, rows, batch):
+                    cursor.executemany(
+                        "INSERT INTO task_result_model "
+                        "(id, task_name, status, date_created, retries) "
+                        "VALUES (%s, 'bench', %s, %s, 0)",
+                        [
+                            (
+                                hashlib.md5(str(g).encode()).hexdigest(),
+                                STATUSES[g % 4],
+                                connection.ops.adapt_datetimefield_value(
+                                    now - timedelta(days=g % DAYS)
+                                ),
+                            )
+                            for g in range(offset, min(rows, offset + batch))
+                        ],
+                    )
+        self.stdout.write(f"{rows} rows 생성 {time.perf_counter() - start:.1f}s")
+
+    def analyze(self) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE task_result_model")
+
+    @contextmanager
+    def timed_statements(self):
+        statements: list[tuple[str, float]] = []
+
+        def wrapper(execute, sql, params, many, context):
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                statements.append(
+                    (sql.lstrip().split(" ", 1)[0].upper(), time.perf_counter() - start)
+                )
+
+        with connection.execute_wrapper(wrapper):
+            yield statements
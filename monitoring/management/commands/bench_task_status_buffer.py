@@ -0,0 +1,88 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from monitoring.domain.task_result import TaskStatus
+from monitoring.infra.celery.task_status_flusher import TaskStatusFlusher
+from monitoring.infra.models.task_result_model import TaskResultModel
+from monitoring.infra.redis.redis_client import redis_client
+from monitoring.infra.repo.task_result_repo import TaskResultRepo
+
+
+class Command(BaseCommand):
+    help = (
+        "태스크 상태 전이(STARTED → SUCCESS) DB 쓰기: 전이마다 UPDATE vs "
+        "Redis 버퍼 + 일괄 flush (설정된 DB/Redis 사용, 생성한 행은 삭제)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=1000)
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def create_rows(self, count: int) -> list[str]:
+        ids = [f"bench-{uuid.uuid4()}" for _ in range(count)]
+        TaskResultModel.objects.bulk_create(
+            [
+                TaskResultModel(id=id, task_name="bench", status=TaskStatus.PENDING)
+                for id in ids
+            ]
+        )
+        return ids
+
+    def transition(self, repo: TaskResultRepo, ids: list[str]) -> None:
+        for id in ids:
+            repo.record_status(
+                id,
+                status=TaskStatus.STARTED,
+                date_started=timezone.now(),
+                date_done=None,
+            )
+        for id in ids:
+            repo.record_status(
+                id,
+                status=TaskStatus.SUCCESS,
+                result={"uid": id},
+                retries=0,
+                date_done=timezone.now(),
+            )
+
+    def handle(self, *args, **options):
+        count = options["tasks"]
+
+        direct_repo = TaskResultRepo()
+        direct_repo.write_behind = False
+        buffered_repo = TaskResultRepo()
+        buffered_repo.write_behind = True
+        flusher = TaskStatusFlusher(
+            buffered_repo, redis_client, batch_size=options["batch_size"]
+        )
+
+        direct_ids = self.create_rows(count)
+        buffered_ids = self.create_rows(count)
+        try:
+            with CaptureQueriesContext(connection) as direct_queries:
+                start = time.perf_counter()
+                self.transition(direct_repo, direct_ids)
+                direct = time.perf_counter() - start
+
+            with CaptureQueriesContext(connection) as buffered_queries:
+                start = time.perf_counter()
+                self.transition(buffered_repo, buffered_ids)
+                recorded = time.perf_counter() - start
+                flusher.flush()
+                buffered = time.perf_counter() - start
+        finally:
+            TaskResultModel.objects.filter(id__in=direct_ids + buffered_ids).delete()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{count} tasks x 2 transitions: "
+                f"direct {len(direct_queries)} queries {direct:.2f}s, "
+                f"buffered {len(buffered_queries)} queries {buffered:.2f}s "
+                f"(record {recorded:.2f}s + flush {buffered - recorded:.2f}s)"
+            )
+        )
@@ -1,11 +1,20 @@
-from django.core.management.base import BaseCommand
+from datetime import timedelta
 
+from django.core.management.base import BaseCommand, CommandError
+
+from config import settings
 from monitoring.domain.task_result import TaskStatus
-from monitoring.infra.models.task_result_model import TaskResultModel
+from monitoring.service.task_result_retention_service import (
+    RetentionPolicy,
+    TaskResultRetentionService,
+)
 
 
 class Command(BaseCommand):
-    help = "Delete task results with FAILURE or PENDING status"
+    help = (
+        "Delete task results with FAILURE or PENDING status "
+        "(in small keyset-ordered chunks)"
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -18,37 +27,64 @@ class Command(BaseCommand):
             type=str,
             help="Delete tasks with specific status (FAILURE, PENDING, STARTED, SUCCESS)",
         )
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            help="Only delete task results created more than N days ago",
+        )
+        parser.add_argument(
+            "--policy",
+            action="store_true",
+            help="Apply the configured per-status retention (TASK_RESULT_RETENTION_DAYS)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=settings.TASK_RESULT_RETENTION_CHUNK_SIZE,
+            help="Rows deleted per statement",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=settings.TASK_RESULT_RETENTION_CHUNK_SLEEP,
+            help="Seconds to wait between chunks",
+        )
 
     def handle(self, *args, **options):
-        if options["all"]:
-            count, details = TaskResultModel.objects.all().delete()
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"Successfully deleted {count} task results of all statuses"
-                )
-            )
-            return
+        service = TaskResultRetentionService(
+            chunk_size=options["chunk_size"], chunk_sleep=options["sleep"]
+        )
 
-        if options["status"]:
-            status = options["status"].upper()
-            count, details = TaskResultModel.objects.filter(status=status).delete()
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"Successfully deleted {count} task results with status {status}"
-                )
+        if options["policy"]:
+            policies = service.default_policies()
+        else:
+            max_age = (
+                timedelta(days=options["older_than_days"])
+                if options["older_than_days"] is not None
+                else None
             )
-            return
-
-        # 기본: FAILURE 및 PENDING 삭제
-        failed_count, _ = TaskResultModel.objects.filter(
-            status=TaskStatus.FAILURE
-        ).delete()
-        pending_count, _ = TaskResultModel.objects.filter(
-            status=TaskStatus.PENDING
-        ).delete()
+            policies = [
+                RetentionPolicy(status, max_age)
+                for status in self._target_statuses(options)
+            ]
 
+        deleted = service.purge(policies)
+        summary = ", ".join(f"{count} {status}" for status, count in deleted.items())
         self.stdout.write(
             self.style.SUCCESS(
-                f"Successfully deleted {failed_count} FAILURE and {pending_count} PENDING task results"
+                f"Successfully deleted {sum(deleted.values())} task results ({summary})"
             )
         )
+
+    def _target_statuses(self, options) -> list[TaskStatus]:
+        if options["all"]:
+            return list(TaskStatus)
+
+        if options["status"]:
+            try:
+                return [TaskStatus(options["status"].upper())]
+            except ValueError:
+                raise CommandError(f"Unknown status: {options['status']}")
+
+        # 기본: FAILURE 및 PENDING 삭제
+        return [TaskStatus.FAILURE, TaskStatus.PENDING]
@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from common.container import container
+from config import settings
+from monitoring.domain.i_repo.i_monitoring_project_repo import IMonitoringProjectRepo
+from monitoring.domain.monitoring_project import ProjectStatus
+from monitoring.service.monitoring_provision_service import MonitoringProvisionService
+from user.service.user_service import UserService
+
+
+class Command(BaseCommand):
+    help = (
+        "Provision log dashboards for many projects in one process "
+        "(bulk onboarding, migrations). Task results and progress events are "
+        "recorded the same way as step2"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_ids", nargs="+", help="Projects to provision")
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.GRAFANA_BATCH_CONCURRENCY,
+            help="Concurrent Grafana requests",
+        )
+
+    def handle(self, *args, **options):
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency must be at least 1")
+
+        project_ids = list(dict.fromkeys(options["project_ids"]))
+        snapshots = container.resolve(
+            IMonitoringProjectRepo
+        ).find_provisioning_snapshots(project_ids)
+        user_service = container.resolve(UserService)
+
+        users = {}
+        targets = []
+        for project_id in project_ids:
+            snapshot = snapshots.get(project_id)
+            if snapshot is None:
+                self.stderr.write(f"{project_id}: project not found, skipped")
+                continue
+            project = snapshot.project
+            if project.status in (ProjectStatus.READY, ProjectStatus.IN_PROGRESS):
+                self.stderr.write(f"{project_id}: status {project.status}, skipped")
+                continue
+            if project.user_id not in users:
+                users[project.user_id] = user_service.get_user_by_id(project.user_id)
+            user = users[project.user_id]
+            if user is None:
+                self.stderr.write(f"{project_id}: owner not found, skipped")
+                continue
+            targets.append((user, snapshot))
+
+        results = container.resolve(
+            MonitoringProvisionService
+        ).provision_log_dashboards_batch(targets, options["concurrency"])
+
+        failed = [r for r in results if not r.succeeded]
+        for result in failed:
+            self.stderr.write(f"{result.project_id}: {result.error}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Provisioned {len(results) - len(failed)} projects "
+                f"({len(failed)} failed, {len(project_ids) - len(results)} skipped)"
+            )
+        )
@@ -2,11 +2,15 @@ import time
 
 from django.core.management.base import BaseCommand
 
+from common.container import container
+from monitoring.domain.i_repo.i_task_result_repo import ITaskResultRepo
 from monitoring.domain.task_result import TaskStatus
 from monitoring.infra.celery.task_executor.grafana_executor import GrafanaTaskExecutor
 from monitoring.infra.grafana.grafana_api import GrafanaAPI
 from monitoring.infra.models.task_result_model import TaskResultModel
 
+task_result_repo = container.lazy(ITaskResultRepo)
+
 
 class Command(BaseCommand):
     help = "Test Grafana integration with Celery tasks"
@@ -440,14 +444,12 @@ class Command(BaseCommand):
         """태스크가 완료될 때까지 대기"""
         start_time = time.time()
         while time.time() - start_time < timeout:
-            try:
-                task = TaskResultModel.objects.get(id=task_id)
-                if task.status in [TaskStatus.SUCCESS, TaskStatus.FAILURE]:
-                    self.stdout.write(f"태스크 {task_id} 완료. 상태: {task.status}")
-                    return task.status == TaskStatus.SUCCESS
-                time.sleep(1)
-            except TaskResultModel.DoesNotExist:
-                time.sleep(1)
+            # flush 전 버퍼 상태까지 합쳐서 조회
+            task = task_result_repo.find_by_task_id(task_id)
+            if task and task.status in [TaskStatus.SUCCESS, TaskStatus.FAILURE]:
+                self.stdout.write(f"태스크 {task_id} 완료. 상태: {task.status}")
+                return task.status == TaskStatus.SUCCESS
+            time.sleep(1)
 
         self.stdout.write(
             self.style.WARNING(f"태스크 {task_id} 시간 초과. 계속 진행합니다.")
@@ -457,8 +459,8 @@ class Command(BaseCommand):
     def get_folder_uid_from_task(self, task_id):
         """태스크 결과에서 폴더 UID 추출"""
         try:
-            task = TaskResultModel.objects.get(id=task_id)
-            if task.status == TaskStatus.SUCCESS and task.result:
+            task = task_result_repo.find_by_task_id(task_id)
+            if task and task.status == TaskStatus.SUCCESS and task.result:
                 result = task.result
                 if isinstance(result, dict) and "uid" in result:
                     return result["uid"]
@@ -469,8 +471,8 @@ class Command(BaseCommand):
     def get_service_account_id_from_task(self, task_id):
         """태스크 결과에서 서비스 계정 ID 추출"""
         try:
-            task = TaskResultModel.objects.get(id=task_id)
-            if task.status == TaskStatus.SUCCESS and task.result:
+            task = task_result_repo.find_by_task_id(task_id)
+            if task and task.status == TaskStatus.SUCCESS and task.result:
                 result = task.result
                 if isinstance(result, dict) and "id" in result:
                     return result["id"]
@@ -481,8 +483,8 @@ class Command(BaseCommand):
     def get_service_token_from_task(self, task_id):
         """태스크 결과에서 서비스 토큰 추출"""
         try:
-            task = TaskResultModel.objects.get(id=task_id)
-            if task.status == TaskStatus.SUCCESS and task.result:
+            task = task_result_repo.find_by_task_id(task_id)
+            if task and task.status == TaskStatus.SUCCESS and task.result:
                 result = task.result
                 if isinstance(result, dict) and "key" in result:
                     return result["key"]
@@ -493,8 +495,8 @@ class Command(BaseCommand):
     def get_dashboard_uid_from_task(self, task_id):
         """태스크 결과에서 대시보드 UID 추출"""
         try:
-            task = TaskResultModel.objects.get(id=task_id)
-            if task.status == TaskStatus.SUCCESS and task.result:
+            task = task_result_repo.find_by_task_id(task_id)
+            if task and task.status == TaskStatus.SUCCESS and task.result:
                 result = task.result
                 if isinstance(result, dict) and "uid" in result:
                     return result["uid"]
@@ -505,8 +507,8 @@ class Command(BaseCommand):
     def get_public_dashboard_uid_from_task(self, task_id):
         """태스크 결과에서 퍼블릭 대시보드 UID 추출"""
         try:
-            task = TaskResultModel.objects.get(id=task_id)
-            if task.status == TaskStatus.SUCCESS and task.result:
+            task = task_result_repo.find_by_task_id(task_id)
+            if task and task.status == TaskStatus.SUCCESS and task.result:
                 result = task.result
                 if isinstance(result, dict) and "uid" in result:
                     return result["uid"]
@@ -526,8 +528,8 @@ class Command(BaseCommand):
     def get_public_dashboard_result_from_task(self, task_id):
         """태스크 결과에서 퍼블릭 대시보드 전체 결과 가져오기"""
         try:
-            task = TaskResultModel.objects.get(id=task_id)
-            if task.status == TaskStatus.SUCCESS and task.result:
+            task = task_result_repo.find_by_task_id(task_id)
+            if task and task.status == TaskStatus.SUCCESS and task.result:
                 return task.result
         except Exception as e:
             self.stdout.write(
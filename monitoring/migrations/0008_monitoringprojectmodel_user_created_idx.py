@@ -0,0 +1,20 @@
+# Generated by Django 5.0.6 on 2026-10-18 08:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("monitoring", "0007_publicdashboardmodel_and_more"),
+        ("user", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="monitoringprojectmodel",
+            index=models.Index(
+                fields=["user", "created_at", "id"], name="mon_project_user_created_idx"
+            ),
+        ),
+    ]
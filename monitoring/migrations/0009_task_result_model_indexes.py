@@ -0,0 +1,27 @@
+# Generated by Django 5.0.6 on 2026-10-18 08:34
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 큰 테이블에서 쓰기를 막지 않도록 CREATE INDEX CONCURRENTLY (트랜잭션 밖에서 실행)
+    atomic = False
+
+    dependencies = [
+        ("monitoring", "0008_monitoringprojectmodel_user_created_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="taskresultmodel",
+            index=models.Index(
+                fields=["status", "date_created", "id"],
+                name="task_result_status_created",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="taskresultmodel",
+            index=models.Index(fields=["date_created"], name="task_result_created"),
+        ),
+    ]
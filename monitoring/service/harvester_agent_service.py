@@ -1,5 +1,6 @@
 import time
 
+from common.container import container
 from monitoring.domain.log_agent.agent_provision_context import (
     AgentProvisioningContext,
     PlatformType,
@@ -7,17 +8,17 @@ from monitoring.domain.log_agent.agent_provision_context import (
 from monitoring.domain.log_agent.log_collector import LogCollectorConfigContext
 from monitoring.domain.log_agent.log_router import LogRouterConfigContext
 from monitoring.domain.log_agent.rendered_config import RenderedConfigFile
-from monitoring.infra.beats.file_beats import FileBeats
-from monitoring.infra.s3.s3_agent_storage import S3AgentStorageProvider
 from monitoring.service.i_log_agent.i_log_agent_provider import ILogAgentProvider
-from monitoring.service.i_storage.i_storage_provider import IAgentStorageProvider
+from monitoring.service.i_storage.i_storage_provider import (
+    AsyncAgentStorageProvider,
+    IAgentStorageProvider,
+)
 
 
 class HarvesterAgentService:
     def __init__(self):
-        # TODO: DI 적용 예정
-        self.log_agent_provider: ILogAgentProvider = FileBeats()
-        self.storage_provider: IAgentStorageProvider = S3AgentStorageProvider()
+        self.log_agent_provider = container.resolve(ILogAgentProvider)
+        self.storage_provider = container.resolve(IAgentStorageProvider)
 
     def create_log_agent_config(
         self,
@@ -47,23 +48,6 @@ class HarvesterAgentService:
         """
         return self.log_agent_provider.create_agent_set_up_script(context)
 
-    def _upload_generated(
-        self, resource_id: str, gen: RenderedConfigFile, ts: int
-    ) -> str:
-        key = self.storage_provider.get_object_key(resource_id, ts, gen.filename)
-
-        ext = gen.filename.rsplit(".", 1)[-1].lower()
-        if ext in ("yml", "yaml"):
-            content_type = "text/yaml"
-        elif ext == "sh":
-            content_type = "text/x-shellscript"
-        else:
-            content_type = "application/octet-stream"
-
-        return self.storage_provider.upload(
-            data=gen.content, key=key, content_type=content_type
-        )
-
     def download_log_agent_set_up_script(
         self,
         resource_id: str,
@@ -81,6 +65,80 @@ class HarvesterAgentService:
         :param log_ctx: 로그 에이전트 설정 컨텍스트
         :param boot_ctx: bootstrap 스크립트 컨텍스트
 
+        """
+        agent_ctx, _ = self.upload_log_agent_set_up_files(
+            resource_id, log_collector_ctx, log_router_ctx, platform
+        )
+        return agent_ctx
+
+    def upload_log_agent_set_up_files(
+        self,
+        resource_id: str,
+        log_collector_ctx: LogCollectorConfigContext,
+        log_router_ctx: LogRouterConfigContext,
+        platform: PlatformType,
+    ) -> tuple[AgentProvisioningContext, list[str]]:
+        """
+        download_log_agent_set_up_script와 같고, 올린 저장소 키도 함께 반환한다.
+        이어지는 저장이 실패하면 delete_log_agent_set_up_files(keys)로 지운다.
+        """
+        ts, files = self._render_set_up_files(
+            resource_id, log_collector_ctx, log_router_ctx, platform
+        )
+
+        # 3개 파일 병렬 업로드 (하나라도 실패하면 전부 롤백)
+        uploaded = self.storage_provider.upload_batch(files)
+        return self._to_agent_context(ts, files, uploaded, platform), list(files)
+
+    def delete_log_agent_set_up_files(self, keys: list[str]) -> None:
+        """upload_log_agent_set_up_files로 올린 파일 중 프로젝트 전용 파일을 지운다."""
+        self.storage_provider.delete_batch(keys)
+
+    async def adownload_log_agent_set_up_script(
+        self,
+        resource_id: str,
+        log_collector_ctx: LogCollectorConfigContext,
+        log_router_ctx: LogRouterConfigContext,
+        platform: PlatformType,
+    ) -> AgentProvisioningContext:
+        """
+        download_log_agent_set_up_script의 async 버전. 업로드를 기다리는 동안 스레드를 잡지 않는다.
+        """
+        agent_ctx, _ = await self.aupload_log_agent_set_up_files(
+            resource_id, log_collector_ctx, log_router_ctx, platform
+        )
+        return agent_ctx
+
+    async def aupload_log_agent_set_up_files(
+        self,
+        resource_id: str,
+        log_collector_ctx: LogCollectorConfigContext,
+        log_router_ctx: LogRouterConfigContext,
+        platform: PlatformType,
+    ) -> tuple[AgentProvisioningContext, list[str]]:
+        """upload_log_agent_set_up_files의 async 버전"""
+        ts, files = self._render_set_up_files(
+            resource_id, log_collector_ctx, log_router_ctx, platform
+        )
+
+        async with container.resolve(AsyncAgentStorageProvider) as storage_provider:
+            uploaded = await storage_provider.upload_batch(files)
+        return self._to_agent_context(ts, files, uploaded, platform), list(files)
+
+    async def adelete_log_agent_set_up_files(self, keys: list[str]) -> None:
+        """delete_log_agent_set_up_files의 async 버전"""
+        async with container.resolve(AsyncAgentStorageProvider) as storage_provider:
+            await storage_provider.delete_batch(keys)
+
+    def _render_set_up_files(
+        self,
+        resource_id: str,
+        log_collector_ctx: LogCollectorConfigContext,
+        log_router_ctx: LogRouterConfigContext,
+        platform: PlatformType,
+    ) -> tuple[int, dict[str, RenderedConfigFile]]:
+        """
+        :return: (timestamp, {저장소 키: 파일}) - collector, router, bootstrap 순서
         """
         ts = int(time.time())
 
@@ -89,35 +147,47 @@ class HarvesterAgentService:
             log_collector_ctx, log_router_ctx
         )
 
-        collector_key = self.storage_provider.get_object_key(
-            resource_id, ts, collector_cfg.filename
+        collector_key = self.storage_provider.get_file_object_key(
+            resource_id, ts, collector_cfg
         )
-        router_key = self.storage_provider.get_object_key(
-            resource_id, ts, router_cfg.filename
+        router_key = self.storage_provider.get_file_object_key(
+            resource_id, ts, router_cfg
         )
 
         collector_url = self.storage_provider.get_object_url(collector_key)
         router_url = self.storage_provider.get_object_url(router_key)
 
-        agent_base_url = self.storage_provider.get_base_static_url()
         bootstrap_ctx = AgentProvisioningContext(
-            base_static_url=agent_base_url,
+            base_static_url=self.storage_provider.get_base_static_url(),
             collector_config_url=collector_url,
             router_config_url=router_url,
             timestamp=ts,
             platform=platform,
         )
         bootstrap_cfg = self.create_agent_set_up_script(bootstrap_ctx)
+        bootstrap_key = self.storage_provider.get_file_object_key(
+            resource_id, ts, bootstrap_cfg
+        )
 
-        collector_upload_url = self._upload_generated(resource_id, collector_cfg, ts)
-        router_upload_url = self._upload_generated(resource_id, router_cfg, ts)
-        bootstrap_upload_url = self._upload_generated(resource_id, bootstrap_cfg, ts)
+        return ts, {
+            collector_key: collector_cfg,
+            router_key: router_cfg,
+            bootstrap_key: bootstrap_cfg,
+        }
 
+    def _to_agent_context(
+        self,
+        ts: int,
+        files: dict[str, RenderedConfigFile],
+        uploaded: dict[str, str],
+        platform: PlatformType,
+    ) -> AgentProvisioningContext:
+        collector_key, router_key, bootstrap_key = files
         return AgentProvisioningContext(
-            base_static_url=agent_base_url,
-            collector_config_url=collector_upload_url,
-            router_config_url=router_upload_url,
-            set_up_script_url=bootstrap_upload_url,
+            base_static_url=self.storage_provider.get_base_static_url(),
+            collector_config_url=uploaded[collector_key],
+            router_config_url=uploaded[router_key],
+            set_up_script_url=uploaded[bootstrap_key],
             timestamp=ts,
             platform=platform,
         )
@@ -1,6 +1,12 @@
 from dataclasses import dataclass
 from typing import Any
 
+from monitoring.domain.visualization_platform.dashboard import (
+    Dashboard,
+    PublicDashboard,
+)
+from monitoring.domain.visualization_platform.folder import FolderPermission, UserFolder
+from monitoring.domain.visualization_platform.service_account import ServiceAccount
 from user.domain.user import User
 
 
@@ -84,3 +90,69 @@ class FinalizeDashboardDTO:
 class ProvisionFailureDTO:
     task_id: str
     project_id: str
+
+
+@dataclass
+class DashboardProvisionPlan:
+    """
+    프로젝트 하나의 프로비저닝 워크플로우. None인 단계는 이미 만들어진 리소스라 건너뛴다.
+    """
+
+    failure: ProvisionFailureDTO
+    user_folder: CreateUserFolderDTO | None = None
+    service_account: CreateServiceAccountDTO | None = None
+    service_token: CreateServiceTokenDTO | None = None
+    permissions: SetFolderPermissionsDTO | None = None
+    dashboard: CreateDashboardDTO | None = None
+    public_dashboard: CreatePublicDashboardDTO | None = None
+    finalize_dashboard: FinalizeDashboardDTO | None = None
+
+    @property
+    def project_id(self) -> str:
+        return self.failure.project_id
+
+
+# ── 일괄 프로비저닝 DTO ─────────────────────────────────────────
+@dataclass
+class ProjectProvisionRequest:
+    user_id: str
+    project_id: str
+    folder_name: str
+    account_name: str
+    token_name: str
+    dashboard_title: str
+    dashboard_config: dict[str, Any]
+    folder: UserFolder | None = None  # 이미 있는 유저 폴더면 새로 만들지 않음
+
+
+@dataclass
+class ProjectProvisionResult:
+    """
+    실패하더라도 그 전까지 만들어진 리소스는 채워서 반환한다.
+    (저장해두면 provision_log_dashboard로 남은 단계만 이어서 진행 가능)
+    """
+
+    user_id: str
+    project_id: str
+    folder: UserFolder | None = None
+    service_account: ServiceAccount | None = None
+    permission: FolderPermission | None = None
+    dashboard: Dashboard | None = None
+    public_dashboard: PublicDashboard | None = None
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ProjectDispatchResult:
+    """
+    일괄 step2 요청의 프로젝트별 결과. 실패 시 code는 MonitoringProjectException.code 또는 DISPATCH_FAILED
+    """
+
+    project_id: str
+    dispatched: bool
+    code: str | None = None
+    message: str | None = None
@@ -6,6 +6,7 @@ from monitoring.service.i_executors.excutor_DTO import (
     CreateServiceAccountDTO,
     CreateServiceTokenDTO,
     CreateUserFolderDTO,
+    DashboardProvisionPlan,
     FinalizeDashboardDTO,
     ProvisionFailureDTO,
     SetFolderPermissionsDTO,
@@ -35,3 +36,17 @@ class VisualizationPlatformTaskExecutor(ABC):
         3) 퍼블릭 대시보드 생성
         """
         ...
+
+    @abstractmethod
+    def dispatch_provision_dashboard_workflows(
+        self,
+        plans: list[DashboardProvisionPlan],
+        user_folder: CreateUserFolderDTO | None = None,
+    ) -> dict[str, str | None]:
+        """
+        < 태스크 일괄 등록 >
+        여러 프로젝트의 워크플로우를 broker 커넥션 하나로 발행한다.
+        user_folder가 있으면 폴더를 먼저 만든 뒤 모든 프로젝트 워크플로우를 시작한다.
+        반환값: {project_id: 실패 사유 (성공이면 None)}
+        """
+        ...
@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Iterator
+
+from monitoring.domain.monitoring_project import ProjectStatus
+from monitoring.domain.provision_progress import ProvisionProgressEvent
+from monitoring.domain.task_result import TaskStatus
+
+
+class IProvisionProgressNotifier(ABC):
+    @abstractmethod
+    def register_steps(self, project_id: str, steps: dict[str, str]) -> None:
+        """
+        dispatch 직전에 호출. 이후 태스크 id만으로 어느 프로젝트의 어느 단계인지 찾을 수 있게 한다.
+
+        :param steps: {task_id: 단계 이름}
+        """
+        ...
+
+    @abstractmethod
+    def register_steps_bulk(self, steps_by_project: dict[str, dict[str, str]]) -> None:
+        """
+        여러 프로젝트의 register_steps를 한 번에 처리한다. (round trip 1회)
+
+        :param steps_by_project: {project_id: {task_id: 단계 이름}}
+        """
+        ...
+
+    @abstractmethod
+    def publish_step_status(self, task_id: str, status: TaskStatus) -> None:
+        """
+        등록되지 않은 태스크면 아무것도 하지 않는다.
+        알림 실패가 태스크 실패가 되면 안 되므로 구현체는 예외를 던지지 않는다.
+        """
+        ...
+
+    @abstractmethod
+    def publish_project_status(self, project_id: str, status: ProjectStatus) -> None:
+        """
+        READY/FAILED는 구독 중인 스트림을 끝내는 이벤트. 예외를 던지지 않는다.
+        """
+        ...
+
+    @abstractmethod
+    def listen(
+        self, project_id: str, timeout: float, heartbeat: float
+    ) -> Iterator[ProvisionProgressEvent | None]:
+        """
+        지금까지의 단계별 최신 상태를 먼저 내보낸 뒤 새 이벤트를 실시간으로 내보낸다.
+        heartbeat초 동안 이벤트가 없으면 None을 내보내고(연결 유지용),
+        종료 이벤트(READY/FAILED) 또는 timeout초가 지나면 끝난다.
+        """
+        ...
+
+    @abstractmethod
+    def alisten(
+        self, project_id: str, timeout: float, heartbeat: float
+    ) -> AsyncIterator[ProvisionProgressEvent | None]:
+        """
+        listen의 async 버전. 구독을 기다리는 동안 스레드를 잡지 않는다.
+        """
+        ...
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Any
+
+from monitoring.domain.log_agent.rendered_config import RenderedConfigFile
 
 
 class IAgentStorageProvider(ABC):
@@ -16,6 +19,27 @@ class IAgentStorageProvider(ABC):
         """
         ...
 
+    @abstractmethod
+    def upload_batch(self, files: dict[str, RenderedConfigFile]) -> dict[str, str]:
+        """
+        여러 파일을 동시에 업로드한다. 하나라도 실패하면 이미 올라간 파일을 지우고 예외를 던진다.
+
+        :param files: {저장소 키: 업로드할 파일}
+        :return: {저장소 키: 업로드된 파일에 접근 가능한 URL}
+        """
+        ...
+
+    @abstractmethod
+    def delete_batch(self, keys: list[str]) -> None:
+        """
+        upload_batch로 올린 파일을 지운다. (업로드 뒤 이어지는 작업이 실패했을 때의 롤백)
+        content-addressed 키는 다른 프로젝트와 공유할 수 있으므로 남긴다.
+        실패해도 예외를 던지지 않고 로그만 남긴다.
+
+        :param keys: 지울 저장소 키
+        """
+        ...
+
     @abstractmethod
     def get_object_url(self, key: str) -> str:
         """
@@ -38,6 +62,22 @@ class IAgentStorageProvider(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_file_object_key(
+        self, resource_id: str, ts: int, file: RenderedConfigFile
+    ) -> str:
+        """
+        업로드할 파일의 저장 키를 반환한다.
+        content-addressed 모드에서 공유 가능한 파일(file.shareable)이면 파일 내용의 SHA-256 기반 키를,
+        아니면 get_object_key 결과를 반환한다.
+
+        :param resource_id: 리소스를 식별하는 ID
+        :param ts: 타임스탬프 또는 버전 구분용 값
+        :param file: 업로드할 파일
+        :return: 저장소 내 경로 키
+        """
+        ...
+
     @abstractmethod
     def get_base_static_url(self) -> str:
         """
@@ -46,3 +86,36 @@ class IAgentStorageProvider(ABC):
         :return: 정적 자산 base URL (예: "https://.../harvester")
         """
         ...
+
+
+class AsyncAgentStorageProvider(ABC):
+    """
+    IAgentStorageProvider 업로드의 asyncio 버전. (ASGI step1 요청에서 사용)
+    키/URL 계산은 IAgentStorageProvider를 그대로 쓰고, 업로드만 event loop 위에서 한다.
+    `async with provider:` 블록 안에서만 호출해야 한다. (커넥션이 event loop에 묶임)
+    """
+
+    async def __aenter__(self) -> "AsyncAgentStorageProvider":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        pass
+
+    @abstractmethod
+    async def upload(
+        self, data: bytes, key: str, content_type: str = "application/octet-stream"
+    ) -> str:
+        """IAgentStorageProvider.upload와 같다."""
+        ...
+
+    @abstractmethod
+    async def upload_batch(
+        self, files: dict[str, RenderedConfigFile]
+    ) -> dict[str, str]:
+        """IAgentStorageProvider.upload_batch와 같다. (all-or-nothing)"""
+        ...
+
+    @abstractmethod
+    async def delete_batch(self, keys: list[str]) -> None:
+        """IAgentStorageProvider.delete_batch와 같다."""
+        ...
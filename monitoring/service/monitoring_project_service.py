@@ -1,9 +1,12 @@
 import uuid
+from itertools import chain
+from typing import AsyncIterator, Iterator
 
-from django.db import transaction
+from django.utils import timezone
 
-from common.domain import PagedResult
-from common.service.paging import Paginator
+from common.container import container
+from common.domain import CursorPagedResult, PagedResult
+from config import settings
 from monitoring.domain.i_repo.i_monitoring_project_repo import IMonitoringProjectRepo
 from monitoring.domain.log_agent.agent_provision_context import (
     AgentProvisioningContext,
@@ -19,25 +22,38 @@ from monitoring.domain.monitoring_project import (
     MonitoringType,
     ProjectStatus,
 )
-from monitoring.infra.repo.monitoring_project_repo import MonitoringProjectRepo
+from monitoring.domain.provision_progress import (
+    ProvisionEventType,
+    ProvisionProgressEvent,
+)
 from monitoring.service.exceptions import (
     AlreadyExistException,
     AlreadyProvisioningException,
+    MonitoringProjectException,
     NotExistException,
     NotImplementedException,
     PermissionException,
 )
 from monitoring.service.harvester_agent_service import HarvesterAgentService
+from monitoring.service.i_executors.excutor_DTO import ProjectDispatchResult
+from monitoring.service.i_progress.i_provision_progress_notifier import (
+    IProvisionProgressNotifier,
+)
 from monitoring.service.monitoring_provision_service import MonitoringProvisionService
 from user.domain.user import User
 
+# broker 발행 실패 (ProjectDispatchResult.code)
+DISPATCH_FAILED = "DISPATCH_FAILED"
+
 
 class MonitoringProjectService:
     def __init__(self):
-        # TODO: DI
-        self.project_repo: IMonitoringProjectRepo = MonitoringProjectRepo()
-        self.harvester_agent_service = HarvesterAgentService()
-        self.monitoring_provision_service = MonitoringProvisionService()
+        self.project_repo = container.resolve(IMonitoringProjectRepo)
+        self.harvester_agent_service = container.resolve(HarvesterAgentService)
+        self.monitoring_provision_service = container.resolve(
+            MonitoringProvisionService
+        )
+        self.progress_notifier = container.resolve(IProvisionProgressNotifier)
 
     def create_project(
         self,
@@ -75,14 +91,57 @@ class MonitoringProjectService:
             raise NotExistException()
         return project_with_both_dashboards
 
+    async def aget_project_detail(
+        self, project_id: str
+    ) -> MonitoringProjectWithBothDashboardsDto:
+        project_with_both_dashboards = (
+            await self.project_repo.afind_with_full_dashboard_dto(project_id)
+        )
+        if not project_with_both_dashboards:
+            raise NotExistException()
+        return project_with_both_dashboards
+
     def get_my_projects_detail(
         self,
         user_id: str,
         page: int = 1,
         page_size: int = 10,
     ) -> PagedResult[MonitoringProjectWithBothDashboardsDto]:
-        all_dtos = self.project_repo.find_all_with_full_dashboard_dto_by_user(user_id)
-        return Paginator.paginate(all_dtos, page=page, page_size=page_size)
+        return self.project_repo.find_page_with_full_dashboard_dto_by_user(
+            user_id, page=page, page_size=page_size
+        )
+
+    async def aget_my_projects_detail(
+        self,
+        user_id: str,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> PagedResult[MonitoringProjectWithBothDashboardsDto]:
+        return await self.project_repo.afind_page_with_full_dashboard_dto_by_user(
+            user_id, page=page, page_size=page_size
+        )
+
+    def get_my_projects_detail_by_cursor(
+        self,
+        user_id: str,
+        cursor: str | None = None,
+        page_size: int = 10,
+    ) -> CursorPagedResult[MonitoringProjectWithBothDashboardsDto]:
+        return self.project_repo.find_cursor_page_with_full_dashboard_dto_by_user(
+            user_id, cursor=cursor, page_size=page_size
+        )
+
+    async def aget_my_projects_detail_by_cursor(
+        self,
+        user_id: str,
+        cursor: str | None = None,
+        page_size: int = 10,
+    ) -> CursorPagedResult[MonitoringProjectWithBothDashboardsDto]:
+        return (
+            await self.project_repo.afind_cursor_page_with_full_dashboard_dto_by_user(
+                user_id, cursor=cursor, page_size=page_size
+            )
+        )
 
     def start_log_project_step1(
         self,
@@ -98,16 +157,19 @@ class MonitoringProjectService:
         harvester_agent_service.download_agent_set_up_script 호출 및 다운로드
         다운로드 링크 반환
         """
-        with transaction.atomic():
-            project_id = log_collector_ctx.project_id
-            agent_ctx = self.harvester_agent_service.download_log_agent_set_up_script(
+        # S3 업로드는 네트워크 I/O라서 DB 저장 전에 따로 수행
+        project_id = log_collector_ctx.project_id
+        agent_ctx, uploaded_keys = (
+            self.harvester_agent_service.upload_log_agent_set_up_files(
                 resource_id=project_id,
                 log_collector_ctx=log_collector_ctx,
                 log_router_ctx=log_router_ctx,
                 platform=platform,
             )
+        )
 
-            project = self.create_project(
+        try:
+            return self.create_project(
                 project_id=project_id,
                 user_id=user.id,
                 name=project_name,
@@ -118,7 +180,50 @@ class MonitoringProjectService:
                 user_folder_id=None,
                 agent_context=agent_ctx,
             )
-            return project
+        except Exception:
+            # 저장되지 않은 프로젝트의 설정 파일이 버킷에 남지 않도록 지운다
+            self.harvester_agent_service.delete_log_agent_set_up_files(uploaded_keys)
+            raise
+
+    async def astart_log_project_step1(
+        self,
+        user: User,
+        project_name: str,
+        project_description: str,
+        log_collector_ctx: LogCollectorConfigContext,
+        log_router_ctx: LogRouterConfigContext,
+        platform: PlatformType = PlatformType.WINDOWS,
+    ) -> MonitoringProject:
+        """
+        start_log_project_step1의 async 버전. (ASGI)
+        S3 업로드는 event loop에서 기다리고, 저장은 async ORM으로 한다.
+        """
+        project_id = log_collector_ctx.project_id
+        agent_ctx, uploaded_keys = (
+            await self.harvester_agent_service.aupload_log_agent_set_up_files(
+                resource_id=project_id,
+                log_collector_ctx=log_collector_ctx,
+                log_router_ctx=log_router_ctx,
+                platform=platform,
+            )
+        )
+
+        project = MonitoringProject(
+            id=project_id,
+            user_id=user.id,
+            name=project_name,
+            project_type=MonitoringType.LOG,
+            description=project_description,
+            agent_context=agent_ctx,
+        )
+        try:
+            await self.project_repo.asave(project)
+        except Exception:
+            await self.harvester_agent_service.adelete_log_agent_set_up_files(
+                uploaded_keys
+            )
+            raise
+        return project
 
     def check_permission(self, user: User, project_id: str) -> bool:
         """
@@ -131,6 +236,14 @@ class MonitoringProjectService:
             raise PermissionException()
         return True
 
+    async def acheck_permission(self, user: User, project_id: str) -> bool:
+        is_exist = await self.project_repo.aexists_by_id_and_user_id(
+            project_id=project_id, user_id=user.id
+        )
+        if not is_exist:
+            raise PermissionException()
+        return True
+
     def start_log_project_step2(self, user, project_id: str) -> None:
         """
         provision_dashboard 호출 및 대시보드 생성 (근데 이건 비동기잖아?)
@@ -140,14 +253,139 @@ class MonitoringProjectService:
             raise NotExistException()
 
         self.check_permission(user, project_id)
+        self._check_provisionable(project)
+
+        # 로그 대시보드 프로비저닝
+        self.monitoring_provision_service.provision_log_dashboard(
+            user=user, project=project
+        )
+
+    def start_log_project_step2_bulk(
+        self, user: User, project_ids: list[str]
+    ) -> list[ProjectDispatchResult]:
+        """
+        여러 프로젝트의 step2를 한 번에 처리한다. (팀 단위 온보딩, Grafana 초기화 후 재프로비저닝 등)
+        - 프로젝트/리소스 상태는 쿼리 1회로 조회하고, 조건에 맞지 않는 프로젝트는 건너뛴다
+        - 결과는 요청 순서대로 프로젝트별 발행 여부를 담는다
+        """
+        project_ids = list(dict.fromkeys(project_ids))  # 중복 제거, 순서 유지
+        snapshots = self.project_repo.find_provisioning_snapshots(project_ids)
+
+        rejected: dict[str, MonitoringProjectException] = {}
+        targets = []
+        for project_id in project_ids:
+            snapshot = snapshots.get(project_id)
+            try:
+                if snapshot is None:
+                    raise NotExistException()
+                if snapshot.project.user_id != user.id:
+                    raise PermissionException()
+                self._check_provisionable(snapshot.project)
+            except MonitoringProjectException as e:
+                rejected[project_id] = e
+                continue
+            targets.append(snapshot)
+
+        errors = self.monitoring_provision_service.provision_log_dashboards(
+            user, targets
+        )
+
+        results: list[ProjectDispatchResult] = []
+        for project_id in project_ids:
+            if project_id in rejected:
+                e = rejected[project_id]
+                results.append(
+                    ProjectDispatchResult(
+                        project_id=project_id,
+                        dispatched=False,
+                        code=e.code,
+                        message=e.message,
+                    )
+                )
+            elif errors.get(project_id):
+                results.append(
+                    ProjectDispatchResult(
+                        project_id=project_id,
+                        dispatched=False,
+                        code=DISPATCH_FAILED,
+                        message=errors[project_id],
+                    )
+                )
+            else:
+                results.append(
+                    ProjectDispatchResult(project_id=project_id, dispatched=True)
+                )
+        return results
 
+    def _check_provisionable(self, project: MonitoringProject) -> None:
         if project.status == ProjectStatus.READY:
             raise AlreadyExistException()
 
         if project.status == ProjectStatus.IN_PROGRESS:
             raise AlreadyProvisioningException()
 
-        # 로그 대시보드 프로비저닝
-        self.monitoring_provision_service.provision_log_dashboard(
-            user=user, project=project
+    def stream_provision_progress(
+        self, project_id: str
+    ) -> Iterator[ProvisionProgressEvent | None]:
+        """
+        프로젝트의 현재 상태(DB)를 먼저 내보내고, 이미 끝난 프로젝트가 아니면
+        단계별 진행 이벤트를 이어서 내보낸다. (None은 연결 유지용 heartbeat)
+        존재 여부는 스트림을 열기 전에 확인한다.
+        """
+        project = self.project_repo.find_by_id(project_id)
+        if not project:
+            raise NotExistException()
+        return self._provision_progress(project)
+
+    async def astream_provision_progress(
+        self, project_id: str
+    ) -> AsyncIterator[ProvisionProgressEvent | None]:
+        """
+        stream_provision_progress의 async 버전. 이벤트는 같고, Redis 구독도 async로 읽는다.
+        """
+        project = await self.project_repo.afind_by_id(project_id)
+        if not project:
+            raise NotExistException()
+        return self._aprovision_progress(project)
+
+    def _provision_progress(
+        self, project: MonitoringProject
+    ) -> Iterator[ProvisionProgressEvent | None]:
+        project_id = project.id
+        current = ProvisionProgressEvent(
+            project_id=project_id,
+            type=ProvisionEventType.PROJECT,
+            status=project.status,
+            timestamp=timezone.now().isoformat(),
         )
+        if current.is_terminal:
+            return iter([current])
+
+        return chain(
+            [current],
+            self.progress_notifier.listen(
+                project_id,
+                timeout=settings.PROVISION_PROGRESS_STREAM_TIMEOUT,
+                heartbeat=settings.PROVISION_PROGRESS_HEARTBEAT,
+            ),
+        )
+
+    async def _aprovision_progress(
+        self, project: MonitoringProject
+    ) -> AsyncIterator[ProvisionProgressEvent | None]:
+        current = ProvisionProgressEvent(
+            project_id=project.id,
+            type=ProvisionEventType.PROJECT,
+            status=project.status,
+            timestamp=timezone.now().isoformat(),
+        )
+        yield current
+        if current.is_terminal:
+            return
+
+        async for event in self.progress_notifier.alisten(
+            project.id,
+            timeout=settings.PROVISION_PROGRESS_STREAM_TIMEOUT,
+            heartbeat=settings.PROVISION_PROGRESS_HEARTBEAT,
+        ):
+            yield event
@@ -1,8 +1,11 @@
 import uuid
 from typing import Any
 
+from asgiref.sync import sync_to_async
+from django.db import transaction
 from django.utils import timezone
 
+from common.container import container
 from monitoring.domain.i_repo.i_monitoring_project_repo import IMonitoringProjectRepo
 from monitoring.domain.i_repo.i_task_result_repo import ITaskResultRepo
 from monitoring.domain.i_repo.i_visualization_platform_repo.i_dashbaord_repo import (
@@ -18,60 +21,72 @@ from monitoring.domain.i_repo.i_visualization_platform_repo.i_folder_repo import
 from monitoring.domain.i_repo.i_visualization_platform_repo.i_service_account_repo import (
     IServiceAccountRepo,
 )
-from monitoring.domain.monitoring_project import MonitoringProject
+from monitoring.domain.monitoring_project import (
+    MonitoringProject,
+    ProjectStatus,
+    ProvisioningSnapshot,
+)
 from monitoring.domain.task_result import (
     MonitoringDashboardTaskName,
     TaskResult,
     TaskStatus,
 )
-from monitoring.infra.celery.task_executor.grafana_executor import GrafanaTaskExecutor
-from monitoring.infra.grafana.grafana_template_provider import GrafanaTemplateProvider
-from monitoring.infra.repo.monitoring_project_repo import MonitoringProjectRepo
-from monitoring.infra.repo.task_result_repo import TaskResultRepo
-from monitoring.infra.repo.visualization_platform_repo.dashboard_repo import (
-    DashboardRepo,
-    PublicDashboardRepo,
-)
-from monitoring.infra.repo.visualization_platform_repo.folder_permission_repo import (
-    FolderPermissionRepo,
-)
-from monitoring.infra.repo.visualization_platform_repo.folder_repo import FolderRepo
-from monitoring.infra.repo.visualization_platform_repo.service_account_repo import (
-    ServiceAccountRepo,
-)
+from monitoring.domain.visualization_platform.folder import UserFolder
 from monitoring.service.i_executors.excutor_DTO import (
     CreateDashboardDTO,
     CreatePublicDashboardDTO,
     CreateServiceAccountDTO,
     CreateServiceTokenDTO,
     CreateUserFolderDTO,
+    DashboardProvisionPlan,
     FinalizeDashboardDTO,
+    ProjectProvisionRequest,
+    ProjectProvisionResult,
     ProvisionFailureDTO,
     SetFolderPermissionsDTO,
 )
 from monitoring.service.i_executors.visualization_platform_executor import (
     VisualizationPlatformTaskExecutor,
 )
+from monitoring.service.i_progress.i_provision_progress_notifier import (
+    IProvisionProgressNotifier,
+)
 from monitoring.service.i_visualization_platform.i_template_provider import (
     VisualizationPlatformTemplateProvider,
 )
+from monitoring.service.i_visualization_platform.i_visualization_platform_provider import (
+    AsyncVisualizationPlatformProvider,
+)
+from monitoring.service.visualization_platform_batch_provisioner import (
+    VisualizationPlatformBatchProvisioner,
+)
 from user.domain.user import User
 
+# 일괄 프로비저닝에서 프로젝트마다 남기는 단계 (유저 폴더는 유저당 한 번)
+BATCH_STEP_NAMES = (
+    MonitoringDashboardTaskName.CREATE_DASHBOARD_SERVICE_ACCOUNT,
+    MonitoringDashboardTaskName.CREATE_DASHBOARD_SERVICE_TOKEN,
+    MonitoringDashboardTaskName.SET_FOLDER_PERMISSIONS,
+    MonitoringDashboardTaskName.CREATE_DASHBOARD,
+    MonitoringDashboardTaskName.CREATE_PUBLIC_DASHBOARD,
+    MonitoringDashboardTaskName.FINALIZE_DASHBOARD,
+)
+
 
 class MonitoringProvisionService:
     def __init__(self):
-        # TODO: DI 적용 예정
-        self.task_executor: VisualizationPlatformTaskExecutor = GrafanaTaskExecutor()
-        self.task_result_repo: ITaskResultRepo = TaskResultRepo()
-        self.template_provider: VisualizationPlatformTemplateProvider = (
-            GrafanaTemplateProvider()
+        self.task_executor = container.resolve(VisualizationPlatformTaskExecutor)
+        self.task_result_repo = container.resolve(ITaskResultRepo)
+        self.template_provider = container.resolve(
+            VisualizationPlatformTemplateProvider
         )
-        self.folder_repo: IFolderRepo = FolderRepo()
-        self.account_repo: IServiceAccountRepo = ServiceAccountRepo()
-        self.folder_permissions_repo: IFolderPermissionRepo = FolderPermissionRepo()
-        self.dashboard_repo: IDashboardRepo = DashboardRepo()
-        self.public_dashboard_repo: IPublicDashboardRepo = PublicDashboardRepo()
-        self.monitoring_project_repo: IMonitoringProjectRepo = MonitoringProjectRepo()
+        self.folder_repo = container.resolve(IFolderRepo)
+        self.account_repo = container.resolve(IServiceAccountRepo)
+        self.folder_permissions_repo = container.resolve(IFolderPermissionRepo)
+        self.dashboard_repo = container.resolve(IDashboardRepo)
+        self.public_dashboard_repo = container.resolve(IPublicDashboardRepo)
+        self.monitoring_project_repo = container.resolve(IMonitoringProjectRepo)
+        self.progress_notifier = container.resolve(IProvisionProgressNotifier)
 
     def _make_folder_name(self, user_id: str, user_name: str) -> str:
         return f"User_{user_id}_{user_name}'s Folder"
@@ -111,20 +126,105 @@ class MonitoringProvisionService:
         user: User,
         project: MonitoringProject,
     ) -> str:
-        # 1) DTO 생성 task 저장은 bulk로 처리함
+        # 1) 이미 만들어진 리소스는 쿼리 1회로 한꺼번에 확인하고, 없는 것만 태스크로 만든다
+        snapshot = self.monitoring_project_repo.find_provisioning_snapshot(
+            user.id, project.id
+        )
+        plan = self._plan_log_dashboard(
+            user, project, snapshot, user_folder=self._plan_user_folder(user, snapshot)
+        )
 
-        monitoring_project_id = project.id
+        # 2) bulk PENDING TaskResult 생성
+        to_upsert = self._pending_task_results(plan, timezone.now().isoformat())
+        if to_upsert:
+            self.task_result_repo.bulk_upsert(to_upsert)
 
-        user_folder_dto = None
-        if not self.folder_repo.find_by_user_id(user.id):
-            folder_id = str(uuid.uuid4())
-            user_folder_dto = CreateUserFolderDTO(
-                task_id=folder_id,
-                user_id=user.id,
-                folder_name=self._make_folder_name(user.id, user.name),
+        # 진행 상황 스트림에서 태스크 id → 단계를 찾을 수 있도록 dispatch 전에 등록
+        self.progress_notifier.register_steps(
+            project.id, {tr.id: tr.task_name for tr in to_upsert}
+        )
+
+        # 3) dispatch
+        return self.task_executor.dispatch_provision_dashboard_workflow(
+            user_folder=plan.user_folder,
+            service_account=plan.service_account,
+            service_token=plan.service_token,
+            permissions=plan.permissions,
+            dashboard=plan.dashboard,
+            public_dashboard=plan.public_dashboard,
+            finalize_dashboard=plan.finalize_dashboard,
+            failure=plan.failure,
+        )
+
+    def provision_log_dashboards(
+        self,
+        user: User,
+        snapshots: list[ProvisioningSnapshot],
+    ) -> dict[str, str | None]:
+        """
+        한 사용자의 여러 프로젝트를 Celery 워크플로우로 일괄 프로비저닝한다.
+        (find_provisioning_snapshots로 조회한 스냅샷, project가 채워져 있어야 함)
+        - PENDING TaskResult는 전 프로젝트 분을 bulk_upsert 한 번으로 저장
+        - 유저 폴더가 없으면 폴더 생성 태스크 하나를 모든 프로젝트가 공유한다
+        - 반환값: {project_id: 발행 실패 사유 (성공이면 None)}
+        """
+        if not snapshots:
+            return {}
+
+        user_folder = self._plan_user_folder(user, snapshots[0])
+        plans = [
+            self._plan_log_dashboard(user, snapshot.project, snapshot, user_folder=None)
+            for snapshot in snapshots
+        ]
+
+        now = timezone.now().isoformat()
+        to_upsert: list[TaskResult] = []
+        steps: dict[str, dict[str, str]] = {}
+        for plan in plans:
+            task_results = self._pending_task_results(plan, now)
+            to_upsert.extend(task_results)
+            steps[plan.project_id] = {tr.id: tr.task_name for tr in task_results}
+        if user_folder:
+            # 공유 폴더 태스크는 첫 프로젝트의 진행 상황으로 보인다
+            folder_result = self._pending_task_result(
+                user_folder.task_id,
+                MonitoringDashboardTaskName.CREATE_DASHBOARD_USER_FOLDER,
+                now,
             )
+            to_upsert.append(folder_result)
+            steps[plans[0].project_id][folder_result.id] = folder_result.task_name
+        self.task_result_repo.bulk_upsert(to_upsert)
+
+        self.progress_notifier.register_steps_bulk(steps)
 
-        service_account = self.account_repo.find_by_project_id(monitoring_project_id)
+        return self.task_executor.dispatch_provision_dashboard_workflows(
+            plans, user_folder=user_folder
+        )
+
+    def _plan_user_folder(
+        self, user: User, snapshot: ProvisioningSnapshot
+    ) -> CreateUserFolderDTO | None:
+        if snapshot.user_folder:
+            return None
+        return CreateUserFolderDTO(
+            task_id=str(uuid.uuid4()),
+            user_id=user.id,
+            folder_name=self._make_folder_name(user.id, user.name),
+        )
+
+    def _plan_log_dashboard(
+        self,
+        user: User,
+        project: MonitoringProject,
+        snapshot: ProvisioningSnapshot,
+        user_folder: CreateUserFolderDTO | None,
+    ) -> DashboardProvisionPlan:
+        """
+        스냅샷에 없는 리소스만 DTO로 만든다. (유저 폴더는 호출하는 쪽에서 결정)
+        """
+        monitoring_project_id = project.id
+
+        service_account = snapshot.service_account
         service_account_dto = None
         if not service_account:
             account_id = str(uuid.uuid4())
@@ -146,13 +246,8 @@ class MonitoringProvisionService:
                 token_name=self._make_token_name(user.id, monitoring_project_id),
             )
 
-        perm = None
-        if service_account:
-            perm = self.folder_permissions_repo.find_by_service_account_id(
-                service_account.id
-            )
         permissions_dto = None
-        if not perm:
+        if not snapshot.folder_permission:
             perm_id = str(uuid.uuid4())
             permissions_dto = SetFolderPermissionsDTO(
                 task_id=perm_id,
@@ -161,11 +256,8 @@ class MonitoringProvisionService:
             )
 
         # dashboard
-        exists = self.dashboard_repo.find_by_project_id(
-            project_id=monitoring_project_id
-        )
         dashboard_dto = None
-        if not exists:
+        if not snapshot.dashboard:
             dash_id = str(uuid.uuid4())
             dashboard_dto = CreateDashboardDTO(
                 task_id=dash_id,
@@ -178,11 +270,8 @@ class MonitoringProvisionService:
             )
 
         # public dashboard
-        exists_public = self.public_dashboard_repo.find_by_project_id(
-            project_id=monitoring_project_id
-        )
         public_dto = None
-        if not exists_public:
+        if not snapshot.public_dashboard:
             pub_id = str(uuid.uuid4())
             public_dto = CreatePublicDashboardDTO(
                 task_id=pub_id,
@@ -190,54 +279,251 @@ class MonitoringProvisionService:
             )
 
         finalize_id = str(uuid.uuid4())
-        finalize_dto = FinalizeDashboardDTO(
-            task_id=finalize_id,
-            user_id=user.id,
-            project_id=monitoring_project_id,
-        )
-        failure_dto = ProvisionFailureDTO(
-            task_id=finalize_id,
-            project_id=monitoring_project_id,
-        )
-
-        # 2) bulk PENDING TaskResult 생성
-        now = timezone.now().isoformat()
-        to_upsert: list[TaskResult] = []
-        for dto, name in [
-            (user_folder_dto, MonitoringDashboardTaskName.CREATE_DASHBOARD_USER_FOLDER),
-            (
-                service_account_dto,
-                MonitoringDashboardTaskName.CREATE_DASHBOARD_SERVICE_ACCOUNT,
-            ),
-            (
-                service_token_dto,
-                MonitoringDashboardTaskName.CREATE_DASHBOARD_SERVICE_TOKEN,
+        return DashboardProvisionPlan(
+            failure=ProvisionFailureDTO(
+                task_id=finalize_id,
+                project_id=monitoring_project_id,
             ),
-            (permissions_dto, MonitoringDashboardTaskName.SET_FOLDER_PERMISSIONS),
-            (dashboard_dto, MonitoringDashboardTaskName.CREATE_DASHBOARD),
-            (public_dto, MonitoringDashboardTaskName.CREATE_PUBLIC_DASHBOARD),
-            (finalize_dto, MonitoringDashboardTaskName.FINALIZE_DASHBOARD),
-        ]:
-            if dto:
-                to_upsert.append(
-                    TaskResult(
-                        id=dto.task_id,
-                        task_name=name.value,
-                        status=TaskStatus.PENDING,
-                        date_created=now,
-                    )
-                )
-        if to_upsert:
-            self.task_result_repo.bulk_upsert(to_upsert)
-
-        # 3) dispatch
-        return self.task_executor.dispatch_provision_dashboard_workflow(
-            user_folder=user_folder_dto,
+            user_folder=user_folder,
             service_account=service_account_dto,
             service_token=service_token_dto,
             permissions=permissions_dto,
             dashboard=dashboard_dto,
             public_dashboard=public_dto,
-            finalize_dashboard=finalize_dto,
-            failure=failure_dto,
+            finalize_dashboard=FinalizeDashboardDTO(
+                task_id=finalize_id,
+                user_id=user.id,
+                project_id=monitoring_project_id,
+            ),
+        )
+
+    def _pending_task_results(
+        self, plan: DashboardProvisionPlan, now: str
+    ) -> list[TaskResult]:
+        return [
+            self._pending_task_result(dto.task_id, name, now)
+            for dto, name in [
+                (
+                    plan.user_folder,
+                    MonitoringDashboardTaskName.CREATE_DASHBOARD_USER_FOLDER,
+                ),
+                (
+                    plan.service_account,
+                    MonitoringDashboardTaskName.CREATE_DASHBOARD_SERVICE_ACCOUNT,
+                ),
+                (
+                    plan.service_token,
+                    MonitoringDashboardTaskName.CREATE_DASHBOARD_SERVICE_TOKEN,
+                ),
+                (plan.permissions, MonitoringDashboardTaskName.SET_FOLDER_PERMISSIONS),
+                (plan.dashboard, MonitoringDashboardTaskName.CREATE_DASHBOARD),
+                (
+                    plan.public_dashboard,
+                    MonitoringDashboardTaskName.CREATE_PUBLIC_DASHBOARD,
+                ),
+                (
+                    plan.finalize_dashboard,
+                    MonitoringDashboardTaskName.FINALIZE_DASHBOARD,
+                ),
+            ]
+            if dto
+        ]
+
+    def _pending_task_result(
+        self, task_id: str, name: MonitoringDashboardTaskName, now: str
+    ) -> TaskResult:
+        return TaskResult(
+            id=task_id,
+            task_name=name.value,
+            status=TaskStatus.PENDING,
+            date_created=now,
+        )
+
+    def provision_log_dashboards_batch(
+        self,
+        targets: list[tuple[User, ProvisioningSnapshot]],
+        concurrency: int,
+    ) -> list[ProjectProvisionResult]:
+        """
+        대량 온보딩(마이그레이션 등)용 일괄 프로비저닝.
+        Celery 체인 대신 한 프로세스에서 플랫폼 API를 동시에 호출하고, 끝난 뒤 결과를 저장한다.
+        (find_provisioning_snapshots로 조회한 스냅샷, project가 채워져 있어야 함)
+        - 플랫폼 리소스가 하나도 없는 프로젝트만 대상 (일부만 있는 프로젝트는 provision_log_dashboard 사용)
+        - 단계별 TaskResult와 진행 상황 이벤트는 Celery 워크플로우와 같은 이름으로 남긴다
+        - 실패한 프로젝트도 만들어진 리소스는 저장하고 FAILED로 표시
+        event loop가 돌고 있는 곳(ASGI view 등)에서는 aprovision_log_dashboards_batch를 사용한다.
+        """
+        requests, steps, skipped = self._prepare_batch(targets)
+        results = self._batch_provisioner(concurrency).provision(requests)
+        self._finish_batch(requests, results, steps)
+        return results + skipped
+
+    async def aprovision_log_dashboards_batch(
+        self,
+        targets: list[tuple[User, ProvisioningSnapshot]],
+        concurrency: int,
+    ) -> list[ProjectProvisionResult]:
+        """
+        provision_log_dashboards_batch의 async 버전. DB 작업만 스레드로 넘긴다.
+        """
+        requests, steps, skipped = await sync_to_async(self._prepare_batch)(targets)
+        results = await self._batch_provisioner(concurrency).aprovision(requests)
+        await sync_to_async(self._finish_batch)(requests, results, steps)
+        return results + skipped
+
+    def _batch_provisioner(
+        self, concurrency: int
+    ) -> VisualizationPlatformBatchProvisioner:
+        # AsyncGrafanaAPI는 async with 동안 커넥션을 쥐고 있으므로 호출마다 새로 받는다
+        return VisualizationPlatformBatchProvisioner(
+            container.resolve(AsyncVisualizationPlatformProvider),
+            concurrency=concurrency,
         )
+
+    def _prepare_batch(self, targets: list[tuple[User, ProvisioningSnapshot]]) -> tuple[
+        list[ProjectProvisionRequest],
+        dict[str, list[TaskResult]],
+        list[ProjectProvisionResult],
+    ]:
+        """
+        :return: (요청 목록, {project_id: PENDING TaskResult 목록}, 건너뛴 프로젝트 결과)
+        """
+        folders: dict[str, UserFolder | None] = {}
+        requests: list[ProjectProvisionRequest] = []
+        skipped: list[ProjectProvisionResult] = []
+        steps: dict[str, list[TaskResult]] = {}
+        now = timezone.now().isoformat()
+        for user, snapshot in targets:
+            project = snapshot.project
+            if snapshot.service_account or snapshot.dashboard:
+                skipped.append(
+                    ProjectProvisionResult(
+                        user_id=user.id,
+                        project_id=project.id,
+                        error="이미 프로비저닝이 진행된 프로젝트입니다.",
+                    )
+                )
+                continue
+
+            names = list(BATCH_STEP_NAMES)
+            if user.id not in folders:
+                folders[user.id] = snapshot.user_folder
+                # 유저 폴더는 한 번만 만들므로 그 유저의 첫 프로젝트 진행 상황으로 보인다
+                if snapshot.user_folder is None:
+                    names.insert(
+                        0, MonitoringDashboardTaskName.CREATE_DASHBOARD_USER_FOLDER
+                    )
+            steps[project.id] = [
+                self._pending_task_result(str(uuid.uuid4()), name, now)
+                for name in names
+            ]
+            requests.append(
+                ProjectProvisionRequest(
+                    user_id=user.id,
+                    project_id=project.id,
+                    folder_name=self._make_folder_name(user.id, user.name),
+                    account_name=self._make_account_name(user.id, project.id),
+                    token_name=self._make_token_name(user.id, project.id),
+                    dashboard_title=self._make_dashboard_title(project.name),
+                    dashboard_config=self.create_logs_dashboard_template(
+                        project.id, project.name
+                    ),
+                    folder=folders[user.id],
+                )
+            )
+
+        if requests:
+            self.task_result_repo.bulk_upsert(
+                [tr for task_results in steps.values() for tr in task_results]
+            )
+            self.progress_notifier.register_steps_bulk(
+                {
+                    project_id: {tr.id: tr.task_name for tr in task_results}
+                    for project_id, task_results in steps.items()
+                }
+            )
+            for request in requests:
+                self.monitoring_project_repo.update_fields(
+                    project_id=request.project_id,
+                    status=ProjectStatus.IN_PROGRESS.value,
+                )
+        return requests, steps, skipped
+
+    def _finish_batch(
+        self,
+        requests: list[ProjectProvisionRequest],
+        results: list[ProjectProvisionResult],
+        steps: dict[str, list[TaskResult]],
+    ) -> None:
+        saved_folder_ids = {r.folder.id for r in requests if r.folder is not None}
+        for result in results:
+            with transaction.atomic():
+                if result.folder and result.folder.id not in saved_folder_ids:
+                    self.folder_repo.save(result.folder)
+                    saved_folder_ids.add(result.folder.id)
+                self._save_provision_result(result)
+
+        # 한 프로세스 안에서 끝났으므로 STARTED 없이 최종 상태만 남긴다
+        now = timezone.now().isoformat()
+        done: list[TaskResult] = []
+        for result in results:
+            for tr in steps[result.project_id]:
+                succeeded = self._batch_step_succeeded(
+                    MonitoringDashboardTaskName(tr.task_name), result
+                )
+                tr.status = TaskStatus.SUCCESS if succeeded else TaskStatus.FAILURE
+                tr.date_done = now
+                if not succeeded:
+                    tr.result = result.error
+                done.append(tr)
+        if done:
+            self.task_result_repo.bulk_upsert(done)
+
+        for result in results:
+            for tr in steps[result.project_id]:
+                self.progress_notifier.publish_step_status(tr.id, tr.status)
+            self.progress_notifier.publish_project_status(
+                result.project_id,
+                ProjectStatus.READY if result.succeeded else ProjectStatus.FAILED,
+            )
+
+    @staticmethod
+    def _batch_step_succeeded(
+        name: MonitoringDashboardTaskName, result: ProjectProvisionResult
+    ) -> bool:
+        match name:
+            case MonitoringDashboardTaskName.CREATE_DASHBOARD_USER_FOLDER:
+                return result.folder is not None
+            case MonitoringDashboardTaskName.CREATE_DASHBOARD_SERVICE_ACCOUNT:
+                return result.service_account is not None
+            case MonitoringDashboardTaskName.CREATE_DASHBOARD_SERVICE_TOKEN:
+                return bool(result.service_account and result.service_account.token)
+            case MonitoringDashboardTaskName.SET_FOLDER_PERMISSIONS:
+                return result.permission is not None
+            case MonitoringDashboardTaskName.CREATE_DASHBOARD:
+                return result.dashboard is not None and result.dashboard.uid is not None
+            case MonitoringDashboardTaskName.CREATE_PUBLIC_DASHBOARD:
+                return result.public_dashboard is not None
+            case _:
+                return result.succeeded
+
+    def _save_provision_result(self, result: ProjectProvisionResult) -> None:
+        if result.service_account:
+            self.account_repo.save(result.service_account)
+        if result.permission:
+            self.folder_permissions_repo.save(result.permission)
+        if result.dashboard:
+            self.dashboard_repo.save(result.dashboard)
+        if result.public_dashboard:
+            self.public_dashboard_repo.save(result.public_dashboard)
+
+        if result.succeeded:
+            self.monitoring_project_repo.update_fields(
+                project_id=result.project_id,
+                status=ProjectStatus.READY.value,
+                user_folder_id=result.folder.id if result.folder else None,
+            )
+        else:
+            self.monitoring_project_repo.update_fields(
+                project_id=result.project_id, status=ProjectStatus.FAILED.value
+            )
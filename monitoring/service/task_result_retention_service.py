@@ -0,0 +1,76 @@
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.utils import timezone
+
+from common.container import container
+from config import settings
+from monitoring.domain.i_repo.i_task_result_repo import ITaskResultRepo
+from monitoring.domain.task_result import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    status: TaskStatus
+    max_age: timedelta | None  # None이면 생성 시각과 관계없이 전부 삭제
+
+
+class TaskResultRetentionService:
+    """
+    보관 기간이 지난 task_result_model 행을 (date_created, pk) 순서의 작은 chunk로 나눠 삭제한다.
+    한 번에 DELETE 하면 긴 트랜잭션으로 락을 오래 잡고 WAL/dead tuple이 한꺼번에 몰리므로
+    chunk마다 짧은 DELETE 한 번(autocommit)으로 끝내고 chunk 사이에 쉰다.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = settings.TASK_RESULT_RETENTION_CHUNK_SIZE,
+        chunk_sleep: float = settings.TASK_RESULT_RETENTION_CHUNK_SLEEP,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size는 1 이상이어야 합니다.")
+        self.task_result_repo = container.resolve(ITaskResultRepo)
+        self.chunk_size = chunk_size
+        self.chunk_sleep = chunk_sleep
+
+    @staticmethod
+    def default_policies() -> list[RetentionPolicy]:
+        return [
+            RetentionPolicy(TaskStatus(status), timedelta(days=days))
+            for status, days in settings.TASK_RESULT_RETENTION_DAYS.items()
+        ]
+
+    def purge(
+        self, policies: list[RetentionPolicy], now: datetime | None = None
+    ) -> dict[TaskStatus, int]:
+        """status별 삭제한 행 수를 반환"""
+        now = now or timezone.now()
+        deleted: dict[TaskStatus, int] = {}
+        for policy in policies:
+            created_before = now - policy.max_age if policy.max_age else None
+            deleted[policy.status] = self._purge_status(policy.status, created_before)
+            logger.info(
+                f"[task result 정리] {policy.status}: {deleted[policy.status]}건 삭제 "
+                f"(기준: {created_before or '전체'})"
+            )
+        return deleted
+
+    def _purge_status(self, status: TaskStatus, created_before: datetime | None) -> int:
+        total = 0
+        after: tuple[datetime, str] | None = None
+        while True:
+            keys = self.task_result_repo.find_expired_keys(
+                status, created_before, after, self.chunk_size
+            )
+            if not keys:
+                return total
+            total += self.task_result_repo.delete_by_ids([id for _, id in keys])
+            if len(keys) < self.chunk_size:
+                return total
+            after = keys[-1]
+            if self.chunk_sleep > 0:
+                time.sleep(self.chunk_sleep)
@@ -0,0 +1,211 @@
+import asyncio
+import uuid
+from typing import Any, Awaitable, Callable
+
+from monitoring.domain.visualization_platform.dashboard import (
+    Dashboard,
+    PublicDashboard,
+)
+from monitoring.domain.visualization_platform.folder import (
+    FolderPermission,
+    FolderPermissionLevel,
+    UserFolder,
+)
+from monitoring.domain.visualization_platform.service_account import ServiceAccount
+from monitoring.service.i_executors.excutor_DTO import (
+    ProjectProvisionRequest,
+    ProjectProvisionResult,
+)
+from monitoring.service.i_visualization_platform.i_visualization_platform_provider import (
+    AsyncVisualizationPlatformProvider,
+)
+
+
+class VisualizationPlatformBatchProvisioner:
+    """
+    여러 프로젝트의 폴더/서비스 계정/토큰/권한/대시보드를 한 event loop에서 동시에 생성한다.
+    - 동시에 진행 중인 플랫폼 요청 수는 concurrency로 제한
+    - 같은 유저의 프로젝트들은 폴더 하나를 공유 (유저당 폴더 생성 1회)
+    - 한 프로젝트 안에서도 서비스 계정 쪽과 대시보드 쪽은 서로 기다리지 않는다
+    - 한 프로젝트의 실패는 다른 프로젝트에 영향을 주지 않고 result.error에 기록
+    DB 저장은 하지 않는다. (호출하는 쪽에서 결과를 보고 저장)
+    """
+
+    def __init__(self, provider: AsyncVisualizationPlatformProvider, concurrency: int):
+        if concurrency < 1:
+            raise ValueError("concurrency는 1 이상이어야 합니다.")
+        self.provider = provider
+        self.concurrency = concurrency
+
+    def provision(
+        self, requests: list[ProjectProvisionRequest]
+    ) -> list[ProjectProvisionResult]:
+        """
+        동기 코드(management command, Celery 워커)에서 호출하는 진입점.
+        asyncio.run을 쓰므로 event loop가 이미 돌고 있는 곳(ASGI view 등)에서는 aprovision을 await 한다.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aprovision(requests))
+        raise RuntimeError("event loop 안에서는 aprovision을 await 해야 합니다.")
+
+    async def aprovision(
+        self, requests: list[ProjectProvisionRequest]
+    ) -> list[ProjectProvisionResult]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def call(fn: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+            async with semaphore:
+                return await fn(*args)
+
+        folders: dict[str, asyncio.Future[UserFolder]] = {}
+        async with self.provider:
+            return list(
+                await asyncio.gather(
+                    *(self._provision_project(req, call, folders) for req in requests)
+                )
+            )
+
+    async def _provision_project(
+        self,
+        request: ProjectProvisionRequest,
+        call: Callable[..., Awaitable[Any]],
+        folders: dict[str, asyncio.Future[UserFolder]],
+    ) -> ProjectProvisionResult:
+        result = ProjectProvisionResult(
+            user_id=request.user_id, project_id=request.project_id
+        )
+        folder = self._get_folder(request, call, folders)
+
+        errors = await asyncio.gather(
+            self._provision_account(request, call, folder, result),
+            self._provision_dashboard(request, call, folder, result),
+            return_exceptions=True,
+        )
+        if folder.done() and not folder.cancelled() and folder.exception() is None:
+            result.folder = folder.result()
+
+        error = next((e for e in errors if isinstance(e, BaseException)), None)
+        if error is not None:
+            result.error = f"{type(error).__name__}: {error}"
+        return result
+
+    def _get_folder(
+        self,
+        request: ProjectProvisionRequest,
+        call: Callable[..., Awaitable[Any]],
+        folders: dict[str, asyncio.Future[UserFolder]],
+    ) -> asyncio.Future[UserFolder]:
+        if request.user_id in folders:
+            return folders[request.user_id]
+
+        if request.folder is not None:
+            future: asyncio.Future[UserFolder] = (
+                asyncio.get_running_loop().create_future()
+            )
+            future.set_result(request.folder)
+        else:
+            future = asyncio.ensure_future(self._create_folder(request, call))
+        folders[request.user_id] = future
+        return future
+
+    async def _create_folder(
+        self, request: ProjectProvisionRequest, call: Callable[..., Awaitable[Any]]
+    ) -> UserFolder:
+        result = await call(self.provider.create_folder, request.folder_name)
+        return UserFolder(
+            id=str(uuid.uuid4()),
+            user_id=request.user_id,
+            uid=result["uid"],
+            name=result["title"],
+            org_id=str(result.get("orgId")) if result.get("orgId") else None,
+        )
+
+    async def _provision_account(
+        self,
+        request: ProjectProvisionRequest,
+        call: Callable[..., Awaitable[Any]],
+        folder: asyncio.Future[UserFolder],
+        result: ProjectProvisionResult,
+    ) -> None:
+        """서비스 계정 생성 → (토큰 생성 | 폴더 권한 설정)"""
+        created = await call(self.provider.create_service_account, request.account_name)
+        account = ServiceAccount(
+            id=str(uuid.uuid4()),
+            account_id=str(created["id"]),
+            project_id=request.project_id,
+            user_id=request.user_id,
+            name=created["name"],
+            role=created["role"],
+            is_disabled=created["isDisabled"],
+        )
+        result.service_account = account
+
+        async def create_token() -> None:
+            token = await call(
+                self.provider.create_service_token,
+                account.account_id,
+                request.token_name,
+            )
+            account.token = token["key"]
+
+        async def set_permission() -> None:
+            folder_uid = (await folder).uid
+            await call(
+                self.provider.set_folder_permissions, folder_uid, account.account_id
+            )
+            result.permission = FolderPermission(
+                id=str(uuid.uuid4()),
+                folder_uid=folder_uid,
+                service_account_id=account.account_id,
+                permission=FolderPermissionLevel.VIEW,
+            )
+
+        await self._gather_or_raise(create_token(), set_permission())
+
+    async def _provision_dashboard(
+        self,
+        request: ProjectProvisionRequest,
+        call: Callable[..., Awaitable[Any]],
+        folder: asyncio.Future[UserFolder],
+        result: ProjectProvisionResult,
+    ) -> None:
+        """대시보드 생성 → 퍼블릭 대시보드 생성"""
+        folder_uid = (await folder).uid
+        created = await call(
+            self.provider.create_dashboard, request.dashboard_config, folder_uid
+        )
+        dashboard = Dashboard(
+            id=str(uuid.uuid4()),
+            uid=created.get("uid"),
+            title=request.dashboard_title,
+            user_id=request.user_id,
+            org_id=None,
+            folder_uid=folder_uid,
+            url=created.get("url"),
+            project_id=request.project_id,
+            config_json=request.dashboard_config,
+        )
+        result.dashboard = dashboard
+        if dashboard.uid is None:
+            raise RuntimeError(
+                f"Dashboard UID is None for project {request.project_id}"
+            )
+
+        public = await call(self.provider.create_public_dashboard, dashboard.uid)
+        result.public_dashboard = PublicDashboard(
+            id=str(uuid.uuid4()),
+            uid=public["uid"],
+            dashboard_id=dashboard.id,
+            project_id=request.project_id,
+            public_url=public["publicUrl"],
+        )
+
+    @staticmethod
+    async def _gather_or_raise(*aws: Awaitable[Any]) -> None:
+        # 형제 작업이 끝까지 진행돼야 만들어진 리소스가 result에 빠짐없이 남는다
+        outcomes = await asyncio.gather(*aws, return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
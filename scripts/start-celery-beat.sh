@@ -0,0 +1,2 @@
+#!/bin/bash
+poetry run celery -A config beat --loglevel=INFO
@@ -0,0 +1,5 @@
+#!/bin/bash
+# 템플릿 렌더링/DB 작업 태스크 (worker_tasks_queue, celery): prefork, 기본 동시성은 CPU 수
+poetry run celery -A config worker --loglevel=INFO \
+    -Q worker_tasks_queue,celery -n cpu@%h \
+    --pool=prefork ${CELERY_CPU_CONCURRENCY:+--concurrency="$CELERY_CPU_CONCURRENCY"} -O fair
@@ -0,0 +1,8 @@
+#!/bin/bash
+# Grafana/S3 호출 태스크 (io_tasks_queue): 네트워크 대기 위주라 threads pool로 동시성을 높인다
+CONCURRENCY=${CELERY_IO_CONCURRENCY:-32}
+# 스레드들이 Grafana 커넥션 풀 하나를 공유하므로 풀 크기를 동시성에 맞춘다
+export GRAFANA_HTTP_POOL_SIZE=${GRAFANA_HTTP_POOL_SIZE:-$CONCURRENCY}
+poetry run celery -A config worker --loglevel=INFO \
+    -Q io_tasks_queue -n io@%h \
+    --pool=threads --concurrency="$CONCURRENCY"
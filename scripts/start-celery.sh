@@ -1,2 +1,3 @@
 #!/bin/bash
+# 로컬 개발용: 모든 큐를 워커 하나로 처리 (운영은 start-celery-io.sh / start-celery-cpu.sh)
 poetry run celery -A config worker --loglevel=DEBUG --concurrency=1
@@ -0,0 +1,7 @@
+#!/bin/bash
+# ASGI(uvicorn): step1/조회 endpoint가 async view로 동작해 적은 프로세스로 많은 동시 요청을 받는다
+WORKERS=${WEB_CONCURRENCY:-2}
+poetry run python manage.py migrate
+poetry run uvicorn config.asgi:application \
+    --host 0.0.0.0 --port 8000 \
+    --workers "$WORKERS" --no-access-log
@@ -0,0 +1,219 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from common.db.pool import (
+    _TRANSACTION_IDLE,
+    _TRANSACTION_INERROR,
+    _TRANSACTION_INTRANS,
+    ConnectionPool,
+    PoolTimeout,
+)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.autocommit = True
+        self.info = SimpleNamespace(transaction_status=_TRANSACTION_IDLE)
+        self.rollbacks = 0
+        self.pings = 0
+        self.ping_fails = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = _TRANSACTION_IDLE
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCursor:
+    def __init__(self, connection: FakeConnection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        self.connection.pings += 1
+        if self.connection.ping_fails:
+            raise ConnectionError("server closed the connection")
+        if not self.connection.autocommit:
+            self.connection.info.transaction_status = _TRANSACTION_INTRANS
+
+
+def make_pool(**options) -> ConnectionPool:
+    opened: list[FakeConnection] = []
+
+    def connect() -> FakeConnection:
+        connection = FakeConnection()
+        opened.append(connection)
+        return connection
+
+    pool = ConnectionPool(
+        connect=connect,
+        **{
+            "pool_size": 2,
+            "max_overflow": 1,
+            "recycle": None,
+            "pre_ping": False,
+            "timeout": 0.1,
+            **options,
+        },
+    )
+    pool.opened = opened
+    return pool
+
+
+def test_reuses_released_connections_lazily():
+    pool = make_pool()
+    assert pool.opened == []
+
+    first = pool.acquire()
+    pool.release(first)
+
+    assert pool.acquire() is first
+    assert pool.stats()["created"] == 1
+
+
+def test_overflow_is_closed_on_release():
+    pool = make_pool()
+    connections = [pool.acquire() for _ in range(3)]
+
+    for connection in connections:
+        pool.release(connection)
+
+    # pool_size만 남기고 overflow는 닫는다
+    assert [c.closed for c in connections] == [False, False, True]
+    stats = pool.stats()
+    assert (stats["size"], stats["idle"], stats["in_use"]) == (2, 2, 0)
+    assert stats["peak_in_use"] == 3
+
+
+def test_waits_for_a_released_connection():
+    pool = make_pool(pool_size=1, max_overflow=0, timeout=1.0)
+    held = pool.acquire()
+
+    timer = threading.Timer(0.05, pool.release, args=[held])
+    timer.start()
+    try:
+        assert pool.acquire() is held
+    finally:
+        timer.join()
+
+    stats = pool.stats()
+    assert stats["waits"] == 1
+    assert stats["wait_time"] > 0
+
+
+def test_times_out_when_exhausted():
+    pool = make_pool(pool_size=1, max_overflow=0)
+    pool.acquire()
+
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_failed_connect_frees_its_slot():
+    pool = make_pool(pool_size=1, max_overflow=0)
+    pool.connect = lambda: (_ for _ in ()).throw(ConnectionError("refused"))
+
+    with pytest.raises(ConnectionError):
+        pool.acquire()
+
+    assert pool.stats()["size"] == 0
+
+
+@pytest.mark.parametrize("status", [_TRANSACTION_INTRANS, _TRANSACTION_INERROR])
+def test_open_transaction_is_rolled_back_on_release(status):
+    pool = make_pool()
+    connection = pool.acquire()
+    connection.info.transaction_status = status
+
+    pool.release(connection)
+
+    assert connection.rollbacks == 1
+    assert pool.acquire() is connection
+
+
+def test_autocommit_is_restored_on_release():
+    pool = make_pool(pre_ping=True)
+    connection = pool.acquire()
+    connection.autocommit = False
+
+    pool.release(connection)
+    reused = pool.acquire()
+
+    assert reused is connection
+    assert connection.autocommit
+    # pre-ping이 트랜잭션을 열지 않는다
+    assert connection.info.transaction_status == _TRANSACTION_IDLE
+
+
+def test_closed_connection_is_discarded_on_release():
+    pool = make_pool()
+    connection = pool.acquire()
+    connection.closed = True
+
+    pool.release(connection)
+
+    assert pool.acquire() is not connection
+    assert pool.stats()["discarded"] == 1
+
+
+def test_recycle_replaces_old_connections():
+    pool = make_pool(recycle=0.05)
+    old = pool.acquire()
+    pool.release(old)
+
+    time.sleep(0.1)
+
+    assert pool.acquire() is not old
+    assert old.closed
+
+
+def test_pre_ping_replaces_dead_connections():
+    pool = make_pool(pre_ping=True)
+    dead = pool.acquire()
+    pool.release(dead)
+    dead.ping_fails = True
+
+    alive = pool.acquire()
+
+    assert alive is not dead
+    assert dead.closed
+    # 새로 만든 커넥션은 확인하지 않는다
+    assert (dead.pings, alive.pings) == (1, 0)
+
+
+def test_foreign_connection_is_closed_not_pooled():
+    pool = make_pool()
+    inherited = FakeConnection()
+
+    pool.release(inherited)
+
+    assert inherited.closed
+    assert pool.stats()["idle"] == 0
+
+
+def test_close_only_closes_idle_connections():
+    pool = make_pool()
+    idle, in_use = pool.acquire(), pool.acquire()
+    pool.release(idle)
+
+    pool.close()
+
+    assert idle.closed
+    assert not in_use.closed
+    assert pool.stats()["in_use"] == 1
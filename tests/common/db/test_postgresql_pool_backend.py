@@ -0,0 +1,64 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
+
+from common.db.backends.postgresql_pool import base
+from common.db.backends.postgresql_pool.base import DatabaseWrapper, pool_stats
+
+
+@pytest.fixture(autouse=True)
+def pools(monkeypatch) -> dict:
+    pools = {}
+    monkeypatch.setattr(base, "_pools", pools)
+    return pools
+
+
+def settings_dict(**overrides) -> dict:
+    return {
+        "ENGINE": "common.db.backends.postgresql_pool",
+        "NAME": "mylogbe",
+        "USER": "postgres",
+        "PASSWORD": "",
+        "HOST": "localhost",
+        "PORT": "5432",
+        "OPTIONS": {},
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": False,
+        "AUTOCOMMIT": True,
+        "ATOMIC_REQUESTS": False,
+        "TIME_ZONE": None,
+        "POOL_OPTIONS": {"POOL_SIZE": 3, "MAX_OVERFLOW": 2, "TIMEOUT": 1.0},
+        **overrides,
+    }
+
+
+def test_wrappers_of_the_same_alias_share_one_pool():
+    first = DatabaseWrapper(settings_dict(), "default")
+    second = DatabaseWrapper(settings_dict(), "default")
+    other = DatabaseWrapper(settings_dict(), "replica")
+
+    assert first.pool is second.pool
+    assert first.pool is not other.pool
+    assert (first.pool.pool_size, first.pool.max_size) == (3, 5)
+
+
+def test_without_pool_options_falls_back_to_plain_connections():
+    assert DatabaseWrapper(settings_dict(POOL_OPTIONS=None), "default").pool is None
+    assert DatabaseWrapper(settings_dict(), NO_DB_ALIAS).pool is None
+
+
+def test_conn_max_age_is_rejected():
+    wrapper = DatabaseWrapper(settings_dict(CONN_MAX_AGE=60), "default")
+
+    with pytest.raises(ImproperlyConfigured):
+        wrapper.pool
+
+
+def test_pool_stats_by_alias():
+    DatabaseWrapper(settings_dict(), "default").pool
+
+    stats = pool_stats()
+
+    assert list(stats) == ["default"]
+    assert stats["default"]["max_size"] == 5
+    assert stats["default"]["in_use"] == 0
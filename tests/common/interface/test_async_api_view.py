@@ -0,0 +1,63 @@
+import json
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import BasePermission
+
+from common.interface.async_api_view import AsyncAPIView
+from common.interface.response import success_response
+
+
+class DenyAll(BasePermission):
+    def has_permission(self, request, view):
+        return False
+
+
+class EchoView(AsyncAPIView):
+    authentication_classes = []
+    permission_classes = []
+
+    async def get(self, request, item_id: str):
+        if item_id == "missing":
+            raise NotFound("없음")
+        return success_response(data={"item_id": item_id})
+
+    async def post(self, request, item_id: str):
+        return success_response(data={"item_id": item_id}, status=201)
+
+
+def call(view, request, **kwargs):
+    return async_to_sync(view)(request, **kwargs)
+
+
+def test_awaits_async_handler(rf):
+    response = call(EchoView.as_view(), rf.get("/items/1"), item_id="1")
+
+    assert response.status_code == 200
+    assert json.loads(response.content)["data"] == {"item_id": "1"}
+
+
+def test_exceptions_are_handled_like_apiview(rf):
+    response = call(EchoView.as_view(), rf.get("/items/missing"), item_id="missing")
+
+    assert response.status_code == 404
+    assert response.data == {"detail": "없음"}
+
+
+def test_method_not_allowed(rf):
+    response = call(EchoView.as_view(), rf.delete("/items/1"), item_id="1")
+
+    assert response.status_code == 405
+
+
+def test_permission_checks_run_before_handler(rf):
+    view = EchoView.as_view(permission_classes=[DenyAll])
+
+    response = call(view, rf.get("/items/1"), item_id="1")
+
+    assert response.status_code == 403
+
+
+def test_view_is_served_as_async():
+    # ASGI에서 스레드로 넘기지 않고 event loop에서 바로 실행된다
+    assert iscoroutinefunction(EchoView.as_view())
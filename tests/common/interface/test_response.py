@@ -0,0 +1,152 @@
+import json
+
+import pytest
+from django.http import JsonResponse
+
+from common.interface.response import (
+    ErrorDetail,
+    ErrorResponse,
+    SuccessResponse,
+    error_response,
+    sse_message,
+    success_response,
+)
+from monitoring.domain.monitoring_project import (
+    MonitoringProjectWithBothDashboardsDto,
+    MonitoringType,
+    ProjectStatus,
+)
+from monitoring.domain.visualization_platform.dashboard import (
+    Dashboard,
+    PublicDashboard,
+)
+from monitoring.interface.DTO.responseDTO import (
+    MonitoringProjectWithBothDashboardsResponse,
+    PagedProjectsResponse,
+)
+
+
+def make_project(
+    i: int, with_dashboards: bool
+) -> MonitoringProjectWithBothDashboardsDto:
+    project_id, dashboard_id = f"project-{i}", f"dashboard-{i}"
+    return MonitoringProjectWithBothDashboardsDto(
+        id=project_id,
+        user_id="user-1",
+        name=f'프로젝트 {i} "quoted" \\ </script>',
+        project_type=MonitoringType.LOG,
+        status=ProjectStatus.READY,
+        service_account_id=str(i),
+        description=None,
+        user_folder_id="folder",
+        dashboard=(
+            Dashboard(
+                id=dashboard_id,
+                uid=f"uid-{i}",
+                title=f"Logs Dashboard {i}",
+                user_id="user-1",
+                project_id=project_id,
+                org_id="1",
+                folder_uid="folder",
+                url=f"/d/uid-{i}",
+                panels=[
+                    {
+                        "id": p,
+                        "title": f"패널 {p}",
+                        "gridPos": {"h": 8, "w": 12, "x": 0, "y": p * 8},
+                        "options": {"wrap": True, "ratio": 0.5, "empty": None},
+                    }
+                    for p in range(3)
+                ],
+                tags=["log"],
+                data_sources=["Elasticsearch"],
+            )
+            if with_dashboards
+            else None
+        ),
+        public_dashboard=(
+            PublicDashboard(
+                id=f"public-{i}",
+                uid=f"public-uid-{i}",
+                project_id=project_id,
+                dashboard_id=dashboard_id,
+                public_url=f"/public-dashboards/public-uid-{i}",
+            )
+            if with_dashboards
+            else None
+        ),
+    )
+
+
+@pytest.fixture
+def paged_projects() -> PagedProjectsResponse:
+    return PagedProjectsResponse(
+        items=[
+            MonitoringProjectWithBothDashboardsResponse(
+                **make_project(i, with_dashboards=i % 2 == 0).to_dict()
+            )
+            for i in range(4)
+        ],
+        total_items=12,
+        total_pages=3,
+        current_page=1,
+        page_size=4,
+        has_previous=False,
+        has_next=True,
+    )
+
+
+def legacy_success_response(data, message: str) -> JsonResponse:
+    """model_dump() dict를 JsonResponse로 내보내던 기존 방식"""
+    if hasattr(data, "model_dump"):
+        data = data.model_dump()
+    return JsonResponse(
+        SuccessResponse(data=data, message=message).model_dump(),
+        status=200,
+        content_type="application/json; charset=utf-8",
+    )
+
+
+def test_model_response_matches_legacy_json(paged_projects):
+    legacy = legacy_success_response(paged_projects, "OK")
+
+    response = success_response(data=paged_projects, message="OK")
+
+    assert json.loads(response.content) == json.loads(legacy.content)
+    assert response["Content-Type"] == legacy["Content-Type"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [{}, [], None, {"nested": {"list": [1, 2.5, True, None, "한글"]}}],
+    ids=["empty-dict", "empty-list", "none", "nested"],
+)
+def test_plain_data_matches_legacy_json(data):
+    legacy = legacy_success_response(data, "OK")
+
+    response = success_response(data=data, message="OK")
+
+    assert json.loads(response.content) == json.loads(legacy.content)
+
+
+def test_error_response_matches_legacy_json():
+    legacy = JsonResponse(
+        ErrorResponse(
+            error=ErrorDetail(code="E1", message="실패", detail={"field": "name"})
+        ).model_dump(),
+        status=403,
+    )
+
+    response = error_response(
+        code="E1", message="실패", status=403, detail={"field": "name"}
+    )
+
+    assert response.status_code == 403
+    assert json.loads(response.content) == json.loads(legacy.content)
+
+
+def test_sse_message():
+    assert sse_message() == ": keepalive\n\n"
+    assert sse_message("step", {"step": "폴더"}) == (
+        'event: step\ndata: {"step": "폴더"}\n\n'
+    )
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from pydantic import BaseModel, Field
+
+from common.interface.response import success_response
+from common.interface.validators import (
+    validate_body,
+    validate_form_data,
+    validate_query_params,
+)
+
+
+class Item(BaseModel):
+    name: str = Field(min_length=1)
+    count: int = 1
+
+
+class ItemView:
+    @validate_body(Item)
+    def post(self, request, body: Item):
+        return success_response(data=body.model_dump())
+
+    @validate_body(Item)
+    async def apost(self, request, body: Item):
+        return success_response(data=body.model_dump())
+
+    @validate_query_params(Item)
+    def get(self, request, params: Item):
+        return success_response(data=params.model_dump())
+
+    @validate_query_params(Item)
+    async def aget(self, request, params: Item):
+        return success_response(data=params.model_dump())
+
+    @validate_form_data(Item)
+    def put(self, request, form_data: Item):
+        return success_response(data=form_data.model_dump())
+
+
+def json_post(rf, body: dict):
+    request = rf.post("/items", data=json.dumps(body), content_type="application/json")
+    # DRF Request처럼 JSONParser가 stream을 읽을 수 있게
+    request.stream = request
+    return request
+
+
+def call(view: ItemView, handler: str, request):
+    """sync/async 핸들러를 같은 방식으로 호출한다"""
+    method = getattr(view, handler)
+    if iscoroutinefunction(method):
+        return async_to_sync(method)(request)
+    return method(request)
+
+
+def content(response) -> dict:
+    return json.loads(response.content)
+
+
+@pytest.fixture
+def view() -> ItemView:
+    return ItemView()
+
+
+def test_async_handlers_stay_async(view):
+    assert iscoroutinefunction(ItemView.apost)
+    assert iscoroutinefunction(ItemView.aget)
+    assert not iscoroutinefunction(ItemView.post)
+
+
+@pytest.mark.parametrize("handler", ["post", "apost"])
+def test_valid_body_is_injected(rf, view, handler):
+    response = call(view, handler, json_post(rf, {"name": "a", "count": 2}))
+
+    assert content(response)["data"] == {"name": "a", "count": 2}
+
+
+@pytest.mark.parametrize("handler", ["post", "apost"])
+def test_invalid_body_returns_error(rf, view, handler):
+    response = call(view, handler, json_post(rf, {"name": ""}))
+
+    assert response.status_code == 400
+    error = content(response)["error"]
+    assert error["code"] == "VALIDATE_BODY_ERROR"
+    assert error["detail"]["details"][0]["loc"] == ["name"]
+
+
+@pytest.mark.parametrize("handler", ["get", "aget"])
+def test_query_params(rf, view, handler):
+    ok = call(view, handler, rf.get("/items", {"name": "a", "count": "3"}))
+    invalid = call(view, handler, rf.get("/items", {"count": "x"}))
+
+    assert content(ok)["data"] == {"name": "a", "count": 3}
+    assert content(invalid)["error"]["code"] == "VALIDATE_QUERY_ERROR"
+
+
+def test_form_data(rf, view):
+    ok = view.put(rf.post("/items", {"name": "a"}))
+    invalid = view.put(rf.post("/items", {}))
+
+    assert content(ok)["data"] == {"name": "a", "count": 1}
+    assert content(invalid)["error"]["code"] == "VALIDATE_FORM_DATA_ERROR"
@@ -0,0 +1,113 @@
+import json
+import math
+from dataclasses import asdict, dataclass, field, make_dataclass
+from datetime import timezone
+from enum import Enum, IntEnum, StrEnum
+from functools import cache
+from typing import Any
+
+import arrow
+import pytest
+from hypothesis import example, given, settings
+from hypothesis import strategies as st
+
+from common.domain import Domain
+from common.utils.base import remove_none
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+class _Level(IntEnum):
+    HIGH = 2
+
+
+class _Kind(StrEnum):
+    LOG = "LOG"
+
+
+@dataclass
+class _Leaf(Domain):
+    name: Any = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+def legacy_to_dict(obj: Domain, excludes: list[str] = []) -> dict[str, Any]:
+    # 변경 전 Domain.to_dict (to_dict 결과는 이것과 같아야 한다)
+    dto = remove_none(json.dumps(asdict(obj), default=str))
+    if excludes:
+        return {key: value for key, value in dto.items() if key not in excludes}
+    return dto
+
+
+@cache
+def _domain_class(n: int) -> type[Domain]:
+    return make_dataclass(
+        f"_Random{n}", [(f"f{i}", Any) for i in range(n)], bases=(Domain,)
+    )
+
+
+def _domain(values: list[Any]) -> Domain:
+    return _domain_class(len(values))(*values)
+
+
+# to_dict 입력이 될 수 있는 값: None, Enum, datetime, Arrow, Decimal, NaN/inf, 큰 정수 ...
+scalars = st.one_of(
+    st.none(),
+    st.text(max_size=5),
+    st.integers(),
+    st.booleans(),
+    st.floats(),
+    st.sampled_from([_Color.RED, _Level.HIGH, _Kind.LOG]),
+    st.datetimes(timezones=st.just(timezone.utc)),
+    st.datetimes(timezones=st.just(timezone.utc)).map(arrow.get),
+    st.decimals(places=2, allow_nan=False),
+    st.uuids(),
+    st.frozensets(st.integers(0, 3), max_size=2),
+)
+# 문자열이 아닌 key도 json.dumps처럼 바꿔야 한다
+keys = st.one_of(
+    st.text(max_size=2),
+    st.integers(-2, 2),
+    st.floats(),
+    st.booleans(),
+    st.none(),
+    st.sampled_from([_Kind.LOG, _Level.HIGH]),
+)
+values = st.recursive(
+    scalars,
+    lambda children: st.one_of(
+        st.lists(children, max_size=3),
+        st.lists(children, max_size=3).map(tuple),
+        st.dictionaries(keys, children, max_size=3),
+        st.lists(children, max_size=4).map(_domain),
+        children.map(lambda name: _Leaf(name=name, extra={"x": None})),
+    ),
+    max_leaves=20,
+)
+domains = st.lists(values, max_size=6).map(_domain)
+excludes = st.lists(st.sampled_from(["f0", "f1", "f2", "f3"]), max_size=2)
+
+
+def as_json(value: Any) -> str:
+    # NaN != NaN 이라 json 문자열로 비교 (dict 순서까지 같아야 한다)
+    return json.dumps(value)
+
+
+@settings(max_examples=200, deadline=None)
+@given(obj=domains, excludes=excludes)
+@example(obj=_domain([{1: None, "1": "a"}, {}, [None, {}]]), excludes=[])
+@example(obj=_domain([{"k": {"x": None}}, _Leaf()]), excludes=["f0"])
+@example(obj=_domain([math.nan, {math.nan: 1, True: 2, None: 3}]), excludes=[])
+def test_to_dict_matches_json_round_trip(obj, excludes):
+    assert as_json(obj.to_dict(excludes)) == as_json(legacy_to_dict(obj, excludes))
+
+
+def test_unsupported_key_raises_type_error_like_json():
+    obj = _domain([{(1, 2): "tuple key"}])
+
+    with pytest.raises(TypeError):
+        legacy_to_dict(obj)
+    with pytest.raises(TypeError):
+        obj.to_dict()
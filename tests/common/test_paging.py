@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from common.service.paging import CursorPaginator, Paginator
+from common.service.token.exception import InvalidPagingParameterException
+
+
+@pytest.mark.parametrize(
+    "page, page_size", [(0, 10), (1, 0), (1, Paginator.MAX_PAGE_SIZE + 1)]
+)
+def test_validate_params_rejects_out_of_range(page, page_size):
+    with pytest.raises(InvalidPagingParameterException):
+        Paginator.validate_params(page, page_size)
+
+
+def test_get_total_pages():
+    assert Paginator.get_total_pages(0, 1, 10) == 0
+    assert Paginator.get_total_pages(10, 1, 10) == 1
+    assert Paginator.get_total_pages(11, 2, 10) == 2
+
+
+def test_get_total_pages_rejects_page_after_last():
+    with pytest.raises(InvalidPagingParameterException):
+        Paginator.get_total_pages(11, 3, 10)
+
+
+def test_to_paged_result_sets_navigation_flags():
+    first = Paginator.to_paged_result(["a"], 25, 3, 1, 10)
+    middle = Paginator.to_paged_result(["a"], 25, 3, 2, 10)
+    last = Paginator.to_paged_result(["a"], 25, 3, 3, 10)
+
+    assert (first.has_previous, first.has_next) == (False, True)
+    assert (middle.has_previous, middle.has_next) == (True, True)
+    assert (last.has_previous, last.has_next) == (True, False)
+
+
+def test_paginate_slices_items():
+    paged = Paginator.paginate(list(range(25)), page=3, page_size=10)
+
+    assert paged.items == [20, 21, 22, 23, 24]
+    assert paged.total_items == 25
+    assert paged.total_pages == 3
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+
+    cursor = CursorPaginator.encode(created_at, "project-1")
+
+    assert "=" not in cursor
+    assert CursorPaginator.decode(cursor) == (created_at, "project-1")
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", "bnVsbA", "WzEsMiwzXQ"])
+def test_cursor_decode_rejects_garbage(cursor):
+    with pytest.raises(InvalidPagingParameterException):
+        CursorPaginator.decode(cursor)
@@ -0,0 +1,72 @@
+import pytest
+
+from common.utils import ttl_cache
+from common.utils.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def now(monkeypatch):
+    """now["t"]를 바꾸면 캐시가 보는 현재 시각이 바뀐다"""
+    clock = {"t": 1_000.0}
+    monkeypatch.setattr(ttl_cache.time, "time", lambda: clock["t"])
+    return clock
+
+
+def test_get_returns_value_until_expiry(now):
+    cache = TTLCache[str, int](max_size=10, default_ttl=60)
+    cache.set("a", 1)
+
+    now["t"] += 59
+    assert cache.get("a") == 1
+
+    now["t"] += 1
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_expires_at_is_capped_by_default_ttl(now):
+    cache = TTLCache[str, int](max_size=10, default_ttl=60)
+    cache.set("short", 1, expires_at=now["t"] + 10)
+    cache.set("long", 2, expires_at=now["t"] + 3_600)
+
+    now["t"] += 30
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+    now["t"] += 30
+    assert cache.get("long") is None
+
+
+def test_already_expired_value_is_not_stored(now):
+    cache = TTLCache[str, int](max_size=10, default_ttl=60)
+    cache.set("a", 1, expires_at=now["t"])
+
+    assert cache.stats()["size"] == 0
+
+
+def test_evicts_least_recently_used(now):
+    cache = TTLCache[str, int](max_size=2, default_ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # b가 가장 오래 안 쓰인 항목이 된다
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_zero_size_disables_cache(now):
+    cache = TTLCache[str, int](max_size=0, default_ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+def test_stats_count_hits_and_misses(now):
+    cache = TTLCache[str, int](max_size=10, default_ttl=60)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+
+    assert cache.stats() == {"size": 1, "max_size": 10, "hits": 1, "misses": 1}
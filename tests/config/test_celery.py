@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+import pytest
+from celery import Celery
+
+from config import settings
+from config.celery import (
+    IO_ROUTING_KEY,
+    IO_TASK_QUEUE,
+    ROUTING_KEY,
+    TASK_QUEUE,
+    _runs_in_main_process,
+    app,
+)
+
+TASK_PACKAGE = "monitoring.infra.celery.tasks."
+
+
+@pytest.fixture(scope="module")
+def task_names() -> list[str]:
+    app.loader.import_default_modules()
+    return sorted(name for name in app.tasks if name.startswith(TASK_PACKAGE))
+
+
+def route(task_name: str) -> tuple[str, str]:
+    route = app.amqp.router.route({}, task_name)
+    return route["queue"].name, route["routing_key"]
+
+
+def test_grafana_tasks_go_to_io_queue(task_names):
+    grafana_tasks = [name for name in task_names if ".grafana_tasks." in name]
+
+    assert grafana_tasks
+    assert {route(name) for name in grafana_tasks} == {(IO_TASK_QUEUE, IO_ROUTING_KEY)}
+
+
+def test_other_tasks_stay_on_worker_queue(task_names):
+    other_tasks = [name for name in task_names if ".grafana_tasks." not in name]
+
+    assert other_tasks
+    assert {route(name) for name in other_tasks} == {(TASK_QUEUE, ROUTING_KEY)}
+
+
+def test_routed_queues_are_declared():
+    declared = {queue.name for queue in app.conf.task_queues}
+
+    # 배포 전 "celery" 큐에 쌓인 메시지도 소비할 수 있도록 남겨 둔다
+    assert {TASK_QUEUE, IO_TASK_QUEUE, "celery"} <= declared
+    assert app.conf.task_create_missing_queues is False
+
+
+def test_beat_schedule_tasks_exist(task_names):
+    for entry in settings.CELERY_BEAT_SCHEDULE.values():
+        assert entry["task"] in task_names
+
+
+@pytest.mark.parametrize(
+    "pool, worker_app, expected",
+    [
+        ("threads", app, True),
+        ("prefork", app, False),
+        ("solo", app, False),
+        ("threads", Celery("other"), False),
+    ],
+)
+def test_flusher_starts_from_main_process_only_without_child_processes(
+    pool, worker_app, expected
+):
+    worker = SimpleNamespace(app=worker_app, pool_cls=pool)
+
+    assert _runs_in_main_process(worker) is expected
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from common.container import container
+from config import settings
+from monitoring.infra.grafana.grafana_http_client import grafana_circuit_breaker
+from monitoring.infra.redis.circuit_breaker import CircuitState, RedisCircuitBreaker
+
+
+@pytest.fixture
+def grafana_circuit(override, redis_client) -> RedisCircuitBreaker:
+    circuit = RedisCircuitBreaker(
+        redis_client,
+        key="circuit:grafana",
+        failure_threshold=2,
+        failure_window=60,
+        recovery_timeout=60,
+        success_threshold=1,
+    )
+    override(RedisCircuitBreaker, lambda: circuit)
+    return circuit
+
+
+def health(rf, call_view) -> dict:
+    response = call_view(rf.get("/"))
+    assert response.status_code == 200
+    return json.loads(response.content)
+
+
+def test_reports_grafana_circuit_from_container(rf, call_view, grafana_circuit):
+    grafana_circuit.record_failure()
+    grafana_circuit.record_failure()
+
+    body = health(rf, call_view)
+
+    assert body["status"] == "success"
+    assert body["grafana_circuit"]["state"] == CircuitState.OPEN
+    assert "token_payload_cache" in body
+    assert "db_pool" in body
+
+
+def test_disabled_grafana_circuit_is_null(rf, call_view, override):
+    override(RedisCircuitBreaker, lambda: None)
+
+    assert health(rf, call_view)["grafana_circuit"] is None
+
+
+def test_grafana_circuit_follows_setting(override, monkeypatch):
+    override(RedisCircuitBreaker, grafana_circuit_breaker)
+
+    circuit = container.resolve(RedisCircuitBreaker)
+    assert circuit.key == "circuit:grafana"
+    # 싱글턴: resolve할 때마다 같은 인스턴스
+    assert container.resolve(RedisCircuitBreaker) is circuit
+
+    monkeypatch.setattr(settings, "GRAFANA_CIRCUIT_ENABLED", False)
+    override(RedisCircuitBreaker, grafana_circuit_breaker)
+    assert container.resolve(RedisCircuitBreaker) is None
@@ -0,0 +1,83 @@
+import fakeredis
+import pytest
+from django.urls import resolve
+
+from common.constant import RequestHeader
+from common.container import Lifetime, container
+from common.utils.ttl_cache import TTLCache
+from user.infra.cache import user_cache
+from user.infra.token.user_token_manager import UserTokenManager
+from user.infra.token.user_token_parser import UserTokenParser
+
+JWT_SECRET = "test-secret-" * 8
+
+
+@pytest.fixture
+def redis_server() -> fakeredis.FakeServer:
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis_client(redis_server) -> fakeredis.FakeRedis:
+    """
+    테스트마다 비어 있는 인메모리 Redis. (Lua 스크립트 지원, decode_responses는 운영과 동일)
+    """
+    return fakeredis.FakeRedis(server=redis_server, decode_responses=True)
+
+
+@pytest.fixture
+def async_redis_client(redis_server) -> fakeredis.FakeAsyncRedis:
+    """redis_client와 같은 데이터를 보는 async client"""
+    return fakeredis.FakeAsyncRedis(server=redis_server, decode_responses=True)
+
+
+@pytest.fixture(autouse=True)
+def user_cache_redis(redis_client, monkeypatch):
+    # User post_save 시그널도 캐시를 지우므로 유저를 만드는 테스트 전체에서 인메모리 Redis 사용
+    monkeypatch.setattr(user_cache, "redis_client", redis_client)
+    return redis_client
+
+
+@pytest.fixture
+def override(monkeypatch):
+    """
+    override(IFoo, lambda: fake) → 테스트 동안만 컨테이너 등록을 바꾼다. (끝나면 원래대로)
+    """
+
+    def override(key, factory, lifetime: Lifetime = Lifetime.SINGLETON) -> None:
+        monkeypatch.setitem(container._factories, key, (factory, lifetime))
+        monkeypatch.delitem(container._instances, key, raising=False)
+
+    return override
+
+
+@pytest.fixture
+def auth_headers(monkeypatch):
+    """
+    auth_headers("user-1") → 테스트용 키로 서명한 access token을 담은 Django test client 헤더
+    """
+    monkeypatch.setattr(UserTokenManager, "JWT_SECRET", JWT_SECRET)
+    monkeypatch.setattr(UserTokenParser, "JWT_SECRET", JWT_SECRET)
+    monkeypatch.setattr(
+        UserTokenParser, "payload_cache", TTLCache(max_size=100, default_ttl=3_600)
+    )
+
+    def auth_headers(user_id: str) -> dict[str, str]:
+        token = UserTokenManager().create_user_access_token(user_id)
+        return {"HTTP_AUTHORIZATION": f"{RequestHeader.HEADER_PREFIX_BEARER}{token}"}
+
+    return auth_headers
+
+
+@pytest.fixture
+def call_view():
+    """
+    call_view(rf.get(url)) → URL에 연결된 view를 미들웨어 없이 바로 호출한다.
+    (async view면 coroutine을 돌려준다)
+    """
+
+    def call_view(request):
+        match = resolve(request.path)
+        return match.func(request, *match.args, **match.kwargs)
+
+    return call_view
@@ -0,0 +1,268 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from botocore.exceptions import ClientError
+
+from config import settings
+from monitoring.domain.log_agent.log_collector import (
+    LogCollectorConfigContext,
+    LogInputType,
+)
+from monitoring.domain.log_agent.log_router import LogRouterConfigContext
+from monitoring.domain.log_agent.rendered_config import RenderedConfigFile
+from monitoring.domain.monitoring_project import MonitoringType, ProjectStatus
+from monitoring.infra.models.monitoring_project_model import MonitoringProjectModel
+from monitoring.infra.models.visualization_platform_model import (
+    DashboardModel,
+    PublicDashboardModel,
+)
+from monitoring.infra.redis.provision_progress_notifier import (
+    RedisProvisionProgressNotifier,
+)
+from monitoring.infra.s3 import async_s3_agent_storage, s3_agent_storage
+from monitoring.infra.s3.async_s3_agent_storage import AsyncS3AgentStorageProvider
+from monitoring.infra.s3.s3_agent_storage import S3AgentStorageProvider
+from monitoring.service.i_progress.i_provision_progress_notifier import (
+    IProvisionProgressNotifier,
+)
+from user.domain.user import OAuthType
+from user.domain.user import User as UserVo
+from user.infra.models.user import User
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def user(db) -> User:
+    return User.objects.create(
+        id="user-1", name="홍길동", oauth_type="google", oauth_id="oauth-1"
+    )
+
+
+@pytest.fixture
+def owner(user) -> UserVo:
+    """user fixture의 도메인 객체 (서비스에 넘기는 용도)"""
+    return UserVo(
+        id=user.id,
+        name=user.name,
+        email=None,
+        mobile_no=None,
+        oauth_type=OAuthType.GOOGLE,
+        oauth_id=user.oauth_id,
+        tos_agreed=True,
+        created_at="",
+        updated_at="",
+    )
+
+
+@pytest.fixture
+def make_project(db):
+    """
+    make_project(user, "p1", minutes=1) → created_at이 BASE_TIME + minutes인 프로젝트.
+    with_dashboards=True면 dashboard/public_dashboard까지 연결한다.
+    """
+
+    def make(
+        user: User,
+        project_id: str,
+        minutes: int = 0,
+        with_dashboards: bool = True,
+        status: ProjectStatus = ProjectStatus.READY,
+    ) -> MonitoringProjectModel:
+        project = MonitoringProjectModel.objects.create(
+            id=project_id,
+            user=user,
+            name=f"name-{project_id}",
+            project_type=MonitoringType.LOG.value,
+            status=status.value,
+        )
+        if with_dashboards:
+            dashboard = DashboardModel.objects.create(
+                id=f"dash-{project_id}",
+                uid=f"uid-{project_id}",
+                title=f"title-{project_id}",
+                project=project,
+                url=f"http://grafana/d/{project_id}",
+                config_json={"panels": [{"id": 1}]},
+            )
+            public_dashboard = PublicDashboardModel.objects.create(
+                id=f"pub-{project_id}",
+                uid=f"pub-uid-{project_id}",
+                dashboard=dashboard,
+                project=project,
+                public_url=f"http://grafana/public/{project_id}",
+            )
+            project.dashboard = dashboard
+            project.public_dashboard = public_dashboard
+            project.save()
+        # auto_now_add라 생성 후 따로 맞춘다
+        MonitoringProjectModel.objects.filter(id=project_id).update(
+            created_at=BASE_TIME + timedelta(minutes=minutes)
+        )
+        return project
+
+    return make
+
+
+@pytest.fixture
+def progress_notifier(
+    override, redis_client, async_redis_client
+) -> RedisProvisionProgressNotifier:
+    notifier = RedisProvisionProgressNotifier(
+        client=redis_client, ttl=60, async_client=async_redis_client
+    )
+    override(IProvisionProgressNotifier, lambda: notifier)
+    return notifier
+
+
+@pytest.fixture
+def agent_contexts():
+    """agent_contexts("p1") → step1에 넘기는 (collector, router) 설정 컨텍스트"""
+
+    def make(
+        project_id: str,
+    ) -> tuple[LogCollectorConfigContext, LogRouterConfigContext]:
+        collector_ctx = LogCollectorConfigContext(
+            project_id=project_id,
+            hosts=["127.0.0.1:5044"],
+            log_paths=["/var/log/app.log"],
+            input_type=LogInputType.JSON,
+            timestamp_field="ts",
+            timestamp_json_path="ts",
+            log_level="level",
+            log_level_json_path="level",
+        )
+        router_ctx = LogRouterConfigContext(
+            project_id=project_id,
+            mq_host="127.0.0.1",
+            mq_port=5672,
+            mq_user="guest",
+            mq_password="guest",
+            mq_vhost="/",
+            mq_exchange="app_logs_exchange",
+            mq_exchange_type="direct",
+            mq_routing_key="logs_1",
+        )
+        return collector_ctx, router_ctx
+
+    return make
+
+
+@pytest.fixture
+def make_files():
+    """
+    make_files(provider) → project-1의 설정 파일 3개 {S3 키: 파일}.
+    shareable=True면 router 파일을 content-addressed 대상으로 만든다.
+    """
+
+    def make(
+        provider: S3AgentStorageProvider, shareable: bool = False
+    ) -> dict[str, RenderedConfigFile]:
+        files = [
+            RenderedConfigFile(filename="collector.yml", content=b"collector"),
+            RenderedConfigFile(
+                filename="router.yml", content=b"router", shareable=shareable
+            ),
+            RenderedConfigFile(filename="setup.sh", content=b"#!/bin/sh"),
+        ]
+        return {provider.get_file_object_key("project-1", 100, f): f for f in files}
+
+    return make
+
+
+class FakeS3Client:
+    """
+    put_object/delete_objects만 흉내 내는 boto3 S3 client. fail_keys에 있는 키는 업로드에 실패한다.
+    """
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.fail_keys: set[str] = set()
+        self.block_keys: dict[str, threading.Event] = {}
+        self.put_threads: set[str] = set()
+        self.deleted: list[str] = []
+        self._lock = threading.Lock()
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        with self._lock:
+            self.put_threads.add(threading.current_thread().name)
+        if Key in self.block_keys:
+            self.block_keys[Key].wait(5)
+        if Key in self.fail_keys:
+            raise ClientError(
+                {"Error": {"Code": "500", "Message": "boom"}}, "PutObject"
+            )
+        with self._lock:
+            self.objects[Key] = Body
+
+    def delete_objects(self, Bucket, Delete):
+        with self._lock:
+            for obj in Delete["Objects"]:
+                self.deleted.append(obj["Key"])
+                self.objects.pop(obj["Key"], None)
+
+
+@pytest.fixture
+def s3_client() -> FakeS3Client:
+    return FakeS3Client()
+
+
+@pytest.fixture
+def s3_storage(monkeypatch, redis_client, s3_client) -> S3AgentStorageProvider:
+    monkeypatch.setattr(s3_agent_storage, "redis_client", redis_client)
+    monkeypatch.setattr(settings, "S3_BUCKET_NAME", "bucket")
+    monkeypatch.setattr(settings, "S3_AWS_REGION", "ap-northeast-2")
+    monkeypatch.setattr(settings, "S3_CONTENT_ADDRESSED", False)
+    provider = S3AgentStorageProvider()
+    provider.client = s3_client
+    return provider
+
+
+class FakeS3Server:
+    """
+    AsyncS3AgentStorageProvider가 보내는 PUT/DELETE를 받는 httpx transport.
+    objects의 키는 S3 키(virtual-hosted URL의 경로), fail_keys에 있는 키는 500으로 응답한다.
+    slow_keys에 있는 키는 응답 전에 잠시 멈춘다.
+    """
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.fail_keys: set[str] = set()
+        self.slow_keys: set[str] = set()
+        self.requests: list[httpx.Request] = []
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        key = request.url.path.lstrip("/")
+        if request.method == "PUT":
+            if key in self.slow_keys:
+                await asyncio.sleep(5)
+            if key in self.fail_keys:
+                return httpx.Response(500)
+            self.objects[key] = request.content
+            return httpx.Response(200)
+        if request.method == "DELETE":
+            self.objects.pop(key, None)
+            return httpx.Response(204)
+        return httpx.Response(405)
+
+
+@pytest.fixture
+def s3_server(monkeypatch) -> FakeS3Server:
+    server = FakeS3Server()
+    transport = httpx.MockTransport(server.handle)
+    async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        async_s3_agent_storage.httpx,
+        "AsyncClient",
+        lambda **kwargs: async_client(transport=transport, **kwargs),
+    )
+    return server
+
+
+@pytest.fixture
+def async_s3_storage(s3_storage, s3_server) -> AsyncS3AgentStorageProvider:
+    return AsyncS3AgentStorageProvider(s3_storage)
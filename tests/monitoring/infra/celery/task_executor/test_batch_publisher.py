@@ -0,0 +1,94 @@
+import pytest
+from celery import Celery, chain
+
+from monitoring.infra.celery.task_executor.batch_publisher import (
+    ConfirmBatchPublisher,
+    _ConfirmTracker,
+)
+
+app = Celery("test_batch_publisher", broker="memory://")
+
+
+@app.task(name="test.noop")
+def noop(*args):
+    return None
+
+
+class BrokenSignature:
+    def apply_async(self, **kwargs):
+        raise ConnectionError("publish failed")
+
+
+@pytest.fixture
+def publisher() -> ConfirmBatchPublisher:
+    return ConfirmBatchPublisher(app=app, confirm_timeout=0.1)
+
+
+@pytest.fixture
+def queue():
+    with app.connection_for_write() as conn:
+        queue = conn.SimpleQueue("celery")
+        queue.clear()
+        yield queue
+        queue.close()
+
+
+def test_publishes_every_workflow_on_one_connection(publisher, queue):
+    results = publisher.publish(
+        {
+            "p1": chain(noop.si(1), noop.si(2)),
+            "p2": noop.si(3),
+        }
+    )
+
+    # confirm을 지원하지 않는 transport는 발행 성공이 곧 결과
+    assert results == {"p1": None, "p2": None}
+    # chain은 첫 태스크만 발행된다
+    assert queue.qsize() == 2
+
+
+def test_failure_is_reported_per_key(publisher, queue):
+    results = publisher.publish({"ok": noop.si(1), "broken": BrokenSignature()})
+
+    assert results["ok"] is None
+    assert "publish failed" in results["broken"]
+    assert queue.qsize() == 1
+
+
+def test_empty_batch_opens_no_connection(monkeypatch, publisher):
+    monkeypatch.setattr(
+        app, "connection_for_write", lambda **kwargs: pytest.fail("connected")
+    )
+
+    assert publisher.publish({}) == {}
+
+
+class FakeChannel:
+    def __init__(self):
+        self.events = {"basic_ack": set(), "basic_nack": set()}
+        self.confirming = False
+
+    def confirm_select(self):
+        self.confirming = True
+
+    def ack(self, tag: int, multiple: bool = False):
+        for callback in self.events["basic_ack"]:
+            callback(tag, multiple)
+
+    def nack(self, tag: int, multiple: bool = False):
+        for callback in self.events["basic_nack"]:
+            callback(tag, multiple)
+
+
+def test_tracker_settles_single_and_multiple_confirms():
+    channel = FakeChannel()
+    tracker = _ConfirmTracker(channel)
+    tracker.pending.update(range(1, 7))
+
+    channel.ack(2)
+    channel.nack(4, multiple=True)  # 1, 3, 4
+    channel.ack(6)
+
+    assert channel.confirming
+    assert tracker.pending == {5}
+    assert tracker.nacked == {1, 3, 4}
@@ -0,0 +1,150 @@
+import threading
+import time
+
+import pytest
+from celery import Celery
+from celery.backends.cache import CacheBackend
+from celery.canvas import _chain, _chord, group
+from celery.contrib.testing.worker import start_worker
+
+from monitoring.infra.celery.task_executor.grafana_executor import (
+    PROVISION_STEP_DEPENDENCIES,
+    ProvisionStep,
+)
+from monitoring.infra.celery.task_executor.workflow_dag import WorkflowDAG
+
+
+class _CacheBackend(CacheBackend):
+    # 운영 backend(django-db)처럼 chord fan-in을 결과별 조회로 처리
+    supports_native_join = False
+
+
+# 실제 broker/DB 없이 canvas를 실행해 보기 위한 in-memory app
+app = Celery(
+    "test_workflow_dag", broker="memory://", backend=f"{__name__}:_CacheBackend"
+)
+app.conf.cache_backend = "memory://"
+app.conf.broker_transport_options = {"polling_interval": 0.01}
+app.conf.task_ignore_result = True  # 운영 설정(CELERY_TASK_IGNORE_RESULT)과 동일
+
+_events: dict[str, tuple[float, float]] = {}
+_failed = threading.Event()
+
+
+@app.task(name="test.step")
+def step(name: str, fail: bool = False):
+    start = time.perf_counter()
+    time.sleep(0.05)
+    _events[name] = (start, time.perf_counter())
+    if fail:
+        raise RuntimeError(f"{name} failed")
+    return name
+
+
+@app.task(name="test.on_failure")
+def on_failure(*args):
+    _failed.set()
+
+
+@pytest.fixture(scope="module")
+def worker():
+    with start_worker(app, pool="threads", concurrency=8, perform_ping_check=False):
+        yield
+
+
+@pytest.fixture
+def events():
+    _events.clear()
+    _failed.clear()
+    return _events
+
+
+def provision_dag(fail_step: str | None = None) -> WorkflowDAG:
+    dag = WorkflowDAG()
+    for name, deps in PROVISION_STEP_DEPENDENCIES.items():
+        dag.add(name, step.si(name.value, name == fail_step), deps)
+    return dag
+
+
+def wait_until(condition, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert (
+            time.monotonic() < deadline
+        ), "워크플로우가 제한 시간 안에 끝나지 않았습니다."
+        time.sleep(0.01)
+
+
+def test_independent_steps_run_in_one_chord():
+    dag = WorkflowDAG()
+    dag.add("folder", step.si("folder"))
+    dag.add("account", step.si("account"))
+    dag.add("permissions", step.si("permissions"), depends_on=["folder", "account"])
+
+    workflow = dag.build()
+
+    assert isinstance(workflow, _chord)
+    assert [s.args[0] for s in workflow.tasks] == ["folder", "account"]
+    assert workflow.body.args[0] == "permissions"
+
+
+def test_single_successor_steps_are_chained():
+    dag = WorkflowDAG()
+    dag.add("dashboard", step.si("dashboard"))
+    dag.add("public", step.si("public"), depends_on=["dashboard"])
+
+    workflow = dag.build()
+
+    assert isinstance(workflow, _chain)
+    assert [s.args[0] for s in workflow.tasks] == ["dashboard", "public"]
+
+
+def test_unregistered_dependencies_count_as_done():
+    dag = WorkflowDAG()
+    dag.add("token", step.si("token"), depends_on=["account"])
+    dag.add("other", step.si("other"))
+
+    workflow = dag.build()
+
+    assert isinstance(workflow, group)
+
+
+def test_rejects_cycles_and_duplicates():
+    dag = WorkflowDAG()
+    dag.add("a", step.si("a"), depends_on=["b"])
+    dag.add("b", step.si("b"), depends_on=["a"])
+    with pytest.raises(ValueError, match="순환"):
+        dag.build()
+
+    with pytest.raises(ValueError, match="이미 등록"):
+        dag.add("a", step.si("a"))
+
+
+def test_empty_dag_builds_nothing():
+    assert WorkflowDAG().build() is None
+
+
+def test_steps_start_after_their_dependencies(worker, events):
+    provision_dag().build(link_error=on_failure.si()).apply_async()
+    wait_until(lambda: ProvisionStep.FINALIZE in events)
+
+    assert set(events) == set(PROVISION_STEP_DEPENDENCIES)
+    for name, deps in PROVISION_STEP_DEPENDENCIES.items():
+        for dep in deps:
+            assert events[dep][1] <= events[name][0], f"{name}가 {dep}보다 먼저 시작"
+    # 서로 의존하지 않는 단계는 겹쳐서 실행된다
+    folder, account = (
+        events[ProvisionStep.FOLDER],
+        events[ProvisionStep.SERVICE_ACCOUNT],
+    )
+    assert folder[0] < account[1] and account[0] < folder[1]
+
+
+def test_failure_calls_errback_and_stops_dependents(worker, events):
+    workflow = provision_dag(fail_step=ProvisionStep.DASHBOARD)
+    workflow.build(link_error=on_failure.si()).apply_async()
+
+    assert _failed.wait(10)
+    time.sleep(0.2)
+    assert ProvisionStep.PUBLIC_DASHBOARD not in events
+    assert ProvisionStep.FINALIZE not in events
@@ -0,0 +1,93 @@
+from typing import Any
+
+import httpx
+import pytest
+from celery import states
+
+from monitoring.domain.i_repo.i_task_result_repo import ITaskResultRepo
+from monitoring.domain.task_result import TaskStatus
+from monitoring.infra.celery.tasks import base
+from monitoring.infra.celery.tasks.utils import locking_task
+from monitoring.infra.grafana.grafana_http_client import GrafanaRateLimited
+from monitoring.service.i_progress.i_provision_progress_notifier import (
+    IProvisionProgressNotifier,
+)
+
+calls: list[str] = []
+
+
+@locking_task(max_retries=0, default_retry_delay=0)
+def record_call(self, task_id: str):
+    calls.append(task_id)
+    return "done"
+
+
+class RecordingRepo:
+    def __init__(self):
+        self.statuses: list[tuple[str, Any]] = []
+
+    def record_status(self, task_id: str, **fields: Any) -> None:
+        self.statuses.append((task_id, fields["status"]))
+
+
+class RecordingNotifier:
+    def __init__(self):
+        self.published: list[tuple[str, TaskStatus]] = []
+
+    def publish_step_status(self, task_id: str, status: TaskStatus) -> None:
+        self.published.append((task_id, status))
+
+
+@pytest.fixture
+def repo(monkeypatch, override, redis_client):
+    calls.clear()
+    monkeypatch.setattr(base, "redis_client", redis_client)
+    repo = RecordingRepo()
+    override(ITaskResultRepo, lambda: repo)
+    return repo
+
+
+@pytest.fixture
+def notifier(override):
+    notifier = RecordingNotifier()
+    override(IProvisionProgressNotifier, lambda: notifier)
+    return notifier
+
+
+def test_task_runs_once_per_task_id(repo, notifier, redis_client):
+    first = record_call.apply(args=("task-1",))
+    second = record_call.apply(args=("task-1",))
+
+    assert first.get() == "done"
+    assert second.state == states.IGNORED
+    assert calls == ["task-1"]
+    assert repo.statuses == [("task-1", TaskStatus.SUCCESS)]
+    assert notifier.published == [("task-1", TaskStatus.SUCCESS)]
+    # 완료 후 락은 남지 않는다
+    assert redis_client.get("lock:dashboard:task-1") is None
+
+
+def test_running_task_is_ignored(repo, notifier, redis_client):
+    redis_client.set("lock:dashboard:task-1", "other-worker")
+
+    result = record_call.apply(args=("task-1",))
+
+    assert result.state == states.IGNORED
+    assert calls == []
+    assert redis_client.get("lock:dashboard:task-1") == "other-worker"
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        GrafanaRateLimited("POST", "/api/dashboards/db", 5.0),
+        httpx.HTTPStatusError(
+            "429",
+            request=httpx.Request("POST", "http://grafana/api/dashboards/db"),
+            response=httpx.Response(429, headers={"Retry-After": "5"}),
+        ),
+    ],
+)
+def test_retry_waits_for_server_requested_delay(exc):
+    # 서버가 알려준 시각 이후로, 워커끼리 겹치지 않게 jitter를 더해 미룬다
+    assert 5.0 <= record_call._retry_countdown(exc) <= 6.0
@@ -0,0 +1,66 @@
+import pytest
+
+from monitoring.infra.celery.task_status_flusher import (
+    FLUSH_LOCK_KEY,
+    TaskStatusFlusher,
+)
+
+
+class FakeRepo:
+    """buffered개를 batch 단위로 반영하는 척한다. on_flush는 flush_buffered마다 호출"""
+
+    def __init__(self, buffered: int, on_flush=lambda: None):
+        self.buffered = buffered
+        self.on_flush = on_flush
+        self.calls = 0
+
+    def flush_buffered(self, limit: int) -> int:
+        self.calls += 1
+        self.on_flush()
+        flushed = min(limit, self.buffered)
+        self.buffered -= flushed
+        return flushed
+
+
+@pytest.fixture
+def make_flusher(redis_client):
+    def make(repo: FakeRepo) -> TaskStatusFlusher:
+        return TaskStatusFlusher(repo, redis_client, interval=1, batch_size=2)
+
+    return make
+
+
+def test_flush_drains_buffer_in_batches(make_flusher, redis_client):
+    repo = FakeRepo(buffered=5)
+
+    assert make_flusher(repo).flush() == 5
+    assert repo.calls == 3
+    assert redis_client.get(FLUSH_LOCK_KEY) is None
+
+
+def test_flush_is_skipped_while_another_process_holds_lock(make_flusher, redis_client):
+    redis_client.set(FLUSH_LOCK_KEY, "other-process")
+    repo = FakeRepo(buffered=5)
+
+    assert make_flusher(repo).flush() == 0
+    assert repo.calls == 0
+    assert redis_client.get(FLUSH_LOCK_KEY) == "other-process"
+
+
+def test_flush_does_not_release_a_lock_it_lost(make_flusher, redis_client):
+    # flush가 lock ttl보다 길어져 락이 만료되고 다른 프로세스가 가져간 상황
+    repo = FakeRepo(
+        buffered=1, on_flush=lambda: redis_client.set(FLUSH_LOCK_KEY, "other-process")
+    )
+
+    assert make_flusher(repo).flush() == 1
+    assert redis_client.get(FLUSH_LOCK_KEY) == "other-process"
+
+
+def test_lock_is_released_when_flush_fails(make_flusher, redis_client):
+    def fail():
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        make_flusher(FakeRepo(buffered=1, on_flush=fail)).flush()
+    assert redis_client.get(FLUSH_LOCK_KEY) is None
@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from monitoring.infra.grafana.grafana_dashboard_builder import GrafanaDashboardBuilder
+from monitoring.infra.grafana.grafana_template_provider import GrafanaTemplateProvider
+from monitoring.service.i_template_renderer.template_renderer import ITemplateRenderer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# fixtures/log_dashboard.json은 이 입력으로 grafana_log_dashboard_json.j2를 렌더링한 결과
+PROJECT_INPUTS = {
+    "project_id": "project-1",
+    "dashboard_title": "프로젝트 1 로그",
+    "dashboard_uid": "dash-uid-1",
+    "data_source_uid": "es-uid-01",
+}
+
+
+class StaticRenderer(ITemplateRenderer):
+    def __init__(self, template: str):
+        self.template = template
+
+    def render(self, template_name: str, context: dict) -> str:
+        result = self.template
+        for name, value in context.items():
+            result = result.replace("{{ " + name + " }}", value)
+        return result
+
+
+@pytest.fixture(autouse=True)
+def skeletons(monkeypatch):
+    # skeleton 캐시는 프로세스 전역이라 테스트마다 비운다
+    monkeypatch.setattr(GrafanaDashboardBuilder, "_skeletons", {})
+
+
+@pytest.fixture
+def golden() -> dict:
+    return json.loads((FIXTURES / "log_dashboard.json").read_text(encoding="utf-8"))
+
+
+def test_log_dashboard_matches_golden(golden):
+    assert GrafanaTemplateProvider().render_logs_dashboard_json(**PROJECT_INPUTS) == (
+        golden
+    )
+
+
+def test_builds_do_not_share_state(golden):
+    provider = GrafanaTemplateProvider()
+    first = provider.render_logs_dashboard_json(**PROJECT_INPUTS)
+    first["panels"].clear()
+
+    assert provider.render_logs_dashboard_json(**PROJECT_INPUTS) == golden
+
+
+def test_patches_variables_inside_strings():
+    builder = GrafanaDashboardBuilder(
+        StaticRenderer('{"title": "Logs {{ name }}", "tags": ["{{ name }}", 1]}')
+    )
+
+    assert builder.build("inline.j2", {"name": "a"}) == {
+        "title": "Logs a",
+        "tags": ["a", 1],
+    }
+    assert builder.build("inline.j2", {"name": "b"})["tags"] == ["b", 1]
+
+
+def test_rejects_variables_in_dict_keys():
+    builder = GrafanaDashboardBuilder(StaticRenderer('{"{{ name }}": 1}'))
+
+    with pytest.raises(ValueError):
+        builder.build("key.j2", {"name": "a"})
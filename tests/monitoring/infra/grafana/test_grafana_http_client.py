@@ -0,0 +1,234 @@
+import asyncio
+
+import httpx
+import pytest
+
+from monitoring.infra.grafana import grafana_http_client
+from monitoring.infra.grafana.grafana_http_client import (
+    READ,
+    WRITE,
+    AsyncGrafanaHttpClient,
+    GrafanaHttpClient,
+    GrafanaRateLimited,
+    GrafanaUnavailable,
+)
+from monitoring.infra.redis.circuit_breaker import CircuitState, RedisCircuitBreaker
+from monitoring.infra.redis.rate_limiter import RedisRateLimiter, TokenBucket
+
+RETRY_OPTIONS = {
+    "max_retries": 2,
+    "backoff_factor": 0,
+    "retry_statuses": [429, 500, 502, 503, 504],
+}
+
+
+class Grafana:
+    """정해진 응답(상태 코드 또는 Response)을 순서대로 돌려주고 받은 요청 수를 센다. Exception이면 raise"""
+
+    def __init__(self, *responses: int | httpx.Response | Exception):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        response = (
+            self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        )
+        if isinstance(response, Exception):
+            raise response
+        if isinstance(response, httpx.Response):
+            return response
+        return httpx.Response(response)
+
+
+def sync_client(grafana: Grafana, **options) -> GrafanaHttpClient:
+    client = GrafanaHttpClient("http://grafana", {}, **{**RETRY_OPTIONS, **options})
+    client.client = httpx.Client(
+        base_url="http://grafana", transport=httpx.MockTransport(grafana)
+    )
+    return client
+
+
+@pytest.mark.parametrize("method", ["GET", "HEAD", "PUT", "DELETE"])
+def test_idempotent_methods_retry_server_errors(method):
+    grafana = Grafana(503, 200)
+
+    response = sync_client(grafana).request(method, "/api/dashboards/uid/x")
+
+    assert response.status_code == 200
+    assert grafana.calls == 2
+
+
+def test_post_is_not_retried_on_server_error():
+    grafana = Grafana(502, 200)
+
+    response = sync_client(grafana).request("POST", "/api/dashboards/db")
+
+    # 이미 처리됐을 수 있으므로 태스크 단위 재시도에 맡긴다
+    assert response.status_code == 502
+    assert grafana.calls == 1
+
+
+def test_post_is_retried_on_429():
+    grafana = Grafana(429, 200)
+
+    response = sync_client(grafana).request("POST", "/api/dashboards/db")
+
+    assert response.status_code == 200
+    assert grafana.calls == 2
+
+
+def test_post_is_retried_on_connect_error():
+    grafana = Grafana(httpx.ConnectError("refused"), 200)
+
+    response = sync_client(grafana).request("POST", "/api/dashboards/db")
+
+    assert response.status_code == 200
+    assert grafana.calls == 2
+
+
+def test_read_error_is_not_retried():
+    grafana = Grafana(httpx.ReadError("reset"), 200)
+
+    with pytest.raises(httpx.ReadError):
+        sync_client(grafana).request("GET", "/api/health")
+    assert grafana.calls == 1
+
+
+def test_gives_up_after_max_retries():
+    grafana = Grafana(503)
+
+    response = sync_client(grafana).request("GET", "/api/health")
+
+    assert response.status_code == 503
+    assert grafana.calls == RETRY_OPTIONS["max_retries"] + 1
+
+
+@pytest.mark.parametrize(
+    "method, expected_status, expected_calls",
+    [("GET", 200, 2), ("POST", 503, 1)],
+)
+def test_async_client_uses_same_policy(method, expected_status, expected_calls):
+    grafana = Grafana(503, 200)
+
+    async def request() -> httpx.Response:
+        client = AsyncGrafanaHttpClient("http://grafana", {}, **RETRY_OPTIONS)
+        await client.aclose()
+        client.client = httpx.AsyncClient(
+            base_url="http://grafana", transport=httpx.MockTransport(grafana)
+        )
+        try:
+            return await client.request(method, "/api/dashboards/db")
+        finally:
+            await client.aclose()
+
+    response = asyncio.run(request())
+
+    assert response.status_code == expected_status
+    assert grafana.calls == expected_calls
+
+
+@pytest.fixture
+def rate_limiter(redis_client) -> RedisRateLimiter:
+    return RedisRateLimiter(
+        redis_client,
+        buckets={
+            WRITE: TokenBucket(rate=10, burst=1),
+            READ: TokenBucket(rate=10, burst=1),
+        },
+        key_prefix="test:ratelimit:",
+        max_wait=0.15,
+    )
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    sleeps: list[float] = []
+    monkeypatch.setattr(grafana_http_client.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_waits_for_reserved_token_before_sending(rate_limiter, sleeps):
+    grafana = Grafana(200)
+    client = sync_client(grafana, rate_limiter=rate_limiter)
+
+    client.request("POST", "/api/dashboards/db")
+    client.request("POST", "/api/dashboards/db")
+
+    assert grafana.calls == 2
+    assert sleeps == [pytest.approx(0.1, abs=0.05)]
+
+
+def test_refuses_to_send_when_wait_exceeds_limit(rate_limiter, sleeps):
+    grafana = Grafana(200)
+    client = sync_client(grafana, rate_limiter=rate_limiter)
+    client.request("POST", "/api/dashboards/db")
+    client.request("POST", "/api/dashboards/db")
+
+    with pytest.raises(GrafanaRateLimited) as e:
+        client.request("POST", "/api/dashboards/db")
+
+    # 태스크는 retry_after 뒤로 재시도를 미룬다
+    assert e.value.retry_after == pytest.approx(0.2, abs=0.05)
+    assert grafana.calls == 2
+
+
+def test_retry_after_pauses_shared_bucket(rate_limiter, sleeps):
+    grafana = Grafana(httpx.Response(429, headers={"Retry-After": "1"}))
+    client = sync_client(grafana, rate_limiter=rate_limiter, max_retries=0)
+
+    response = client.request("POST", "/api/dashboards/db")
+
+    assert response.status_code == 429
+    # 같은 버킷을 쓰는 다른 워커도 Retry-After 동안 보내지 않는다
+    assert not rate_limiter.reserve(WRITE).granted
+    assert rate_limiter.reserve(READ).granted
+
+
+@pytest.fixture
+def circuit_breaker(redis_client) -> RedisCircuitBreaker:
+    return RedisCircuitBreaker(
+        redis_client,
+        key="circuit:test",
+        failure_threshold=2,
+        failure_window=60,
+        recovery_timeout=60,
+        success_threshold=1,
+    )
+
+
+def test_outages_open_the_circuit(circuit_breaker, sleeps):
+    grafana = Grafana(503, httpx.ConnectError("refused"), 200)
+    client = sync_client(grafana, circuit_breaker=circuit_breaker, max_retries=0)
+
+    assert client.request("GET", "/api/health").status_code == 503
+    with pytest.raises(httpx.ConnectError):
+        client.request("GET", "/api/health")
+
+    # 열린 뒤에는 연결을 시도하지 않는다
+    with pytest.raises(GrafanaUnavailable) as e:
+        client.request("GET", "/api/health")
+    assert 0 < e.value.retry_after <= 60
+    assert grafana.calls == 2
+
+
+def test_request_errors_do_not_count_as_outage(circuit_breaker, sleeps):
+    grafana = Grafana(500, 400, 404, 200)
+    client = sync_client(grafana, circuit_breaker=circuit_breaker, max_retries=0)
+
+    statuses = [
+        client.request("POST", "/api/dashboards/db").status_code for _ in range(4)
+    ]
+
+    assert statuses == [500, 400, 404, 200]
+    assert circuit_breaker.allow().state == CircuitState.CLOSED
+
+
+def test_open_circuit_stops_retries_in_progress(circuit_breaker, sleeps):
+    grafana = Grafana(503)
+    client = sync_client(grafana, circuit_breaker=circuit_breaker, max_retries=5)
+
+    # 재시도 중에 circuit이 열리면 남은 재시도를 멈춘다
+    with pytest.raises(GrafanaUnavailable):
+        client.request("GET", "/api/health")
+    assert grafana.calls == 2
@@ -0,0 +1,55 @@
+import pytest
+from jinja2 import Environment, FileSystemLoader
+
+from monitoring.infra.jinja2.jinja2_template_renderer import Jinja2TemplateRenderer
+
+ROUTER_CONTEXT = {
+    "beats_port": 5044,
+    "mq_host": "127.0.0.1",
+    "mq_port": 5672,
+    "mq_user": "guest",
+    "mq_password": "guest",
+    "mq_vhost": "/",
+    "mq_exchange": "app_logs_exchange",
+    "mq_exchange_type": "direct",
+    "mq_routing_key": "logs_1",
+    "mq_persistent": True,
+    "mq_heartbeat": 30,
+}
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, settings, tmp_path):
+    # 다른 테스트가 만든 Environment를 쓰지 않도록 비운다
+    monkeypatch.setattr(Jinja2TemplateRenderer, "_shared_env", None)
+    settings.JINJA2_BYTECODE_CACHE_DIR = str(tmp_path / "jinja2")
+    return tmp_path / "jinja2"
+
+
+def test_instances_share_one_environment(cache_dir):
+    assert Jinja2TemplateRenderer().env is Jinja2TemplateRenderer().env
+
+
+def test_renders_same_as_a_fresh_environment(cache_dir):
+    fresh = Environment(
+        loader=FileSystemLoader(Jinja2TemplateRenderer.DEFAULT_TEMPLATE_PATH)
+    )
+
+    rendered = Jinja2TemplateRenderer().render("logstash_conf.j2", ROUTER_CONTEXT)
+
+    assert rendered == fresh.get_template("logstash_conf.j2").render(**ROUTER_CONTEXT)
+
+
+def test_warm_up_compiles_every_template_into_bytecode_cache(cache_dir):
+    names = Jinja2TemplateRenderer.warm_up()
+
+    assert "logstash_conf.j2" in names
+    assert all(name.endswith(".j2") for name in names)
+    # 템플릿마다 바이트코드 파일이 하나씩 생긴다
+    assert len(list(cache_dir.iterdir())) == len(names)
+
+
+def test_auto_reload_follows_debug(cache_dir, settings):
+    settings.DEBUG = False
+
+    assert Jinja2TemplateRenderer().env.auto_reload is False
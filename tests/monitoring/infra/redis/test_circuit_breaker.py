@@ -0,0 +1,139 @@
+import time
+
+import fakeredis
+import pytest
+
+from monitoring.infra.redis.circuit_breaker import CircuitState, RedisCircuitBreaker
+
+RECOVERY = 0.1
+
+
+def make_breaker(client, **options) -> RedisCircuitBreaker:
+    return RedisCircuitBreaker(
+        client,
+        key="circuit:test",
+        **{
+            "failure_threshold": 3,
+            "failure_window": 60,
+            "recovery_timeout": RECOVERY,
+            "success_threshold": 3,
+            **options,
+        },
+    )
+
+
+@pytest.fixture
+def breaker(redis_client) -> RedisCircuitBreaker:
+    return make_breaker(redis_client)
+
+
+def open_circuit(breaker: RedisCircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def half_open(breaker: RedisCircuitBreaker) -> None:
+    open_circuit(breaker)
+    time.sleep(RECOVERY * 1.5)
+    assert breaker.allow() == (CircuitState.HALF_OPEN, True, 0.0)
+
+
+def test_opens_after_threshold_failures(breaker):
+    for _ in range(breaker.failure_threshold - 1):
+        breaker.record_failure()
+    assert breaker.allow().allowed
+
+    breaker.record_failure()
+
+    decision = breaker.allow()
+    assert decision.state == CircuitState.OPEN
+    assert not decision.allowed
+    assert 0 < decision.retry_after <= RECOVERY
+
+
+def test_closed_successes_do_not_touch_redis(breaker, redis_client):
+    breaker.record_success(CircuitState.CLOSED)
+
+    assert breaker.allow() == (CircuitState.CLOSED, True, 0.0)
+    assert redis_client.keys("*") == []
+
+
+def test_half_open_ramps_probes_up_then_closes(breaker):
+    # 첫 probe(half_open 전환)가 끝나기 전에는 더 내보내지 않는다
+    half_open(breaker)
+    assert not breaker.allow().allowed
+
+    # probe가 성공할 때마다 두 건씩 더
+    breaker.record_success(CircuitState.HALF_OPEN)
+    assert [breaker.allow().allowed for _ in range(3)] == [True, True, False]
+
+    breaker.record_success(CircuitState.HALF_OPEN)
+    breaker.record_success(CircuitState.HALF_OPEN)
+
+    assert breaker.allow() == (CircuitState.CLOSED, True, 0.0)
+
+
+def test_failure_while_half_open_reopens_immediately(breaker):
+    half_open(breaker)
+
+    breaker.record_failure()
+
+    decision = breaker.allow()
+    assert decision.state == CircuitState.OPEN
+    assert not decision.allowed
+
+
+def test_lost_probe_is_replaced_after_recovery_timeout(breaker):
+    half_open(breaker)
+    assert not breaker.allow().allowed
+
+    # 결과를 알리지 못한 probe(워커 종료 등) 때문에 half_open에 머물지 않는다
+    time.sleep(RECOVERY * 1.5)
+
+    assert breaker.allow() == (CircuitState.HALF_OPEN, True, 0.0)
+
+
+def test_all_workers_share_the_state(breaker, redis_client):
+    other_worker = make_breaker(redis_client)
+
+    open_circuit(breaker)
+
+    assert not other_worker.allow().allowed
+
+
+def test_snapshot(breaker):
+    breaker.record_failure()
+    assert breaker.snapshot() == {
+        "state": CircuitState.CLOSED,
+        "recent_failures": 1,
+        "failure_threshold": 3,
+    }
+
+    open_circuit(breaker)
+    opened = breaker.snapshot()
+    assert opened["state"] == CircuitState.OPEN
+    assert 0 < opened["open_for"] <= RECOVERY
+
+    time.sleep(RECOVERY * 1.5)
+    breaker.allow()
+    breaker.record_success(CircuitState.HALF_OPEN)
+    assert breaker.snapshot() == {
+        "state": CircuitState.HALF_OPEN,
+        "recent_failures": 0,
+        "failure_threshold": 3,
+        "probes_issued": 1,
+        "probe_successes": 1,
+        "success_threshold": 3,
+    }
+
+
+def test_redis_failure_fails_open():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    breaker = make_breaker(fakeredis.FakeRedis(server=server, decode_responses=True))
+
+    open_circuit(breaker)
+    breaker.record_success(CircuitState.HALF_OPEN)
+
+    assert breaker.allow() == (CircuitState.CLOSED, True, 0.0)
+    assert breaker.snapshot()["state"] == "unknown"
@@ -0,0 +1,132 @@
+import asyncio
+
+import fakeredis
+import pytest
+
+from monitoring.domain.monitoring_project import ProjectStatus
+from monitoring.domain.provision_progress import ProvisionEventType
+from monitoring.domain.task_result import TaskStatus
+from monitoring.infra.redis.provision_progress_notifier import (
+    RedisProvisionProgressNotifier,
+)
+
+
+@pytest.fixture
+def notifier(redis_client, async_redis_client) -> RedisProvisionProgressNotifier:
+    return RedisProvisionProgressNotifier(
+        client=redis_client, ttl=60, async_client=async_redis_client
+    )
+
+
+def steps(events) -> dict[str, str]:
+    return {
+        event.step: event.status
+        for event in events
+        if event is not None and event.type == ProvisionEventType.STEP
+    }
+
+
+def test_late_listener_sees_snapshot_then_terminal_project_event(notifier):
+    notifier.register_steps("p1", {"t1": "folder", "t2": "dashboard"})
+    notifier.publish_step_status("t1", TaskStatus.SUCCESS)
+    notifier.publish_step_status("t2", TaskStatus.FAILURE)
+    notifier.publish_project_status("p1", ProjectStatus.FAILED)
+
+    events = list(notifier.listen("p1", timeout=1, heartbeat=0.01))
+
+    assert steps(events) == {
+        "folder": TaskStatus.SUCCESS,
+        "dashboard": TaskStatus.FAILURE,
+    }
+    # 이미 끝난 프로젝트면 구독을 기다리지 않고 바로 끝난다
+    assert events[-1].type == ProvisionEventType.PROJECT
+    assert events[-1].status == ProjectStatus.FAILED
+
+
+def test_listener_receives_live_events_until_terminal(notifier):
+    notifier.register_steps("p1", {"t1": "folder"})
+    stream = notifier.listen("p1", timeout=1, heartbeat=0.01)
+
+    # 첫 next()에서 구독한 뒤 스냅샷(PENDING)을 내보낸다
+    first = next(stream)
+    notifier.publish_step_status("t1", TaskStatus.SUCCESS)
+    notifier.publish_project_status("p1", ProjectStatus.READY)
+    rest = [event for event in stream if event is not None]
+
+    assert (first.step, first.status) == ("folder", TaskStatus.PENDING)
+    assert [(event.type, event.status) for event in rest] == [
+        (ProvisionEventType.STEP, TaskStatus.SUCCESS),
+        (ProvisionEventType.PROJECT, ProjectStatus.READY),
+    ]
+
+
+def test_async_listener_receives_live_events_until_terminal(notifier):
+    notifier.register_steps("p1", {"t1": "folder"})
+
+    async def listen():
+        stream = notifier.alisten("p1", timeout=1, heartbeat=0.01)
+        first = await anext(stream)
+        notifier.publish_step_status("t1", TaskStatus.SUCCESS)
+        notifier.publish_project_status("p1", ProjectStatus.READY)
+        return first, [event async for event in stream if event is not None]
+
+    first, rest = asyncio.run(listen())
+
+    assert (first.step, first.status) == ("folder", TaskStatus.PENDING)
+    assert [(event.type, event.status) for event in rest] == [
+        (ProvisionEventType.STEP, TaskStatus.SUCCESS),
+        (ProvisionEventType.PROJECT, ProjectStatus.READY),
+    ]
+
+
+def test_async_listener_stops_at_terminal_snapshot(notifier):
+    notifier.register_steps("p1", {"t1": "folder"})
+    notifier.publish_project_status("p1", ProjectStatus.FAILED)
+
+    async def listen():
+        return [e async for e in notifier.alisten("p1", timeout=1, heartbeat=0.01)]
+
+    events = asyncio.run(listen())
+
+    assert [(event.type, event.status) for event in events] == [
+        (ProvisionEventType.STEP, TaskStatus.PENDING),
+        (ProvisionEventType.PROJECT, ProjectStatus.FAILED),
+    ]
+
+
+def test_idle_stream_sends_heartbeats_and_stops_at_timeout(notifier):
+    events = list(notifier.listen("p1", timeout=0.05, heartbeat=0.01))
+
+    assert events
+    assert all(event is None for event in events)
+
+
+def test_reregistering_clears_previous_progress(notifier):
+    notifier.register_steps("p1", {"t1": "folder"})
+    notifier.publish_step_status("t1", TaskStatus.FAILURE)
+    notifier.publish_project_status("p1", ProjectStatus.FAILED)
+
+    notifier.register_steps("p1", {"t2": "dashboard"})
+    notifier.publish_project_status("p1", ProjectStatus.READY)
+
+    assert steps(notifier.listen("p1", timeout=1, heartbeat=0.01)) == {
+        "dashboard": TaskStatus.PENDING
+    }
+
+
+def test_unregistered_task_is_ignored(notifier, redis_client):
+    notifier.publish_step_status("unknown", TaskStatus.SUCCESS)
+
+    assert redis_client.keys("*") == []
+
+
+def test_publishing_never_raises_when_redis_is_down():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    notifier = RedisProvisionProgressNotifier(
+        client=fakeredis.FakeRedis(server=server, decode_responses=True), ttl=60
+    )
+
+    notifier.register_steps("p1", {"t1": "folder"})
+    notifier.publish_step_status("t1", TaskStatus.SUCCESS)
+    notifier.publish_project_status("p1", ProjectStatus.READY)
@@ -0,0 +1,84 @@
+import fakeredis
+import pytest
+
+from monitoring.infra.redis.rate_limiter import RedisRateLimiter, TokenBucket
+
+RATE = 10  # 토큰 간격 0.1s
+BURST = 3
+# 예약 사이에 흐르는 실제 시간(Redis TIME 기준)만큼의 오차
+APPROX = 0.05
+
+
+@pytest.fixture
+def limiter(redis_client) -> RedisRateLimiter:
+    return RedisRateLimiter(
+        redis_client,
+        buckets={
+            "write": TokenBucket(rate=RATE, burst=BURST),
+            "read": TokenBucket(rate=RATE, burst=BURST),
+        },
+        key_prefix="test:ratelimit:",
+        max_wait=1.0,
+    )
+
+
+def waits(limiter: RedisRateLimiter, name: str, count: int) -> list[float]:
+    return [limiter.reserve(name).wait for _ in range(count)]
+
+
+def test_burst_is_free_then_requests_are_spaced_at_rate(limiter):
+    reserved = waits(limiter, "write", BURST + 3)
+
+    assert reserved[:BURST] == [0.0] * BURST
+    # 이후로는 예약한 순서대로 1/rate 간격
+    assert reserved[BURST:] == pytest.approx([0.1, 0.2, 0.3], abs=APPROX)
+
+
+def test_reservation_past_max_wait_is_refused_without_taking_a_token(limiter):
+    # max_wait 1s → burst 뒤 10개까지 예약 가능
+    granted = [limiter.reserve("write") for _ in range(BURST + 11)]
+
+    assert all(r.granted for r in granted[:-1])
+    refused = granted[-1]
+    assert not refused.granted
+    assert refused.wait == pytest.approx(1.1, abs=APPROX)
+    # 거절된 예약은 버킷을 더 밀지 않는다
+    again = limiter.reserve("write")
+    assert not again.granted
+    assert again.wait == pytest.approx(refused.wait, abs=APPROX)
+
+
+def test_buckets_are_independent(limiter):
+    waits(limiter, "write", BURST + 5)
+
+    assert waits(limiter, "read", BURST) == [0.0] * BURST
+
+
+def test_pause_delays_every_worker_and_drops_the_burst(limiter, redis_client):
+    other_worker = RedisRateLimiter(
+        redis_client,
+        buckets=limiter.buckets,
+        key_prefix="test:ratelimit:",
+        max_wait=1.0,
+    )
+
+    limiter.pause("write", 0.5)
+
+    # 멈춘 뒤에는 burst 없이 rate 간격으로 재개
+    assert waits(other_worker, "write", 3) == pytest.approx([0.5, 0.6, 0.7], abs=APPROX)
+
+
+def test_redis_failure_fails_open():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    limiter = RedisRateLimiter(
+        fakeredis.FakeRedis(server=server, decode_responses=True),
+        buckets={"write": TokenBucket(rate=RATE, burst=1)},
+        key_prefix="test:ratelimit:",
+        max_wait=1.0,
+    )
+
+    limiter.pause("write", 10)
+
+    assert waits(limiter, "write", 5) == [0.0] * 5
+    assert limiter.reserve("write").granted
@@ -0,0 +1,76 @@
+import time
+
+import pytest
+
+from monitoring.infra.redis.task_lock import AcquireResult, TaskLock
+
+
+@pytest.fixture
+def make_lock(redis_client):
+    def make(lock_ttl: int = 10) -> TaskLock:
+        return TaskLock(
+            redis_client,
+            lock_key="lock:dashboard:task-1",
+            done_key="done:dashboard:task-1",
+            lock_ttl=lock_ttl,
+            done_ttl=60,
+        )
+
+    return make
+
+
+def test_only_one_worker_acquires(make_lock):
+    first, second = make_lock(), make_lock()
+
+    assert first.acquire() == AcquireResult.ACQUIRED
+    assert second.acquire() == AcquireResult.BUSY
+    assert first.owned and not second.owned
+
+
+def test_done_task_is_not_acquired_again(make_lock, redis_client):
+    lock = make_lock()
+    lock.acquire()
+
+    assert lock.release_and_mark_done()
+    assert redis_client.get("lock:dashboard:task-1") is None
+    assert 0 < redis_client.ttl("done:dashboard:task-1") <= 60
+    assert make_lock().acquire() == AcquireResult.DONE
+
+
+def test_release_does_not_delete_another_workers_lock(make_lock, redis_client):
+    first = make_lock()
+    first.acquire()
+    # 첫 락이 만료되고 다른 워커가 가져간 상황
+    redis_client.delete("lock:dashboard:task-1")
+    second = make_lock()
+    assert second.acquire() == AcquireResult.ACQUIRED
+
+    assert not first.release()
+    assert not first.extend()
+    assert redis_client.get("lock:dashboard:task-1") == second.token
+
+
+def test_mark_done_after_losing_lock_still_records_done(make_lock, redis_client):
+    first = make_lock()
+    first.acquire()
+    redis_client.delete("lock:dashboard:task-1")
+    second = make_lock()
+    second.acquire()
+
+    assert not first.release_and_mark_done()
+    # 작업은 끝났으므로 done은 남기고, 다른 워커의 락은 건드리지 않는다
+    assert redis_client.exists("done:dashboard:task-1")
+    assert redis_client.get("lock:dashboard:task-1") == second.token
+
+
+def test_heartbeat_keeps_lock_past_ttl(make_lock, redis_client):
+    lock = make_lock(lock_ttl=1)
+    lock.acquire()
+    lock.start_heartbeat()
+    try:
+        time.sleep(1.5)
+        assert redis_client.get("lock:dashboard:task-1") == lock.token
+    finally:
+        lock.release()
+
+    assert redis_client.get("lock:dashboard:task-1") is None
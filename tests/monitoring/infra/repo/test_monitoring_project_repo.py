@@ -0,0 +1,237 @@
+import pytest
+
+from common.service.token.exception import InvalidPagingParameterException
+from monitoring.domain.monitoring_project import ProjectStatus, ProvisioningSnapshot
+from monitoring.domain.visualization_platform.folder import FolderPermissionLevel
+from monitoring.infra.models.visualization_platform_model import (
+    FolderPermissionModel,
+    ServiceAccountModel,
+    UserFolderModel,
+)
+from monitoring.infra.repo.monitoring_project_repo import MonitoringProjectRepo
+from monitoring.infra.repo.visualization_platform_repo.dashboard_repo import (
+    DashboardRepo,
+    PublicDashboardRepo,
+)
+from monitoring.infra.repo.visualization_platform_repo.folder_permission_repo import (
+    FolderPermissionRepo,
+)
+from monitoring.infra.repo.visualization_platform_repo.folder_repo import FolderRepo
+from monitoring.infra.repo.visualization_platform_repo.service_account_repo import (
+    ServiceAccountRepo,
+)
+from user.infra.models.user import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def repo() -> MonitoringProjectRepo:
+    return MonitoringProjectRepo()
+
+
+def test_find_page_returns_newest_first_with_dashboards(repo, user, make_project):
+    for i in range(5):
+        make_project(user, f"p{i}", minutes=i)
+    make_project(user, "no-dash", minutes=10, with_dashboards=False)
+
+    paged = repo.find_page_with_full_dashboard_dto_by_user(user.id, page=1, page_size=3)
+
+    assert [dto.id for dto in paged.items] == ["no-dash", "p4", "p3"]
+    assert paged.items[0].dashboard is None
+    assert paged.items[0].public_dashboard is None
+    assert paged.items[1].dashboard.uid == "uid-p4"
+    assert paged.items[1].public_dashboard.public_url == "http://grafana/public/p4"
+    assert (paged.total_items, paged.total_pages) == (6, 2)
+    assert (paged.has_previous, paged.has_next) == (False, True)
+
+
+def test_find_page_uses_count_and_one_select(
+    repo, user, make_project, django_assert_num_queries
+):
+    for i in range(10):
+        make_project(user, f"p{i}", minutes=i)
+
+    # 프로젝트 수와 관계없이 COUNT 1회 + join 조회 1회
+    with django_assert_num_queries(2):
+        paged = repo.find_page_with_full_dashboard_dto_by_user(
+            user.id, page=2, page_size=4
+        )
+
+    assert [dto.id for dto in paged.items] == ["p5", "p4", "p3", "p2"]
+
+
+def test_find_page_only_returns_own_projects(repo, user, make_project):
+    other = User.objects.create(id="user-2", oauth_type="google", oauth_id="oauth-2")
+    make_project(user, "mine")
+    make_project(other, "theirs")
+
+    paged = repo.find_page_with_full_dashboard_dto_by_user(user.id)
+
+    assert [dto.id for dto in paged.items] == ["mine"]
+
+
+def test_find_page_rejects_page_after_last(repo, user, make_project):
+    make_project(user, "p0")
+
+    with pytest.raises(InvalidPagingParameterException):
+        repo.find_page_with_full_dashboard_dto_by_user(user.id, page=2, page_size=10)
+
+
+def test_cursor_pages_walk_every_project_once(repo, user, make_project):
+    # created_at이 같은 프로젝트가 페이지 경계에 걸려도 id로 이어서 조회한다
+    for i in range(7):
+        make_project(user, f"p{i}", minutes=i // 3)
+
+    ids, cursor, pages = [], None, 0
+    while True:
+        paged = repo.find_cursor_page_with_full_dashboard_dto_by_user(
+            user.id, cursor=cursor, page_size=3
+        )
+        ids += [dto.id for dto in paged.items]
+        pages += 1
+        if not paged.has_next:
+            assert paged.next_cursor is None
+            break
+        cursor = paged.next_cursor
+
+    assert ids == ["p6", "p5", "p4", "p3", "p2", "p1", "p0"]
+    assert pages == 3
+
+
+def test_cursor_page_of_exact_size_has_no_next(repo, user, make_project):
+    for i in range(3):
+        make_project(user, f"p{i}", minutes=i)
+
+    paged = repo.find_cursor_page_with_full_dashboard_dto_by_user(user.id, page_size=3)
+
+    assert len(paged.items) == 3
+    assert not paged.has_next
+
+
+def test_cursor_page_uses_one_query(
+    repo, user, make_project, django_assert_num_queries
+):
+    for i in range(5):
+        make_project(user, f"p{i}", minutes=i)
+    first = repo.find_cursor_page_with_full_dashboard_dto_by_user(user.id, page_size=2)
+
+    with django_assert_num_queries(1):
+        repo.find_cursor_page_with_full_dashboard_dto_by_user(
+            user.id, cursor=first.next_cursor, page_size=2
+        )
+
+
+@pytest.fixture
+def provision(user):
+    """provision(project) → 사용자 폴더, 서비스 계정, 폴더 권한을 만든다."""
+
+    def provision(project) -> None:
+        UserFolderModel.objects.get_or_create(
+            id=f"folder-{user.id}",
+            defaults=dict(user=user, uid=f"folder-uid-{user.id}", name="폴더"),
+        )
+        ServiceAccountModel.objects.create(
+            id=f"sa-{project.id}",
+            account_id=f"account-{project.id}",
+            user=user,
+            project=project,
+            name=f"sa-{project.id}",
+            role="Viewer",
+            token="token",
+        )
+        # 권한은 행 id가 아니라 서비스 계정의 account_id로 연결된다
+        FolderPermissionModel.objects.create(
+            id=f"perm-{project.id}",
+            service_account_id=f"account-{project.id}",
+            folder_uid=f"folder-uid-{user.id}",
+            permission=FolderPermissionLevel.VIEW.value,
+        )
+
+    return provision
+
+
+def separate_lookup(user_id: str, project_id: str) -> tuple:
+    account = ServiceAccountRepo().find_by_project_id(project_id)
+    return (
+        FolderRepo().find_by_user_id(user_id),
+        account,
+        (
+            FolderPermissionRepo().find_by_service_account_id(account.account_id)
+            if account
+            else None
+        ),
+        DashboardRepo().find_by_project_id(project_id),
+        PublicDashboardRepo().find_by_project_id(project_id),
+    )
+
+
+def resource_ids(snapshot: ProvisioningSnapshot) -> tuple:
+    resources = (
+        snapshot.user_folder,
+        snapshot.service_account,
+        snapshot.folder_permission,
+        snapshot.dashboard,
+        snapshot.public_dashboard,
+    )
+    return tuple(resource.id if resource else None for resource in resources)
+
+
+@pytest.mark.parametrize("provisioned", [True, False])
+def test_snapshot_matches_separate_lookups_in_one_query(
+    repo, user, make_project, provision, provisioned, django_assert_num_queries
+):
+    project = make_project(user, "p1", with_dashboards=provisioned)
+    if provisioned:
+        provision(project)
+
+    with django_assert_num_queries(1):
+        snapshot = repo.find_provisioning_snapshot(user.id, "p1")
+
+    expected = tuple(
+        resource.id if resource else None for resource in separate_lookup(user.id, "p1")
+    )
+    assert resource_ids(snapshot) == expected
+    assert all(expected) if provisioned else not any(expected)
+    assert snapshot.project is None
+
+
+def test_snapshot_maps_every_column(repo, user, make_project, provision):
+    provision(make_project(user, "p1"))
+
+    snapshot = repo.find_provisioning_snapshot(user.id, "p1")
+
+    assert snapshot.user_folder.uid == "folder-uid-user-1"
+    assert snapshot.service_account.account_id == "account-p1"
+    assert snapshot.service_account.is_disabled is False
+    assert snapshot.folder_permission.permission == FolderPermissionLevel.VIEW
+    assert snapshot.dashboard.url == "http://grafana/d/p1"
+    assert snapshot.public_dashboard.dashboard_id == "dash-p1"
+
+
+def test_snapshots_for_many_projects_in_one_query(
+    repo, user, make_project, provision, django_assert_num_queries
+):
+    provision(make_project(user, "p1"))
+    make_project(user, "p2", with_dashboards=False, status=ProjectStatus.FAILED)
+
+    with django_assert_num_queries(1):
+        snapshots = repo.find_provisioning_snapshots(["p1", "p2", "missing"])
+
+    assert set(snapshots) == {"p1", "p2"}
+    assert resource_ids(snapshots["p1"]) == (
+        "folder-user-1",
+        "sa-p1",
+        "perm-p1",
+        "dash-p1",
+        "pub-p1",
+    )
+    # 폴더는 프로젝트 소유자 기준이라 리소스가 없는 프로젝트에도 채워진다
+    assert resource_ids(snapshots["p2"]) == ("folder-user-1", None, None, None, None)
+    assert snapshots["p2"].project.status == ProjectStatus.FAILED
+    assert snapshots["p2"].project.user_id == user.id
+
+
+def test_snapshots_for_no_projects_skip_the_query(repo, django_assert_num_queries):
+    with django_assert_num_queries(0):
+        assert repo.find_provisioning_snapshots([]) == {}
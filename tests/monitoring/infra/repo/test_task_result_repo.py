@@ -0,0 +1,106 @@
+import fakeredis
+import pytest
+from django.utils import timezone
+
+from monitoring.domain.task_result import TaskStatus
+from monitoring.infra.models.task_result_model import TaskResultModel
+from monitoring.infra.redis.task_status_buffer import TaskStatusBuffer
+from monitoring.infra.repo.task_result_repo import TaskResultRepo
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def buffer(redis_client) -> TaskStatusBuffer:
+    return TaskStatusBuffer(redis_client, ttl=60)
+
+
+@pytest.fixture
+def repo(buffer) -> TaskResultRepo:
+    repo = TaskResultRepo(buffer)
+    repo.write_behind = True
+    return repo
+
+
+@pytest.fixture
+def task_ids() -> list[str]:
+    ids = [f"task-{i}" for i in range(3)]
+    TaskResultModel.objects.bulk_create(
+        [
+            TaskResultModel(id=id, task_name="test", status=TaskStatus.PENDING)
+            for id in ids
+        ]
+    )
+    return ids
+
+
+def db_status(task_id: str) -> str:
+    return TaskResultModel.objects.get(id=task_id).status
+
+
+def test_transitions_are_merged_and_written_once(
+    repo, task_ids, django_assert_num_queries
+):
+    started = timezone.now()
+    for task_id in task_ids:
+        repo.record_status(task_id, status=TaskStatus.STARTED, date_started=started)
+        repo.record_status(task_id, status=TaskStatus.SUCCESS, result={"ok": 1})
+
+    # 기록만으로는 DB에 쓰지 않는다
+    assert db_status("task-0") == TaskStatus.PENDING
+    # 조회는 버퍼 내용을 합쳐서 돌려준다
+    assert repo.find_by_task_id("task-0").status == TaskStatus.SUCCESS
+
+    # 같은 필드 조합끼리 bulk_update 한 번
+    with django_assert_num_queries(1):
+        assert repo.flush_buffered(limit=10) == 3
+
+    model = TaskResultModel.objects.get(id="task-0")
+    assert model.status == TaskStatus.SUCCESS
+    assert model.result == {"ok": 1}
+    assert model.date_started == started
+    assert repo.flush_buffered(limit=10) == 0
+
+
+def test_flush_respects_limit(repo, task_ids):
+    for task_id in task_ids:
+        repo.record_status(task_id, status=TaskStatus.SUCCESS)
+
+    assert repo.flush_buffered(limit=2) == 2
+    assert repo.flush_buffered(limit=2) == 1
+    assert {db_status(id) for id in task_ids} == {TaskStatus.SUCCESS}
+
+
+def test_transition_recorded_during_flush_is_kept(buffer):
+    buffer.record("task-0", {"status": TaskStatus.STARTED})
+    entries = buffer.take(10)
+    # DB에 반영하는 동안 새 전이가 들어옴
+    buffer.record("task-0", {"status": TaskStatus.SUCCESS})
+
+    buffer.ack({id: version for id, (version, _) in entries.items()})
+
+    assert buffer.get("task-0") == {"status": TaskStatus.SUCCESS}
+
+
+def test_ack_clears_entries_whose_buffer_expired(buffer, redis_client):
+    buffer.record("task-0", {"status": TaskStatus.STARTED})
+    buffer.record("task-1", {"status": TaskStatus.STARTED})
+    redis_client.delete("task_status:pending:task-1")  # ttl 만료
+    entries = buffer.take(10)
+
+    assert entries["task-1"] == ("", {})
+    assert buffer.ack({id: version for id, (version, _) in entries.items()}) == 2
+    assert buffer.take(10) == {}
+
+
+def test_redis_failure_writes_to_db_directly(task_ids):
+    server = fakeredis.FakeServer()
+    buffer = TaskStatusBuffer(fakeredis.FakeRedis(server=server), ttl=60)
+    server.connected = False
+    repo = TaskResultRepo(buffer)
+    repo.write_behind = True
+
+    repo.record_status("task-0", status=TaskStatus.FAILURE)
+
+    assert db_status("task-0") == TaskStatus.FAILURE
+    assert repo.find_by_task_id("task-0").status == TaskStatus.FAILURE
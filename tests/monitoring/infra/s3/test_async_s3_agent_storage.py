@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from monitoring.infra.s3.async_s3_agent_storage import AsyncS3AgentStorageProvider
+
+
+def upload_batch(storage: AsyncS3AgentStorageProvider, files) -> dict[str, str]:
+    async def upload():
+        async with storage:
+            return await storage.upload_batch(files)
+
+    return asyncio.run(upload())
+
+
+def test_upload_batch_sends_signed_puts(
+    make_files, async_s3_storage, s3_storage, s3_server
+):
+    files = make_files(s3_storage)
+
+    urls = upload_batch(async_s3_storage, files)
+
+    # URL은 sync 구현과 같다
+    assert urls == {key: s3_storage.get_object_url(key) for key in files}
+    assert s3_server.objects == {key: f.content for key, f in files.items()}
+    for request in s3_server.requests:
+        assert request.url.host == "bucket.s3.ap-northeast-2.amazonaws.com"
+        assert request.headers["Authorization"].startswith("AWS4-HMAC-SHA256")
+
+
+def test_upload_batch_rolls_back_when_one_upload_fails(
+    make_files, async_s3_storage, s3_storage, s3_server
+):
+    files = make_files(s3_storage)
+    failed_key = "configs/project-1/100/setup.sh"
+    s3_server.fail_keys.add(failed_key)
+
+    with pytest.raises(RuntimeError, match="setup.sh"):
+        upload_batch(async_s3_storage, files)
+
+    assert s3_server.objects == {}
+
+
+def test_pending_uploads_are_cancelled_after_a_failure(
+    make_files, async_s3_storage, s3_storage, s3_server
+):
+    files = make_files(s3_storage)
+    s3_server.fail_keys.add("configs/project-1/100/setup.sh")
+    s3_server.slow_keys.add("configs/project-1/100/collector.yml")
+
+    with pytest.raises(RuntimeError) as exc_info:
+        upload_batch(async_s3_storage, files)
+
+    assert (
+        "configs/project-1/100/collector.yml: cancelled after "
+        "configs/project-1/100/setup.sh failed"
+    ) in str(exc_info.value)
+    assert s3_server.objects == {}
+
+
+def test_content_addressed_files_are_uploaded_once(
+    make_files, async_s3_storage, s3_storage, s3_server
+):
+    s3_storage.content_addressed = True
+    files = make_files(s3_storage, shareable=True)
+    (shared_key,) = [key for key in files if s3_storage.is_content_key(key)]
+
+    upload_batch(async_s3_storage, files)
+    s3_server.requests.clear()
+    urls = upload_batch(async_s3_storage, files)
+
+    assert urls[shared_key] == s3_storage.get_object_url(shared_key)
+    assert shared_key not in [r.url.path.lstrip("/") for r in s3_server.requests]
+
+
+def test_content_addressed_files_survive_rollback(
+    make_files, async_s3_storage, s3_storage, s3_server
+):
+    s3_storage.content_addressed = True
+    files = make_files(s3_storage, shareable=True)
+    (shared_key,) = [key for key in files if s3_storage.is_content_key(key)]
+    s3_server.fail_keys.add("configs/project-1/100/setup.sh")
+
+    with pytest.raises(RuntimeError):
+        upload_batch(async_s3_storage, files)
+
+    # 다른 요청이 공유할 수 있는 객체는 지우지 않는다
+    assert list(s3_server.objects) == [shared_key]
+
+
+def test_requires_async_with(async_s3_storage):
+    with pytest.raises(RuntimeError, match="async with"):
+        asyncio.run(async_s3_storage.upload(b"data", "key"))
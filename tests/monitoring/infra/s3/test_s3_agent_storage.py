@@ -0,0 +1,127 @@
+import threading
+
+import pytest
+
+from config import settings
+from monitoring.domain.log_agent.rendered_config import RenderedConfigFile
+
+
+def test_upload_batch_uploads_every_file_in_parallel(make_files, s3_storage, s3_client):
+    files = make_files(s3_storage)
+
+    urls = s3_storage.upload_batch(files)
+
+    assert urls == {key: s3_storage.get_object_url(key) for key in files}
+    assert s3_client.objects == {key: f.content for key, f in files.items()}
+    assert all(name.startswith("s3-upload") for name in s3_client.put_threads)
+
+
+def test_upload_batch_rolls_back_when_one_upload_fails(
+    make_files, s3_storage, s3_client
+):
+    files = make_files(s3_storage)
+    failed_key = "configs/project-1/100/router.yml"
+    s3_client.fail_keys.add(failed_key)
+
+    with pytest.raises(RuntimeError, match="router.yml"):
+        s3_storage.upload_batch(files)
+
+    # all-or-nothing: 성공한 업로드도 남지 않는다
+    assert s3_client.objects == {}
+    assert failed_key not in s3_client.deleted
+
+
+def test_uploads_still_running_after_a_failure_are_deleted(
+    make_files, s3_storage, s3_client
+):
+    files = make_files(s3_storage)
+    failed_key = "configs/project-1/100/router.yml"
+    slow_key = "configs/project-1/100/setup.sh"
+    s3_client.fail_keys.add(failed_key)
+    release = threading.Event()
+    s3_client.block_keys[slow_key] = release
+
+    # 실패가 나면 다른 업로드를 기다리지 않는다
+    with pytest.raises(RuntimeError) as e:
+        s3_storage.upload_batch(files)
+    assert f"{slow_key}: cancelled after {failed_key} failed" in str(e.value)
+
+    # 이미 시작돼 멈출 수 없던 업로드는 끝나면 지운다
+    deleted = threading.Event()
+    original_delete = s3_client.delete_objects
+
+    def delete_objects(**kwargs):
+        original_delete(**kwargs)
+        deleted.set()
+
+    s3_client.delete_objects = delete_objects
+    release.set()
+    assert deleted.wait(5)
+    assert s3_client.objects == {}
+
+
+class TestContentAddressed:
+    @pytest.fixture(autouse=True)
+    def content_addressed(self, s3_storage):
+        s3_storage.content_addressed = True
+
+    def test_only_shareable_files_get_content_keys(self, s3_storage):
+        collector = RenderedConfigFile(filename="collector_p1.yml", content=b"c")
+        router = RenderedConfigFile(
+            filename="router_p1.yml", content=b"r", shareable=True
+        )
+
+        assert s3_storage.get_file_object_key("p1", 100, collector) == (
+            "configs/p1/100/collector_p1.yml"
+        )
+        assert s3_storage.is_content_key(
+            s3_storage.get_file_object_key("p1", 100, router)
+        )
+
+    def test_same_content_shares_key_across_projects(self, s3_storage, s3_client):
+        routers = [
+            RenderedConfigFile(
+                filename=f"router_{project_id}.yml", content=b"r", shareable=True
+            )
+            for project_id in ("p1", "p2")
+        ]
+        keys = [
+            s3_storage.get_file_object_key(project_id, 100, router)
+            for project_id, router in zip(("p1", "p2"), routers)
+        ]
+        assert keys[0] == keys[1]
+
+        s3_storage.upload_batch({keys[0]: routers[0]})
+        s3_client.objects.clear()
+        s3_storage.upload_batch({keys[1]: routers[1]})
+
+        # 이미 올라간 내용은 다시 올리지 않는다
+        assert s3_client.objects == {}
+
+    def test_rollback_keeps_content_keys(self, s3_storage, s3_client):
+        router = RenderedConfigFile(
+            filename="router_p1.yml", content=b"r", shareable=True
+        )
+        collector = RenderedConfigFile(filename="collector_p1.yml", content=b"c")
+        router_key = s3_storage.get_file_object_key("p1", 100, router)
+        collector_key = s3_storage.get_file_object_key("p1", 100, collector)
+        s3_client.fail_keys.add(collector_key)
+
+        with pytest.raises(RuntimeError):
+            s3_storage.upload_batch({router_key: router, collector_key: collector})
+
+        # 다른 프로젝트가 같이 쓰는 객체일 수 있어 지우지 않는다
+        assert router_key not in s3_client.deleted
+
+    def test_delete_batch_keeps_content_keys(self, s3_storage, s3_client):
+        router = RenderedConfigFile(
+            filename="router_p1.yml", content=b"r", shareable=True
+        )
+        collector = RenderedConfigFile(filename="collector_p1.yml", content=b"c")
+        router_key = s3_storage.get_file_object_key("p1", 100, router)
+        collector_key = s3_storage.get_file_object_key("p1", 100, collector)
+        s3_storage.upload_batch({router_key: router, collector_key: collector})
+
+        s3_storage.delete_batch([router_key, collector_key])
+
+        assert list(s3_client.objects) == [router_key]
@@ -0,0 +1,176 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.urls import reverse
+
+from monitoring.domain.monitoring_project import ProjectStatus
+from monitoring.domain.task_result import TaskStatus
+from monitoring.infra.s3.async_s3_agent_storage import AsyncS3AgentStorageProvider
+from monitoring.interface.views.log_monitoring_project_views import (
+    AsyncLogMonitoringProjectStep1View,
+)
+from monitoring.interface.views.my_monitoring_project_views import (
+    AsyncMyMonitoringProjectProgressView,
+    AsyncMyMonitoringProjectView,
+)
+from monitoring.interface.views.my_monitoring_projects_view import (
+    AsyncMyMonitoringProjectsView,
+)
+from monitoring.service.exceptions import PermissionException
+from monitoring.service.harvester_agent_service import HarvesterAgentService
+from monitoring.service.i_storage.i_storage_provider import (
+    AsyncAgentStorageProvider,
+    IAgentStorageProvider,
+)
+from monitoring.service.monitoring_project_service import MonitoringProjectService
+from user.infra.models.user import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def project_service(override, progress_notifier):
+    # 싱글톤이 이전 테스트의 의존성을 잡고 있지 않도록 새로 만든다
+    override(HarvesterAgentService, HarvesterAgentService)
+    override(MonitoringProjectService, MonitoringProjectService)
+
+
+def call_async(view_class, request, **kwargs):
+    """URL 설정(ASYNC_VIEWS_ENABLED)과 상관없이 async view를 직접 호출한다"""
+    return async_to_sync(view_class.as_view())(request, **kwargs)
+
+
+def content(response) -> dict:
+    return json.loads(response.content)
+
+
+def test_project_detail_matches_sync_view(
+    rf, call_view, user, make_project, auth_headers
+):
+    make_project(user, "p1")
+    request = rf.get(
+        reverse("monitoring-project-detail", args=["p1"]), **auth_headers(user.id)
+    )
+
+    response = call_async(AsyncMyMonitoringProjectView, request, project_id="p1")
+
+    assert response.status_code == 200
+    assert content(response) == content(call_view(request))
+
+
+def test_project_detail_rejects_other_users_project(
+    rf, user, make_project, auth_headers
+):
+    other = User.objects.create(
+        id="user-2", name="김철수", oauth_type="google", oauth_id="oauth-2"
+    )
+    make_project(other, "p2")
+    request = rf.get(
+        reverse("monitoring-project-detail", args=["p2"]), **auth_headers(user.id)
+    )
+
+    response = call_async(AsyncMyMonitoringProjectView, request, project_id="p2")
+
+    assert response.status_code == 400
+    assert content(response)["error"]["message"] == PermissionException().message
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"page_size": "2"}, {"pagination": "cursor", "page_size": "2"}],
+    ids=["page", "cursor"],
+)
+def test_project_list_matches_sync_view(
+    rf, call_view, user, make_project, auth_headers, params
+):
+    for minutes in range(3):
+        make_project(user, f"p{minutes}", minutes=minutes)
+    request = rf.get(
+        reverse("monitoring-projects-list"), params, **auth_headers(user.id)
+    )
+
+    response = call_async(AsyncMyMonitoringProjectsView, request)
+
+    assert response.status_code == 200
+    assert content(response) == content(call_view(request))
+
+
+def test_invalid_cursor_is_rejected(rf, user, auth_headers):
+    request = rf.get(
+        reverse("monitoring-projects-list"),
+        {"pagination": "cursor", "cursor": "not-a-cursor"},
+        **auth_headers(user.id),
+    )
+
+    response = call_async(AsyncMyMonitoringProjectsView, request)
+
+    assert response.status_code == 400
+
+
+def test_progress_streams_as_async_iterator(
+    rf, user, make_project, auth_headers, progress_notifier
+):
+    make_project(user, "p1", status=ProjectStatus.IN_PROGRESS)
+    progress_notifier.register_steps("p1", {"t1": "folder"})
+    progress_notifier.publish_step_status("t1", TaskStatus.SUCCESS)
+    progress_notifier.publish_project_status("p1", ProjectStatus.READY)
+    request = rf.get(
+        reverse("monitoring-project-events", args=["p1"]), **auth_headers(user.id)
+    )
+
+    response = call_async(
+        AsyncMyMonitoringProjectProgressView, request, project_id="p1"
+    )
+
+    assert response.is_async
+
+    async def read() -> list[str]:
+        return [chunk.decode() async for chunk in response.streaming_content]
+
+    events = [
+        line.removeprefix("event: ")
+        for chunk in async_to_sync(read)()
+        for line in chunk.splitlines()
+        if line.startswith("event: ")
+    ]
+    assert events[0] == "project"
+    assert "step" in events
+    assert events[-1] == "project"
+
+
+def test_step1_uploads_with_async_client_and_saves_project(
+    rf, override, user, auth_headers, s3_storage, s3_server
+):
+    override(IAgentStorageProvider, lambda: s3_storage)
+    override(
+        AsyncAgentStorageProvider,
+        lambda: AsyncS3AgentStorageProvider(s3_storage),
+    )
+    request = rf.post(
+        reverse("logProjectStep1"),
+        data=json.dumps(
+            {
+                "log_paths": ["/var/log/app.log"],
+                "project_name": "app",
+                "project_description": "app logs",
+                "timestamp_field": "ts",
+                "timestamp_json_path": "ts",
+                "log_level": "level",
+                "log_level_json_path": "level",
+            }
+        ),
+        content_type="application/json",
+        **auth_headers(user.id),
+    )
+
+    response = call_async(AsyncLogMonitoringProjectStep1View, request)
+
+    assert response.status_code == 200
+    data = content(response)["data"]
+    project = MonitoringProjectService().get_project_detail(data["project_id"])
+    assert project.name == "app"
+    assert len(s3_server.objects) == 3
+    assert data["set_up_script_url"] in {
+        s3_storage.get_object_url(key) for key in s3_server.objects
+    }
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+from django.urls import reverse
+
+from monitoring.domain.monitoring_project import ProjectStatus
+from monitoring.domain.task_result import TaskStatus
+from monitoring.service.exceptions import PermissionException
+from monitoring.service.monitoring_project_service import MonitoringProjectService
+from user.infra.models.user import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def project_service(override, progress_notifier):
+    # 싱글톤이 이전 테스트의 notifier를 잡고 있지 않도록 새로 만든다
+    override(MonitoringProjectService, MonitoringProjectService)
+
+
+def read_events(response) -> list[tuple[str, dict]]:
+    body = b"".join(response.streaming_content).decode()
+    events = []
+    for message in body.split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in message.splitlines() if ": " in line
+        )
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def events_url(project_id: str) -> str:
+    return reverse("monitoring-project-events", args=[project_id])
+
+
+def test_finished_project_streams_only_its_status(
+    rf, call_view, user, make_project, auth_headers
+):
+    make_project(user, "p1", status=ProjectStatus.READY)
+
+    response = call_view(rf.get(events_url("p1"), **auth_headers(user.id)))
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/event-stream"
+    assert response["Cache-Control"] == "no-cache"
+    assert [(event, data["status"]) for event, data in read_events(response)] == [
+        ("project", ProjectStatus.READY)
+    ]
+
+
+def test_in_progress_project_streams_steps_until_finished(
+    rf, call_view, user, make_project, auth_headers, progress_notifier
+):
+    make_project(user, "p1", status=ProjectStatus.IN_PROGRESS)
+    progress_notifier.register_steps("p1", {"t1": "folder", "t2": "dashboard"})
+    progress_notifier.publish_step_status("t1", TaskStatus.SUCCESS)
+    progress_notifier.publish_step_status("t2", TaskStatus.SUCCESS)
+    progress_notifier.publish_project_status("p1", ProjectStatus.READY)
+
+    response = call_view(
+        rf.get(
+            events_url("p1"), HTTP_ACCEPT="text/event-stream", **auth_headers(user.id)
+        )
+    )
+
+    events = read_events(response)
+    assert events[0] == (
+        "project",
+        {**events[0][1], "status": ProjectStatus.IN_PROGRESS},
+    )
+    assert {
+        data["step"]: data["status"] for event, data in events if event == "step"
+    } == {
+        "folder": TaskStatus.SUCCESS,
+        "dashboard": TaskStatus.SUCCESS,
+    }
+    assert events[-1][0] == "project"
+    assert events[-1][1]["status"] == ProjectStatus.READY
+
+
+def test_other_users_project_is_rejected(
+    rf, call_view, user, make_project, auth_headers
+):
+    other = User.objects.create(
+        id="user-2", name="김철수", oauth_type="google", oauth_id="oauth-2"
+    )
+    make_project(other, "p2", status=ProjectStatus.IN_PROGRESS)
+
+    response = call_view(rf.get(events_url("p2"), **auth_headers(user.id)))
+
+    assert response.status_code == 400
+    assert (
+        json.loads(response.content)["error"]["message"]
+        == PermissionException().message
+    )
+
+
+def test_requires_access_token(rf, call_view):
+    response = call_view(rf.get(events_url("p1")))
+
+    assert response.status_code == 403
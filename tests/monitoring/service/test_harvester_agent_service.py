@@ -0,0 +1,44 @@
+import pytest
+
+from monitoring.domain.log_agent.agent_provision_context import PlatformType
+from monitoring.service.harvester_agent_service import HarvesterAgentService
+
+
+@pytest.fixture
+def service(s3_storage) -> HarvesterAgentService:
+    s3_storage.content_addressed = True
+    service = HarvesterAgentService()
+    service.storage_provider = s3_storage
+    return service
+
+
+@pytest.fixture
+def step1(service, agent_contexts):
+    def step1(project_id: str):
+        collector_ctx, router_ctx = agent_contexts(project_id)
+        return service.upload_log_agent_set_up_files(
+            project_id, collector_ctx, router_ctx, PlatformType.LINUX
+        )
+
+    return step1
+
+
+def test_only_router_config_is_shared_between_projects(step1, s3_client):
+    first, _ = step1("project-1")
+    second, _ = step1("project-2")
+
+    assert first.router_config_url == second.router_config_url
+    assert first.collector_config_url != second.collector_config_url
+    assert first.set_up_script_url != second.set_up_script_url
+    # router 1개 + 프로젝트별 collector/bootstrap 2개씩
+    assert len(s3_client.objects) == 5
+
+
+def test_delete_removes_only_project_files(service, step1, s3_client):
+    _, first_keys = step1("project-1")
+    _, second_keys = step1("project-2")
+
+    service.delete_log_agent_set_up_files(first_keys)
+
+    # 공유하는 router config는 다른 프로젝트가 계속 쓴다
+    assert set(s3_client.objects) == set(second_keys)
@@ -0,0 +1,248 @@
+import uuid
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import DatabaseError
+
+from monitoring.domain.monitoring_project import ProjectStatus
+from monitoring.domain.task_result import MonitoringDashboardTaskName, TaskStatus
+from monitoring.infra.models.task_result_model import TaskResultModel
+from monitoring.infra.models.visualization_platform_model import UserFolderModel
+from monitoring.infra.s3.async_s3_agent_storage import AsyncS3AgentStorageProvider
+from monitoring.service.exceptions import (
+    AlreadyExistException,
+    AlreadyProvisioningException,
+    NotExistException,
+    PermissionException,
+)
+from monitoring.service.harvester_agent_service import HarvesterAgentService
+from monitoring.service.i_executors.excutor_DTO import (
+    CreateUserFolderDTO,
+    DashboardProvisionPlan,
+)
+from monitoring.service.i_executors.visualization_platform_executor import (
+    VisualizationPlatformTaskExecutor,
+)
+from monitoring.service.i_storage.i_storage_provider import AsyncAgentStorageProvider
+from monitoring.service.monitoring_project_service import (
+    DISPATCH_FAILED,
+    MonitoringProjectService,
+)
+from monitoring.service.monitoring_provision_service import MonitoringProvisionService
+from user.infra.models.user import User
+
+pytestmark = pytest.mark.django_db
+
+
+class FakeTaskExecutor(VisualizationPlatformTaskExecutor):
+    """발행 대신 받은 plan을 기록한다. fail_projects에 있는 프로젝트는 발행에 실패한다"""
+
+    def __init__(self):
+        self.fail_projects: set[str] = set()
+        self.calls: list[
+            tuple[list[DashboardProvisionPlan], CreateUserFolderDTO | None]
+        ] = []
+
+    def dispatch_provision_dashboard_workflow(self, **kwargs) -> str:
+        raise AssertionError("일괄 step2는 프로젝트별 발행을 쓰지 않는다")
+
+    def dispatch_provision_dashboard_workflows(
+        self,
+        plans: list[DashboardProvisionPlan],
+        user_folder: CreateUserFolderDTO | None = None,
+    ) -> dict[str, str | None]:
+        self.calls.append((plans, user_folder))
+        return {
+            plan.project_id: (
+                "발행 실패" if plan.project_id in self.fail_projects else None
+            )
+            for plan in plans
+        }
+
+
+@pytest.fixture
+def executor(override) -> FakeTaskExecutor:
+    executor = FakeTaskExecutor()
+    override(VisualizationPlatformTaskExecutor, lambda: executor)
+    return executor
+
+
+@pytest.fixture
+def service(override, executor, progress_notifier) -> MonitoringProjectService:
+    # 싱글톤이 이전 테스트의 executor/notifier를 잡고 있지 않도록 새로 만든다
+    override(MonitoringProvisionService, MonitoringProvisionService)
+    return MonitoringProjectService()
+
+
+def make_projects(make_project, user, count: int) -> list[str]:
+    project_ids = [f"p{i}" for i in range(count)]
+    for project_id in project_ids:
+        make_project(
+            user, project_id, with_dashboards=False, status=ProjectStatus.INITIATED
+        )
+    return project_ids
+
+
+def test_results_follow_request_order_with_rejection_codes(
+    service, executor, owner, user, make_project
+):
+    make_projects(make_project, user, 2)
+    make_project(user, "ready", status=ProjectStatus.READY)
+    make_project(user, "running", status=ProjectStatus.IN_PROGRESS)
+    other = User.objects.create(
+        id="user-2", name="김철수", oauth_type="google", oauth_id="oauth-2"
+    )
+    make_project(other, "others", status=ProjectStatus.INITIATED)
+    executor.fail_projects = {"p1"}
+
+    results = service.start_log_project_step2_bulk(
+        owner, ["p0", "ready", "p1", "missing", "others", "running", "p0"]
+    )
+
+    # 중복은 한 번만, 요청 순서대로
+    assert [(r.project_id, r.dispatched, r.code) for r in results] == [
+        ("p0", True, None),
+        ("ready", False, AlreadyExistException.code),
+        ("p1", False, DISPATCH_FAILED),
+        ("missing", False, NotExistException.code),
+        ("others", False, PermissionException.code),
+        ("running", False, AlreadyProvisioningException.code),
+    ]
+    assert results[2].message == "발행 실패"
+    # 통과한 프로젝트만 한 번에 발행
+    ((plans, _),) = executor.calls
+    assert [plan.project_id for plan in plans] == ["p0", "p1"]
+
+
+def test_user_without_folder_shares_one_folder_task(
+    service, executor, owner, user, make_project, progress_notifier
+):
+    project_ids = make_projects(make_project, user, 3)
+
+    service.start_log_project_step2_bulk(owner, project_ids)
+
+    ((plans, user_folder),) = executor.calls
+    assert user_folder is not None
+    assert all(plan.user_folder is None for plan in plans)
+
+    task_results = TaskResultModel.objects.all()
+    assert {tr.status for tr in task_results} == {TaskStatus.PENDING}
+    folder_tasks = [
+        tr
+        for tr in task_results
+        if tr.task_name == MonitoringDashboardTaskName.CREATE_DASHBOARD_USER_FOLDER
+    ]
+    assert [tr.id for tr in folder_tasks] == [user_folder.task_id]
+    # 공유 폴더 태스크는 첫 프로젝트의 진행 상황에 보인다
+    first_steps = {
+        event.step for event in progress_notifier.listen("p0", timeout=0, heartbeat=0)
+    }
+    assert MonitoringDashboardTaskName.CREATE_DASHBOARD_USER_FOLDER in first_steps
+
+
+def test_user_with_folder_skips_folder_task(
+    service, executor, owner, user, make_project
+):
+    UserFolderModel.objects.create(
+        id="folder-1", user=user, uid="folder-uid-1", name="폴더"
+    )
+    project_ids = make_projects(make_project, user, 2)
+
+    service.start_log_project_step2_bulk(owner, project_ids)
+
+    ((plans, user_folder),) = executor.calls
+    assert user_folder is None
+    assert all(plan.permissions is not None for plan in plans)
+
+
+def test_query_count_does_not_grow_with_projects(
+    service, owner, user, make_project, django_assert_max_num_queries
+):
+    project_ids = make_projects(make_project, user, 8)
+
+    # 스냅샷 조회 1회 + TaskResult bulk_upsert (프로젝트 수와 무관)
+    with django_assert_max_num_queries(3):
+        results = service.start_log_project_step2_bulk(owner, project_ids)
+
+    assert all(result.dispatched for result in results)
+
+
+def test_nothing_to_dispatch(service, executor, owner):
+    results = service.start_log_project_step2_bulk(owner, ["missing"])
+
+    assert [r.code for r in results] == [NotExistException.code]
+    assert executor.calls == []
+
+
+class TestStep1:
+    @pytest.fixture
+    def service(self, s3_storage) -> MonitoringProjectService:
+        service = MonitoringProjectService()
+        service.harvester_agent_service = HarvesterAgentService()
+        service.harvester_agent_service.storage_provider = s3_storage
+        return service
+
+    def step1(self, service, owner, agent_contexts):
+        collector_ctx, router_ctx = agent_contexts(str(uuid.uuid4()))
+        return service.start_log_project_step1(
+            user=owner,
+            project_name="app",
+            project_description="app logs",
+            log_collector_ctx=collector_ctx,
+            log_router_ctx=router_ctx,
+        )
+
+    def test_saves_project_with_uploaded_urls(
+        self, service, owner, agent_contexts, s3_client
+    ):
+        project = self.step1(service, owner, agent_contexts)
+
+        saved = service.get_project_detail(project.id)
+        assert saved.name == "app"
+        assert len(s3_client.objects) == 3
+
+    def test_deletes_uploaded_files_when_save_fails(
+        self, monkeypatch, service, owner, agent_contexts, s3_client
+    ):
+        def save(project):
+            raise DatabaseError("insert failed")
+
+        monkeypatch.setattr(service.project_repo, "save", save)
+
+        with pytest.raises(DatabaseError):
+            self.step1(service, owner, agent_contexts)
+
+        assert s3_client.objects == {}
+
+    def test_async_deletes_uploaded_files_when_save_fails(
+        self,
+        monkeypatch,
+        override,
+        service,
+        owner,
+        agent_contexts,
+        s3_storage,
+        s3_server,
+    ):
+        override(
+            AsyncAgentStorageProvider,
+            lambda: AsyncS3AgentStorageProvider(s3_storage),
+        )
+
+        async def asave(project):
+            raise DatabaseError("insert failed")
+
+        monkeypatch.setattr(service.project_repo, "asave", asave)
+        collector_ctx, router_ctx = agent_contexts(str(uuid.uuid4()))
+
+        with pytest.raises(DatabaseError):
+            async_to_sync(service.astart_log_project_step1)(
+                user=owner,
+                project_name="app",
+                project_description="app logs",
+                log_collector_ctx=collector_ctx,
+                log_router_ctx=router_ctx,
+            )
+
+        assert len(s3_server.requests) == 6
+        assert s3_server.objects == {}
@@ -0,0 +1,224 @@
+import asyncio
+from typing import Any
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+
+from common.container import Lifetime
+from monitoring.domain.monitoring_project import ProjectStatus
+from monitoring.domain.task_result import MonitoringDashboardTaskName, TaskStatus
+from monitoring.infra.models.monitoring_project_model import MonitoringProjectModel
+from monitoring.infra.models.task_result_model import TaskResultModel
+from monitoring.infra.models.visualization_platform_model import (
+    DashboardModel,
+    ServiceAccountModel,
+    UserFolderModel,
+)
+from monitoring.infra.repo.monitoring_project_repo import MonitoringProjectRepo
+from monitoring.service.i_visualization_platform.i_visualization_platform_provider import (
+    AsyncVisualizationPlatformProvider,
+)
+from monitoring.service.monitoring_provision_service import MonitoringProvisionService
+
+pytestmark = pytest.mark.django_db
+
+
+class FakeAsyncGrafana(AsyncVisualizationPlatformProvider):
+    """fail_accounts에 있는 서비스 계정 이름은 생성에 실패한다"""
+
+    def __init__(self):
+        self.fail_accounts: set[str] = set()
+        self.folders_created = 0
+        self._next_id = 0
+
+    def _id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    async def create_folder(self, title: str) -> dict[str, Any]:
+        self.folders_created += 1
+        return {"uid": f"folder-{self._id()}", "title": title, "orgId": 1}
+
+    async def create_service_account(
+        self, name: str, role: str = "Viewer"
+    ) -> dict[str, Any]:
+        if name in self.fail_accounts:
+            raise RuntimeError("service account 생성 실패")
+        return {"id": self._id(), "name": name, "role": role, "isDisabled": False}
+
+    async def create_service_token(
+        self, service_account_id: str, token_name: str
+    ) -> dict[str, Any]:
+        return {"key": f"glsa_{service_account_id}"}
+
+    async def set_folder_permissions(
+        self, folder_uid: str, service_account_id: str, permission: int = 1
+    ) -> dict[str, Any]:
+        return {"message": "Folder permissions updated"}
+
+    async def create_dashboard(
+        self, dashboard_data: dict[str, Any], folder_uid: str
+    ) -> dict[str, Any]:
+        uid = f"dash-{self._id()}"
+        return {"uid": uid, "url": f"/d/{uid}"}
+
+    async def create_public_dashboard(self, dashboard_uid: str) -> dict[str, Any]:
+        return {"uid": f"pub-{dashboard_uid}", "publicUrl": f"/public/{dashboard_uid}"}
+
+    async def get_folders(self) -> list[dict[str, Any]]:
+        return []
+
+    async def get_public_dashboard(self, public_dashboard_uid: str) -> dict[str, Any]:
+        return {}
+
+    async def get_dashboard(self, uid: str) -> dict[str, Any]:
+        return {}
+
+
+@pytest.fixture
+def grafana(override) -> FakeAsyncGrafana:
+    grafana = FakeAsyncGrafana()
+    override(AsyncVisualizationPlatformProvider, lambda: grafana, Lifetime.TRANSIENT)
+    return grafana
+
+
+@pytest.fixture
+def service(grafana, progress_notifier) -> MonitoringProvisionService:
+    return MonitoringProvisionService()
+
+
+@pytest.fixture
+def targets(user, owner, make_project):
+    repo = MonitoringProjectRepo()
+    for project_id in ("p1", "p2"):
+        make_project(
+            user, project_id, with_dashboards=False, status=ProjectStatus.INITIATED
+        )
+    snapshots = repo.find_provisioning_snapshots(["p1", "p2"])
+    return [(owner, snapshots[project_id]) for project_id in ("p1", "p2")]
+
+
+def project_status(project_id: str) -> str:
+    return MonitoringProjectModel.objects.get(id=project_id).status
+
+
+def test_batch_saves_resources_and_task_results(service, grafana, targets):
+    results = service.provision_log_dashboards_batch(targets, concurrency=4)
+
+    assert all(r.succeeded for r in results)
+    assert project_status("p1") == project_status("p2") == ProjectStatus.READY
+    # 같은 유저의 프로젝트는 폴더 하나를 공유
+    assert grafana.folders_created == 1
+    assert UserFolderModel.objects.count() == 1
+    assert DashboardModel.objects.count() == 2
+    assert ServiceAccountModel.objects.filter(token__startswith="glsa_").count() == 2
+
+    # 폴더 1 + 프로젝트마다 6단계, 전부 SUCCESS
+    assert TaskResultModel.objects.count() == 13
+    assert set(TaskResultModel.objects.values_list("status", flat=True)) == {
+        TaskStatus.SUCCESS.value
+    }
+
+
+def test_batch_uses_given_snapshots(monkeypatch, service, targets):
+    def find_provisioning_snapshot(user_id, project_id):
+        raise AssertionError("프로젝트마다 스냅샷을 다시 조회하면 안 된다")
+
+    monkeypatch.setattr(
+        service.monitoring_project_repo,
+        "find_provisioning_snapshot",
+        find_provisioning_snapshot,
+    )
+
+    results = service.provision_log_dashboards_batch(targets, concurrency=4)
+
+    assert all(r.succeeded for r in results)
+
+
+def test_batch_publishes_progress(service, targets, progress_notifier):
+    service.provision_log_dashboards_batch(targets, concurrency=4)
+
+    events = list(progress_notifier.listen("p1", timeout=1, heartbeat=1))
+
+    assert {e.step for e in events if e.step} == {
+        name.value for name in MonitoringDashboardTaskName
+    }
+    assert events[-1].status == ProjectStatus.READY
+
+
+def test_failed_project_keeps_created_resources(
+    service, grafana, targets, progress_notifier
+):
+    grafana.fail_accounts.add("service-user-1-p2")
+
+    results = {
+        r.project_id: r
+        for r in service.provision_log_dashboards_batch(targets, concurrency=4)
+    }
+
+    assert results["p1"].succeeded
+    assert "service account 생성 실패" in results["p2"].error
+    assert project_status("p1") == ProjectStatus.READY
+    assert project_status("p2") == ProjectStatus.FAILED
+    # 대시보드 쪽은 서비스 계정 실패와 관계없이 만들어져 저장된다
+    assert DashboardModel.objects.filter(project_id="p2").exists()
+
+    steps = {
+        e.step: e.status
+        for e in progress_notifier.listen("p2", timeout=1, heartbeat=1)
+        if e.step
+    }
+    assert steps == {
+        MonitoringDashboardTaskName.CREATE_DASHBOARD_SERVICE_ACCOUNT: TaskStatus.FAILURE,
+        MonitoringDashboardTaskName.CREATE_DASHBOARD_SERVICE_TOKEN: TaskStatus.FAILURE,
+        MonitoringDashboardTaskName.SET_FOLDER_PERMISSIONS: TaskStatus.FAILURE,
+        MonitoringDashboardTaskName.CREATE_DASHBOARD: TaskStatus.SUCCESS,
+        MonitoringDashboardTaskName.CREATE_PUBLIC_DASHBOARD: TaskStatus.SUCCESS,
+        MonitoringDashboardTaskName.FINALIZE_DASHBOARD: TaskStatus.FAILURE,
+    }
+    # DB의 TaskResult도 같은 상태 (p2의 실패 4단계)
+    assert TaskResultModel.objects.filter(status=TaskStatus.FAILURE).count() == 4
+
+
+def test_already_provisioned_project_is_skipped(service, user, make_project, targets):
+    make_project(user, "p3", with_dashboards=True, status=ProjectStatus.FAILED)
+    owner = targets[0][0]
+    done = MonitoringProjectRepo().find_provisioning_snapshots(["p3"])["p3"]
+
+    results = service.provision_log_dashboards_batch(
+        targets + [(owner, done)], concurrency=4
+    )
+
+    skipped = next(r for r in results if r.project_id == "p3")
+    assert not skipped.succeeded
+    assert project_status("p3") == ProjectStatus.FAILED
+
+
+def test_async_batch_runs_inside_event_loop(service, targets):
+    # ASGI view처럼 이미 event loop가 돌고 있는 곳에서 호출
+    results = async_to_sync(service.aprovision_log_dashboards_batch)(
+        targets, concurrency=4
+    )
+
+    assert all(r.succeeded for r in results)
+    assert project_status("p1") == ProjectStatus.READY
+
+
+def test_sync_provisioner_refuses_running_loop(service, targets):
+    provisioner = service._batch_provisioner(concurrency=4)
+
+    async def call_sync():
+        provisioner.provision([])
+
+    with pytest.raises(RuntimeError, match="aprovision"):
+        asyncio.run(call_sync())
+
+
+def test_management_command(grafana, progress_notifier, targets, capsys):
+    call_command("provision_log_dashboards_batch", "p1", "p2", "missing")
+
+    assert project_status("p1") == project_status("p2") == ProjectStatus.READY
+    out, err = capsys.readouterr()
+    assert "Provisioned 2 projects (0 failed, 1 skipped)" in out
+    assert "missing: project not found" in err
@@ -0,0 +1,167 @@
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from monitoring.domain.i_repo.i_task_result_repo import ITaskResultRepo
+from monitoring.domain.task_result import TaskStatus
+from monitoring.infra.models.task_result_model import TaskResultModel
+from monitoring.infra.redis.task_status_buffer import TaskStatusBuffer
+from monitoring.infra.repo.task_result_repo import TaskResultRepo
+from monitoring.service.task_result_retention_service import (
+    RetentionPolicy,
+    TaskResultRetentionService,
+)
+
+pytestmark = pytest.mark.django_db
+
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def task_result_repo(override, redis_client):
+    override(
+        ITaskResultRepo, lambda: TaskResultRepo(TaskStatusBuffer(redis_client, ttl=60))
+    )
+
+
+def create(rows: list[tuple[str, TaskStatus, int]]) -> None:
+    """(id, status, 생성 후 지난 일수) 행을 만든다."""
+    TaskResultModel.objects.bulk_create(
+        [
+            TaskResultModel(id=id, task_name="test", status=status)
+            for id, status, _ in rows
+        ]
+    )
+    # date_created는 auto_now_add라 생성 후 과거 시각으로 바꾼다
+    for id, _, days in rows:
+        TaskResultModel.objects.filter(id=id).update(
+            date_created=NOW - timedelta(days=days)
+        )
+
+
+def remaining() -> set[str]:
+    return set(TaskResultModel.objects.values_list("id", flat=True))
+
+
+def test_purges_only_expired_rows_of_each_status():
+    create(
+        [
+            ("success-old", TaskStatus.SUCCESS, 20),
+            ("success-new", TaskStatus.SUCCESS, 3),
+            ("failure-old", TaskStatus.FAILURE, 20),
+            ("pending-old", TaskStatus.PENDING, 20),
+        ]
+    )
+    service = TaskResultRetentionService(chunk_size=10, chunk_sleep=0)
+
+    deleted = service.purge(
+        [
+            RetentionPolicy(TaskStatus.SUCCESS, timedelta(days=14)),
+            RetentionPolicy(TaskStatus.FAILURE, timedelta(days=30)),
+        ],
+        now=NOW,
+    )
+
+    assert deleted == {TaskStatus.SUCCESS: 1, TaskStatus.FAILURE: 0}
+    assert remaining() == {"success-new", "failure-old", "pending-old"}
+
+
+def test_policy_without_max_age_purges_every_row_of_status():
+    create(
+        [
+            ("pending-old", TaskStatus.PENDING, 20),
+            ("pending-new", TaskStatus.PENDING, 0),
+            ("success-new", TaskStatus.SUCCESS, 0),
+        ]
+    )
+    service = TaskResultRetentionService(chunk_size=10, chunk_sleep=0)
+
+    deleted = service.purge([RetentionPolicy(TaskStatus.PENDING, None)], now=NOW)
+
+    assert deleted == {TaskStatus.PENDING: 2}
+    assert remaining() == {"success-new"}
+
+
+def test_deletes_in_chunks_past_rows_with_same_date_created():
+    # 생성 시각이 모두 같아도 (date_created, id) keyset으로 건너뛰거나 반복하지 않는다
+    create([(f"task-{i}", TaskStatus.SUCCESS, 30) for i in range(5)])
+    service = TaskResultRetentionService(chunk_size=2, chunk_sleep=0)
+
+    with CaptureQueriesContext(connection) as queries:
+        deleted = service.purge(
+            [RetentionPolicy(TaskStatus.SUCCESS, timedelta(days=14))], now=NOW
+        )
+
+    assert deleted == {TaskStatus.SUCCESS: 5}
+    assert remaining() == set()
+    statements = [query["sql"].split(" ", 1)[0] for query in queries]
+    # 2 + 2 + 1: 마지막 chunk가 chunk_size보다 작으면 더 읽지 않는다
+    assert statements == ["SELECT", "DELETE"] * 3
+
+
+def test_matches_single_delete_on_random_rows():
+    rng = random.Random(0)
+    statuses = list(TaskStatus)
+    rows = [
+        (f"task-{i:04d}", rng.choice(statuses), rng.randrange(60)) for i in range(300)
+    ]
+    create(rows)
+    policies = TaskResultRetentionService.default_policies()
+    max_ages = {policy.status: policy.max_age for policy in policies}
+    expected = {
+        id for id, status, days in rows if timedelta(days=days) > max_ages[status]
+    }
+
+    service = TaskResultRetentionService(chunk_size=7, chunk_sleep=0)
+    deleted = service.purge(policies, now=NOW)
+
+    assert sum(deleted.values()) == len(expected)
+    assert remaining() == {id for id, _, _ in rows} - expected
+
+
+def test_rejects_empty_chunk():
+    with pytest.raises(ValueError):
+        TaskResultRetentionService(chunk_size=0)
+
+
+class TestCleanTasksCommand:
+    @pytest.fixture(autouse=True)
+    def rows(self):
+        create(
+            [
+                ("success", TaskStatus.SUCCESS, 0),
+                ("failure", TaskStatus.FAILURE, 0),
+                ("pending", TaskStatus.PENDING, 0),
+                ("started-old", TaskStatus.STARTED, 10),
+                ("started-new", TaskStatus.STARTED, 0),
+            ]
+        )
+
+    @pytest.fixture(autouse=True)
+    def now(self, monkeypatch):
+        monkeypatch.setattr(timezone, "now", lambda: NOW)
+
+    def test_defaults_to_failure_and_pending(self):
+        call_command("clean_tasks", sleep=0)
+
+        assert remaining() == {"success", "started-old", "started-new"}
+
+    def test_status_and_age(self):
+        call_command("clean_tasks", status="started", older_than_days=7, sleep=0)
+
+        assert remaining() == {"success", "failure", "pending", "started-new"}
+
+    def test_all(self):
+        call_command("clean_tasks", all=True, sleep=0)
+
+        assert remaining() == set()
+
+    def test_unknown_status(self):
+        with pytest.raises(CommandError):
+            call_command("clean_tasks", status="DONE", sleep=0)
@@ -0,0 +1,22 @@
+import pytest
+
+from user.domain.user import OAuthType
+from user.domain.user import User as UserVo
+
+
+@pytest.fixture
+def make_user_vo():
+    def make(user_id: str = "user-1") -> UserVo:
+        return UserVo(
+            id=user_id,
+            name="홍길동",
+            email=None,
+            mobile_no=None,
+            oauth_type=OAuthType.GOOGLE,
+            oauth_id="oauth-1",
+            tos_agreed=True,
+            created_at="2025-01-01T00:00:00Z",
+            updated_at="2025-01-01T00:00:00Z",
+        )
+
+    return make
@@ -0,0 +1,67 @@
+import fakeredis
+import pytest
+
+from user.infra.cache import user_cache
+from user.infra.cache.user_cache import UserCache
+from user.infra.models.user import User
+from user.infra.repository.user_repo import UserRepo
+from user.service.repository.i_user_repo import IUserRepo
+
+
+def test_round_trip(make_user_vo):
+    cache = UserCache(ttl=60)
+    cache.set(make_user_vo())
+
+    assert cache.get("user-1") == make_user_vo()
+
+
+def test_entries_expire_with_ttl(user_cache_redis, make_user_vo):
+    UserCache(ttl=60).set(make_user_vo())
+
+    assert 0 < user_cache_redis.ttl(f"{UserCache.KEY_PREFIX}user-1") <= 60
+
+
+def test_redis_failure_is_a_cache_miss(monkeypatch, make_user_vo):
+    server = fakeredis.FakeServer()
+    server.connected = False
+    monkeypatch.setattr(user_cache, "redis_client", fakeredis.FakeRedis(server=server))
+    cache = UserCache(ttl=60)
+
+    cache.set(make_user_vo())
+    cache.delete("user-1")
+    assert cache.get("user-1") is None
+
+
+@pytest.mark.django_db
+class TestUserRepoCache:
+    @pytest.fixture
+    def user(self) -> User:
+        return User.objects.create(
+            id="user-1", name="홍길동", oauth_type="google", oauth_id="oauth-1"
+        )
+
+    def test_id_lookup_is_served_from_cache(self, user, django_assert_num_queries):
+        repo = UserRepo()
+        first = repo.get_user(IUserRepo.Filter(user_id=user.id))
+
+        with django_assert_num_queries(0):
+            second = repo.get_user(IUserRepo.Filter(user_id=user.id))
+
+        assert first == second
+
+    def test_oauth_lookup_is_not_cached(self, user, django_assert_num_queries):
+        repo = UserRepo()
+        oauth_filter = IUserRepo.Filter(oauth_id="oauth-1", oauth_type="google")
+        repo.get_user(oauth_filter)
+
+        with django_assert_num_queries(1):
+            repo.get_user(oauth_filter)
+
+    def test_saving_the_model_invalidates_cache(self, user):
+        repo = UserRepo()
+        repo.get_user(IUserRepo.Filter(user_id=user.id))
+
+        user.name = "김철수"
+        user.save()
+
+        assert repo.get_user(IUserRepo.Filter(user_id=user.id)).name == "김철수"
@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+
+import jwt
+import pytest
+
+from common import response_msg
+from common.utils.ttl_cache import TTLCache
+from user.domain.user_role import UserRoles
+from user.domain.user_token import UserTokenType
+from user.infra.token.user_token_manager import UserTokenManager
+from user.infra.token.user_token_parser import UserTokenParser
+
+SECRET = "test-secret-" * 8
+
+
+@pytest.fixture
+def parser(monkeypatch) -> UserTokenParser:
+    monkeypatch.setattr(UserTokenManager, "JWT_SECRET", SECRET)
+    monkeypatch.setattr(UserTokenParser, "JWT_SECRET", SECRET)
+    monkeypatch.setattr(
+        UserTokenParser, "payload_cache", TTLCache(max_size=100, default_ttl=3_600)
+    )
+    return UserTokenParser()
+
+
+@pytest.fixture
+def decode_calls(parser, monkeypatch) -> list[str]:
+    calls: list[str] = []
+    decode = parser.decode_token
+
+    def counting_decode(token):
+        calls.append(token)
+        return decode(token)
+
+    monkeypatch.setattr(parser, "decode_token", counting_decode)
+    return calls
+
+
+def test_second_check_uses_cached_payload(parser, decode_calls):
+    token = UserTokenManager().create_user_access_token("user-1")
+
+    first, _ = parser.check_token(token, UserRoles.USER_ROLES, UserTokenType.ACCESS)
+    second, message = parser.check_token(
+        token, UserRoles.USER_ROLES, UserTokenType.ACCESS
+    )
+
+    assert first == second
+    assert second.user_id == "user-1"
+    assert message == response_msg.TokenMessage.VALID.value
+    assert decode_calls == [token]
+
+
+def test_cached_payload_is_still_checked_for_type_and_role(parser, decode_calls):
+    token = UserTokenManager().create_user_access_token("user-1")
+    parser.check_token(token, UserRoles.USER_ROLES, UserTokenType.ACCESS)
+
+    wrong_type = parser.check_token(token, UserRoles.USER_ROLES, UserTokenType.REFRESH)
+    wrong_role = parser.check_token(token, UserRoles.ADMIN_ROLES, UserTokenType.ACCESS)
+
+    assert wrong_type == (None, response_msg.TokenMessage.WRONG_TYPE.value)
+    assert wrong_role == (None, response_msg.TokenMessage.ROLE_NO_PERMISSION.value)
+    assert len(decode_calls) == 1
+
+
+def test_expired_token_is_rejected_and_not_cached(parser):
+    now = datetime.now()
+    token = jwt.encode(
+        {
+            "user_id": "user-1",
+            "type": UserTokenType.ACCESS.value,
+            "role": "USER",
+            "iat": int((now - timedelta(hours=2)).timestamp()),
+            "exp": int((now - timedelta(hours=1)).timestamp()),
+        },
+        SECRET,
+        UserTokenParser.JWT_ALGORITHM,
+    )
+
+    payload, message = parser.check_token(
+        token, UserRoles.USER_ROLES, UserTokenType.ACCESS
+    )
+
+    assert payload is None
+    assert message == response_msg.TokenMessage.EXPIRED.value
+    assert parser.payload_cache.stats()["size"] == 0
+
+
+def test_token_signed_with_other_key_is_not_served_from_cache(parser):
+    token = UserTokenManager().create_user_access_token("user-1")
+    parser.check_token(token, UserRoles.USER_ROLES, UserTokenType.ACCESS)
+
+    # 같은 payload라도 토큰 문자열이 다르면 캐시를 타지 않고 서명 검증을 한다
+    forged = jwt.encode(
+        jwt.decode(token, options={"verify_signature": False}),
+        "other-secret-" * 8,
+        UserTokenParser.JWT_ALGORITHM,
+    )
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        parser.check_token(forged, UserRoles.USER_ROLES, UserTokenType.ACCESS)
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from common.middleware.request_cache import RequestCacheMiddleware, get_request_cache
+from user.domain.user_token import UserTokenPayload, UserTokenType
+from user.service.user_service import UserService
+
+
+def make_payload(user_id: str | None = "user-1") -> UserTokenPayload:
+    return UserTokenPayload(
+        admin_id=None,
+        user_id=user_id,
+        guest_id=None,
+        type=UserTokenType.ACCESS,
+        role="USER",
+        exp=0,
+        iat=0,
+    )
+
+
+@pytest.fixture
+def lookups(monkeypatch, make_user_vo) -> list[str]:
+    calls: list[str] = []
+
+    def get_user_by_id(self, user_id):
+        calls.append(user_id)
+        return make_user_vo(user_id)
+
+    monkeypatch.setattr(UserService, "get_user_by_id", get_user_by_id)
+    return calls
+
+
+def test_outside_request_every_call_looks_up(lookups):
+    assert get_request_cache() is None
+
+    UserService.get_user_from_token_payload(make_payload())
+    UserService.get_user_from_token_payload(make_payload())
+
+    assert lookups == ["user-1", "user-1"]
+
+
+def test_same_request_looks_up_once(lookups):
+    def view(request):
+        UserService.get_user_from_token_payload(make_payload())
+        UserService.get_user_from_token_payload(make_payload())
+        UserService.get_user_from_token_payload(make_payload("user-2"))
+        return HttpResponse()
+
+    middleware = RequestCacheMiddleware(view)
+    middleware(RequestFactory().get("/"))
+    middleware(RequestFactory().get("/"))
+
+    # 요청마다 memo가 새로 열리고, 요청이 끝나면 닫힌다
+    assert lookups == ["user-1", "user-2", "user-1", "user-2"]
+    assert get_request_cache() is None
+
+
+def test_async_request_looks_up_once(lookups):
+    async def view(request):
+        await UserService.aget_user_from_token_payload(make_payload())
+        await UserService.aget_user_from_token_payload(make_payload())
+        return HttpResponse()
+
+    middleware = RequestCacheMiddleware(view)
+    asyncio.run(middleware(RequestFactory().get("/")))
+
+    assert lookups == ["user-1"]
+
+
+def test_payload_without_any_id_is_rejected(lookups):
+    with pytest.raises(ValueError):
+        UserService.get_user_from_token_payload(make_payload(None))
+    assert lookups == []
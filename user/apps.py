@@ -7,3 +7,7 @@ class UserConfig(AppConfig):
 
     def ready(self) -> None:
         import user.infra.models.user
+        from common.container import container
+        from user.dependencies import register_dependencies
+
+        register_dependencies(container)
@@ -0,0 +1,18 @@
+from common.container import Container
+from common.service.token.i_token_manager import ITokenManager
+from common.service.token.i_token_parser import ITokenParser
+from user.infra.repository.user_repo import UserRepo
+from user.infra.token.user_token_manager import UserTokenManager
+from user.infra.token.user_token_parser import UserTokenParser
+from user.service.oauth.oauth_factory import OauthFactory
+from user.service.repository.i_user_repo import IUserRepo
+from user.service.user_service import UserService
+
+
+def register_dependencies(container: Container) -> None:
+    """user 앱의 구현체 등록. (UserConfig.ready()에서 호출)"""
+    container.register(IUserRepo, UserRepo)
+    container.register(ITokenManager, UserTokenManager)
+    container.register(ITokenParser, UserTokenParser)
+    container.register(OauthFactory, OauthFactory)
+    container.register(UserService, UserService)
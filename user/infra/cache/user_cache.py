@@ -0,0 +1,50 @@
+import json
+import logging
+
+from redis import RedisError
+
+from config.settings import USER_CACHE_TTL
+from monitoring.infra.redis.redis_client import redis_client
+from user.domain.user import User as UserVo
+
+logger = logging.getLogger(__name__)
+
+
+class UserCache:
+    """
+    user_id → User 도메인 객체를 Redis에 공유 캐싱한다. (web, celery 공통)
+    Redis 장애 시에는 캐시 miss로 취급해서 DB 조회로 넘어간다.
+    """
+
+    KEY_PREFIX = "cache:user:"
+
+    def __init__(self, ttl: int = USER_CACHE_TTL):
+        self.ttl = ttl
+
+    def _key(self, user_id: str) -> str:
+        return f"{self.KEY_PREFIX}{user_id}"
+
+    def get(self, user_id: str) -> UserVo | None:
+        try:
+            raw = redis_client.get(self._key(user_id))
+        except RedisError as e:
+            logger.warning(f"user cache 조회 실패: {e}")
+            return None
+
+        if raw is None:
+            return None
+        return UserVo.from_dict(json.loads(raw))
+
+    def set(self, user_vo: UserVo) -> None:
+        try:
+            redis_client.set(
+                self._key(user_vo.id), json.dumps(user_vo.to_dict()), ex=self.ttl
+            )
+        except RedisError as e:
+            logger.warning(f"user cache 저장 실패: {e}")
+
+    def delete(self, user_id: str) -> None:
+        try:
+            redis_client.delete(self._key(user_id))
+        except RedisError as e:
+            logger.warning(f"user cache 삭제 실패: {e}")
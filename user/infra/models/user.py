@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 
 class User(models.Model):
@@ -20,3 +22,12 @@ class User(models.Model):
             models.Index(fields=["created_at"]),
             models.Index(fields=["updated_at"]),
         ]
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance: User, **kwargs):
+    # 유저 정보가 바뀌면 공유 캐시를 비운다 (다음 조회 시 DB에서 다시 채움)
+    from user.infra.cache.user_cache import UserCache
+
+    UserCache().delete(instance.id)
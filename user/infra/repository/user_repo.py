@@ -1,13 +1,24 @@
 from django.db import DatabaseError
 
 from user.domain.user import User as UserVo
+from user.infra.cache.user_cache import UserCache
 from user.infra.models.serializer import UserSerializer
 from user.infra.models.user import User
 from user.service.repository.i_user_repo import IUserRepo
 
 
 class UserRepo(IUserRepo):
+    def __init__(self):
+        self.user_cache = UserCache()
+
     def get_user(self, filter: IUserRepo.Filter) -> UserVo | None:
+        # user_id 단건 조회는 공유 캐시 먼저 확인
+        is_id_lookup = filter.user_id and not (filter.oauth_id and filter.oauth_type)
+        if is_id_lookup:
+            cached = self.user_cache.get(filter.user_id)
+            if cached is not None:
+                return cached
+
         user = User.objects.all()
         if filter.oauth_id and filter.oauth_type:
             user = user.filter(oauth_id=filter.oauth_id, oauth_type=filter.oauth_type)
@@ -21,7 +32,10 @@ class UserRepo(IUserRepo):
 
         serializer = UserSerializer(user)
         user_dict = serializer.data
-        return UserVo.from_dict(dto=user_dict)
+        user_vo = UserVo.from_dict(dto=user_dict)
+        if is_id_lookup:
+            self.user_cache.set(user_vo)
+        return user_vo
 
     def get_bulk(self):
         pass
@@ -31,6 +45,7 @@ class UserRepo(IUserRepo):
 
         if serializer.is_valid():
             serializer.save()
+            self.user_cache.delete(user_vo.id)
 
             return user_vo.from_dict(serializer.data)
         else:
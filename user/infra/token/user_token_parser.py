@@ -1,3 +1,4 @@
+import hashlib
 from typing import Any
 
 import jwt
@@ -6,13 +7,20 @@ from django.http.request import HttpHeaders
 from common import response_msg
 from common.constant import RequestHeader
 from common.service.token.i_token_parser import ITokenParser
-from config.settings import JWT_SECRET
+from common.utils.ttl_cache import TTLCache
+from config.settings import JWT_PAYLOAD_CACHE_SIZE, JWT_PAYLOAD_CACHE_TTL, JWT_SECRET
 from user.domain.user_token import UserTokenPayload
 
+# 서명 검증 + dacite 변환까지 끝난 payload를 토큰 해시 기준으로 보관 (프로세스 단위)
+user_token_payload_cache: TTLCache[str, UserTokenPayload] = TTLCache(
+    max_size=JWT_PAYLOAD_CACHE_SIZE, default_ttl=JWT_PAYLOAD_CACHE_TTL
+)
+
 
 class UserTokenParser(ITokenParser):
     JWT_ALGORITHM = "HS512"
     JWT_SECRET = JWT_SECRET
+    payload_cache = user_token_payload_cache
 
     def _validate_token(
         self, token: str, validate_type: str, allowed_roles: list[str]
@@ -21,20 +29,34 @@ class UserTokenParser(ITokenParser):
             return None, response_msg.TokenMessage.NOT_FOUND.value
 
         try:
-            payload = self.decode_token(token)
+            user_token_payload_vo = self._get_payload_vo(token)
 
-            if payload[UserTokenPayload.FIELD_TYPE] != validate_type:
+            if user_token_payload_vo.type != validate_type:
                 return None, response_msg.TokenMessage.WRONG_TYPE.value
 
-            if not payload[UserTokenPayload.FIELD_ROLE] in allowed_roles:
+            if not user_token_payload_vo.role in allowed_roles:
                 return None, response_msg.TokenMessage.ROLE_NO_PERMISSION.value
 
-            user_token_payload_vo = UserTokenPayload.from_dict(payload)
             return user_token_payload_vo, response_msg.TokenMessage.VALID.value
 
         except jwt.ExpiredSignatureError:
             return None, response_msg.TokenMessage.EXPIRED.value
 
+    def _get_payload_vo(self, token: str) -> UserTokenPayload:
+        """
+        캐시에 있으면 서명 검증/dacite 변환 없이 반환.
+        캐시 항목은 토큰의 exp 시각에 만료된다.
+        """
+        cache_key = hashlib.sha256(token.encode()).hexdigest()
+        cached = self.payload_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        payload = self.decode_token(token)
+        payload_vo = UserTokenPayload.from_dict(payload)
+        self.payload_cache.set(cache_key, payload_vo, expires_at=payload_vo.exp)
+        return payload_vo
+
     def check_token(
         self, token: str, allowed_roles: list[str], validate_type: str
     ) -> tuple[UserTokenPayload | None, str]:
@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field
 from rest_framework import status
 from rest_framework.views import APIView
 
+from common.container import container
 from common.interface.response import ErrorResponse, success_response
 from common.interface.validators import validate_body, validate_query_params
 from common.response_msg import LoginMessage
@@ -27,8 +28,8 @@ class OAuthLoginView(APIView):
         token: str = Field(min_length=32)
 
     def __init__(self):
-        self.oauth_factory = OauthFactory()
-        self.user_service = UserService()
+        self.oauth_factory = container.resolve(OauthFactory)
+        self.user_service = container.resolve(UserService)
 
     @extend_schema(
         summary="OAuth 로그인 엔드포인트",
@@ -103,7 +104,7 @@ class UserView(APIView):
 
 class RefreshTokenView(APIView):
     def __init__(self):
-        self.user_service = UserService()
+        self.user_service = container.resolve(UserService)
 
     @extend_schema(
         summary="Access 토큰 재발급",
@@ -1,18 +1,19 @@
+from asgiref.sync import sync_to_async
+
+from common.container import container
+from common.middleware.request_cache import get_request_cache
 from common.service.token.i_token_manager import ITokenManager
 from user.domain.user import OAuthUser
 from user.domain.user import User
 from user.domain.user import User as UserVo
 from user.domain.user_token import UserTokenPayload
-from user.infra.repository.user_repo import UserRepo
-from user.infra.token.user_token_manager import UserTokenManager
 from user.service.repository.i_user_repo import IUserRepo
 
 
 class UserService:
     def __init__(self):
-        # TODO: DI 적용
-        self.user_token_manager: ITokenManager = UserTokenManager()
-        self.user_repo: IUserRepo = UserRepo()
+        self.user_token_manager = container.resolve(ITokenManager)
+        self.user_repo = container.resolve(IUserRepo)
 
     @staticmethod
     def get_user_from_token_payload(token_payload: UserTokenPayload) -> User:
@@ -22,12 +23,31 @@ class UserService:
         if user_id is None:
             raise ValueError("No user/admin/guest ID found in token payload.")
 
-        user_service = UserService()
+        # 같은 요청 안에서는 한 번만 조회
+        request_cache = get_request_cache()
+        memo_key = f"user:{user_id}"
+        if request_cache is not None and memo_key in request_cache:
+            return request_cache[memo_key]
+
+        user_service = container.resolve(UserService)
         user = user_service.get_user_by_id(user_id)
         if user is None:
             raise ValueError(f"User not found for ID: {user_id}")
+
+        if request_cache is not None:
+            request_cache[memo_key] = user
         return user
 
+    @staticmethod
+    async def aget_user_from_token_payload(token_payload: UserTokenPayload) -> User:
+        """
+        async view용. 요청 스레드(thread_sensitive)에서 조회하므로
+        DB 커넥션은 요청이 끝날 때 기존과 같이 정리된다.
+        """
+        return await sync_to_async(UserService.get_user_from_token_payload)(
+            token_payload
+        )
+
     def create_access_token(self, user_id: str) -> dict:
         return {"access": self.user_token_manager.create_user_access_token(user_id)}
 